@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS dashboard_snapshots (
+    id BIGSERIAL PRIMARY KEY,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    build_ms DOUBLE PRECISION,
+    view JSONB NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS dashboard_snapshots_computed_at_idx
+    ON dashboard_snapshots (computed_at DESC);
@@ -0,0 +1,74 @@
+CREATE TABLE IF NOT EXISTS store_counters (
+    store_name TEXT PRIMARY KEY,
+    row_count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION bump_store_counter_on_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO store_counters (store_name, row_count, updated_at)
+    SELECT TG_TABLE_NAME, COUNT(*), NOW() FROM inserted_rows
+    ON CONFLICT (store_name) DO UPDATE SET
+        row_count = store_counters.row_count + EXCLUDED.row_count,
+        updated_at = EXCLUDED.updated_at;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bump_store_counter_on_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE store_counters
+    SET row_count = GREATEST(0, row_count - (SELECT COUNT(*) FROM deleted_rows)),
+        updated_at = NOW()
+    WHERE store_name = TG_TABLE_NAME;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement-level triggers: one counter update per INSERT statement, so bulk writers pay once per batch.
+DROP TRIGGER IF EXISTS trg_store_counter_raw_event_insert ON raw_event_store;
+CREATE TRIGGER trg_store_counter_raw_event_insert
+AFTER INSERT ON raw_event_store
+REFERENCING NEW TABLE AS inserted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_store_counter_on_insert();
+
+DROP TRIGGER IF EXISTS trg_store_counter_canonical_insert ON canonical_fact_store;
+CREATE TRIGGER trg_store_counter_canonical_insert
+AFTER INSERT ON canonical_fact_store
+REFERENCING NEW TABLE AS inserted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_store_counter_on_insert();
+
+DROP TRIGGER IF EXISTS trg_store_counter_canonical_delete ON canonical_fact_store;
+CREATE TRIGGER trg_store_counter_canonical_delete
+AFTER DELETE ON canonical_fact_store
+REFERENCING OLD TABLE AS deleted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_store_counter_on_delete();
+
+DROP TRIGGER IF EXISTS trg_store_counter_quarantine_insert ON quarantine_batches;
+CREATE TRIGGER trg_store_counter_quarantine_insert
+AFTER INSERT ON quarantine_batches
+REFERENCING NEW TABLE AS inserted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_store_counter_on_insert();
+
+DROP TRIGGER IF EXISTS trg_store_counter_quarantine_delete ON quarantine_batches;
+CREATE TRIGGER trg_store_counter_quarantine_delete
+AFTER DELETE ON quarantine_batches
+REFERENCING OLD TABLE AS deleted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_store_counter_on_delete();
+
+-- One-time backfill; re-running the migration re-syncs counters with the stores.
+INSERT INTO store_counters (store_name, row_count, updated_at)
+VALUES
+    ('raw_event_store', (SELECT COUNT(*) FROM raw_event_store), NOW()),
+    ('canonical_fact_store', (SELECT COUNT(*) FROM canonical_fact_store), NOW()),
+    ('quarantine_batches', (SELECT COUNT(*) FROM quarantine_batches), NOW())
+ON CONFLICT (store_name) DO UPDATE SET
+    row_count = EXCLUDED.row_count,
+    updated_at = EXCLUDED.updated_at;
@@ -0,0 +1,153 @@
+CREATE TABLE IF NOT EXISTS learning_forecast_rollup (
+    horizon TEXT NOT NULL,
+    day DATE NOT NULL,
+    forecast_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (horizon, day)
+);
+
+CREATE TABLE IF NOT EXISTS learning_realization_rollup (
+    horizon TEXT NOT NULL,
+    day DATE NOT NULL,
+    realized_count BIGINT NOT NULL DEFAULT 0,
+    hit_count BIGINT NOT NULL DEFAULT 0,
+    abs_error_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    signed_error_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    PRIMARY KEY (horizon, day)
+);
+
+CREATE TABLE IF NOT EXISTS forecast_error_category_rollup (
+    horizon TEXT NOT NULL,
+    category TEXT NOT NULL,
+    day DATE NOT NULL,
+    attribution_count BIGINT NOT NULL DEFAULT 0,
+    contribution_count BIGINT NOT NULL DEFAULT 0,
+    contribution_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    abs_contribution_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    PRIMARY KEY (horizon, category, day)
+);
+
+-- Days are UTC: forecasts bucket by as_of, realizations and attributions by evaluated_at.
+CREATE OR REPLACE FUNCTION rollup_forecast_records_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO learning_forecast_rollup (horizon, day, forecast_count)
+    SELECT horizon, (as_of AT TIME ZONE 'UTC')::date, COUNT(*)
+    FROM inserted_rows
+    GROUP BY 1, 2
+    ON CONFLICT (horizon, day) DO UPDATE SET
+        forecast_count = learning_forecast_rollup.forecast_count + EXCLUDED.forecast_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollup_realization_records_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO learning_realization_rollup (
+        horizon, day, realized_count, hit_count, abs_error_sum, signed_error_sum
+    )
+    SELECT
+        fr.horizon,
+        (ins.evaluated_at AT TIME ZONE 'UTC')::date,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE ins.hit),
+        SUM(ABS(ins.forecast_error)),
+        SUM(ins.forecast_error)
+    FROM inserted_rows ins
+    JOIN forecast_records fr ON fr.id = ins.forecast_id
+    GROUP BY 1, 2
+    ON CONFLICT (horizon, day) DO UPDATE SET
+        realized_count = learning_realization_rollup.realized_count + EXCLUDED.realized_count,
+        hit_count = learning_realization_rollup.hit_count + EXCLUDED.hit_count,
+        abs_error_sum = learning_realization_rollup.abs_error_sum + EXCLUDED.abs_error_sum,
+        signed_error_sum = learning_realization_rollup.signed_error_sum + EXCLUDED.signed_error_sum;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollup_forecast_error_attributions_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO forecast_error_category_rollup (
+        horizon, category, day, attribution_count, contribution_count, contribution_sum, abs_contribution_sum
+    )
+    SELECT
+        fr.horizon,
+        ins.category,
+        (rr.evaluated_at AT TIME ZONE 'UTC')::date,
+        COUNT(*),
+        COUNT(ins.contribution),
+        COALESCE(SUM(ins.contribution), 0),
+        COALESCE(SUM(ABS(ins.contribution)), 0)
+    FROM inserted_rows ins
+    JOIN realization_records rr ON rr.id = ins.realization_id
+    JOIN forecast_records fr ON fr.id = rr.forecast_id
+    GROUP BY 1, 2, 3
+    ON CONFLICT (horizon, category, day) DO UPDATE SET
+        attribution_count = forecast_error_category_rollup.attribution_count + EXCLUDED.attribution_count,
+        contribution_count = forecast_error_category_rollup.contribution_count + EXCLUDED.contribution_count,
+        contribution_sum = forecast_error_category_rollup.contribution_sum + EXCLUDED.contribution_sum,
+        abs_contribution_sum = forecast_error_category_rollup.abs_contribution_sum + EXCLUDED.abs_contribution_sum;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_rollup_forecast_records_insert ON forecast_records;
+CREATE TRIGGER trg_rollup_forecast_records_insert
+AFTER INSERT ON forecast_records
+REFERENCING NEW TABLE AS inserted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_forecast_records_insert();
+
+DROP TRIGGER IF EXISTS trg_rollup_realization_records_insert ON realization_records;
+CREATE TRIGGER trg_rollup_realization_records_insert
+AFTER INSERT ON realization_records
+REFERENCING NEW TABLE AS inserted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_realization_records_insert();
+
+DROP TRIGGER IF EXISTS trg_rollup_forecast_error_attributions_insert ON forecast_error_attributions;
+CREATE TRIGGER trg_rollup_forecast_error_attributions_insert
+AFTER INSERT ON forecast_error_attributions
+REFERENCING NEW TABLE AS inserted_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_forecast_error_attributions_insert();
+
+-- Initial backfill; later drift is repaired with `cli learning-rollup-rebuild`.
+DELETE FROM learning_forecast_rollup;
+INSERT INTO learning_forecast_rollup (horizon, day, forecast_count)
+SELECT horizon, (as_of AT TIME ZONE 'UTC')::date, COUNT(*)
+FROM forecast_records
+GROUP BY 1, 2;
+
+DELETE FROM learning_realization_rollup;
+INSERT INTO learning_realization_rollup (
+    horizon, day, realized_count, hit_count, abs_error_sum, signed_error_sum
+)
+SELECT
+    fr.horizon,
+    (rr.evaluated_at AT TIME ZONE 'UTC')::date,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE rr.hit),
+    SUM(ABS(rr.forecast_error)),
+    SUM(rr.forecast_error)
+FROM realization_records rr
+JOIN forecast_records fr ON fr.id = rr.forecast_id
+GROUP BY 1, 2;
+
+DELETE FROM forecast_error_category_rollup;
+INSERT INTO forecast_error_category_rollup (
+    horizon, category, day, attribution_count, contribution_count, contribution_sum, abs_contribution_sum
+)
+SELECT
+    fr.horizon,
+    fea.category,
+    (rr.evaluated_at AT TIME ZONE 'UTC')::date,
+    COUNT(*),
+    COUNT(fea.contribution),
+    COALESCE(SUM(fea.contribution), 0),
+    COALESCE(SUM(ABS(fea.contribution)), 0)
+FROM forecast_error_attributions fea
+JOIN realization_records rr ON rr.id = fea.realization_id
+JOIN forecast_records fr ON fr.id = rr.forecast_id
+GROUP BY 1, 2, 3;
@@ -0,0 +1,13 @@
+-- Policy benchmark materialized per day; maintained by PostgresRepository.refresh_benchmark_nav_daily
+-- whenever benchmark component points are written, rebuilt with `cli benchmark-nav-rebuild`.
+CREATE TABLE IF NOT EXISTS benchmark_nav_daily (
+    as_of DATE PRIMARY KEY,
+    qqq_return DOUBLE PRECISION NOT NULL,
+    kospi200_return DOUBLE PRECISION NOT NULL,
+    btc_return DOUBLE PRECISION NOT NULL,
+    sgov_return DOUBLE PRECISION NOT NULL,
+    benchmark_return DOUBLE PRECISION NOT NULL,
+    benchmark_nav DOUBLE PRECISION NOT NULL,
+    weights_version TEXT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,23 @@
+CREATE TABLE IF NOT EXISTS portfolio_positions (
+    id BIGSERIAL PRIMARY KEY,
+    as_of DATE NOT NULL,
+    symbol TEXT NOT NULL,
+    quantity NUMERIC NOT NULL,
+    currency TEXT NOT NULL,
+    asset_class TEXT NOT NULL,
+    region TEXT NOT NULL DEFAULT 'OTHER',
+    price_series_key TEXT,
+    is_leveraged BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT portfolio_positions_as_of_symbol_unique UNIQUE (as_of, symbol),
+    CONSTRAINT portfolio_positions_currency_code CHECK (currency ~ '^[A-Z]{3}$'),
+    CONSTRAINT portfolio_positions_asset_class_check CHECK (
+        asset_class IN ('equity', 'etf', 'crypto', 'bond', 'cash')
+    ),
+    CONSTRAINT portfolio_positions_region_check CHECK (
+        region IN ('US', 'KR', 'CRYPTO', 'OTHER')
+    )
+);
+
+CREATE INDEX IF NOT EXISTS portfolio_positions_as_of_idx
+    ON portfolio_positions (as_of DESC);
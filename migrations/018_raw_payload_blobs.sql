@@ -0,0 +1,33 @@
+-- Content-addressed payload storage: each distinct payload is stored once, compressed,
+-- and raw events / quarantine batches reference it by sha256 of its canonical JSON.
+CREATE TABLE IF NOT EXISTS raw_payload_blobs (
+    payload_hash TEXT PRIMARY KEY,
+    encoding TEXT NOT NULL DEFAULT 'zlib',
+    byte_size INTEGER NOT NULL,
+    body BYTEA NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT raw_payload_blobs_hash_format CHECK (payload_hash ~ '^[0-9a-f]{64}$')
+);
+
+-- Blobs are immutable once written; the hash is their identity.
+CREATE OR REPLACE FUNCTION prevent_raw_payload_blob_mutation()
+RETURNS TRIGGER AS $$
+BEGIN
+    RAISE EXCEPTION 'raw_payload_blobs is append-only';
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_prevent_raw_payload_blob_update ON raw_payload_blobs;
+CREATE TRIGGER trg_prevent_raw_payload_blob_update
+BEFORE UPDATE ON raw_payload_blobs
+FOR EACH ROW
+EXECUTE FUNCTION prevent_raw_payload_blob_mutation();
+
+-- New rows carry payload_hash and a NULL payload; rows written before this migration keep
+-- their inline JSON and are read back unchanged.
+ALTER TABLE raw_event_store ADD COLUMN IF NOT EXISTS payload_hash TEXT REFERENCES raw_payload_blobs (payload_hash);
+ALTER TABLE raw_event_store ALTER COLUMN payload DROP NOT NULL;
+ALTER TABLE quarantine_batches ADD COLUMN IF NOT EXISTS payload_hash TEXT REFERENCES raw_payload_blobs (payload_hash);
+
+CREATE INDEX IF NOT EXISTS idx_raw_event_payload_hash ON raw_event_store (payload_hash);
+CREATE INDEX IF NOT EXISTS idx_quarantine_payload_hash ON quarantine_batches (payload_hash);
@@ -0,0 +1,10 @@
+-- Persistent RevisionStore: one row per (idempotency key, revision), newest revision last.
+-- Lets run_ingestion_job skip unchanged payloads across runs and processes.
+CREATE TABLE IF NOT EXISTS payload_revisions (
+    idempotency_key TEXT NOT NULL,
+    revision_number INTEGER NOT NULL,
+    payload_hash TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (idempotency_key, revision_number),
+    CONSTRAINT payload_revisions_number_positive CHECK (revision_number > 0)
+);
@@ -0,0 +1,9 @@
+-- Accepted record schema per source for the batch quality profiler's schema_drift check.
+-- One row per source; a drifting batch leaves it unchanged, deleting the row accepts the next batch.
+CREATE TABLE IF NOT EXISTS source_schema_fingerprints (
+    source TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    field_types JSONB NOT NULL,
+    required_fields JSONB NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
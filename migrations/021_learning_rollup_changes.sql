@@ -0,0 +1,266 @@
+-- 015 keeps the learning rollups current on INSERT only. UPDATE and DELETE on the
+-- source tables recompute the (horizon, day) keys they touched from the base tables.
+-- Each refresh locks its rollup like `cli learning-rollup-rebuild`, so concurrent
+-- insert triggers either land before the recompute or add their delta after it.
+CREATE OR REPLACE FUNCTION refresh_learning_forecast_rollup(p_horizons TEXT[], p_days DATE[])
+RETURNS VOID AS $$
+BEGIN
+    IF p_horizons IS NULL THEN
+        RETURN;
+    END IF;
+    LOCK TABLE learning_forecast_rollup IN SHARE ROW EXCLUSIVE MODE;
+    DELETE FROM learning_forecast_rollup r
+    USING unnest(p_horizons, p_days) AS k(horizon, day)
+    WHERE r.horizon = k.horizon AND r.day = k.day;
+    INSERT INTO learning_forecast_rollup (horizon, day, forecast_count)
+    SELECT fr.horizon, (fr.as_of AT TIME ZONE 'UTC')::date, COUNT(*)
+    FROM forecast_records fr
+    JOIN (SELECT DISTINCT * FROM unnest(p_horizons, p_days)) AS k(horizon, day)
+      ON fr.horizon = k.horizon AND (fr.as_of AT TIME ZONE 'UTC')::date = k.day
+    GROUP BY 1, 2;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION refresh_learning_realization_rollup(p_horizons TEXT[], p_days DATE[])
+RETURNS VOID AS $$
+BEGIN
+    IF p_horizons IS NULL THEN
+        RETURN;
+    END IF;
+    LOCK TABLE learning_realization_rollup IN SHARE ROW EXCLUSIVE MODE;
+    DELETE FROM learning_realization_rollup r
+    USING unnest(p_horizons, p_days) AS k(horizon, day)
+    WHERE r.horizon = k.horizon AND r.day = k.day;
+    INSERT INTO learning_realization_rollup (
+        horizon, day, realized_count, hit_count, abs_error_sum, signed_error_sum
+    )
+    SELECT
+        fr.horizon,
+        (rr.evaluated_at AT TIME ZONE 'UTC')::date,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE rr.hit),
+        SUM(ABS(rr.forecast_error)),
+        SUM(rr.forecast_error)
+    FROM realization_records rr
+    JOIN forecast_records fr ON fr.id = rr.forecast_id
+    JOIN (SELECT DISTINCT * FROM unnest(p_horizons, p_days)) AS k(horizon, day)
+      ON fr.horizon = k.horizon AND (rr.evaluated_at AT TIME ZONE 'UTC')::date = k.day
+    GROUP BY 1, 2;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Keyed by (horizon, day): every category of a touched day is recomputed.
+CREATE OR REPLACE FUNCTION refresh_forecast_error_category_rollup(p_horizons TEXT[], p_days DATE[])
+RETURNS VOID AS $$
+BEGIN
+    IF p_horizons IS NULL THEN
+        RETURN;
+    END IF;
+    LOCK TABLE forecast_error_category_rollup IN SHARE ROW EXCLUSIVE MODE;
+    DELETE FROM forecast_error_category_rollup r
+    USING unnest(p_horizons, p_days) AS k(horizon, day)
+    WHERE r.horizon = k.horizon AND r.day = k.day;
+    INSERT INTO forecast_error_category_rollup (
+        horizon, category, day, attribution_count, contribution_count, contribution_sum, abs_contribution_sum
+    )
+    SELECT
+        fr.horizon,
+        fea.category,
+        (rr.evaluated_at AT TIME ZONE 'UTC')::date,
+        COUNT(*),
+        COUNT(fea.contribution),
+        COALESCE(SUM(fea.contribution), 0),
+        COALESCE(SUM(ABS(fea.contribution)), 0)
+    FROM forecast_error_attributions fea
+    JOIN realization_records rr ON rr.id = fea.realization_id
+    JOIN forecast_records fr ON fr.id = rr.forecast_id
+    JOIN (SELECT DISTINCT * FROM unnest(p_horizons, p_days)) AS k(horizon, day)
+      ON fr.horizon = k.horizon AND (rr.evaluated_at AT TIME ZONE 'UTC')::date = k.day
+    GROUP BY 1, 2, 3;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollup_forecast_records_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    horizons TEXT[];
+    days DATE[];
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        -- Realizations reference forecasts, so only realization-free forecasts get here.
+        SELECT array_agg(k.horizon), array_agg(k.day) INTO horizons, days
+        FROM (SELECT DISTINCT horizon, (as_of AT TIME ZONE 'UTC')::date AS day FROM old_rows) AS k;
+        PERFORM refresh_learning_forecast_rollup(horizons, days);
+        RETURN NULL;
+    END IF;
+
+    -- The forecast upsert rewrites estimates only; rollups move with horizon and as_of.
+    SELECT array_agg(k.horizon), array_agg(k.day) INTO horizons, days
+    FROM (
+        SELECT DISTINCT h.horizon, h.day
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        CROSS JOIN LATERAL (
+            VALUES
+                (o.horizon, (o.as_of AT TIME ZONE 'UTC')::date),
+                (n.horizon, (n.as_of AT TIME ZONE 'UTC')::date)
+        ) AS h(horizon, day)
+        WHERE o.horizon IS DISTINCT FROM n.horizon OR o.as_of IS DISTINCT FROM n.as_of
+    ) AS k;
+    PERFORM refresh_learning_forecast_rollup(horizons, days);
+
+    -- Realizations and attributions take their horizon from the forecast.
+    SELECT array_agg(k.horizon), array_agg(k.day) INTO horizons, days
+    FROM (
+        SELECT DISTINCT h.horizon, (rr.evaluated_at AT TIME ZONE 'UTC')::date AS day
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        JOIN realization_records rr ON rr.forecast_id = n.id
+        CROSS JOIN LATERAL (VALUES (o.horizon), (n.horizon)) AS h(horizon)
+        WHERE o.horizon IS DISTINCT FROM n.horizon
+    ) AS k;
+    PERFORM refresh_learning_realization_rollup(horizons, days);
+    PERFORM refresh_forecast_error_category_rollup(horizons, days);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollup_realization_records_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    horizons TEXT[];
+    days DATE[];
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        SELECT array_agg(k.horizon), array_agg(k.day) INTO horizons, days
+        FROM (
+            SELECT DISTINCT fr.horizon, (o.evaluated_at AT TIME ZONE 'UTC')::date AS day
+            FROM old_rows o
+            JOIN forecast_records fr ON fr.id = o.forecast_id
+        ) AS k;
+    ELSE
+        SELECT array_agg(k.horizon), array_agg(k.day) INTO horizons, days
+        FROM (
+            SELECT fr.horizon, (o.evaluated_at AT TIME ZONE 'UTC')::date AS day
+            FROM old_rows o
+            JOIN forecast_records fr ON fr.id = o.forecast_id
+            UNION
+            SELECT fr.horizon, (n.evaluated_at AT TIME ZONE 'UTC')::date
+            FROM new_rows n
+            JOIN forecast_records fr ON fr.id = n.forecast_id
+        ) AS k;
+    END IF;
+    PERFORM refresh_learning_realization_rollup(horizons, days);
+    -- Attributions bucket by their realization's evaluated_at.
+    PERFORM refresh_forecast_error_category_rollup(horizons, days);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rollup_forecast_error_attributions_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    horizons TEXT[];
+    days DATE[];
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        SELECT array_agg(k.horizon), array_agg(k.day) INTO horizons, days
+        FROM (
+            SELECT DISTINCT fr.horizon, (rr.evaluated_at AT TIME ZONE 'UTC')::date AS day
+            FROM old_rows o
+            JOIN realization_records rr ON rr.id = o.realization_id
+            JOIN forecast_records fr ON fr.id = rr.forecast_id
+        ) AS k;
+    ELSE
+        SELECT array_agg(k.horizon), array_agg(k.day) INTO horizons, days
+        FROM (
+            SELECT fr.horizon, (rr.evaluated_at AT TIME ZONE 'UTC')::date AS day
+            FROM old_rows o
+            JOIN realization_records rr ON rr.id = o.realization_id
+            JOIN forecast_records fr ON fr.id = rr.forecast_id
+            UNION
+            SELECT fr.horizon, (rr.evaluated_at AT TIME ZONE 'UTC')::date
+            FROM new_rows n
+            JOIN realization_records rr ON rr.id = n.realization_id
+            JOIN forecast_records fr ON fr.id = rr.forecast_id
+        ) AS k;
+    END IF;
+    PERFORM refresh_forecast_error_category_rollup(horizons, days);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_rollup_forecast_records_update ON forecast_records;
+CREATE TRIGGER trg_rollup_forecast_records_update
+AFTER UPDATE ON forecast_records
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_forecast_records_change();
+
+DROP TRIGGER IF EXISTS trg_rollup_forecast_records_delete ON forecast_records;
+CREATE TRIGGER trg_rollup_forecast_records_delete
+AFTER DELETE ON forecast_records
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_forecast_records_change();
+
+DROP TRIGGER IF EXISTS trg_rollup_realization_records_update ON realization_records;
+CREATE TRIGGER trg_rollup_realization_records_update
+AFTER UPDATE ON realization_records
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_realization_records_change();
+
+DROP TRIGGER IF EXISTS trg_rollup_realization_records_delete ON realization_records;
+CREATE TRIGGER trg_rollup_realization_records_delete
+AFTER DELETE ON realization_records
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_realization_records_change();
+
+DROP TRIGGER IF EXISTS trg_rollup_forecast_error_attributions_update ON forecast_error_attributions;
+CREATE TRIGGER trg_rollup_forecast_error_attributions_update
+AFTER UPDATE ON forecast_error_attributions
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_forecast_error_attributions_change();
+
+DROP TRIGGER IF EXISTS trg_rollup_forecast_error_attributions_delete ON forecast_error_attributions;
+CREATE TRIGGER trg_rollup_forecast_error_attributions_delete
+AFTER DELETE ON forecast_error_attributions
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_forecast_error_attributions_change();
+
+-- TRUNCATE fires no row-level transition tables; clear the rollups alongside it.
+CREATE OR REPLACE FUNCTION rollup_learning_truncate()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'forecast_records' THEN
+        TRUNCATE learning_forecast_rollup, learning_realization_rollup, forecast_error_category_rollup;
+    ELSIF TG_TABLE_NAME = 'realization_records' THEN
+        TRUNCATE learning_realization_rollup, forecast_error_category_rollup;
+    ELSE
+        TRUNCATE forecast_error_category_rollup;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_rollup_forecast_records_truncate ON forecast_records;
+CREATE TRIGGER trg_rollup_forecast_records_truncate
+AFTER TRUNCATE ON forecast_records
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_learning_truncate();
+
+DROP TRIGGER IF EXISTS trg_rollup_realization_records_truncate ON realization_records;
+CREATE TRIGGER trg_rollup_realization_records_truncate
+AFTER TRUNCATE ON realization_records
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_learning_truncate();
+
+DROP TRIGGER IF EXISTS trg_rollup_forecast_error_attributions_truncate ON forecast_error_attributions;
+CREATE TRIGGER trg_rollup_forecast_error_attributions_truncate
+AFTER TRUNCATE ON forecast_error_attributions
+FOR EACH STATEMENT
+EXECUTE FUNCTION rollup_learning_truncate();
@@ -0,0 +1,78 @@
+"""Benchmark: sniffed column date parsing vs. the per-value generic parser.
+
+Usage: python3 -m scripts.bench_date_parsing [--rows 50000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import date, timedelta
+
+from src.research import normalization
+
+
+def build_payloads(rows: int) -> dict[str, list[str]]:
+    start = date(1900, 1, 1)
+    return {
+        # FRED daily observations: one distinct ISO date per row.
+        "fred_daily": [(start + timedelta(days=idx)).isoformat() for idx in range(rows)],
+        # ECOS monthly statistics across many entities: few distinct YYYYMM labels.
+        "ecos_monthly": [f"{2000 + (idx // 12) % 25}{idx % 12 + 1:02d}" for idx in range(rows)],
+    }
+
+
+def _best_of(repeat: int, run) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(rows: int = 50_000, repeat: int = 3) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for name, values in build_payloads(rows).items():
+
+        def generic() -> None:
+            for value in values:
+                normalization._parse_datetime(value)
+
+        def sniffed_cold() -> None:
+            normalization._DATE_CACHE.clear()
+            parse = normalization.DateColumnParser()
+            for value in values:
+                parse(value)
+
+        def sniffed_warm() -> None:
+            parse = normalization.DateColumnParser()
+            for value in values:
+                parse(value)
+
+        generic_s = _best_of(repeat, generic)
+        cold_s = _best_of(repeat, sniffed_cold)
+        warm_s = _best_of(repeat, sniffed_warm)
+        results[name] = {
+            "rows": float(len(values)),
+            "generic_ms": round(generic_s * 1000, 1),
+            "sniffed_cold_ms": round(cold_s * 1000, 1),
+            "sniffed_warm_ms": round(warm_s * 1000, 1),
+            "speedup_cold": round(generic_s / cold_s, 1),
+            "speedup_warm": round(generic_s / warm_s, 1),
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    _ = parser.add_argument("--rows", type=int, default=50_000)
+    _ = parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.rows, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+"""Benchmark: streaming canonical hashing vs. hashing one json.dumps string.
+
+Usage: python3 -m scripts.bench_payload_hashing [--tags 400] [--entries 60] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import time
+import tracemalloc
+
+from src.ingestion import payload_blobs
+
+
+def build_payload(tags: int, entries: int) -> dict[str, object]:
+    """SEC companyfacts-shaped payload: many tags, each with a list of dated facts."""
+    return {
+        "source": "sec_edgar",
+        "entity_id": "0000320193",
+        "payload": {
+            "cik": 320193,
+            "facts": {
+                "us-gaap": {
+                    f"Tag{tag:04d}": {
+                        "label": f"Tag {tag}",
+                        "description": "Amount of the reported concept for the period. " * 3,
+                        "units": {
+                            "USD": [
+                                {
+                                    "end": f"{2000 + idx // 4}-{(idx % 4) * 3 + 3:02d}-30",
+                                    "val": tag * 1_000_003 + idx,
+                                    "accn": f"0000320193-{idx:02d}-0000{tag:02d}",
+                                    "fy": 2000 + idx // 4,
+                                    "fp": f"Q{idx % 4 + 1}",
+                                    "form": "10-Q",
+                                    "filed": f"{2000 + idx // 4}-{(idx % 4) * 3 + 4:02d}-28",
+                                    "frame": f"CY{2000 + idx // 4}Q{idx % 4 + 1}",
+                                }
+                                for idx in range(entries)
+                            ]
+                        },
+                    }
+                    for tag in range(tags)
+                }
+            },
+        },
+    }
+
+
+def _one_shot_hash(payload: dict[str, object]) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _measure(repeat: int, run) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmark(tags: int = 400, entries: int = 60, repeat: int = 3) -> dict[str, float]:
+    payload = build_payload(tags, entries)
+    one_shot_s, one_shot_peak = _measure(repeat, lambda: _one_shot_hash(payload))
+    streaming_s, streaming_peak = _measure(repeat, lambda: payload_blobs.canonical_payload_hash(payload))
+    if _one_shot_hash(payload) != payload_blobs.canonical_payload_hash(payload):
+        raise AssertionError("streaming hash differs from the one-shot hash")
+
+    # A job hashes the same payload for the revision check, the revision record and the blob.
+    def job_sites() -> None:
+        wrapped = payload_blobs.HashedPayload(payload)
+        for _ in range(3):
+            payload_blobs.canonical_payload_hash(wrapped)
+
+    memoized_s, _ = _measure(repeat, job_sites)
+    return {
+        "payload_mb": round(len(payload_blobs.canonical_payload_bytes(payload)) / 1e6, 2),
+        "one_shot_ms": round(one_shot_s * 1000, 1),
+        "one_shot_peak_mb": round(one_shot_peak / 1e6, 2),
+        "streaming_ms": round(streaming_s * 1000, 1),
+        "streaming_peak_mb": round(streaming_peak / 1e6, 2),
+        "job_three_sites_one_shot_ms": round(one_shot_s * 3000, 1),
+        "job_three_sites_memoized_ms": round(memoized_s * 1000, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    _ = parser.add_argument("--tags", type=int, default=400)
+    _ = parser.add_argument("--entries", type=int, default=60)
+    _ = parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.tags, args.entries, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
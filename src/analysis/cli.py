@@ -1,7 +1,7 @@
 """Command-line interface for the macro-analysis and stock-analysis data tools.
 
 Usage:
-    python -m src.analysis.cli series <source> <id> [--limit N]
+    python -m src.analysis.cli series <source> <id> [--limit N] [--entity ID]
     python -m src.analysis.cli news <category> [--limit N]
     python -m src.analysis.cli official <institution> [--limit N]
     python -m src.analysis.cli document <url> [--max-chars N]
@@ -31,7 +31,7 @@ from src.analysis.stock_client import DartStockClient, EdgarStockClient, FmpStoc
 
 def cmd_series(args: argparse.Namespace) -> None:
     client = CanonicalDataClient()
-    rows = client.read_series(args.source, args.id, limit=args.limit)
+    rows = client.read_series(args.source, args.id, limit=args.limit, entity_id=args.entity)
     print(json.dumps(rows, default=str, ensure_ascii=False, indent=2))
 
 
@@ -120,6 +120,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_series.add_argument("source", help="Data source (e.g. fred, ecos)")
     p_series.add_argument("id", help="Series metric_name (e.g. CPIAUCSL, 722Y001)")
     p_series.add_argument("--limit", type=int, default=12)
+    p_series.add_argument("--entity", default=None, help="Filer id for company metrics (CIK, DART corp_code)")
     p_series.set_defaults(func=cmd_series)
 
     # news
@@ -119,10 +119,10 @@ class CanonicalDataClient:
         )
 
     def read_series(
-        self, source: str, metric_name: str, limit: int = 12
+        self, source: str, metric_name: str, limit: int = 12, entity_id: str | None = None
     ) -> list[dict[str, object]]:
         try:
-            rows = self._repo.read_canonical_facts(source, metric_name, limit)
+            rows = self._repo.read_canonical_facts(source, metric_name, limit, entity_id=entity_id)
         except Exception:
             rows = []
 
@@ -1,14 +1,16 @@
 import os
 import math
 import importlib
+import threading
 from collections.abc import Mapping
 
-from src.ingestion.dashboard_service import REQUIRED_LEARNING_HORIZONS
+from src.ingestion.dashboard_service import REQUIRED_LEARNING_HORIZONS, dashboard_call_timeout_seconds
+from src.ingestion.view_cache import VIEW_CACHE, format_cache_caption, read_data_version
 
 PLACEHOLDER_STRINGS = {"", "-", "n/a", "na", "none", "null", "unknown"}
 CRITICAL_METRIC_KEYS = {
     "raw_events",
-    "canonical_events",
+    "canonical_facts",
     "quarantine_events",
     "forecast_count",
     "realized_count",
@@ -20,6 +22,8 @@ CRITICAL_METRIC_KEYS = {
     "evidence_gap_count",
 }
 
+ATTRIBUTION_DETAIL_CACHE_KEY = "attribution_gap_detail_cache"
+
 RELIABILITY_BADGES = {
     "reliable": "🟢 reliable",
     "low_sample": "🟠 low_sample",
@@ -53,7 +57,7 @@ KPI_LAYOUT_TIERS: tuple[tuple[str, tuple[str, ...]], ...] = (
         "Tier 2 · Core Pipeline",
         (
             "raw_events",
-            "canonical_events",
+            "canonical_facts",
             "quarantine_events",
             "forecast_count",
             "realized_count",
@@ -192,11 +196,12 @@ def build_operator_cards(view: Mapping[str, object]) -> dict[str, object]:
     counters = view.get("counters", {})
     if isinstance(counters, Mapping):
         raw_events = to_int_metric(counters.get("raw_events"))
-        canonical_events = to_int_metric(counters.get("canonical_events"))
+        # Precomputed snapshots written before the counter was renamed still say canonical_events.
+        canonical_facts = to_int_metric(counters.get("canonical_facts", counters.get("canonical_events")))
         quarantine_events = to_int_metric(counters.get("quarantine_events"))
     else:
         raw_events = _metric("n/a", status="unknown", reason="missing_block")
-        canonical_events = _metric("n/a", status="unknown", reason="missing_block")
+        canonical_facts = _metric("n/a", status="unknown", reason="missing_block")
         quarantine_events = _metric("n/a", status="unknown", reason="missing_block")
 
     learning = view.get("learning_metrics", {})
@@ -239,7 +244,7 @@ def build_operator_cards(view: Mapping[str, object]) -> dict[str, object]:
 
     metrics = {
         "raw_events": raw_events,
-        "canonical_events": canonical_events,
+        "canonical_facts": canonical_facts,
         "quarantine_events": quarantine_events,
         "forecast_count": forecast_count,
         "realized_count": realized_count,
@@ -398,12 +403,68 @@ def _primary_reliability(cards: Mapping[str, object]) -> tuple[str, str | None]:
     )
 
 
+_POOLED_REPOSITORIES: dict[str, object] = {}
+_POOLED_REPOSITORIES_LOCK = threading.Lock()
+
+
+def _pooled_repository(dsn: str) -> object:
+    # Streamlit reruns share the process, so the pool survives across renders;
+    # sessions run on separate threads, so creation is serialized.
+    with _POOLED_REPOSITORIES_LOCK:
+        repository = _POOLED_REPOSITORIES.get(dsn)
+        if repository is None:
+            postgres_repository = importlib.import_module("src.ingestion.postgres_repository")
+            # Queries abandoned by the per-call timeout are cancelled server-side too.
+            timeout_ms = int(dashboard_call_timeout_seconds() * 1000)
+            repository = postgres_repository.PostgresRepository.pooled(dsn, statement_timeout_ms=timeout_ms)
+            _POOLED_REPOSITORIES[dsn] = repository
+        return repository
+
+
 def load_dashboard_view(dsn: str) -> dict[str, object]:
     dashboard_service = importlib.import_module("src.ingestion.dashboard_service")
+    repository = _pooled_repository(dsn)
+    # The newest precomputed snapshot is one indexed read; rebuild live only once it is stale.
+    snapshot_view = dashboard_service.read_fresh_dashboard_snapshot(repository)
+    if isinstance(snapshot_view, dict):
+        return snapshot_view
+    build_dashboard_view = dashboard_service.build_dashboard_view
+    # Drill-through detail is loaded on demand for the selected row only.
+    return build_dashboard_view(repository, prefetch_attribution_details=False)
+
+
+def load_attribution_detail(
+    dsn: str,
+    attribution_id: int,
+    max_preview_chars: int = 240,
+) -> dict[str, object] | None:
     postgres_repository = importlib.import_module("src.ingestion.postgres_repository")
     repository = postgres_repository.PostgresRepository(dsn=dsn)
-    build_dashboard_view = dashboard_service.build_dashboard_view
-    return build_dashboard_view(repository)
+    return repository.read_forecast_error_attribution_detail(
+        attribution_id=attribution_id,
+        max_preview_chars=max_preview_chars,
+    )
+
+
+def _resolve_attribution_detail(
+    st: object,
+    dsn: str,
+    view: Mapping[str, object],
+    attribution_id: int,
+) -> dict[str, object] | None:
+    detail_map = view.get("attribution_gap_details", {})
+    if isinstance(detail_map, Mapping) and isinstance(detail_map.get(attribution_id), Mapping):
+        return dict(detail_map[attribution_id])
+
+    session_state = getattr(st, "session_state", None)
+    cache = session_state.setdefault(ATTRIBUTION_DETAIL_CACHE_KEY, {}) if session_state is not None else {}
+    if attribution_id not in cache:
+        try:
+            cache[attribution_id] = load_attribution_detail(dsn, attribution_id)
+        except Exception:
+            return None
+    detail = cache.get(attribution_id)
+    return detail if isinstance(detail, Mapping) else None
 
 
 def update_refresh_request_status(
@@ -417,25 +478,40 @@ def update_refresh_request_status(
 ) -> dict[str, object] | None:
     postgres_repository = importlib.import_module("src.ingestion.postgres_repository")
     repository = postgres_repository.PostgresRepository(dsn=dsn)
-    return repository.update_refresh_request_status(
+    updated = repository.update_refresh_request_status(
         request_id=request_id,
         status=status,
         handler=handler,
         result_message=result_message,
         ingestion_run_id=ingestion_run_id,
     )
+    # The operator's own write must show on the next rerun, not after the cache TTL.
+    VIEW_CACHE.invalidate()
+    return updated
 
 
 def run_streamlit_app(dsn: str, *, configure_page: bool = True) -> None:
     st = importlib.import_module("streamlit")
 
-    view = load_dashboard_view(dsn)
+    cached = VIEW_CACHE.get_or_load(
+        "operator.dashboard",
+        dsn,
+        load_dashboard_view,
+        data_version=read_data_version(_pooled_repository(dsn)),
+    )
+    view = cached.value if isinstance(cached.value, dict) else {}
     cards = build_operator_cards(view)
 
     if configure_page:
         st.set_page_config(page_title="Ingestion Operator Dashboard", layout="wide")
     st.title("Ingestion Operator Dashboard")
     st.caption("Manual update monitoring (cron separated)")
+    data_source = view.get("data_source", {})
+    if isinstance(data_source, Mapping) and data_source.get("kind") == "snapshot":
+        age_seconds = data_source.get("age_seconds")
+        age_label = f"{float(age_seconds):.0f}s old" if isinstance(age_seconds, (int, float)) else "age unknown"
+        st.caption(f"Data as of snapshot computed at {data_source.get('computed_at')} ({age_label})")
+    st.caption(format_cache_caption(cached))
 
     if cards["has_critical_metric_alert"]:
         st.warning(
@@ -446,6 +522,14 @@ def run_streamlit_app(dsn: str, *, configure_page: bool = True) -> None:
             "Primary horizon (1M) learning metrics are not yet statistically reliable; treat KPI changes as directional only."
         )
 
+    load_timings = view.get("load_timings", {})
+    degraded_calls = load_timings.get("degraded_calls") if isinstance(load_timings, Mapping) else None
+    if isinstance(degraded_calls, list) and degraded_calls:
+        st.warning(
+            "Some panels fell back to defaults after a slow or failed read: "
+            + ", ".join(str(key) for key in degraded_calls)
+        )
+
     deployed_access = cards.get("deployed_access", {})
     if isinstance(deployed_access, Mapping):
         deploy_access_mode = str(deployed_access.get("deploy_access_mode", "public")).lower()
@@ -485,10 +569,10 @@ def run_streamlit_app(dsn: str, *, configure_page: bool = True) -> None:
         ),
         "evidence_gap_count": ("No-Evd Attr", cards["evidence_gap_count"], cards["evidence_gap_pct"]),
         "raw_events": ("Raw", cards["raw_events"], _metric_delta(cards, "raw_events")),
-        "canonical_events": (
+        "canonical_facts": (
             "Canonical",
-            cards["canonical_events"],
-            _metric_delta(cards, "canonical_events"),
+            cards["canonical_facts"],
+            _metric_delta(cards, "canonical_facts"),
         ),
         "quarantine_events": (
             "Quarantine",
@@ -601,8 +685,7 @@ def run_streamlit_app(dsn: str, *, configure_page: bool = True) -> None:
                     attribution_ids,
                     key="attribution_gap_drillthrough_id",
                 )
-                detail_map = view.get("attribution_gap_details", {})
-                detail = detail_map.get(selected_id) if isinstance(detail_map, Mapping) else None
+                detail = _resolve_attribution_detail(st, dsn, view, int(selected_id))
                 selected_row = next(
                     (
                         row
@@ -692,6 +775,22 @@ def run_streamlit_app(dsn: str, *, configure_page: bool = True) -> None:
     else:
         st.info("No run history found.")
 
+    if isinstance(load_timings, Mapping) and load_timings:
+        with st.expander("Data load timings", expanded=False):
+            total_ms = load_timings.get("total_ms")
+            if isinstance(total_ms, (int, float)):
+                st.caption(f"Total load: {float(total_ms):.0f} ms")
+            call_timings = load_timings.get("calls")
+            if isinstance(call_timings, Mapping):
+                st.dataframe(
+                    [
+                        {"call": key, **timing}
+                        for key, timing in call_timings.items()
+                        if isinstance(timing, Mapping)
+                    ],
+                    use_container_width=True,
+                )
+
 
 def main() -> None:
     dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
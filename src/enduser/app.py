@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import importlib
 
+from src.enduser.downsampling import downsample_rows
 from src.enduser.macro_signal_reader import read_latest_macro_regime_signal
 from src.enduser.performance_service import build_performance_view
 from src.enduser.signals import render_macro_regime_card
 from src.ingestion.postgres_repository import PostgresRepository
+from src.ingestion.view_cache import VIEW_CACHE, format_cache_caption, read_data_version
 
 
 def _format_pct(value: object, precision: int = 2) -> str:
@@ -35,40 +37,8 @@ def _format_pp(value: object, precision: int = 2) -> str:
         return "n/a"
 
 
-def _render_portfolio_tab(st: object, dsn: str) -> None:
-    repository = PostgresRepository(dsn=dsn)
-    performance = build_performance_view(repository)
-
-    nav_series = performance.get("nav_series", [])
-    if not isinstance(nav_series, list) or not nav_series:
-        st.info("포트폴리오 스냅샷이 없습니다.")
-        return
-
-    total_return_pct = performance.get("total_return_pct")
-    mdd_pct = performance.get("mdd_pct")
-    sharpe_ratio = performance.get("sharpe_ratio")
-    alpha_pct = performance.get("alpha_pct")
-
-    c1, c2, c3, c4 = st.columns(4)
-    c1.metric("총수익률", _format_pct(total_return_pct))
-    c2.metric("MDD", _format_pct(mdd_pct))
-    c3.metric("Sharpe", _format_ratio(sharpe_ratio))
-    c4.metric("알파(vs 벤치마크)", _format_pct(alpha_pct))
-
-    if bool(performance.get("mdd_alert")):
-        policy_limit_pct = performance.get("policy_mdd_limit_pct")
-        mdd_policy_buffer_pp = performance.get("mdd_policy_buffer_pp")
-        if mdd_policy_buffer_pp is not None and float(mdd_policy_buffer_pp) > 0:
-            st.warning(
-                f"⚠️ MDD {_format_pct(mdd_pct)} — 정책 한계({_format_pct(policy_limit_pct)})까지 "
-                f"{_format_pp(mdd_policy_buffer_pp)} 남음"
-            )
-        else:
-            st.warning(
-                f"⚠️ MDD {_format_pct(mdd_pct)} — 정책 한계({_format_pct(policy_limit_pct)})를 초과했습니다"
-            )
-
-    benchmark_series = performance.get("benchmark_series", [])
+def _nav_chart_rows(nav_series: list[dict[str, object]], benchmark_series: object) -> list[object]:
+    # Fallback for view models built without a precomputed chart_series.
     benchmark_map: dict[str, float] = {}
     if isinstance(benchmark_series, list):
         for row in benchmark_series:
@@ -105,6 +75,97 @@ def _render_portfolio_tab(st: object, dsn: str) -> None:
                 }
             )
 
+    return list(downsample_rows(chart_rows, ["portfolio_nav_index", "benchmark_nav_index"]))
+
+
+def _render_risk_section(st: object, risk: dict[str, object]) -> None:
+    st.subheader("리스크")
+    var = risk.get("var")
+    cvar = risk.get("cvar")
+    current_drawdown = risk.get("current_drawdown")
+    confidence = risk.get("var_confidence")
+    confidence_label = f"{float(confidence) * 100:.0f}%" if isinstance(confidence, (int, float)) else ""
+
+    r1, r2, r3, r4 = st.columns(4)
+    r1.metric(f"VaR {confidence_label}", _format_pct(float(var) * 100 if var is not None else None))
+    r2.metric(f"CVaR {confidence_label}", _format_pct(float(cvar) * 100 if cvar is not None else None))
+    r3.metric("베타(vs 벤치마크)", _format_ratio(risk.get("beta")))
+    r4.metric(
+        "현재 낙폭",
+        _format_pct(float(current_drawdown) * 100 if current_drawdown is not None else None),
+    )
+
+    rolling = risk.get("rolling")
+    if isinstance(rolling, dict):
+        volatility_rows: dict[str, dict[str, object]] = {}
+        for window, rows in rolling.items():
+            if not isinstance(rows, list):
+                continue
+            for row in rows:
+                if isinstance(row, dict) and row.get("as_of"):
+                    point = volatility_rows.setdefault(str(row["as_of"]), {"as_of": row["as_of"]})
+                    point[f"volatility_{window}d"] = row.get("volatility")
+        if volatility_rows:
+            volatility_keys = [f"volatility_{window}d" for window in rolling]
+            st.line_chart(
+                downsample_rows([volatility_rows[key] for key in sorted(volatility_rows)], volatility_keys),
+                x="as_of",
+                y=volatility_keys,
+            )
+
+    drawdown_series = risk.get("drawdown_series")
+    if isinstance(drawdown_series, list) and drawdown_series:
+        st.area_chart(downsample_rows(drawdown_series, ["drawdown"]), x="as_of", y="drawdown")
+    max_duration = risk.get("max_drawdown_duration_days")
+    if max_duration:
+        st.caption(f"최장 낙폭 기간: {max_duration}일")
+
+
+def _render_portfolio_tab(st: object, dsn: str, data_version: str | None = None) -> None:
+    repository = PostgresRepository(dsn=dsn)
+    cached = VIEW_CACHE.get_or_load(
+        "enduser.performance",
+        dsn,
+        lambda _dsn: build_performance_view(repository),
+        data_version=data_version,
+    )
+    performance = cached.value if isinstance(cached.value, dict) else {}
+
+    nav_series = performance.get("nav_series", [])
+    if not isinstance(nav_series, list) or not nav_series:
+        st.info("포트폴리오 스냅샷이 없습니다.")
+        return
+
+    st.caption(format_cache_caption(cached))
+
+    total_return_pct = performance.get("total_return_pct")
+    mdd_pct = performance.get("mdd_pct")
+    sharpe_ratio = performance.get("sharpe_ratio")
+    alpha_pct = performance.get("alpha_pct")
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("총수익률", _format_pct(total_return_pct))
+    c2.metric("MDD", _format_pct(mdd_pct))
+    c3.metric("Sharpe", _format_ratio(sharpe_ratio))
+    c4.metric("알파(vs 벤치마크)", _format_pct(alpha_pct))
+
+    if bool(performance.get("mdd_alert")):
+        policy_limit_pct = performance.get("policy_mdd_limit_pct")
+        mdd_policy_buffer_pp = performance.get("mdd_policy_buffer_pp")
+        if mdd_policy_buffer_pp is not None and float(mdd_policy_buffer_pp) > 0:
+            st.warning(
+                f"⚠️ MDD {_format_pct(mdd_pct)} — 정책 한계({_format_pct(policy_limit_pct)})까지 "
+                f"{_format_pp(mdd_policy_buffer_pp)} 남음"
+            )
+        else:
+            st.warning(
+                f"⚠️ MDD {_format_pct(mdd_pct)} — 정책 한계({_format_pct(policy_limit_pct)})를 초과했습니다"
+            )
+
+    chart_rows = performance.get("chart_series")
+    if not isinstance(chart_rows, list):
+        chart_rows = _nav_chart_rows(nav_series, performance.get("benchmark_series", []))
+
     if chart_rows:
         st.line_chart(
             chart_rows,
@@ -112,6 +173,10 @@ def _render_portfolio_tab(st: object, dsn: str) -> None:
             y=["portfolio_nav_index", "benchmark_nav_index"],
         )
 
+    risk = performance.get("risk")
+    if isinstance(risk, dict) and risk.get("drawdown_series"):
+        _render_risk_section(st, risk)
+
     allocation_pairs = [
         ("US", performance.get("us_weight_pct")),
         ("KR", performance.get("kr_weight_pct")),
@@ -149,11 +214,18 @@ def run_enduser_app(dsn: str, *, configure_page: bool = True) -> None:
     st.caption("Investor workspace (paper-trade intelligence).")
 
     portfolio_tab, signals_tab = st.tabs(["Portfolio", "Signals"])
+    # One version read per rerun, shared by every cached view on the page.
+    data_version = read_data_version(PostgresRepository(dsn=dsn))
 
     with portfolio_tab:
-        _render_portfolio_tab(st, dsn)
+        _render_portfolio_tab(st, dsn, data_version)
 
     with signals_tab:
-        regime_signal = read_latest_macro_regime_signal(dsn)
+        regime_signal = VIEW_CACHE.get_or_load(
+            "enduser.macro_regime_signal",
+            dsn,
+            read_latest_macro_regime_signal,
+            data_version=data_version,
+        ).value
         render_macro_regime_card(regime_signal=regime_signal, dsn=dsn)
         st.info("More signal cards coming soon")
@@ -1,139 +1,209 @@
 from __future__ import annotations
 
-import os
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
 from collections.abc import Mapping
-from datetime import date, datetime
-
-BENCHMARK_COMPONENTS: tuple[str, ...] = ("QQQ", "KOSPI200", "BTC", "SGOV")
-DEFAULT_BENCHMARK_WEIGHTS: dict[str, float] = {
-    "QQQ": 0.45,
-    "KOSPI200": 0.25,
-    "BTC": 0.20,
-    "SGOV": 0.10,
-}
-WEIGHT_ENV_MAP: dict[str, str] = {
-    "QQQ": "BENCHMARK_WEIGHT_QQQ",
-    "KOSPI200": "BENCHMARK_WEIGHT_KOSPI200",
-    "BTC": "BENCHMARK_WEIGHT_BTC",
-    "SGOV": "BENCHMARK_WEIGHT_SGOV",
-}
-
-
-def _parse_as_of(raw: object) -> date | None:
-    if raw is None:
-        return None
-    if isinstance(raw, datetime):
-        return raw.date()
-    if isinstance(raw, date):
-        return raw
-    text = str(raw).strip()
-    if not text:
+from datetime import date, datetime, time, timezone
+
+from src.research.benchmark import (
+    BENCHMARK_CALENDAR,
+    BENCHMARK_COMPONENTS,
+    COMPONENT_POINT_LIMIT,
+    ComponentLevels,
+    benchmark_nav_rows,
+    benchmark_weights_version,
+    build_component_levels,
+    daily_levels_from_rows,
+    load_benchmark_weights,
+    parse_as_of,
+)
+from src.research.trading_calendar import CALENDARS
+
+DEFAULT_COMPONENT_CACHE_MAX_ENTRIES = 64
+
+
+def _append_component_tail(
+    cached: ComponentLevels,
+    tail_rows: list[object],
+    last_as_of: object,
+) -> ComponentLevels:
+    """Merge points from the cached last day onward into the cached levels."""
+    cut_day = cached.level_days[-1]
+    keep = bisect_left(cached.level_days, cut_day)
+    tail = {day: level for day, level in daily_levels_from_rows(tail_rows).items() if day >= cut_day}
+    level_days = cached.level_days[:keep]
+    levels = cached.levels[:keep]
+    for day in sorted(tail):
+        level_days.append(day)
+        levels.append(tail[day])
+
+    # Stay within the same window a full rebuild would read.
+    overflow = len(level_days) - COMPONENT_POINT_LIMIT
+    if overflow > 0:
+        del level_days[:overflow]
+        del levels[:overflow]
+    return ComponentLevels(cached.metric_key, last_as_of, level_days, levels)
+
+
+class ComponentLevelCache:
+    """Process-wide cache of per-component daily levels keyed by (metric_key, last as_of).
+
+    A changed newest ``as_of`` triggers a tail read from the cached last day instead of a
+    full reload, so a page load after ingestion only pays for the new points.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_COMPONENT_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str], ComponentLevels] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {"hits": 0, "tail_refreshes": 0, "full_loads": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def get(self, scope: str, metric_key: str) -> ComponentLevels | None:
+        with self._lock:
+            entry = self._entries.get((scope, metric_key))
+            if entry is not None:
+                self._entries.move_to_end((scope, metric_key))
+            return entry
+
+    def put(self, scope: str, entry: ComponentLevels) -> None:
+        with self._lock:
+            self._entries[(scope, entry.metric_key)] = entry
+            self._entries.move_to_end((scope, entry.metric_key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def load(self, repository: object, metric_key: str, latest_as_of: object) -> ComponentLevels:
+        scope = getattr(repository, "cache_scope", None)
+        cached = self.get(scope, metric_key) if isinstance(scope, str) else None
+        if cached is not None and latest_as_of is not None and str(cached.last_as_of) == str(latest_as_of):
+            self._count("hits")
+            return cached
+
+        read_since = getattr(repository, "read_macro_series_points_since", None)
+        if cached is not None and latest_as_of is not None and callable(read_since) and len(cached.level_days):
+            # Start a day early so as_of values stored in non-UTC offsets still cover the cut day.
+            since = datetime.combine(date.fromordinal(cached.level_days[-1] - 1), time.min, tzinfo=timezone.utc)
+            tail_rows = read_since(metric_key, since, limit=COMPONENT_POINT_LIMIT)
+            # A tail as long as a full read means a large backfill; rebuild instead of merging.
+            if len(tail_rows) < COMPONENT_POINT_LIMIT:
+                entry = _append_component_tail(cached, tail_rows, latest_as_of)
+                self.put(scope, entry)  # type: ignore[arg-type]
+                self._count("tail_refreshes")
+                return entry
+
+        rows = repository.read_macro_series_points(metric_key, limit=COMPONENT_POINT_LIMIT)
+        entry = build_component_levels(metric_key, rows, latest_as_of)
+        self._count("full_loads")
+        # Without a scope or a version to validate against, the entry could never be trusted again.
+        if isinstance(scope, str) and latest_as_of is not None:
+            self.put(scope, entry)
+        return entry
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+COMPONENT_LEVEL_CACHE = ComponentLevelCache()
+
+
+def _read_latest_as_of(repository: object) -> dict[str, object]:
+    read_latest = getattr(repository, "read_macro_series_latest_as_of", None)
+    if not callable(read_latest):
+        return {}
+    try:
+        latest = read_latest(list(BENCHMARK_COMPONENTS))
+    except Exception:
+        return {}
+    return latest if isinstance(latest, dict) else {}
+
+
+def _materialized_through(latest: Mapping[str, object], end: date) -> date:
+    """Last benchmark day stored rows must reach: *end*, or the newest day every component has."""
+    through = end
+    days = [parse_as_of(latest.get(key)) for key in BENCHMARK_COMPONENTS]
+    if all(day is not None for day in days):
+        through = min(through, *days)  # type: ignore[type-var]
+    calendar = CALENDARS[BENCHMARK_CALENDAR]
+    if calendar.is_session(through):
+        return through
+    return calendar.previous_session(through) or through
+
+
+def _read_materialized_series(
+    repository: object,
+    start: date,
+    end: date,
+    weights_version: str,
+    through: date,
+) -> list[dict[str, object]] | None:
+    """Range scan of benchmark_nav_daily, or None when it is unavailable, built with other
+    weights or stops before *through* (a failed or lagging refresh)."""
+    read_range = getattr(repository, "read_benchmark_nav_range", None)
+    if not callable(read_range):
         return None
-    if text.endswith("Z"):
-        text = text[:-1] + "+00:00"
     try:
-        return datetime.fromisoformat(text).date()
-    except ValueError:
+        rows = read_range(start, end)
+    except Exception:
         return None
-
-
-def _load_weights() -> dict[str, float]:
-    weights = dict(DEFAULT_BENCHMARK_WEIGHTS)
-    for key, env_name in WEIGHT_ENV_MAP.items():
-        raw = os.getenv(env_name)
-        if raw is None or raw.strip() == "":
-            continue
-        try:
-            parsed = float(raw)
-        except ValueError:
-            continue
-        if parsed < 0:
-            continue
-        weights[key] = parsed
-
-    total_weight = sum(weights.values())
-    if total_weight <= 0:
-        return dict(DEFAULT_BENCHMARK_WEIGHTS)
-
-    # Keep benchmark return scale stable even when env overrides are partially set.
-    return {key: value / total_weight for key, value in weights.items()}
-
-
-def _build_daily_levels(repository: object, metric_key: str) -> dict[date, float]:
-    rows = repository.read_macro_series_points(metric_key, limit=10_000)
-    levels: dict[date, float] = {}
-    for row in rows:
-        if not isinstance(row, Mapping):
-            continue
-        day = _parse_as_of(row.get("as_of"))
-        if day is None or day in levels:
-            continue
-        value = row.get("value")
-        try:
-            levels[day] = float(value)  # type: ignore[arg-type]
-        except (TypeError, ValueError):
-            continue
-    return levels
-
-
-def _build_daily_returns(levels: dict[date, float]) -> dict[date, float]:
-    returns: dict[date, float] = {}
-    ordered_days = sorted(levels.keys())
-    for idx in range(1, len(ordered_days)):
-        prev_day = ordered_days[idx - 1]
-        day = ordered_days[idx]
-        prev_value = levels[prev_day]
-        current_value = levels[day]
-        if prev_value == 0:
-            continue
-        returns[day] = (current_value / prev_value) - 1.0
-    return returns
-
-
-def compute_benchmark_series(repository: object, start_date: object, end_date: object) -> list[dict[str, object]]:
+    if not rows or any(row.get("weights_version") != weights_version for row in rows):
+        return None
+    last_day = parse_as_of(rows[-1].get("as_of"))
+    if last_day is None or last_day < through:
+        return None
+    base_nav = float(rows[0].get("base_nav") or 1.0)
+    return [
+        {
+            "as_of": str(parse_as_of(row.get("as_of"))),
+            "benchmark_return": float(row["benchmark_return"]),
+            "benchmark_nav": float(row["benchmark_nav"]) / base_nav,
+        }
+        for row in rows
+    ]
+
+
+def compute_benchmark_series(
+    repository: object,
+    start_date: object,
+    end_date: object,
+    cache: ComponentLevelCache | None = None,
+) -> list[dict[str, object]]:
     """Compute weighted daily return / indexed NAV series for policy benchmark.
 
-    Returns [{as_of, benchmark_return, benchmark_nav}, ...] for dates where all
-    benchmark components have an available daily return.
+    Returns [{as_of, benchmark_return, benchmark_nav}, ...] for each US|KR session
+    (BENCHMARK_CALENDAR) between the first and last day every component has a level.
+    Components are forward-filled onto that calendar for up to BENCHMARK_MAX_FILL_DAYS,
+    so a closed market contributes a zero return; a longer gap drops the day. Reads the
+    materialized benchmark_nav_daily table when it matches the current weights and reaches
+    the newest day every component has (or *end_date*), otherwise computes from cached
+    component levels.
     """
 
-    start = _parse_as_of(start_date)
-    end = _parse_as_of(end_date)
+    start = parse_as_of(start_date)
+    end = parse_as_of(end_date)
     if start is None or end is None or start > end:
         return []
 
-    weights = _load_weights()
-    per_component_returns: dict[str, dict[date, float]] = {}
-    for metric_key in BENCHMARK_COMPONENTS:
-        levels = _build_daily_levels(repository, metric_key)
-        per_component_returns[metric_key] = _build_daily_returns(levels)
-
-    if not per_component_returns:
-        return []
-
-    common_dates: set[date] | None = None
-    for metric_key in BENCHMARK_COMPONENTS:
-        metric_dates = set(per_component_returns[metric_key].keys())
-        common_dates = metric_dates if common_dates is None else common_dates & metric_dates
-
-    if not common_dates:
-        return []
-
-    nav = 1.0
-    series: list[dict[str, object]] = []
-    for day in sorted(common_dates):
-        if day < start or day > end:
-            continue
-        benchmark_return = 0.0
-        for metric_key in BENCHMARK_COMPONENTS:
-            benchmark_return += weights.get(metric_key, 0.0) * per_component_returns[metric_key][day]
-        nav *= 1.0 + benchmark_return
-        series.append(
-            {
-                "as_of": day.isoformat(),
-                "benchmark_return": benchmark_return,
-                "benchmark_nav": nav,
-            }
-        )
-
-    return series
+    weights = load_benchmark_weights()
+    latest = _read_latest_as_of(repository)
+    materialized = _read_materialized_series(
+        repository, start, end, benchmark_weights_version(weights), _materialized_through(latest, end)
+    )
+    if materialized is not None:
+        return materialized
+
+    cache = cache if cache is not None else COMPONENT_LEVEL_CACHE
+    components = [cache.load(repository, metric_key, latest.get(metric_key)) for metric_key in BENCHMARK_COMPONENTS]
+    return [
+        {
+            "as_of": row["as_of"].isoformat(),  # type: ignore[union-attr]
+            "benchmark_return": row["benchmark_return"],
+            "benchmark_nav": row["benchmark_nav"],
+        }
+        for row in benchmark_nav_rows(components, weights, start, end)
+    ]
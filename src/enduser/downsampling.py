@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+
+DEFAULT_CHART_MAX_POINTS = 600
+
+
+def chart_max_points() -> int:
+    raw = os.getenv("CHART_MAX_POINTS")
+    if raw is None or raw.strip() == "":
+        return DEFAULT_CHART_MAX_POINTS
+    try:
+        parsed = int(raw)
+    except ValueError:
+        return DEFAULT_CHART_MAX_POINTS
+    return parsed if parsed >= 3 else DEFAULT_CHART_MAX_POINTS
+
+
+def lttb_indices(values: Sequence[float], threshold: int) -> list[int]:
+    """Largest-Triangle-Three-Buckets over evenly spaced x; returns kept indices in order."""
+    count = len(values)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    kept = [0]
+    bucket_size = (count - 2) / (threshold - 2)
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(math.floor(bucket * bucket_size)) + 1
+        end = int(math.floor((bucket + 1) * bucket_size)) + 1
+        next_start = end
+        next_end = min(int(math.floor((bucket + 2) * bucket_size)) + 1, count)
+        if next_start >= next_end:
+            next_start, next_end = count - 1, count
+        avg_x = (next_start + next_end - 1) / 2.0
+        avg_y = sum(values[next_start:next_end]) / (next_end - next_start)
+
+        prev_y = values[previous]
+        best_idx = start
+        best_area = -1.0
+        for idx in range(start, min(end, count - 1)):
+            area = abs((previous - avg_x) * (values[idx] - prev_y) - (previous - idx) * (avg_y - prev_y))
+            if area > best_area:
+                best_area = area
+                best_idx = idx
+        kept.append(best_idx)
+        previous = best_idx
+    kept.append(count - 1)
+    return kept
+
+
+def minmax_indices(values: Sequence[float], threshold: int) -> list[int]:
+    """Min/max bucketing: keep each bucket's lowest and highest point (about *threshold* points)."""
+    count = len(values)
+    if threshold >= count or threshold < 4:
+        return list(range(count))
+
+    buckets = max(1, (threshold - 2) // 2)
+    bucket_size = (count - 2) / buckets
+    kept = {0, count - 1}
+    for bucket in range(buckets):
+        start = int(math.floor(bucket * bucket_size)) + 1
+        end = min(int(math.floor((bucket + 1) * bucket_size)) + 1, count - 1)
+        if start >= end:
+            continue
+        window = range(start, end)
+        kept.add(min(window, key=values.__getitem__))
+        kept.add(max(window, key=values.__getitem__))
+    return sorted(kept)
+
+
+def max_drawdown_indices(values: Sequence[float]) -> tuple[int, int] | None:
+    """(peak, trough) indices of the deepest peak-to-trough decline, or None when there is none."""
+    if not values:
+        return None
+    peak_idx = 0
+    best: tuple[int, int] | None = None
+    best_drawdown = 0.0
+    for idx, value in enumerate(values):
+        if value > values[peak_idx]:
+            peak_idx = idx
+            continue
+        if values[peak_idx] > 0:
+            drawdown = (value / values[peak_idx]) - 1.0
+            if drawdown < best_drawdown:
+                best_drawdown = drawdown
+                best = (peak_idx, idx)
+    return best
+
+
+def downsample_rows(
+    rows: Sequence[Mapping[str, Any]],
+    y_keys: Sequence[str],
+    max_points: int | None = None,
+    method: str = "lttb",
+) -> list[Mapping[str, Any]]:
+    """Reduce chart rows to about *max_points*, shaped by the first y key.
+
+    The global min/max of every y key and the deepest drawdown of the first key are
+    always kept, so the rendered chart never hides a peak or trough.
+    """
+    target = max_points if max_points is not None else chart_max_points()
+    if len(rows) <= target or not y_keys:
+        return list(rows)
+
+    primary: list[float] = []
+    last_value = 0.0
+    for row in rows:
+        value = row.get(y_keys[0])
+        # Gaps carry the previous value so they neither create nor hide extremes.
+        if isinstance(value, (int, float)) and math.isfinite(value):
+            last_value = float(value)
+        primary.append(last_value)
+
+    if method == "minmax":
+        kept = set(minmax_indices(primary, target))
+    elif method == "lttb":
+        kept = set(lttb_indices(primary, target))
+    else:
+        raise ValueError("method must be 'lttb' or 'minmax'")
+
+    for key in y_keys:
+        present = [
+            (float(row[key]), idx)
+            for idx, row in enumerate(rows)
+            if isinstance(row.get(key), (int, float)) and math.isfinite(row[key])
+        ]
+        if present:
+            kept.add(min(present)[1])
+            kept.add(max(present)[1])
+    drawdown = max_drawdown_indices(primary)
+    if drawdown is not None:
+        kept.update(drawdown)
+    return [rows[idx] for idx in sorted(kept)]
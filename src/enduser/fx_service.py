@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+
+from src.research.fx import fx_candidate_keys
+
+
+DEFAULT_FX_MAX_LAG_DAYS = 5
+DEFAULT_FX_CACHE_MAX_ENTRIES = 32
+
+
+def _parse_as_of(raw: object) -> date | None:
+    if isinstance(raw, datetime):
+        return raw.date()
+    if isinstance(raw, date):
+        return raw
+    if isinstance(raw, str) and raw.strip():
+        text = raw.strip()
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        try:
+            return datetime.fromisoformat(text).date()
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass(frozen=True)
+class FxRateSeries:
+    """Daily *base_currency* per *currency* rates as parallel ordinal-day arrays.
+
+    ``source_key`` is the metric key the rates came from (None for an identity or empty series).
+    """
+
+    currency: str
+    base_currency: str
+    source_key: str | None
+    days: array
+    rates: array
+
+    def align(self, days: Sequence[date], max_lag_days: int = DEFAULT_FX_MAX_LAG_DAYS) -> list[float | None]:
+        """As-of rates for *days*: the latest rate on or before each day, None when older than the lag."""
+        if self.currency == self.base_currency:
+            return [1.0] * len(days)
+        aligned: list[float | None] = []
+        lo = 0
+        previous = None
+        for day in days:
+            ordinal = day.toordinal()
+            # Ascending input (the usual case) narrows each bisect to the unseen tail.
+            if previous is None or ordinal < previous:
+                lo = 0
+            idx = bisect_right(self.days, ordinal, lo) - 1
+            previous = ordinal
+            if idx < 0 or ordinal - self.days[idx] > max_lag_days:
+                aligned.append(None)
+                continue
+            lo = idx
+            aligned.append(self.rates[idx])
+        return aligned
+
+    def convert(
+        self,
+        values: Sequence[float],
+        days: Sequence[date],
+        max_lag_days: int = DEFAULT_FX_MAX_LAG_DAYS,
+    ) -> list[float | None]:
+        """Convert *values* (in *currency*) observed on *days* into *base_currency*."""
+        if len(values) != len(days):
+            raise ValueError("values and days must have the same length")
+        if self.currency == self.base_currency:
+            return [float(value) for value in values]
+        return [
+            None if rate is None else float(value) * rate
+            for value, rate in zip(values, self.align(days, max_lag_days))
+        ]
+
+
+def build_fx_rate_series(currency: str, base_currency: str, rows: list[Mapping[str, object]]) -> FxRateSeries:
+    """Pick the first candidate key present in *rows* and keep its last valid value per day."""
+    currency = currency.upper()
+    base_currency = base_currency.upper()
+    if currency == base_currency:
+        return FxRateSeries(currency, base_currency, None, array("l"), array("d"))
+
+    by_key: dict[str, dict[int, float]] = {}
+    for row in rows:
+        metric_key = row.get("metric_key")
+        day = _parse_as_of(row.get("as_of"))
+        try:
+            value = float(row.get("value"))  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(metric_key, str) or day is None or not math.isfinite(value) or value <= 0:
+            continue
+        # Rows are ordered by as_of within a key, so later points overwrite earlier ones that day.
+        by_key.setdefault(metric_key, {})[day.toordinal()] = value
+
+    for metric_key, inverted in fx_candidate_keys(currency, base_currency):
+        daily = by_key.get(metric_key)
+        if not daily:
+            continue
+        days = array("l", sorted(daily))
+        rates = array("d", ((1.0 / daily[day]) if inverted else daily[day] for day in days))
+        return FxRateSeries(currency, base_currency, metric_key, days, rates)
+    return FxRateSeries(currency, base_currency, None, array("l"), array("d"))
+
+
+class FxRateCache:
+    """Bounded LRU of rate series keyed by (scope, pair, date range, newest stored as_of).
+
+    The newest as_of of the candidate keys is read first (one index-only query), so new
+    FX points invalidate the entry without a timer.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_FX_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[Hashable, FxRateSeries] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {"hits": 0, "loads": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def load(
+        self,
+        repository: object,
+        currency: str,
+        base_currency: str,
+        start: date,
+        end: date,
+        max_lag_days: int = DEFAULT_FX_MAX_LAG_DAYS,
+    ) -> FxRateSeries:
+        currency = currency.upper()
+        base_currency = base_currency.upper()
+        if currency == base_currency:
+            return build_fx_rate_series(currency, base_currency, [])
+
+        metric_keys = [key for key, _ in fx_candidate_keys(currency, base_currency)]
+        cache_key = self._cache_key(repository, metric_keys, currency, base_currency, start, end, max_lag_days)
+        if cache_key is not None:
+            with self._lock:
+                cached = self._entries.get(cache_key)
+                if cached is not None:
+                    self._entries.move_to_end(cache_key)
+                    self.stats["hits"] += 1
+                    return cached
+
+        # Reach back by the lag bound so the first requested day can forward-fill.
+        window_start = datetime.combine(start - timedelta(days=max_lag_days), time.min, tzinfo=timezone.utc)
+        window_end = datetime.combine(end, time.max, tzinfo=timezone.utc)
+        rows = repository.read_macro_series_window(metric_keys, window_start, window_end)
+        series = build_fx_rate_series(currency, base_currency, rows)
+        self._count("loads")
+        if cache_key is not None:
+            with self._lock:
+                self._entries[cache_key] = series
+                self._entries.move_to_end(cache_key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return series
+
+    @staticmethod
+    def _cache_key(
+        repository: object,
+        metric_keys: list[str],
+        currency: str,
+        base_currency: str,
+        start: date,
+        end: date,
+        max_lag_days: int,
+    ) -> Hashable | None:
+        scope = getattr(repository, "cache_scope", None)
+        read_latest = getattr(repository, "read_macro_series_latest_as_of", None)
+        if not isinstance(scope, str) or not callable(read_latest):
+            return None
+        try:
+            latest = read_latest(metric_keys)
+        except Exception:
+            return None
+        if not isinstance(latest, dict):
+            return None
+        version = tuple(str(latest.get(key)) for key in metric_keys)
+        return (scope, currency, base_currency, start.toordinal(), end.toordinal(), max_lag_days, version)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+FX_RATE_CACHE = FxRateCache()
+
+
+def convert_values(
+    repository: object,
+    values: Sequence[float],
+    days: Sequence[date],
+    currency: str,
+    target_currency: str,
+    cache: FxRateCache | None = None,
+    max_lag_days: int = DEFAULT_FX_MAX_LAG_DAYS,
+) -> list[float | None]:
+    """Convert a whole column of *currency* values into *target_currency* with one rate load.
+
+    Days without a rate within *max_lag_days* convert to None.
+    """
+    if not days or currency.upper() == target_currency.upper():
+        return [float(value) for value in values]
+    cache = cache if cache is not None else FX_RATE_CACHE
+    series = cache.load(repository, currency, target_currency, min(days), max(days), max_lag_days)
+    return series.convert(values, days, max_lag_days)
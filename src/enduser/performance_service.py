@@ -7,11 +7,19 @@ from statistics import stdev
 from typing import Any
 
 from src.enduser.benchmark_service import compute_benchmark_series
+from src.enduser.downsampling import downsample_rows
+from src.enduser.fx_service import convert_values
+from src.enduser.risk_analytics import RISK_ANALYTICS_CACHE, risk_inputs_fingerprint
+from src.research.benchmark import BENCHMARK_MAX_FILL_DAYS
+from src.research.fx import load_base_currency
+from src.research.trading_calendar import align_asof
 
 
 DEFAULT_MDD_ALERT_THRESHOLD = -0.20
 DEFAULT_POLICY_MDD_LIMIT = -0.30
 DEFAULT_LEVERAGE_CAP = 0.20
+# Charts are downsampled, so the query only needs a safety bound (~40 years of daily snapshots).
+DEFAULT_PERFORMANCE_SNAPSHOT_LIMIT = 10_000
 
 
 def _parse_as_of(raw: object) -> date | None:
@@ -153,7 +161,89 @@ def _compute_sharpe_ratio(daily_returns: list[float]) -> float | None:
     return (mean_return / volatility) * math.sqrt(252)
 
 
-def build_performance_view(repository: object, limit: int = 365) -> dict[str, Any]:
+def _load_snapshot_limit() -> int:
+    raw = os.getenv("PERFORMANCE_SNAPSHOT_LIMIT")
+    if raw is None or raw.strip() == "":
+        return DEFAULT_PERFORMANCE_SNAPSHOT_LIMIT
+    try:
+        parsed = int(raw)
+    except ValueError:
+        return DEFAULT_PERFORMANCE_SNAPSHOT_LIMIT
+    return parsed if parsed > 0 else DEFAULT_PERFORMANCE_SNAPSHOT_LIMIT
+
+
+def _load_display_currency(base_currency: str) -> str:
+    raw = (os.getenv("PERFORMANCE_CURRENCY") or "").strip().upper()
+    return raw if len(raw) == 3 and raw.isalpha() else base_currency
+
+
+def _convert_snapshot_navs(
+    repository: object,
+    snapshots: list[dict[str, Any]],
+    base_currency: str,
+    currency: str,
+) -> list[dict[str, Any]]:
+    """Restate chronological snapshot NAVs in *currency*; days without an FX rate are dropped."""
+    if not snapshots or currency == base_currency or not hasattr(repository, "read_macro_series_window"):
+        return snapshots
+    converted = convert_values(
+        repository,
+        [item["nav"] for item in snapshots],
+        [item["as_of"] for item in snapshots],
+        base_currency,
+        currency,
+    )
+    return [{**item, "nav": nav} for item, nav in zip(snapshots, converted) if nav is not None and nav > 0]
+
+
+def _build_chart_series(
+    nav_series: list[dict[str, Any]],
+    benchmark_series: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Portfolio vs benchmark NAV indexed to 100, downsampled for the browser."""
+    if not nav_series or nav_series[0]["nav"] <= 0:
+        return []
+    base_nav = nav_series[0]["nav"]
+    benchmark_days: list[int] = []
+    benchmark_index: list[float] = []
+    for row in benchmark_series:
+        day = _parse_as_of(row.get("as_of"))
+        if day is None or row.get("benchmark_nav") is None:
+            continue
+        benchmark_days.append(day.toordinal())
+        benchmark_index.append(float(row["benchmark_nav"]) * 100)
+    # Snapshots taken on a benchmark holiday show the last benchmark close, not a gap.
+    aligned = align_asof(
+        benchmark_days,
+        benchmark_index,
+        [date.fromisoformat(row["as_of"]).toordinal() for row in nav_series],
+        BENCHMARK_MAX_FILL_DAYS,
+    )
+    rows = [
+        {
+            "as_of": row["as_of"],
+            "portfolio_nav_index": (row["nav"] / base_nav) * 100,
+            "benchmark_nav_index": benchmark_nav_index,
+        }
+        for row, benchmark_nav_index in zip(nav_series, aligned)
+    ]
+    return list(downsample_rows(rows, ["portfolio_nav_index", "benchmark_nav_index"]))
+
+
+def build_performance_view(
+    repository: object,
+    limit: int | None = None,
+    currency: str | None = None,
+) -> dict[str, Any]:
+    """Performance, policy and risk view over portfolio snapshots.
+
+    Snapshot NAV is stored in PORTFOLIO_BASE_CURRENCY; *currency* (or PERFORMANCE_CURRENCY)
+    restates it through the stored FX series before any metric is computed.
+    """
+    if limit is None:
+        limit = _load_snapshot_limit()
+    base_currency = load_base_currency()
+    currency = currency.strip().upper() if currency else _load_display_currency(base_currency)
     rows = repository.read_portfolio_snapshots(limit=limit) if hasattr(repository, "read_portfolio_snapshots") else []
 
     snapshots: list[dict[str, Any]] = []
@@ -178,6 +268,7 @@ def build_performance_view(repository: object, limit: int = 365) -> dict[str, An
         )
 
     snapshots.sort(key=lambda item: item["as_of"])
+    snapshots = _convert_snapshot_navs(repository, snapshots, base_currency, currency)
     nav_points: list[tuple[date, float]] = [(item["as_of"], item["nav"]) for item in snapshots]
 
     nav_series: list[dict[str, Any]] = []
@@ -215,6 +306,11 @@ def build_performance_view(repository: object, limit: int = 365) -> dict[str, An
             if last_nav is not None:
                 benchmark_total_return = last_nav - 1.0
 
+    # Keyed on the full (converted) NAV and benchmark columns, so backfills and restatements
+    # of earlier days are recomputed too.
+    risk_cache_key = risk_inputs_fingerprint(nav_points, benchmark_series) if nav_points else None
+    risk = RISK_ANALYTICS_CACHE.get_or_compute(risk_cache_key, nav_points, benchmark_series)
+
     alpha: float | None = None
     if total_return is not None and benchmark_total_return is not None:
         alpha = total_return - benchmark_total_return
@@ -249,6 +345,7 @@ def build_performance_view(repository: object, limit: int = 365) -> dict[str, An
     )
 
     return {
+        "currency": currency,
         "total_return_pct": total_return * 100 if total_return is not None else None,
         "mdd_pct": mdd_pct,
         "sharpe_ratio": sharpe,
@@ -266,4 +363,6 @@ def build_performance_view(repository: object, limit: int = 365) -> dict[str, An
         "leverage_cap_breached": leverage_cap_breached,
         "nav_series": nav_series,
         "benchmark_series": benchmark_series,
+        "chart_series": _build_chart_series(nav_series, benchmark_series),
+        "risk": risk,
     }
@@ -4,6 +4,7 @@ from collections.abc import Callable
 from typing import Any
 
 from src.ingestion.postgres_repository import PostgresRepository
+from src.ingestion.view_cache import VIEW_CACHE
 
 RepositoryFactory = Callable[[str], Any]
 
@@ -20,10 +21,13 @@ def submit_macro_refresh_request(
     repository_factory: RepositoryFactory = PostgresRepository,
 ) -> dict[str, object]:
     repository = repository_factory(dsn)
-    return repository.create_refresh_request(
+    result = repository.create_refresh_request(
         request_type=REQUEST_TYPE_MACRO_SIGNAL,
         source_view=SOURCE_VIEW_ENDUSER_SIGNALS,
         requested_by=requested_by,
         note=None,
         cooldown_minutes=cooldown_minutes,
     )
+    # This session should see its own request on the next rerun, not a cached view.
+    VIEW_CACHE.invalidate()
+    return result
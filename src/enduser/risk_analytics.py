@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from datetime import date
+from itertools import accumulate
+from typing import Any
+
+
+TRADING_DAYS_PER_YEAR = 252
+DEFAULT_ROLLING_WINDOWS: tuple[int, ...] = (20, 60)
+DEFAULT_VAR_CONFIDENCE = 0.95
+DEFAULT_RISK_CACHE_MAX_ENTRIES = 32
+
+
+def _returns_with_days(nav_points: list[tuple[date, float]]) -> tuple[list[date], array]:
+    days: list[date] = []
+    returns = array("d")
+    for idx in range(1, len(nav_points)):
+        prev_nav = nav_points[idx - 1][1]
+        if prev_nav <= 0:
+            continue
+        days.append(nav_points[idx][0])
+        returns.append((nav_points[idx][1] / prev_nav) - 1.0)
+    return days, returns
+
+
+def _prefix_sums(values: object) -> array:
+    return array("d", accumulate(values, initial=0.0))  # type: ignore[call-overload]
+
+
+def _rolling_metrics(days: list[date], returns: array, window: int) -> list[dict[str, Any]]:
+    """Rolling volatility / Sharpe / Sortino from prefix sums: O(n) regardless of window size."""
+    if window < 2 or len(returns) < window:
+        return []
+    sums = _prefix_sums(returns)
+    squares = _prefix_sums(value * value for value in returns)
+    downside = _prefix_sums(min(value, 0.0) ** 2 for value in returns)
+    annualizer = math.sqrt(TRADING_DAYS_PER_YEAR)
+
+    rows: list[dict[str, Any]] = []
+    for end in range(window, len(returns) + 1):
+        start = end - window
+        total = sums[end] - sums[start]
+        mean = total / window
+        # Sample variance to match statistics.stdev used for the headline Sharpe.
+        variance = max(0.0, (squares[end] - squares[start] - total * mean) / (window - 1))
+        volatility = math.sqrt(variance)
+        downside_deviation = math.sqrt(max(0.0, downside[end] - downside[start]) / window)
+        rows.append(
+            {
+                "as_of": days[end - 1].isoformat(),
+                "volatility": volatility * annualizer,
+                "sharpe": (mean / volatility) * annualizer if volatility > 0 else None,
+                "sortino": (mean / downside_deviation) * annualizer if downside_deviation > 0 else None,
+            }
+        )
+    return rows
+
+
+def _drawdowns(nav_points: list[tuple[date, float]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Drawdown series plus episodes (peak → trough → recovery) in one pass."""
+    series: list[dict[str, Any]] = []
+    episodes: list[dict[str, Any]] = []
+    peak_day, peak_nav = nav_points[0]
+    episode: dict[str, Any] | None = None
+    for day, nav in nav_points:
+        if nav >= peak_nav:
+            if episode is not None:
+                episode["recovery"] = day.isoformat()
+                episode["recovery_days"] = (day - date.fromisoformat(episode["trough"])).days
+                episode["duration_days"] = (day - peak_day).days
+                episodes.append(episode)
+                episode = None
+            peak_day, peak_nav = day, nav
+            series.append({"as_of": day.isoformat(), "drawdown": 0.0})
+            continue
+
+        drawdown = (nav / peak_nav) - 1.0
+        series.append({"as_of": day.isoformat(), "drawdown": drawdown})
+        if episode is None:
+            episode = {"peak": peak_day.isoformat(), "trough": day.isoformat(), "depth": drawdown}
+        elif drawdown < episode["depth"]:
+            episode["trough"] = day.isoformat()
+            episode["depth"] = drawdown
+
+    if episode is not None:
+        # Still under water: duration runs to the last snapshot, recovery is open.
+        episode["recovery"] = None
+        episode["recovery_days"] = None
+        episode["duration_days"] = (nav_points[-1][0] - peak_day).days
+        episodes.append(episode)
+    return series, episodes
+
+
+def _historical_var(returns: array, confidence: float) -> tuple[float | None, float | None]:
+    """Historical VaR / CVaR as positive loss fractions of one-period returns."""
+    if len(returns) < 2:
+        return None, None
+    ordered = sorted(returns)
+    # Epsilon keeps e.g. (1 - 0.8) * 10 from flooring to 1 in binary floating point.
+    tail_count = max(1, int(math.floor((1.0 - confidence) * len(ordered) + 1e-9)))
+    tail = ordered[:tail_count]
+    return -tail[-1], -(sum(tail) / len(tail))
+
+
+def _beta(
+    days: list[date],
+    returns: array,
+    benchmark_series: list[Mapping[str, Any]],
+) -> tuple[float | None, int]:
+    benchmark_by_day: dict[str, float] = {}
+    for row in benchmark_series:
+        value = row.get("benchmark_return")
+        if row.get("as_of") is None or value is None:
+            continue
+        benchmark_by_day[str(row["as_of"])] = float(value)
+
+    pairs = [
+        (value, benchmark_by_day[key])
+        for key, value in zip((day.isoformat() for day in days), returns)
+        if key in benchmark_by_day
+    ]
+    if len(pairs) < 2:
+        return None, len(pairs)
+    count = len(pairs)
+    mean_portfolio = sum(p for p, _ in pairs) / count
+    mean_benchmark = sum(b for _, b in pairs) / count
+    covariance = sum((p - mean_portfolio) * (b - mean_benchmark) for p, b in pairs)
+    variance = sum((b - mean_benchmark) ** 2 for _, b in pairs)
+    if variance == 0:
+        return None, count
+    return covariance / variance, count
+
+
+def compute_risk_analytics(
+    nav_points: list[tuple[date, float]],
+    benchmark_series: list[Mapping[str, Any]],
+    windows: tuple[int, ...] = DEFAULT_ROLLING_WINDOWS,
+    confidence: float = DEFAULT_VAR_CONFIDENCE,
+) -> dict[str, Any]:
+    """Rolling and tail risk over the full (chronological) snapshot NAV history."""
+    empty: dict[str, Any] = {
+        "windows": list(windows),
+        "rolling": {str(window): [] for window in windows},
+        "drawdown_series": [],
+        "drawdown_episodes": [],
+        "current_drawdown": None,
+        "max_drawdown_duration_days": None,
+        "var_confidence": confidence,
+        "var": None,
+        "cvar": None,
+        "beta": None,
+        "beta_observations": 0,
+    }
+    if not nav_points:
+        return empty
+
+    days, returns = _returns_with_days(nav_points)
+    drawdown_series, episodes = _drawdowns(nav_points)
+    var, cvar = _historical_var(returns, confidence)
+    beta, beta_observations = _beta(days, returns, benchmark_series)
+    return {
+        **empty,
+        "rolling": {str(window): _rolling_metrics(days, returns, window) for window in windows},
+        "drawdown_series": drawdown_series,
+        "drawdown_episodes": episodes,
+        "current_drawdown": drawdown_series[-1]["drawdown"],
+        "max_drawdown_duration_days": max((e["duration_days"] for e in episodes), default=0),
+        "var": var,
+        "cvar": cvar,
+        "beta": beta,
+        "beta_observations": beta_observations,
+    }
+
+
+def risk_inputs_fingerprint(
+    nav_points: list[tuple[date, float]],
+    benchmark_series: list[Mapping[str, Any]],
+) -> str:
+    """Digest of every NAV point and benchmark return the analytics read.
+
+    A backfilled snapshot or a restated FX or benchmark value changes it even when the last
+    day, the point count and the last NAV stay the same.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(array("l", (day.toordinal() for day, _ in nav_points)).tobytes())
+    digest.update(array("d", (nav for _, nav in nav_points)).tobytes())
+    for row in benchmark_series:
+        digest.update(f"{row.get('as_of')}={row.get('benchmark_return')};".encode())
+    return digest.hexdigest()
+
+
+class RiskAnalyticsCache:
+    """Bounded LRU of computed analytics keyed by the caller (see risk_inputs_fingerprint)."""
+
+    def __init__(self, max_entries: int = DEFAULT_RISK_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[Hashable, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        key: Hashable | None,
+        nav_points: list[tuple[date, float]],
+        benchmark_series: list[Mapping[str, Any]],
+    ) -> dict[str, Any]:
+        if key is None:
+            return compute_risk_analytics(nav_points, benchmark_series)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+        analytics = compute_risk_analytics(nav_points, benchmark_series)
+        with self._lock:
+            self._entries[key] = analytics
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return analytics
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+RISK_ANALYTICS_CACHE = RiskAnalyticsCache()
@@ -1,7 +1,12 @@
 from collections.abc import Mapping
+from datetime import date, datetime, timezone
 from typing import Optional, Protocol
 
 
+# Monthly rows requested per pull, ending at the current month; stays under the 100-row page.
+ECOS_WINDOW_MONTHS = 48
+
+
 class ApiClient(Protocol):
     def request_json(
         self, url: str, headers: Optional[Mapping[str, str]] = None
@@ -22,12 +27,17 @@ class EcosAdapter:
             "payload": payload,
         }
 
-    def fetch_statistic(self, stat_code: str) -> dict[str, object]:
+    def fetch_statistic(self, stat_code: str, as_of: Optional[date] = None) -> dict[str, object]:
         if self.client is None:
             raise ValueError("client is required for fetch operations")
+        today = as_of or datetime.now(timezone.utc).date()
+        end_index = today.year * 12 + today.month - 1
+        start_index = end_index - (ECOS_WINDOW_MONTHS - 1)
+        start = f"{start_index // 12}{start_index % 12 + 1:02d}"
+        end = f"{end_index // 12}{end_index % 12 + 1:02d}"
         url = (
             "https://ecos.bok.or.kr/api/StatisticSearch/"
-            f"{self.api_key}/json/kr/1/100/{stat_code}/M/202001/202312"
+            f"{self.api_key}/json/kr/1/100/{stat_code}/M/{start}/{end}"
         )
         payload = self.client.request_json(url)
         return {"source": self.source_name, "entity_id": stat_code, "payload": payload}
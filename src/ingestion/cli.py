@@ -1,19 +1,24 @@
 import argparse
+import csv
 import importlib
 import json
+import math
 import os
+import sys
+import time
 import urllib.request
-from collections.abc import Mapping
-from datetime import datetime, timedelta, timezone
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
+from src.research.fx import load_base_currency
+
 from .adapters.ecos import EcosAdapter
 from .adapters.fred import FredAdapter
 from .adapters.opendart import OpenDartAdapter
 from .adapters.sec_edgar import SecEdgarAdapter
 from .http_client import HttpResponse, SimpleHttpClient
 from .postgres_repository import PostgresRepository
-from .quality_gate import BatchMetrics
 from .repository import InMemoryRepository
 from .source_registry import SourceDescriptor
 
@@ -25,6 +30,7 @@ def build_parser() -> argparse.ArgumentParser:
     run_update = subparsers.add_parser("run-update")
     _ = run_update.add_argument("--source", required=True)
     _ = run_update.add_argument("--entity")
+    _ = run_update.add_argument("--refresh-dashboard-snapshot", action="store_true")
 
     portfolio_snapshot_create = subparsers.add_parser("portfolio-snapshot-create")
     _ = portfolio_snapshot_create.add_argument("--as-of", required=True)
@@ -34,6 +40,22 @@ def build_parser() -> argparse.ArgumentParser:
     _ = portfolio_snapshot_create.add_argument("--crypto-weight", type=float)
     _ = portfolio_snapshot_create.add_argument("--leverage-weight", type=float)
 
+    portfolio_snapshot_import = subparsers.add_parser("portfolio-snapshot-import")
+    _ = portfolio_snapshot_import.add_argument("--file", required=True)
+    _ = portfolio_snapshot_import.add_argument("--format", choices=["auto", "csv", "jsonl"], default="auto")
+
+    portfolio_positions_import = subparsers.add_parser("portfolio-positions-import")
+    _ = portfolio_positions_import.add_argument("--file", required=True)
+    _ = portfolio_positions_import.add_argument("--format", choices=["auto", "csv", "jsonl"], default="auto")
+
+    portfolio_valuate = subparsers.add_parser("portfolio-valuate")
+    _ = portfolio_valuate.add_argument("--start", default=None)
+    _ = portfolio_valuate.add_argument("--end", default=None)
+    # Snapshot NAV is read back in PORTFOLIO_BASE_CURRENCY, so write it in that currency.
+    _ = portfolio_valuate.add_argument("--base-currency", default=load_base_currency())
+    _ = portfolio_valuate.add_argument("--max-price-lag-days", type=int, default=5)
+    _ = portfolio_valuate.add_argument("--dry-run", action="store_true")
+
     expected_vs_realized = subparsers.add_parser("expected-vs-realized")
     _ = expected_vs_realized.add_argument("--horizon", default="1M")
     _ = expected_vs_realized.add_argument("--limit", type=int, default=50)
@@ -59,6 +81,10 @@ def build_parser() -> argparse.ArgumentParser:
     _ = forecast_record_create.add_argument("--evidence-soft-json", default="[]")
     _ = forecast_record_create.add_argument("--as-of", required=True)
 
+    forecast_record_import = subparsers.add_parser("forecast-record-import")
+    _ = forecast_record_import.add_argument("--file", required=True, help="JSONL path, or - for stdin")
+    _ = forecast_record_import.add_argument("--chunk-size", type=int, default=200)
+
     streamlit_access_check = subparsers.add_parser("streamlit-access-check")
     _ = streamlit_access_check.add_argument("--url", required=True)
     _ = streamlit_access_check.add_argument("--timeout-seconds", type=float, default=15)
@@ -79,6 +105,31 @@ def build_parser() -> argparse.ArgumentParser:
     _ = learning_bootstrap.add_argument("--min-samples", default="8,12,6")
     _ = learning_bootstrap.add_argument("--dry-run", action="store_true")
 
+    evaluate_realizations = subparsers.add_parser("evaluate-realizations")
+    _ = evaluate_realizations.add_argument("--as-of")
+    _ = evaluate_realizations.add_argument("--limit", type=int, default=5000, help="page size")
+    _ = evaluate_realizations.add_argument("--max-price-lag-days", type=int, default=5)
+    _ = evaluate_realizations.add_argument("--dry-run", action="store_true")
+
+    learning_calibration = subparsers.add_parser("learning-calibration")
+    _ = learning_calibration.add_argument("--horizon", default="1M", choices=["1W", "1M", "3M"])
+    _ = learning_calibration.add_argument("--windows", default="20,60")
+    _ = learning_calibration.add_argument("--bins", type=int, default=5)
+    _ = learning_calibration.add_argument("--limit", type=int, default=200)
+
+    learning_rollup_rebuild = subparsers.add_parser("learning-rollup-rebuild")
+    _ = learning_rollup_rebuild.add_argument("--dry-run", action="store_true")
+
+    dashboard_snapshot = subparsers.add_parser("dashboard-snapshot")
+    _ = dashboard_snapshot.add_argument("--limit", type=int, default=20)
+    _ = dashboard_snapshot.add_argument("--keep-latest", type=int, default=48)
+
+    benchmark_nav_rebuild = subparsers.add_parser("benchmark-nav-rebuild")
+    _ = benchmark_nav_rebuild.add_argument("--since", default=None)
+
+    source_schema_reset = subparsers.add_parser("source-schema-reset")
+    _ = source_schema_reset.add_argument("--source", required=True)
+
     return parser
 
 
@@ -154,7 +205,11 @@ def _parse_iso_date(raw: str, field_name: str) -> str:
     return parsed.isoformat()
 
 
-def run_update_command(source: str, entity: Optional[str] = None) -> dict[str, object]:
+def run_update_command(
+    source: str,
+    entity: Optional[str] = None,
+    refresh_dashboard_snapshot: bool = False,
+) -> dict[str, object]:
     manual_runner = importlib.import_module("src.ingestion.manual_runner")
     run_manual_update = manual_runner.run_manual_update
     entity_id, payload = _collect_payload(source, entity)
@@ -173,22 +228,53 @@ def run_update_command(source: str, entity: Optional[str] = None) -> dict[str, o
             cost=3,
             maintenance=3,
         ),
-        metrics=BatchMetrics(
-            freshness=True,
-            completeness=True,
-            schema_drift=False,
-            license_ok=True,
-        ),
+        # Profiled from the normalized batch (freshness, completeness, schema drift, license).
+        metrics=None,
         idempotency_key=f"{source}|{entity_id}|{now.date().isoformat()}|manual",
+        # Undated, so the next day's unchanged pull is a noop as well.
+        revision_key=f"{source}|{entity_id}",
         payload=payload,
         rows=[{"entity_id": entity_id, "available_at": now}],
         decision_time=now,
         repository=data_repository,
         run_history_repository=run_history_repository,
     )
+
+    if refresh_dashboard_snapshot or os.getenv("DASHBOARD_SNAPSHOT_AFTER_INGEST", "").strip() == "1":
+        # A failed snapshot refresh must not turn a successful ingestion into a failure;
+        # the dashboard falls back to a live build once the old snapshot goes stale.
+        try:
+            summary["dashboard_snapshot"] = refresh_dashboard_snapshot_command()
+        except Exception as exc:
+            summary["dashboard_snapshot"] = {"error": str(exc)}
     return summary
 
 
+PORTFOLIO_SNAPSHOT_WEIGHT_FIELDS: tuple[str, ...] = ("us_weight", "kr_weight", "crypto_weight", "leverage_weight")
+
+
+def _build_portfolio_snapshot_payload(
+    as_of: str,
+    nav: float,
+    weights: Mapping[str, Optional[float]],
+) -> dict[str, object]:
+    if nav <= 0:
+        raise ValueError("nav must be > 0")
+
+    for field_name in PORTFOLIO_SNAPSHOT_WEIGHT_FIELDS:
+        value = weights.get(field_name)
+        if value is None:
+            continue
+        if not (0 <= value <= 1):
+            raise ValueError(f"{field_name} must be between 0 and 1")
+
+    return {
+        "as_of": _parse_iso_date(as_of, "as_of"),
+        "nav": nav,
+        **{field_name: weights.get(field_name) for field_name in PORTFOLIO_SNAPSHOT_WEIGHT_FIELDS},
+    }
+
+
 def create_portfolio_snapshot_command(
     as_of: str,
     nav: float,
@@ -200,39 +286,277 @@ def create_portfolio_snapshot_command(
     dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
     if not dsn:
         raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
-    if nav <= 0:
-        raise ValueError("nav must be > 0")
-
-    for field_name, value in [
-        ("us_weight", us_weight),
-        ("kr_weight", kr_weight),
-        ("crypto_weight", crypto_weight),
-        ("leverage_weight", leverage_weight),
-    ]:
-        if value is None:
-            continue
-        if not (0 <= value <= 1):
-            raise ValueError(f"{field_name} must be between 0 and 1")
 
-    repository = PostgresRepository(dsn=dsn)
-    snapshot_id = repository.write_portfolio_snapshot(
+    snapshot = _build_portfolio_snapshot_payload(
+        as_of,
+        nav,
         {
-            "as_of": _parse_iso_date(as_of, "as_of"),
-            "nav": nav,
             "us_weight": us_weight,
             "kr_weight": kr_weight,
             "crypto_weight": crypto_weight,
             "leverage_weight": leverage_weight,
-        }
+        },
     )
+    repository = PostgresRepository(dsn=dsn)
+    snapshot_id = repository.write_portfolio_snapshot(snapshot)
 
     return {
         "id": snapshot_id,
-        "as_of": _parse_iso_date(as_of, "as_of"),
+        "as_of": snapshot["as_of"],
         "nav": nav,
     }
 
 
+def _iter_tabular_records(path: str, file_format: str) -> Iterator[tuple[int, object]]:
+    resolved = file_format
+    if resolved == "auto":
+        resolved = "csv" if path.lower().endswith(".csv") else "jsonl"
+    handle = sys.stdin if path == "-" else open(path, encoding="utf-8", newline="")
+    try:
+        if resolved == "csv":
+            reader = csv.DictReader(handle)
+            for record in reader:
+                # Header is line 1; report the physical line the record ended on.
+                yield reader.line_num, record
+            return
+        for line_no, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield line_no, ValueError(f"invalid JSON: {exc.msg}")
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def _portfolio_snapshot_from_record(record: object) -> dict[str, object]:
+    if isinstance(record, ValueError):
+        raise record
+    if not isinstance(record, Mapping):
+        raise ValueError("each record must be an object")
+    as_of = record.get("as_of")
+    if as_of is None or str(as_of).strip() == "":
+        raise ValueError("as_of is required")
+
+    def number(field_name: str) -> Optional[float]:
+        raw = record.get(field_name)
+        # CSV exports leave optional weights blank.
+        if raw is None or (isinstance(raw, str) and raw.strip() == ""):
+            return None
+        try:
+            value = float(raw)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"{field_name} must be a number") from exc
+        if not math.isfinite(value):
+            raise ValueError(f"{field_name} must be a number")
+        return value
+
+    nav = number("nav")
+    if nav is None:
+        raise ValueError("nav is required")
+    return _build_portfolio_snapshot_payload(
+        str(as_of),
+        nav,
+        {field_name: number(field_name) for field_name in PORTFOLIO_SNAPSHOT_WEIGHT_FIELDS},
+    )
+
+
+def _portfolio_position_from_record(
+    record: object,
+    asset_classes: tuple[str, ...],
+    regions: tuple[str, ...],
+) -> dict[str, object]:
+    if isinstance(record, ValueError):
+        raise record
+    if not isinstance(record, Mapping):
+        raise ValueError("each record must be an object")
+
+    def text(field_name: str) -> str:
+        raw = record.get(field_name)
+        return "" if raw is None else str(raw).strip()
+
+    if not text("as_of"):
+        raise ValueError("as_of is required")
+    symbol = text("symbol").upper()
+    if not symbol:
+        raise ValueError("symbol is required")
+    try:
+        quantity = float(text("quantity"))
+    except ValueError as exc:
+        raise ValueError("quantity must be a number") from exc
+    if not math.isfinite(quantity):
+        raise ValueError("quantity must be a number")
+    currency = text("currency").upper()
+    if len(currency) != 3 or not currency.isalpha():
+        raise ValueError("currency must be a 3-letter ISO code")
+    asset_class = text("asset_class").lower()
+    if asset_class not in asset_classes:
+        raise ValueError(f"asset_class must be one of {', '.join(asset_classes)}")
+    region = text("region").upper() or "OTHER"
+    if region not in regions:
+        raise ValueError(f"region must be one of {', '.join(regions)}")
+
+    leveraged_raw = record.get("is_leveraged")
+    if isinstance(leveraged_raw, str):
+        is_leveraged = leveraged_raw.strip().lower() in {"1", "true", "yes", "y"}
+    else:
+        is_leveraged = bool(leveraged_raw)
+
+    return {
+        "as_of": _parse_iso_date(text("as_of"), "as_of"),
+        "symbol": symbol,
+        "quantity": quantity,
+        "currency": currency,
+        "asset_class": asset_class,
+        "region": region,
+        "price_series_key": text("price_series_key").upper() or None,
+        "is_leveraged": is_leveraged,
+    }
+
+
+def import_portfolio_positions_command(
+    path: str,
+    file_format: str = "auto",
+    records: Optional[Iterable[tuple[int, object]]] = None,
+    max_rejections_reported: int = 50,
+) -> dict[str, object]:
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+    if file_format not in {"auto", "csv", "jsonl"}:
+        raise ValueError("format must be one of auto, csv, jsonl")
+
+    portfolio_valuation = importlib.import_module("src.ingestion.portfolio_valuation")
+    asset_classes = tuple(portfolio_valuation.POSITION_ASSET_CLASSES)
+    regions = tuple(portfolio_valuation.POSITION_REGIONS)
+    started = time.monotonic()
+    positions: list[dict[str, object]] = []
+    rejected: list[dict[str, object]] = []
+    rows = 0
+    rejected_count = 0
+    for line_no, record in records if records is not None else _iter_tabular_records(path, file_format):
+        rows += 1
+        try:
+            positions.append(_portfolio_position_from_record(record, asset_classes, regions))
+        except ValueError as exc:
+            rejected_count += 1
+            if len(rejected) < max_rejections_reported:
+                rejected.append({"line": line_no, "error": str(exc)})
+
+    repository = PostgresRepository(dsn=dsn)
+    written = repository.write_portfolio_positions_bulk(positions)
+    elapsed_seconds = time.monotonic() - started
+    return {
+        "rows": rows,
+        **written,
+        "rejected": rejected_count,
+        "rejections": rejected,
+        "elapsed_ms": elapsed_seconds * 1000.0,
+    }
+
+
+def run_portfolio_valuation_command(
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    base_currency: Optional[str] = None,
+    max_price_lag_days: int = 5,
+    dry_run: bool = False,
+) -> dict[str, object]:
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+    if max_price_lag_days < 0:
+        raise ValueError("max_price_lag_days must be >= 0")
+
+    portfolio_valuation = importlib.import_module("src.ingestion.portfolio_valuation")
+    realization_evaluator = importlib.import_module("src.ingestion.realization_evaluator")
+    base = (base_currency or load_base_currency()).strip().upper()
+    repository = PostgresRepository(dsn=dsn)
+
+    started = time.monotonic()
+    positions = repository.read_portfolio_positions(
+        start=date.fromisoformat(_parse_iso_date(start, "start")) if start else None,
+        end=date.fromisoformat(_parse_iso_date(end, "end")) if end else None,
+    )
+    metric_keys, window_start, window_end = portfolio_valuation.plan_valuation_series(
+        positions,
+        base_currency=base,
+        max_price_lag_days=max_price_lag_days,
+    )
+    series_rows = repository.read_macro_series_window(metric_keys, window_start, window_end)
+    series_by_key = realization_evaluator.build_price_series(series_rows)
+    valuations, skipped = portfolio_valuation.value_positions(
+        positions,
+        series_by_key,
+        base_currency=base,
+        max_price_lag_days=max_price_lag_days,
+    )
+    written = (
+        {"snapshots_inserted": 0, "snapshots_updated": 0, "metrics_written": 0}
+        if dry_run
+        else repository.write_portfolio_valuations_bulk(valuations)
+    )
+    elapsed_seconds = time.monotonic() - started
+
+    result: dict[str, object] = {
+        "dry_run": dry_run,
+        "base_currency": base,
+        "positions": len(positions),
+        "days_valued": len(valuations),
+        **written,
+        "skipped": skipped,
+        "elapsed_ms": elapsed_seconds * 1000.0,
+    }
+    if dry_run:
+        result["valuations"] = valuations
+    return result
+
+
+def import_portfolio_snapshots_command(
+    path: str,
+    file_format: str = "auto",
+    records: Optional[Iterable[tuple[int, object]]] = None,
+    max_rejections_reported: int = 50,
+) -> dict[str, object]:
+    """Validate a CSV/JSONL snapshot export and bulk upsert it via COPY + one upsert on as_of."""
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+    if file_format not in {"auto", "csv", "jsonl"}:
+        raise ValueError("format must be one of auto, csv, jsonl")
+
+    rejected: list[dict[str, object]] = []
+    counts = {"rows": 0, "rejected": 0}
+
+    def valid_snapshots() -> Iterator[dict[str, object]]:
+        source = records if records is not None else _iter_tabular_records(path, file_format)
+        for line_no, record in source:
+            counts["rows"] += 1
+            try:
+                yield _portfolio_snapshot_from_record(record)
+            except ValueError as exc:
+                counts["rejected"] += 1
+                if len(rejected) < max_rejections_reported:
+                    rejected.append({"line": line_no, "error": str(exc)})
+
+    started = time.monotonic()
+    repository = PostgresRepository(dsn=dsn)
+    loaded = repository.copy_portfolio_snapshots(valid_snapshots())
+    elapsed_seconds = time.monotonic() - started
+    return {
+        "rows": counts["rows"],
+        "inserted": loaded["inserted"],
+        "updated": loaded["updated"],
+        "duplicates": loaded["duplicates"],
+        "rejected": counts["rejected"],
+        "rejections": rejected,
+        "elapsed_ms": elapsed_seconds * 1000.0,
+        "rows_per_second": counts["rows"] / elapsed_seconds if elapsed_seconds > 0 else None,
+    }
+
+
 def read_expected_vs_realized_command(horizon: str = "1M", limit: int = 50) -> list[dict[str, object]]:
     dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
     if not dsn:
@@ -315,36 +639,32 @@ def run_deploy_access_gate_command(
     }
 
 
-def create_forecast_record_command(
+FORECAST_HORIZONS = ("1W", "1M", "3M")
+
+
+def _build_forecast_record_payload(
     thesis_id: str,
     horizon: str,
     expected_return_low: float,
     expected_return_high: float,
     confidence: float,
     as_of: str,
-    key_drivers_json: str,
-    evidence_hard_json: str,
-    evidence_soft_json: str = "[]",
+    key_drivers: list[object],
+    evidence_hard: list[object],
+    evidence_soft: list[object],
     expected_volatility: Optional[float] = None,
     expected_drawdown: Optional[float] = None,
 ) -> dict[str, object]:
-    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
-    if not dsn:
-        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
-
+    if horizon not in FORECAST_HORIZONS:
+        raise ValueError(f"horizon must be one of {', '.join(FORECAST_HORIZONS)}")
     if expected_return_low > expected_return_high:
         raise ValueError("expected_return_low must be <= expected_return_high")
     if not (0 <= confidence <= 1):
         raise ValueError("confidence must be between 0 and 1")
-
-    key_drivers = _parse_json_array(key_drivers_json, "key_drivers_json")
-    evidence_hard = _parse_json_array(evidence_hard_json, "evidence_hard_json")
-    evidence_soft = _parse_json_array(evidence_soft_json, "evidence_soft_json")
-
     if not evidence_hard:
         raise ValueError("evidence_hard_json must be a non-empty JSON array")
 
-    payload = {
+    return {
         "thesis_id": thesis_id,
         "horizon": horizon,
         "expected_return_low": expected_return_low,
@@ -358,6 +678,38 @@ def create_forecast_record_command(
         "as_of": _parse_iso_datetime(as_of, "as_of"),
     }
 
+
+def create_forecast_record_command(
+    thesis_id: str,
+    horizon: str,
+    expected_return_low: float,
+    expected_return_high: float,
+    confidence: float,
+    as_of: str,
+    key_drivers_json: str,
+    evidence_hard_json: str,
+    evidence_soft_json: str = "[]",
+    expected_volatility: Optional[float] = None,
+    expected_drawdown: Optional[float] = None,
+) -> dict[str, object]:
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+
+    payload = _build_forecast_record_payload(
+        thesis_id=thesis_id,
+        horizon=horizon,
+        expected_return_low=expected_return_low,
+        expected_return_high=expected_return_high,
+        confidence=confidence,
+        as_of=as_of,
+        key_drivers=_parse_json_array(key_drivers_json, "key_drivers_json"),
+        evidence_hard=_parse_json_array(evidence_hard_json, "evidence_hard_json"),
+        evidence_soft=_parse_json_array(evidence_soft_json, "evidence_soft_json"),
+        expected_volatility=expected_volatility,
+        expected_drawdown=expected_drawdown,
+    )
+
     repository = PostgresRepository(dsn=dsn)
     forecast_id, deduplicated = repository.write_forecast_record_idempotent(payload)
     return {
@@ -368,6 +720,128 @@ def create_forecast_record_command(
     }
 
 
+def _forecast_json_array(record: Mapping[str, object], field_name: str, default: str = "[]") -> list[object]:
+    value = record.get(field_name)
+    if value is None:
+        return _parse_json_array(default, field_name)
+    if isinstance(value, str):
+        return _parse_json_array(value, field_name)
+    if not isinstance(value, list):
+        raise ValueError(f"{field_name} must be a JSON array")
+    return value
+
+
+def _record_float(record: Mapping[str, object], field_name: str) -> Optional[float]:
+    value = record.get(field_name)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{field_name} must be a number")
+    try:
+        return float(value)
+    except ValueError as exc:
+        raise ValueError(f"{field_name} must be a number") from exc
+
+
+def _forecast_payload_from_json_line(line: str) -> dict[str, object]:
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"invalid JSON: {exc.msg}") from exc
+    if not isinstance(record, dict):
+        raise ValueError("each line must be a JSON object")
+
+    missing = [
+        name
+        for name in ("thesis_id", "horizon", "expected_return_low", "expected_return_high", "confidence", "as_of")
+        if record.get(name) is None
+    ]
+    if missing:
+        raise ValueError(f"missing required fields: {', '.join(missing)}")
+
+    return _build_forecast_record_payload(
+        thesis_id=str(record["thesis_id"]),
+        horizon=str(record["horizon"]),
+        expected_return_low=float(_record_float(record, "expected_return_low") or 0.0),
+        expected_return_high=float(_record_float(record, "expected_return_high") or 0.0),
+        confidence=float(_record_float(record, "confidence") or 0.0),
+        as_of=str(record["as_of"]),
+        key_drivers=_forecast_json_array(record, "key_drivers"),
+        evidence_hard=_forecast_json_array(record, "evidence_hard"),
+        evidence_soft=_forecast_json_array(record, "evidence_soft"),
+        expected_volatility=_record_float(record, "expected_volatility"),
+        expected_drawdown=_record_float(record, "expected_drawdown"),
+    )
+
+
+def _iter_jsonl_lines(path: str) -> Iterator[tuple[int, str]]:
+    if path == "-":
+        for line_no, line in enumerate(sys.stdin, start=1):
+            yield line_no, line
+        return
+    with open(path, encoding="utf-8") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            yield line_no, line
+
+
+def import_forecast_records_command(
+    path: str,
+    chunk_size: int = 200,
+    emit: Optional[Callable[[dict[str, object]], None]] = None,
+    lines: Optional[Iterable[tuple[int, str]]] = None,
+) -> dict[str, object]:
+    """Validate and upsert forecast records from JSONL in chunks over one connection.
+
+    Every non-blank line yields one result (``inserted``/``deduplicated``/``error``)
+    through *emit*; invalid lines never block the rest of the file.
+    """
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    counts = {"lines": 0, "inserted": 0, "deduplicated": 0, "errors": 0}
+
+    def publish(result: dict[str, object]) -> None:
+        status = str(result["status"])
+        counts["errors" if status == "error" else status] += 1
+        if emit is not None:
+            emit(result)
+
+    def valid_chunks() -> Iterator[list[tuple[int, dict[str, object]]]]:
+        chunk: list[tuple[int, dict[str, object]]] = []
+        for line_no, line in lines if lines is not None else _iter_jsonl_lines(path):
+            if not line.strip():
+                continue
+            counts["lines"] += 1
+            try:
+                chunk.append((line_no, _forecast_payload_from_json_line(line)))
+            except ValueError as exc:
+                publish({"line": line_no, "status": "error", "error": str(exc)})
+                continue
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    started = time.monotonic()
+    repository = PostgresRepository(dsn=dsn)
+    chunks = 0
+    for results in repository.write_forecast_record_chunks(valid_chunks()):
+        chunks += 1
+        for line_no, result in results:
+            publish({"line": line_no, **result})
+
+    elapsed_seconds = time.monotonic() - started
+    return {
+        **counts,
+        "chunks": chunks,
+        "elapsed_ms": elapsed_seconds * 1000.0,
+    }
+
+
 def run_learning_bootstrap_command(
     as_of: str,
     horizons: str = "1W,1M,3M",
@@ -407,72 +881,236 @@ def run_learning_bootstrap_command(
     if dry_run:
         return {"dry_run": True, "as_of": as_of_dt.isoformat(), "planned_rows": len(plan), "plan": plan}
 
-    repository = PostgresRepository(dsn=dsn)
-    upserted = 0
-    realized = 0
-    attributed = 0
+    samples: list[dict[str, object]] = []
     for row in plan:
-        repository.write_investment_thesis(
-            {
-                "thesis_id": row["thesis_id"],
-                "scope_level": "portfolio",
-                "target_id": row["horizon"],
-                "title": f"Bootstrap {row['horizon']} sample",
-                "summary": "Deterministic bootstrap sample for learning-loop readiness",
-                "evidence_hard": [{"source": "bootstrap", "metric": "seed"}],
-                "evidence_soft": [],
-                "as_of": row["as_of"],
-                "lineage_id": "learning-bootstrap-v1",
-            }
-        )
-        forecast_id, _ = repository.write_forecast_record_idempotent(
+        samples.append(
             {
-                "thesis_id": row["thesis_id"],
-                "horizon": row["horizon"],
-                "expected_return_low": row["expected_return_low"],
-                "expected_return_high": row["expected_return_high"],
-                "expected_volatility": 0.12,
-                "expected_drawdown": -0.08,
-                "confidence": 0.55,
-                "key_drivers": ["bootstrap:readiness"],
-                "evidence_hard": [{"source": "bootstrap", "metric": "seed"}],
-                "evidence_soft": [],
-                "as_of": row["as_of"],
+                "thesis": {
+                    "thesis_id": row["thesis_id"],
+                    "scope_level": "portfolio",
+                    "target_id": row["horizon"],
+                    "title": f"Bootstrap {row['horizon']} sample",
+                    "summary": "Deterministic bootstrap sample for learning-loop readiness",
+                    "evidence_hard": [{"source": "bootstrap", "metric": "seed"}],
+                    "evidence_soft": [],
+                    "as_of": row["as_of"],
+                    "lineage_id": "learning-bootstrap-v1",
+                },
+                "forecast": {
+                    "thesis_id": row["thesis_id"],
+                    "horizon": row["horizon"],
+                    "expected_return_low": row["expected_return_low"],
+                    "expected_return_high": row["expected_return_high"],
+                    "expected_volatility": 0.12,
+                    "expected_drawdown": -0.08,
+                    "confidence": 0.55,
+                    "key_drivers": ["bootstrap:readiness"],
+                    "evidence_hard": [{"source": "bootstrap", "metric": "seed"}],
+                    "evidence_soft": [],
+                    "as_of": row["as_of"],
+                },
+                "realization": {
+                    "realized_return": row["realized_return"],
+                    "realized_volatility": 0.11,
+                    "max_drawdown": -0.06,
+                    "evaluated_at": row["evaluated_at"],
+                },
+                "attribution": {
+                    "category": row["category"],
+                    "contribution": 0.0,
+                    "note": "bootstrap seed",
+                    "evidence_hard": [{"source": "bootstrap", "metric": "seed"}],
+                    "evidence_soft": [],
+                },
             }
         )
-        upserted += 1
-
-        existing = repository.read_expected_vs_realized(horizon=str(row["horizon"]), limit=500)
-        if any(r.get("forecast_id") == forecast_id and r.get("realization_id") is not None for r in existing):
-            continue
 
-        realization_id = repository.write_realization_from_outcome(
-            forecast_id=forecast_id,
-            realized_return=float(row["realized_return"]),
-            realized_volatility=0.11,
-            max_drawdown=-0.06,
-            evaluated_at=row["evaluated_at"],
-        )
-        realized += 1
-        repository.write_forecast_error_attribution(
-            {
-                "realization_id": realization_id,
-                "category": row["category"],
-                "contribution": 0.0,
-                "note": "bootstrap seed",
-                "evidence_hard": [{"source": "bootstrap", "metric": "seed"}],
-                "evidence_soft": [],
-            }
-        )
-        attributed += 1
+    repository = PostgresRepository(dsn=dsn)
+    written = repository.write_learning_samples_bulk(samples)
 
     return {
         "dry_run": False,
         "as_of": as_of_dt.isoformat(),
         "planned_rows": len(plan),
-        "forecast_upserts": upserted,
-        "realization_inserts": realized,
-        "attribution_inserts": attributed,
+        "forecast_upserts": written["forecast_upserts"],
+        "realization_inserts": written["realization_inserts"],
+        "attribution_inserts": written["attribution_inserts"],
+    }
+
+
+def run_evaluate_realizations_command(
+    as_of: Optional[str] = None,
+    limit: int = 5000,
+    max_price_lag_days: int = 5,
+    dry_run: bool = False,
+) -> dict[str, object]:
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    if max_price_lag_days < 0:
+        raise ValueError("max_price_lag_days must be >= 0")
+
+    realization_evaluator = importlib.import_module("src.ingestion.realization_evaluator")
+    as_of_dt = _parse_iso_datetime(as_of, "as_of") if as_of else datetime.now(timezone.utc)
+    repository = PostgresRepository(dsn=dsn)
+
+    started = time.monotonic()
+    candidates = 0
+    pages = 0
+    all_realizations: list[dict[str, object]] = []
+    inserted_total = 0
+    skipped: dict[str, int] = {}
+    after: Optional[tuple[datetime, int]] = None
+    # Keyset pages of --limit rows: forecasts that cannot be priced yet stay unrealized
+    # and would otherwise fill every page ahead of newer forecasts.
+    while True:
+        forecasts = repository.read_matured_unrealized_forecasts(as_of=as_of_dt, limit=limit, after=after)
+        if not forecasts:
+            break
+        pages += 1
+        candidates += len(forecasts)
+
+        metric_keys, window_start, window_end = realization_evaluator.plan_series_window(
+            forecasts,
+            max_price_lag_days=max_price_lag_days,
+        )
+        series_rows = repository.read_macro_series_window(metric_keys, window_start, window_end)
+        series_by_key = realization_evaluator.build_price_series(series_rows)
+
+        realizations, page_skipped = realization_evaluator.evaluate_matured_forecasts(
+            forecasts,
+            series_by_key,
+            max_price_lag_days=max_price_lag_days,
+        )
+        for reason, count in page_skipped.items():
+            skipped[reason] = skipped.get(reason, 0) + count
+        all_realizations.extend(realizations)
+        if not dry_run and realizations:
+            inserted_total += len(repository.write_realizations_bulk(realizations))
+
+        if len(forecasts) < limit:
+            break
+        last = forecasts[-1]
+        after = (last["as_of"], int(last["forecast_id"]))  # type: ignore[call-overload]
+    elapsed_seconds = time.monotonic() - started
+
+    result: dict[str, object] = {
+        "dry_run": dry_run,
+        "as_of": as_of_dt.isoformat(),
+        "candidates": candidates,
+        "pages": pages,
+        "evaluated": len(all_realizations),
+        "realization_inserts": inserted_total,
+        "skipped": skipped,
+        "elapsed_ms": elapsed_seconds * 1000.0,
+        "forecasts_per_second": candidates / elapsed_seconds if candidates and elapsed_seconds > 0 else None,
+    }
+    if dry_run:
+        result["realizations"] = all_realizations
+    return result
+
+
+def read_learning_calibration_command(
+    horizon: str = "1M",
+    windows: str = "20,60",
+    bins: int = 5,
+    limit: int = 200,
+) -> dict[str, object]:
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+    try:
+        window_sizes = tuple(int(w.strip()) for w in windows.split(",") if w.strip())
+    except ValueError as exc:
+        raise ValueError("windows must be a comma-separated list of integers") from exc
+    if not window_sizes or any(size < 1 for size in window_sizes):
+        raise ValueError("windows must contain positive integers")
+
+    repository = PostgresRepository(dsn=dsn)
+    return repository.read_learning_calibration(
+        horizon=horizon,
+        windows=window_sizes,
+        bins=bins,
+        limit=limit,
+    )
+
+
+def run_benchmark_nav_rebuild_command(since: Optional[str] = None) -> dict[str, object]:
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+
+    since_day = date.fromisoformat(since) if since else None
+    started = time.monotonic()
+    repository = PostgresRepository(dsn=dsn)
+    result = repository.refresh_benchmark_nav_daily(since=since_day)
+    return {**result, "elapsed_ms": (time.monotonic() - started) * 1000.0}
+
+
+def run_source_schema_reset_command(source: str) -> dict[str, object]:
+    """Drop a source's accepted record schema after an intentional provider change."""
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+    name = source.strip().lower()
+    if not name:
+        raise ValueError("source is required")
+
+    quality_profiler = importlib.import_module("src.ingestion.quality_profiler")
+    repository = PostgresRepository(dsn=dsn)
+    deleted = repository.delete_source_schema(name)
+    quality_profiler.SCHEMA_FINGERPRINT_CACHE.forget(repository, name)
+    return {"source": name, "deleted": deleted}
+
+
+def run_learning_rollup_rebuild_command(dry_run: bool = False) -> dict[str, object]:
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+
+    repository = PostgresRepository(dsn=dsn)
+    tables = repository.rebuild_learning_rollups(dry_run=dry_run)
+    consistent = all(
+        counts.get("missing_rows", 0) == 0 and counts.get("orphan_rows", 0) == 0 and counts.get("drifted_rows", 0) == 0
+        for counts in tables.values()
+    )
+    return {"dry_run": dry_run, "consistent": consistent, "tables": tables}
+
+
+def refresh_dashboard_snapshot_command(limit: int = 20, keep_latest: int = 48) -> dict[str, object]:
+    dsn = os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("SUPABASE_DB_URL or DATABASE_URL is required")
+    if keep_latest < 1:
+        raise ValueError("keep_latest must be >= 1")
+
+    dashboard_service = importlib.import_module("src.ingestion.dashboard_service")
+    repository = PostgresRepository(dsn=dsn)
+
+    started = time.monotonic()
+    view = dashboard_service.build_dashboard_view(
+        repository,
+        limit=limit,
+        prefetch_attribution_details=False,
+    )
+    build_ms = (time.monotonic() - started) * 1000.0
+    computed_at = datetime.now(timezone.utc)
+
+    snapshot_id = repository.write_dashboard_snapshot(
+        view=view,
+        computed_at=computed_at,
+        build_ms=build_ms,
+        keep_latest=keep_latest,
+    )
+    load_timings = view.get("load_timings") if isinstance(view, dict) else None
+    degraded_calls = load_timings.get("degraded_calls", []) if isinstance(load_timings, dict) else []
+    return {
+        "id": snapshot_id,
+        "computed_at": computed_at.isoformat(),
+        "build_ms": build_ms,
+        "degraded_calls": degraded_calls,
     }
 
 
@@ -481,8 +1119,12 @@ def main(argv: Optional[list[str]] = None) -> int:
     args = parser.parse_args(argv)
 
     if args.command == "run-update":
-        summary = run_update_command(args.source, args.entity)
-        print(json.dumps(summary))
+        summary = run_update_command(
+            args.source,
+            args.entity,
+            refresh_dashboard_snapshot=args.refresh_dashboard_snapshot,
+        )
+        print(json.dumps(summary, default=str))
         return 0
 
     if args.command == "portfolio-snapshot-create":
@@ -497,6 +1139,27 @@ def main(argv: Optional[list[str]] = None) -> int:
         print(json.dumps(summary, default=str))
         return 0
 
+    if args.command == "portfolio-snapshot-import":
+        summary = import_portfolio_snapshots_command(path=args.file, file_format=args.format)
+        print(json.dumps(summary, default=str))
+        return 0 if summary["rejected"] == 0 else 2
+
+    if args.command == "portfolio-positions-import":
+        summary = import_portfolio_positions_command(path=args.file, file_format=args.format)
+        print(json.dumps(summary, default=str))
+        return 0 if summary["rejected"] == 0 else 2
+
+    if args.command == "portfolio-valuate":
+        result = run_portfolio_valuation_command(
+            start=args.start,
+            end=args.end,
+            base_currency=args.base_currency,
+            max_price_lag_days=args.max_price_lag_days,
+            dry_run=args.dry_run,
+        )
+        print(json.dumps(result, default=str))
+        return 0
+
     if args.command == "expected-vs-realized":
         rows = read_expected_vs_realized_command(horizon=args.horizon, limit=args.limit)
         print(json.dumps(rows, default=str))
@@ -529,6 +1192,15 @@ def main(argv: Optional[list[str]] = None) -> int:
         print(json.dumps(row, default=str))
         return 0
 
+    if args.command == "forecast-record-import":
+        summary = import_forecast_records_command(
+            path=args.file,
+            chunk_size=args.chunk_size,
+            emit=lambda result: print(json.dumps(result, default=str)),
+        )
+        print(json.dumps({"summary": summary}, default=str))
+        return 0 if summary["errors"] == 0 else 2
+
     if args.command == "streamlit-access-check":
         result = run_streamlit_access_check_command(
             url=args.url,
@@ -563,6 +1235,46 @@ def main(argv: Optional[list[str]] = None) -> int:
         print(json.dumps(result, default=str))
         return 0
 
+    if args.command == "evaluate-realizations":
+        result = run_evaluate_realizations_command(
+            as_of=args.as_of,
+            limit=args.limit,
+            max_price_lag_days=args.max_price_lag_days,
+            dry_run=args.dry_run,
+        )
+        print(json.dumps(result, default=str))
+        return 0
+
+    if args.command == "learning-calibration":
+        result = read_learning_calibration_command(
+            horizon=args.horizon,
+            windows=args.windows,
+            bins=args.bins,
+            limit=args.limit,
+        )
+        print(json.dumps(result, default=str))
+        return 0
+
+    if args.command == "learning-rollup-rebuild":
+        result = run_learning_rollup_rebuild_command(dry_run=args.dry_run)
+        print(json.dumps(result, default=str))
+        return 0 if bool(result.get("consistent")) or not args.dry_run else 2
+
+    if args.command == "dashboard-snapshot":
+        result = refresh_dashboard_snapshot_command(limit=args.limit, keep_latest=args.keep_latest)
+        print(json.dumps(result, default=str))
+        return 0
+
+    if args.command == "benchmark-nav-rebuild":
+        result = run_benchmark_nav_rebuild_command(since=args.since)
+        print(json.dumps(result, default=str))
+        return 0
+
+    if args.command == "source-schema-reset":
+        result = run_source_schema_reset_command(source=args.source)
+        print(json.dumps(result, default=str))
+        return 0
+
     parser.print_help()
     return 1
 
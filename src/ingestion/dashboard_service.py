@@ -1,6 +1,10 @@
 import json
 import os
+import threading
+import time
 from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from typing import Protocol
 
@@ -24,6 +28,13 @@ POLICY_UNIVERSE_REGION_SENTINELS: dict[str, tuple[str, ...]] = {
     "CRYPTO": ("BTC",),
 }
 POLICY_LOCK_REFERENCE = "docs/POLICY_LOCK_V1.md"
+DEFAULT_DASHBOARD_LOAD_MAX_WORKERS: int = 8
+DEFAULT_DASHBOARD_CALL_TIMEOUT_SECONDS: float = 5.0
+DEFAULT_DASHBOARD_LOAD_DEADLINE_SECONDS: float = 12.0
+DEFAULT_DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS: int = 900
+
+# key -> (default, repository callable, kwargs)
+RepoCallSpec = tuple[object, Callable[..., object], dict[str, object]]
 
 
 class DashboardRepositoryProtocol(Protocol):
@@ -43,6 +54,12 @@ class DashboardRepositoryProtocol(Protocol):
         max_preview_chars: int = 240,
     ) -> dict[str, object] | None: ...
 
+    def read_forecast_error_attribution_details(
+        self,
+        attribution_ids: list[int],
+        max_preview_chars: int = 240,
+    ) -> dict[int, dict[str, object]]: ...
+
     def read_latest_canonical_metric(self, metric_name: str) -> dict[str, object] | None: ...
 
 
@@ -159,6 +176,97 @@ def _safe_repo_call(default: object, fn: object, *args: object, **kwargs: object
         return default
 
 
+def _run_repo_calls(
+    calls: dict[str, RepoCallSpec],
+    max_workers: int,
+    call_timeout_seconds: float,
+    deadline: float,
+) -> tuple[dict[str, object], dict[str, dict[str, object]]]:
+    """Run independent repository reads concurrently with per-call and total bounds.
+
+    Each call degrades to its default on error, on exceeding its own timeout
+    (measured from when it actually starts), or when the shared monotonic
+    deadline passes. An abandoned call keeps its worker until the database
+    cancels it, so repositories should carry a matching server-side
+    statement_timeout (see ``dashboard_call_timeout_seconds``).
+    Returns (results, per-call timings).
+    """
+    results: dict[str, object] = {key: spec[0] for key, spec in calls.items()}
+    timings: dict[str, dict[str, object]] = {}
+    if not calls:
+        return results, timings
+
+    started_at: dict[str, float] = {}
+    lock = threading.Lock()
+
+    def _invoke(key: str, fn: Callable[..., object], kwargs: dict[str, object]) -> object:
+        with lock:
+            started_at[key] = time.monotonic()
+        return fn(**kwargs)
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(calls))),
+        thread_name_prefix="dashboard-load",
+    )
+    pending: dict[Future[object], str] = {}
+    try:
+        for key, (_, fn, kwargs) in calls.items():
+            if not callable(fn):
+                timings[key] = {"status": "skipped", "latency_ms": 0.0}
+                continue
+            pending[executor.submit(_invoke, key, fn, kwargs)] = key
+
+        while pending:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+
+            next_expiry = deadline
+            for future, key in list(pending.items()):
+                with lock:
+                    started = started_at.get(key)
+                if started is None:
+                    continue
+                expires_at = started + call_timeout_seconds
+                if now >= expires_at and not future.done():
+                    del pending[future]
+                    timings[key] = {"status": "timeout", "latency_ms": (now - started) * 1000.0}
+                    continue
+                next_expiry = min(next_expiry, expires_at)
+            if not pending:
+                break
+
+            # Queued calls have no start time yet; poll so their timeout clock is honored.
+            wait_seconds = max(0.0, min(next_expiry, now + call_timeout_seconds) - now)
+            done, _ = wait(list(pending), timeout=wait_seconds, return_when=FIRST_COMPLETED)
+            finished_at = time.monotonic()
+            for future in done:
+                key = pending.pop(future)
+                with lock:
+                    started = started_at.get(key, finished_at)
+                latency_ms = (finished_at - started) * 1000.0
+                try:
+                    results[key] = future.result()
+                    timings[key] = {"status": "ok", "latency_ms": latency_ms}
+                except Exception:
+                    timings[key] = {"status": "error", "latency_ms": latency_ms}
+
+        now = time.monotonic()
+        for future, key in pending.items():
+            future.cancel()
+            with lock:
+                started = started_at.get(key)
+            timings[key] = {
+                "status": "deadline_exceeded",
+                "latency_ms": (now - started) * 1000.0 if started is not None else None,
+            }
+    finally:
+        # Do not block the render on calls that already blew their budget.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results, timings
+
+
 def _parse_iso_utc(value: object) -> datetime | None:
     if not isinstance(value, str):
         return None
@@ -206,6 +314,11 @@ def _float_env(name: str, default: float) -> float:
         return default
 
 
+def dashboard_call_timeout_seconds() -> float:
+    """Per-call dashboard read timeout; pools serving the dashboard use it as statement_timeout."""
+    return _float_env("DASHBOARD_CALL_TIMEOUT_SECONDS", DEFAULT_DASHBOARD_CALL_TIMEOUT_SECONDS)
+
+
 
 
 def _normalize_deployed_access_status(payload: object) -> dict[str, object]:
@@ -358,8 +471,25 @@ def _classify_learning_reliability(
     }
 
 
+def _exposure_metric_names() -> tuple[str, str, str]:
+    return (
+        os.getenv("PORTFOLIO_EXPOSURE_CRYPTO_BTC_ETH_METRIC", "portfolio_exposure_crypto_btc_eth_share"),
+        os.getenv("PORTFOLIO_EXPOSURE_CRYPTO_ALT_METRIC", "portfolio_exposure_crypto_alt_share"),
+        os.getenv("PORTFOLIO_EXPOSURE_LEVERAGE_METRIC", "portfolio_exposure_leverage_share"),
+    )
+
+
+def _policy_series_keys() -> tuple[str, ...]:
+    keys: list[str] = []
+    for metric_keys in POLICY_UNIVERSE_REGION_SENTINELS.values():
+        keys.extend(metric_keys)
+    keys.extend(POLICY_CHECK_BENCHMARK_KEYS)
+    return tuple(dict.fromkeys(keys))
+
+
 def _build_policy_compliance(
-    repository: DashboardRepositoryProtocol,
+    macro_points_by_key: dict[str, object] | None,
+    canonical_metric_rows: dict[str, object],
     counters: dict[str, object],
     learning_metrics_by_horizon: dict[str, dict[str, object]],
     latest_run_time: str | None,
@@ -367,7 +497,7 @@ def _build_policy_compliance(
     checks: list[dict[str, object]] = []
 
     raw_events = int(counters.get("raw_events", 0) or 0)
-    canonical_events = int(counters.get("canonical_events", 0) or 0)
+    canonical_facts = int(counters.get("canonical_facts", 0) or 0)
 
     universe_regions_present: dict[str, bool] = {
         region: False for region in POLICY_UNIVERSE_REGION_SENTINELS
@@ -376,10 +506,10 @@ def _build_policy_compliance(
         region: [] for region in POLICY_UNIVERSE_REGION_SENTINELS
     }
 
-    if hasattr(repository, "read_macro_series_points"):
+    if macro_points_by_key is not None:
         for region, metric_keys in POLICY_UNIVERSE_REGION_SENTINELS.items():
             for metric_key in metric_keys:
-                points = _safe_repo_call([], repository.read_macro_series_points, metric_key=metric_key, limit=1)
+                points = macro_points_by_key.get(metric_key, [])
                 if isinstance(points, list) and points:
                     top = points[0] if isinstance(points[0], dict) else {}
                     universe_regions_present[region] = True
@@ -408,7 +538,7 @@ def _build_policy_compliance(
     if all(universe_regions_present.values()):
         universe_status = "PASS"
         universe_reason = "Region-aware HARD evidence confirms US/KR/Crypto coverage."
-    elif raw_events > 0 and canonical_events > 0:
+    elif raw_events > 0 and canonical_facts > 0:
         universe_status = "WARN"
         universe_reason = (
             "Ingest data exists but region-aware coverage evidence is incomplete: "
@@ -426,7 +556,7 @@ def _build_policy_compliance(
             "as_of": latest_run_time,
             "evidence": {
                 "raw_events": raw_events,
-                "canonical_events": canonical_events,
+                "canonical_facts": canonical_facts,
                 "regions_present": universe_regions_present,
                 "missing_regions": missing_regions,
                 "region_metric_evidence": universe_region_evidence,
@@ -468,9 +598,7 @@ def _build_policy_compliance(
         }
     )
 
-    crypto_btc_eth_metric = os.getenv("PORTFOLIO_EXPOSURE_CRYPTO_BTC_ETH_METRIC", "portfolio_exposure_crypto_btc_eth_share")
-    crypto_alt_metric = os.getenv("PORTFOLIO_EXPOSURE_CRYPTO_ALT_METRIC", "portfolio_exposure_crypto_alt_share")
-    leverage_metric = os.getenv("PORTFOLIO_EXPOSURE_LEVERAGE_METRIC", "portfolio_exposure_leverage_share")
+    crypto_btc_eth_metric, crypto_alt_metric, leverage_metric = _exposure_metric_names()
 
     def _to_share(value: object) -> float | None:
         try:
@@ -485,13 +613,9 @@ def _build_policy_compliance(
         except (TypeError, ValueError):
             return None
 
-    crypto_btc_eth_row = None
-    crypto_alt_row = None
-    leverage_row = None
-    if hasattr(repository, "read_latest_canonical_metric"):
-        crypto_btc_eth_row = _safe_repo_call(None, repository.read_latest_canonical_metric, metric_name=crypto_btc_eth_metric)
-        crypto_alt_row = _safe_repo_call(None, repository.read_latest_canonical_metric, metric_name=crypto_alt_metric)
-        leverage_row = _safe_repo_call(None, repository.read_latest_canonical_metric, metric_name=leverage_metric)
+    crypto_btc_eth_row = canonical_metric_rows.get(crypto_btc_eth_metric)
+    crypto_alt_row = canonical_metric_rows.get(crypto_alt_metric)
+    leverage_row = canonical_metric_rows.get(leverage_metric)
 
     btc_eth_share = _to_share((crypto_btc_eth_row or {}).get("metric_value") if isinstance(crypto_btc_eth_row, dict) else None)
     alt_share = _to_share((crypto_alt_row or {}).get("metric_value") if isinstance(crypto_alt_row, dict) else None)
@@ -607,9 +731,9 @@ def _build_policy_compliance(
 
     benchmark_points: dict[str, int] = {}
     benchmark_as_of: dict[str, object] = {}
-    if hasattr(repository, "read_macro_series_points"):
+    if macro_points_by_key is not None:
         for key in POLICY_CHECK_BENCHMARK_KEYS:
-            points = _safe_repo_call([], repository.read_macro_series_points, metric_key=key, limit=1)
+            points = macro_points_by_key.get(key, [])
             if isinstance(points, list) and points:
                 benchmark_points[key] = len(points)
                 top = points[0] if isinstance(points[0], dict) else {}
@@ -699,26 +823,127 @@ def _build_policy_compliance(
     return {"checks": checks, "summary": summary}
 
 
+def _load_attribution_gap_details(
+    repository: DashboardRepositoryProtocol,
+    attribution_gap_rows: list[dict[str, object]],
+    max_preview_chars: int = 240,
+) -> dict[int, dict[str, object]]:
+    gap_ids = [
+        row["attribution_id"]
+        for row in attribution_gap_rows
+        if row.get("evidence_gap_reason") != "none" and isinstance(row.get("attribution_id"), int)
+    ]
+    if not gap_ids:
+        return {}
+
+    # One batched query per render; per-row lookups remain only for legacy repositories.
+    if hasattr(repository, "read_forecast_error_attribution_details"):
+        details = _safe_repo_call(
+            {},
+            repository.read_forecast_error_attribution_details,
+            attribution_ids=gap_ids,
+            max_preview_chars=max_preview_chars,
+        )
+        if not isinstance(details, dict):
+            return {}
+        return {
+            attribution_id: detail
+            for attribution_id, detail in details.items()
+            if isinstance(attribution_id, int) and isinstance(detail, dict)
+        }
+
+    gap_details: dict[int, dict[str, object]] = {}
+    if hasattr(repository, "read_forecast_error_attribution_detail"):
+        for attribution_id in gap_ids:
+            detail = _safe_repo_call(
+                None,
+                repository.read_forecast_error_attribution_detail,
+                attribution_id=attribution_id,
+                max_preview_chars=max_preview_chars,
+            )
+            if isinstance(detail, dict):
+                gap_details[attribution_id] = detail
+    return gap_details
+
+
 def build_dashboard_view(
     repository: DashboardRepositoryProtocol,
     limit: int = 20,
+    *,
+    prefetch_attribution_details: bool = True,
+    max_workers: int | None = None,
+    call_timeout_seconds: float | None = None,
+    total_deadline_seconds: float | None = None,
 ) -> dict[str, object]:
-    recent_runs = _safe_repo_call([], repository.read_latest_runs, limit=limit)
-    counters = _safe_repo_call(
-        {"raw_events": 0, "canonical_events": 0, "quarantine_events": 0},
-        repository.read_status_counters,
+    """Build the operator view model from independent repository reads.
+
+    Reads are issued concurrently (thread pool, one connection per call) and
+    each panel falls back to its default when its read fails, exceeds
+    ``call_timeout_seconds`` or misses the shared ``total_deadline_seconds``.
+    Per-call status/latency is reported under ``load_timings``.
+    """
+    load_started = time.monotonic()
+    worker_count = max_workers or _int_env("DASHBOARD_LOAD_MAX_WORKERS", DEFAULT_DASHBOARD_LOAD_MAX_WORKERS)
+    per_call_timeout = call_timeout_seconds or dashboard_call_timeout_seconds()
+    deadline = load_started + (
+        total_deadline_seconds
+        or _float_env("DASHBOARD_LOAD_DEADLINE_SECONDS", DEFAULT_DASHBOARD_LOAD_DEADLINE_SECONDS)
     )
+
     tracked_horizons = REQUIRED_LEARNING_HORIZONS
+    calls: dict[str, RepoCallSpec] = {
+        "recent_runs": ([], repository.read_latest_runs, {"limit": limit}),
+        "counters": (
+            {"raw_events": 0, "canonical_facts": 0, "quarantine_events": 0},
+            repository.read_status_counters,
+            {},
+        ),
+    }
+    for horizon in tracked_horizons:
+        calls[f"learning_metrics:{horizon}"] = (
+            _default_learning_metrics(horizon),
+            repository.read_learning_metrics,
+            {"horizon": horizon},
+        )
+    if hasattr(repository, "read_forecast_error_category_stats"):
+        calls["category_stats"] = (
+            [],
+            repository.read_forecast_error_category_stats,
+            {"horizon": "1M", "limit": 5},
+        )
+    if hasattr(repository, "read_forecast_error_attributions"):
+        calls["attributions"] = (
+            [],
+            repository.read_forecast_error_attributions,
+            {"horizon": "1M", "limit": 200},
+        )
+    if hasattr(repository, "read_pending_refresh_requests"):
+        calls["pending_refresh_requests"] = ([], repository.read_pending_refresh_requests, {"limit": 50})
+    has_macro_series = hasattr(repository, "read_macro_series_points")
+    if has_macro_series:
+        for metric_key in _policy_series_keys():
+            calls[f"macro_series_points:{metric_key}"] = (
+                [],
+                repository.read_macro_series_points,
+                {"metric_key": metric_key, "limit": 1},
+            )
+    if hasattr(repository, "read_latest_canonical_metric"):
+        for metric_name in _exposure_metric_names():
+            calls[f"canonical_metric:{metric_name}"] = (
+                None,
+                repository.read_latest_canonical_metric,
+                {"metric_name": metric_name},
+            )
+
+    loaded, load_timings = _run_repo_calls(calls, worker_count, per_call_timeout, deadline)
+
+    recent_runs = loaded["recent_runs"]
+    counters = loaded["counters"]
     thresholds = _reliability_thresholds()
     min_realized_by_horizon = thresholds["min_realized_by_horizon"]
     coverage_floor = float(thresholds["coverage_floor"])
     learning_metrics_by_horizon = {
-        horizon: _safe_repo_call(
-            _default_learning_metrics(horizon),
-            repository.read_learning_metrics,
-            horizon=horizon,
-        )
-        for horizon in tracked_horizons
+        horizon: loaded[f"learning_metrics:{horizon}"] for horizon in tracked_horizons
     }
     learning_reliability_by_horizon = {
         horizon: _classify_learning_reliability(
@@ -744,13 +969,8 @@ def build_dashboard_view(
         "evidence_gap_count": 0,
         "evidence_gap_coverage": None,
     }
-    if hasattr(repository, "read_forecast_error_category_stats"):
-        category_stats = _safe_repo_call(
-            [],
-            repository.read_forecast_error_category_stats,
-            horizon="1M",
-            limit=5,
-        )
+    if "category_stats" in calls:
+        category_stats = loaded["category_stats"]
         if isinstance(category_stats, list) and category_stats:
             top = category_stats[0]
             attribution_summary = {
@@ -767,13 +987,8 @@ def build_dashboard_view(
 
     attribution_gap_rows: list[dict[str, object]] = []
     attribution_gap_details: dict[int, dict[str, object]] = {}
-    if hasattr(repository, "read_forecast_error_attributions"):
-        attribution_rows = _safe_repo_call(
-            [],
-            repository.read_forecast_error_attributions,
-            horizon="1M",
-            limit=200,
-        )
+    if "attributions" in calls:
+        attribution_rows = loaded["attributions"]
         if isinstance(attribution_rows, list) and attribution_rows:
             categories = [
                 str(row.get("category", "unknown"))
@@ -837,21 +1052,24 @@ def build_dashboard_view(
                 if evidence_gap_reason == "missing_hard_and_soft":
                     evidence_gap_count += 1
 
-            if hasattr(repository, "read_forecast_error_attribution_detail"):
-                for row in attribution_gap_rows:
-                    if row.get("evidence_gap_reason") == "none":
-                        continue
-                    attribution_id = row.get("attribution_id")
-                    if not isinstance(attribution_id, int):
-                        continue
-                    detail = _safe_repo_call(
-                        None,
-                        repository.read_forecast_error_attribution_detail,
-                        attribution_id=attribution_id,
-                        max_preview_chars=240,
-                    )
-                    if isinstance(detail, dict):
-                        attribution_gap_details[attribution_id] = detail
+            if prefetch_attribution_details:
+                # Depends on the attribution rows, so it runs as a second phase
+                # under the same deadline.
+                detail_results, detail_timings = _run_repo_calls(
+                    {
+                        "attribution_details": (
+                            {},
+                            _load_attribution_gap_details,
+                            {"repository": repository, "attribution_gap_rows": attribution_gap_rows},
+                        )
+                    },
+                    1,
+                    per_call_timeout,
+                    deadline,
+                )
+                load_timings.update(detail_timings)
+                details = detail_results["attribution_details"]
+                attribution_gap_details = details if isinstance(details, dict) else {}
 
             if valid_rows > 0:
                 attribution_summary["total"] = valid_rows
@@ -864,8 +1082,8 @@ def build_dashboard_view(
                 attribution_summary["evidence_gap_coverage"] = evidence_gap_count / valid_rows
 
     pending_refresh_requests: list[dict[str, object]] = []
-    if hasattr(repository, "read_pending_refresh_requests"):
-        pending_rows = _safe_repo_call([], repository.read_pending_refresh_requests, limit=50)
+    if "pending_refresh_requests" in calls:
+        pending_rows = loaded["pending_refresh_requests"]
         if isinstance(pending_rows, list):
             pending_refresh_requests = [row for row in pending_rows if isinstance(row, dict)]
 
@@ -896,7 +1114,15 @@ def build_dashboard_view(
         "attribution_gap_rows": attribution_gap_rows,
         "attribution_gap_details": attribution_gap_details,
         "policy_compliance": _build_policy_compliance(
-            repository=repository,
+            macro_points_by_key=(
+                {key: loaded[f"macro_series_points:{key}"] for key in _policy_series_keys()}
+                if has_macro_series
+                else None
+            ),
+            canonical_metric_rows={
+                metric_name: loaded.get(f"canonical_metric:{metric_name}")
+                for metric_name in _exposure_metric_names()
+            },
             counters=counters if isinstance(counters, dict) else {},
             learning_metrics_by_horizon=learning_metrics_by_horizon,
             latest_run_time=last_run_time or None,
@@ -904,4 +1130,66 @@ def build_dashboard_view(
         "deployed_access": _load_deployed_access_status(),
         "pending_refresh_requests": pending_refresh_requests,
         "recent_runs": recent_runs,
+        "load_timings": {
+            "total_ms": (time.monotonic() - load_started) * 1000.0,
+            "degraded_calls": sorted(
+                key for key, timing in load_timings.items() if timing.get("status") not in {"ok", "skipped"}
+            ),
+            "calls": load_timings,
+        },
+        "data_source": {"kind": "live"},
+    }
+
+
+def dashboard_snapshot_max_age_seconds() -> int:
+    return _int_env("DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS", DEFAULT_DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS)
+
+
+def read_fresh_dashboard_snapshot(
+    repository: object,
+    max_age_seconds: int | None = None,
+    now: datetime | None = None,
+) -> dict[str, object] | None:
+    """Return the newest precomputed view when it is within the staleness budget.
+
+    Environment-derived blocks (deployed access status) are re-evaluated for
+    the reading process instead of trusting the snapshot writer's env.
+    """
+    read_snapshot = getattr(repository, "read_latest_dashboard_snapshot", None)
+    row = _safe_repo_call(None, read_snapshot)
+    if not isinstance(row, dict):
+        return None
+
+    view = row.get("view")
+    if isinstance(view, str):
+        try:
+            view = json.loads(view)
+        except json.JSONDecodeError:
+            return None
+    if not isinstance(view, dict):
+        return None
+
+    computed_at = row.get("computed_at")
+    computed_at_dt = (
+        computed_at if isinstance(computed_at, datetime) else _parse_iso_utc(computed_at)
+    )
+    if computed_at_dt is None:
+        return None
+    if computed_at_dt.tzinfo is None:
+        computed_at_dt = computed_at_dt.replace(tzinfo=timezone.utc)
+
+    budget = max_age_seconds if max_age_seconds is not None else dashboard_snapshot_max_age_seconds()
+    age_seconds = max(0.0, ((now or datetime.now(timezone.utc)) - computed_at_dt).total_seconds())
+    if age_seconds > budget:
+        return None
+
+    view = dict(view)
+    view["deployed_access"] = _load_deployed_access_status()
+    view["data_source"] = {
+        "kind": "snapshot",
+        "snapshot_id": row.get("id"),
+        "computed_at": computed_at_dt.isoformat(),
+        "age_seconds": age_seconds,
+        "max_age_seconds": budget,
     }
+    return view
@@ -1,13 +1,28 @@
-from collections.abc import Mapping
+import threading
+import weakref
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional, Protocol
 
-from src.research.normalization import normalize_payload
+from src.research.contracts import CanonicalFact, SeriesBlock
+from src.research.normalization import (
+    canonical_facts_from_blocks,
+    normalize_canonical_facts,
+    normalize_payload_blocks,
+)
 
+from .payload_blobs import HashedPayload
 from .pit_query import filter_point_in_time
 from .quality_gate import BatchMetrics, evaluate_quality
-from .revision_store import RevisionStore
+from .quality_profiler import (
+    BatchProfile,
+    accept_batch_schema,
+    profile_batch,
+    series_from_blocks,
+    series_from_facts,
+)
+from .revision_store import PutResult, RevisionStore, revision_content
 from .source_registry import SourceDescriptor, evaluate_source
 
 
@@ -17,6 +32,8 @@ class JobResult:
     canonical_written: int
     quarantined: int
     dashboard: dict[str, int]
+    skipped_unchanged: bool = False
+    quality: Optional[BatchProfile] = None
 
 
 class IngestionRepositoryProtocol(Protocol):
@@ -24,13 +41,43 @@ class IngestionRepositoryProtocol(Protocol):
 
     def write_canonical(self, row: Mapping[str, object]) -> None: ...
 
+    def write_canonical_facts(self, facts: list[CanonicalFact]) -> int: ...
+
     def write_quarantine(self, reason: str, payload: Mapping[str, object]) -> None: ...
 
-    def write_macro_series_points(self, points: list[object]) -> int: ...
+    def write_macro_series_points(self, points: list[SeriesBlock]) -> int: ...
+
+    def read_payload_revision(self, idempotency_key: str) -> Optional[tuple[int, str]]: ...
+
+    def put_payload_revision(self, idempotency_key: str, payload_hash: str) -> PutResult: ...
+
+    def read_source_schema(self, source: str) -> Optional[dict[str, object]]: ...
+
+    def write_source_schema(
+        self,
+        source: str,
+        fingerprint: str,
+        field_types: Mapping[str, str],
+        required_fields: Sequence[str],
+    ) -> None: ...
 
     def snapshot_counts(self) -> dict[str, int]: ...
 
 
+# One store per repository so its front cache outlives a single job call.
+_REVISION_STORES: "weakref.WeakKeyDictionary[object, RevisionStore]" = weakref.WeakKeyDictionary()
+_REVISION_STORES_LOCK = threading.Lock()
+
+
+def _revision_store_for(repository: IngestionRepositoryProtocol) -> RevisionStore:
+    with _REVISION_STORES_LOCK:
+        store = _REVISION_STORES.get(repository)
+        if store is None:
+            store = RevisionStore(backend=repository)
+            _REVISION_STORES[repository] = store
+        return store
+
+
 def _resolve_entity_id(rows: list[dict[str, object]]) -> str:
     if not rows:
         return "unknown"
@@ -53,56 +100,129 @@ def _resolve_available_at(rows: list[dict[str, object]], decision_time: datetime
     return value
 
 
+def _normalize_batch(
+    source_name: str,
+    payload: Mapping[str, object],
+    entity_id: str,
+    available_at: datetime,
+    lineage_id: str,
+) -> tuple[Optional[list[SeriesBlock]], list[CanonicalFact]]:
+    """(series blocks for series sources else None, canonical facts)."""
+    if source_name in {"fred", "ecos"}:
+        series_blocks = normalize_payload_blocks(
+            source=source_name,
+            payload=payload,
+            entity_id=entity_id,
+            available_at=available_at,
+            lineage_id=lineage_id,
+        )
+        return series_blocks, canonical_facts_from_blocks(series_blocks)
+    facts = normalize_canonical_facts(
+        source=source_name,
+        payload=payload,
+        entity_id=entity_id,
+        available_at=available_at,
+        lineage_id=lineage_id,
+    )
+    return None, facts
+
+
 def run_ingestion_job(
     source: SourceDescriptor,
-    metrics: BatchMetrics,
+    metrics: Optional[BatchMetrics],
     idempotency_key: str,
     payload: Mapping[str, object],
     rows: list[dict[str, object]],
     decision_time: datetime,
     repository: IngestionRepositoryProtocol,
     revision_store: Optional[RevisionStore] = None,
+    revision_key: Optional[str] = None,
 ) -> JobResult:
-    store = revision_store or RevisionStore()
+    # Hashed once here; the revision check, revision record and blob store reuse it.
+    payload = HashedPayload(payload)
+    store = revision_store or _revision_store_for(repository)
+    # Revisions are tracked per revision_key (e.g. source|entity) so an unchanged pull on a
+    # later day is a noop; idempotency_key stays the run's lineage.
+    revision_key = revision_key or idempotency_key
+    source_name = source.name.lower()
+    # Compared without request-date stamps (e.g. FRED realtime_*), which change every pull.
+    revision_payload = revision_content(source_name, payload)
+    pit_rows = filter_point_in_time(rows, decision_time)
+
+    if store.is_unchanged(revision_key, revision_payload):
+        # Same content as the last promoted revision: nothing to write.
+        dashboard = repository.snapshot_counts()
+        dashboard["pit_rows"] = len(pit_rows)
+        dashboard["macro_series_points_written"] = 0
+        dashboard["canonical_facts_written"] = 0
+        return JobResult(
+            raw_written=0,
+            canonical_written=0,
+            quarantined=0,
+            dashboard=dashboard,
+            skipped_unchanged=True,
+        )
+
+    entity_id = _resolve_entity_id(rows)
+    available_at = _resolve_available_at(rows, decision_time)
+    normalized: Optional[tuple[Optional[list[SeriesBlock]], list[CanonicalFact]]] = None
+    profile: Optional[BatchProfile] = None
+    if metrics is None:
+        # Profile the normalized batch; the promoted path writes the same blocks and facts.
+        normalized = _normalize_batch(source_name, payload, entity_id, available_at, idempotency_key)
+        series_blocks, facts = normalized
+        profile = profile_batch(
+            source=source_name,
+            payload=payload,
+            series=series_from_blocks(series_blocks) if series_blocks is not None else series_from_facts(facts),
+            decision_time=decision_time,
+            schema_store=repository,
+        )
+        metrics = profile.metrics
 
     source_eval = evaluate_source(source)
     quality_eval = evaluate_quality(metrics)
 
     repository.write_raw(payload)
-    store.put(idempotency_key, payload)
 
     macro_series_points_written = 0
+    canonical_facts_written = 0
     if source_eval.admitted and quality_eval.promote:
-        repository.write_canonical(payload)
         canonical_written = 1
         quarantined = 0
 
-        source_name = source.name.lower()
-        if source_name in {"fred", "ecos"}:
-            normalized_points = normalize_payload(
-                source=source_name,
-                payload=payload,
-                entity_id=_resolve_entity_id(rows),
-                available_at=_resolve_available_at(rows, decision_time),
-                lineage_id=idempotency_key,
-            )
-            macro_series_points_written = repository.write_macro_series_points(
-                normalized_points
-            )
+        if normalized is None:
+            normalized = _normalize_batch(source_name, payload, entity_id, available_at, idempotency_key)
+        series_blocks, facts = normalized
+        if series_blocks is not None:
+            macro_series_points_written = repository.write_macro_series_points(series_blocks)
+
+        if facts:
+            canonical_facts_written = repository.write_canonical_facts(facts)
+        else:
+            # Payloads without extractable facts (profiles, unknown shapes) keep the event marker.
+            repository.write_canonical(payload)
+        # Recorded only once everything is written, so a failed run is retried in full;
+        # quarantined payloads are not recorded and get re-evaluated on the next pull.
+        # Likewise only a promoted batch may set or widen the source's accepted schema.
+        if profile is not None:
+            accept_batch_schema(repository, source_name, profile)
+        store.put(revision_key, revision_payload)
     else:
         reason = "source_gate_failed" if not source_eval.admitted else "quality_gate_failed"
         repository.write_quarantine(reason=reason, payload=payload)
         canonical_written = 0
         quarantined = 1
 
-    pit_rows = filter_point_in_time(rows, decision_time)
     dashboard = repository.snapshot_counts()
     dashboard["pit_rows"] = len(pit_rows)
     dashboard["macro_series_points_written"] = macro_series_points_written
+    dashboard["canonical_facts_written"] = canonical_facts_written
 
     return JobResult(
         raw_written=1,
         canonical_written=canonical_written,
         quarantined=quarantined,
         dashboard=dashboard,
+        quality=profile,
     )
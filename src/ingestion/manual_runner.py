@@ -14,13 +14,14 @@ class RunHistoryRepositoryProtocol(Protocol):
 
 def run_manual_update(
     source: SourceDescriptor,
-    metrics: BatchMetrics,
+    metrics: Optional[BatchMetrics],
     idempotency_key: str,
     payload: Mapping[str, object],
     rows: list[dict[str, object]],
     decision_time: datetime,
     repository: IngestionRepositoryProtocol,
     run_history_repository: Optional[RunHistoryRepositoryProtocol] = None,
+    revision_key: Optional[str] = None,
 ) -> dict[str, object]:
     run_id = str(uuid4())
     started_at = datetime.now(timezone.utc)
@@ -34,9 +35,15 @@ def run_manual_update(
             rows=rows,
             decision_time=decision_time,
             repository=repository,
+            revision_key=revision_key,
         )
-        status = "success" if result.quarantined == 0 else "quarantine"
+        if result.skipped_unchanged:
+            status = "noop"
+        else:
+            status = "success" if result.quarantined == 0 else "quarantine"
         error_message: Optional[str] = None
+        if status == "quarantine" and result.quality is not None and result.quality.reasons:
+            error_message = "; ".join(result.quality.reasons)
         raw_written = result.raw_written
         canonical_written = result.canonical_written
         quarantined = result.quarantined
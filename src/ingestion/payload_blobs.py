@@ -0,0 +1,173 @@
+import hashlib
+import json
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from functools import cached_property
+
+
+PAYLOAD_BLOB_ENCODING = "zlib"
+DEFAULT_KNOWN_BLOB_HASHES = 4096
+# Lists are encoded this many elements at a time by the C encoder; dict levels are walked
+# in Python so no single chunk holds a whole large payload.
+CANONICAL_LIST_CHUNK = 256
+_HASH_BUFFER_CHARS = 1 << 16
+
+_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+    default=str,
+)
+
+
+def iter_canonical_chunks(value: object) -> Iterator[str]:
+    """Canonical JSON (sorted keys, compact, UTF-8 text, ``str`` fallback) in pieces.
+
+    Joining the pieces gives exactly the one-shot encoding, so hashes stay comparable
+    with payloads serialized whole.
+    """
+    if isinstance(value, dict):
+        if not value:
+            yield "{}"
+            return
+        # Non-string keys are rare; let the encoder coerce and order them.
+        if not all(isinstance(key, str) for key in value):
+            yield _ENCODER.encode(value)
+            return
+        separator = "{"
+        for key in sorted(value):
+            yield separator + _ENCODER.encode(key) + ":"
+            yield from iter_canonical_chunks(value[key])
+            separator = ","
+        yield "}"
+    elif isinstance(value, (list, tuple)):
+        if len(value) <= CANONICAL_LIST_CHUNK:
+            yield _ENCODER.encode(value)
+            return
+        separator = "["
+        for start in range(0, len(value), CANONICAL_LIST_CHUNK):
+            # list() so tuples and lists slice to the same JSON array.
+            yield separator + _ENCODER.encode(list(value[start : start + CANONICAL_LIST_CHUNK]))[1:-1]
+            separator = ","
+        yield "]"
+    else:
+        yield _ENCODER.encode(value)
+
+
+def _iter_canonical_bytes(payload: Mapping[str, object]) -> Iterator[bytes]:
+    # Small chunks are buffered so hashlib/zlib see a few large updates.
+    buffered: list[str] = []
+    size = 0
+    root = payload.data if isinstance(payload, HashedPayload) else payload
+    if not isinstance(root, dict):
+        root = dict(root)
+    for chunk in iter_canonical_chunks(root):
+        buffered.append(chunk)
+        size += len(chunk)
+        if size >= _HASH_BUFFER_CHARS:
+            yield "".join(buffered).encode("utf-8")
+            buffered, size = [], 0
+    if buffered:
+        yield "".join(buffered).encode("utf-8")
+
+
+def canonical_payload_bytes(payload: Mapping[str, object]) -> bytes:
+    """UTF-8 JSON with sorted keys and no insignificant whitespace: equal payloads, equal bytes."""
+    return b"".join(_iter_canonical_bytes(payload))
+
+
+def payload_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _stream_payload_hash(payload: Mapping[str, object]) -> str:
+    digest = hashlib.sha256()
+    for piece in _iter_canonical_bytes(payload):
+        digest.update(piece)
+    return digest.hexdigest()
+
+
+class HashedPayload(Mapping[str, object]):
+    """Read-only view of a payload that computes its canonical hash once.
+
+    run_ingestion_job wraps the payload for the duration of a job, so the revision
+    check, the revision record and the raw blob store all share one hash.
+    """
+
+    def __init__(self, data: Mapping[str, object]) -> None:
+        self.data: Mapping[str, object] = data.data if isinstance(data, HashedPayload) else data
+
+    def __getitem__(self, key: str) -> object:
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @cached_property
+    def payload_hash(self) -> str:
+        return _stream_payload_hash(self.data)
+
+
+def canonical_payload_hash(payload: Mapping[str, object]) -> str:
+    """sha256 of the canonical JSON, computed incrementally (memoized for HashedPayload)."""
+    if isinstance(payload, HashedPayload):
+        return payload.payload_hash
+    return _stream_payload_hash(payload)
+
+
+def compress_payload_bytes(raw: bytes) -> bytes:
+    return zlib.compress(raw, 6)
+
+
+def compress_payload(payload: Mapping[str, object]) -> tuple[bytes, int]:
+    """(zlib body, uncompressed byte size) without materializing the uncompressed JSON."""
+    compressor = zlib.compressobj(6)
+    parts: list[bytes] = []
+    byte_size = 0
+    for piece in _iter_canonical_bytes(payload):
+        byte_size += len(piece)
+        parts.append(compressor.compress(piece))
+    parts.append(compressor.flush())
+    return b"".join(parts), byte_size
+
+
+def decode_payload(body: object, encoding: str = PAYLOAD_BLOB_ENCODING) -> dict[str, object]:
+    # psycopg2 returns BYTEA as memoryview.
+    data = bytes(body)  # type: ignore[call-overload]
+    if encoding == "zlib":
+        data = zlib.decompress(data)
+    elif encoding != "identity":
+        raise ValueError(f"unsupported payload blob encoding: {encoding}")
+    return json.loads(data.decode("utf-8"))
+
+
+class KnownBlobHashes:
+    """Bounded LRU of hashes already committed to raw_payload_blobs by this process.
+
+    Blobs are immutable, so a remembered hash never goes stale and the blob body does
+    not need to be sent again.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_KNOWN_BLOB_HASHES) -> None:
+        self.max_entries = max(1, max_entries)
+        self._hashes: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, payload_hash: object) -> bool:
+        with self._lock:
+            if payload_hash not in self._hashes:
+                return False
+            self._hashes.move_to_end(payload_hash)  # type: ignore[arg-type]
+            return True
+
+    def add(self, payload_hash: str) -> None:
+        with self._lock:
+            self._hashes[payload_hash] = None
+            self._hashes.move_to_end(payload_hash)
+            while len(self._hashes) > self.max_entries:
+                self._hashes.popitem(last=False)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from datetime import date, datetime, time, timedelta, timezone
+
+from src.research.fx import DEFAULT_BASE_CURRENCY, fx_candidate_keys
+
+from .realization_evaluator import PriceSeries
+
+
+POSITION_ASSET_CLASSES: tuple[str, ...] = ("equity", "etf", "crypto", "bond", "cash")
+POSITION_REGIONS: tuple[str, ...] = ("US", "KR", "CRYPTO", "OTHER")
+CRYPTO_CORE_SYMBOLS = frozenset({"BTC", "ETH"})
+DEFAULT_MAX_PRICE_LAG_DAYS = 5
+VALUATION_SOURCE = "portfolio_valuation"
+
+# Canonical metric names match the dashboard's policy-check defaults.
+EXPOSURE_METRIC_BTC_ETH = "portfolio_exposure_crypto_btc_eth_share"
+EXPOSURE_METRIC_ALT = "portfolio_exposure_crypto_alt_share"
+EXPOSURE_METRIC_LEVERAGE = "portfolio_exposure_leverage_share"
+
+
+def _to_date(value: object) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and value.strip():
+        try:
+            return date.fromisoformat(value.strip()[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def price_series_key(position: Mapping[str, object]) -> str | None:
+    if str(position.get("asset_class") or "") == "cash":
+        return None
+    key = position.get("price_series_key") or position.get("symbol")
+    return str(key).strip().upper() if key else None
+
+
+def plan_valuation_series(
+    positions: list[Mapping[str, object]],
+    base_currency: str = DEFAULT_BASE_CURRENCY,
+    max_price_lag_days: int = DEFAULT_MAX_PRICE_LAG_DAYS,
+) -> tuple[list[str], datetime, datetime]:
+    """Price and FX keys plus the [start, end] window covering every position date."""
+    days = [day for day in (_to_date(p.get("as_of")) for p in positions) if day is not None]
+    if not days:
+        now = datetime.now(timezone.utc)
+        return [], now, now
+    keys: list[str] = []
+    for position in positions:
+        key = price_series_key(position)
+        if key:
+            keys.append(key)
+        currency = str(position.get("currency") or base_currency).upper()
+        if currency != base_currency:
+            keys.extend(key for key, _ in fx_candidate_keys(currency, base_currency))
+    start = datetime.combine(min(days) - timedelta(days=max_price_lag_days), time.min, tzinfo=timezone.utc)
+    end = datetime.combine(max(days), time.max, tzinfo=timezone.utc)
+    return list(dict.fromkeys(keys)), start, end
+
+
+class _SeriesLookup:
+    """End-of-day level lookups with a staleness bound, memoized per (key, day)."""
+
+    def __init__(self, series_by_key: Mapping[str, PriceSeries], max_lag_days: int) -> None:
+        self._series_by_key = series_by_key
+        self._max_lag_days = max_lag_days
+        self._memo: dict[tuple[str, date], float | None] = {}
+
+    def level(self, key: str, day: date) -> float | None:
+        memo_key = (key, day)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+        series = self._series_by_key.get(key)
+        value: float | None = None
+        if series is not None:
+            moment = datetime.combine(day, time.max, tzinfo=timezone.utc)
+            idx = series.index_at_or_before(moment)
+            if idx >= 0:
+                observed = datetime.fromtimestamp(series.timestamps[idx], tz=timezone.utc).date()
+                if (day - observed).days <= self._max_lag_days:
+                    value = series.levels[idx]
+        self._memo[memo_key] = value
+        return value
+
+    def fx_rate(self, currency: str, base_currency: str, day: date) -> float | None:
+        if currency == base_currency:
+            return 1.0
+        for key, inverted in fx_candidate_keys(currency, base_currency):
+            rate = self.level(key, day)
+            if rate is not None and rate > 0:
+                return 1.0 / rate if inverted else rate
+        return None
+
+
+def value_positions(
+    positions: list[Mapping[str, object]],
+    series_by_key: Mapping[str, PriceSeries],
+    base_currency: str = DEFAULT_BASE_CURRENCY,
+    max_price_lag_days: int = DEFAULT_MAX_PRICE_LAG_DAYS,
+) -> tuple[list[dict[str, object]], dict[str, object]]:
+    """Value holdings per day; returns (valuations, skipped).
+
+    A day is only valued when every holding has a price and FX rate within the lag
+    bound, so a snapshot never mixes priced and unpriced positions.
+    """
+    lookup = _SeriesLookup(series_by_key, max_price_lag_days)
+    by_day: dict[date, list[Mapping[str, object]]] = {}
+    invalid = 0
+    for position in positions:
+        day = _to_date(position.get("as_of"))
+        if day is None:
+            invalid += 1
+            continue
+        by_day.setdefault(day, []).append(position)
+
+    valuations: list[dict[str, object]] = []
+    skipped_days: dict[str, list[str]] = {}
+    for day in sorted(by_day):
+        totals = {"nav": 0.0, "US": 0.0, "KR": 0.0, "crypto": 0.0, "crypto_core": 0.0, "leverage": 0.0}
+        missing: list[str] = []
+        for position in by_day[day]:
+            symbol = str(position.get("symbol") or "").upper()
+            currency = str(position.get("currency") or base_currency).upper()
+            key = price_series_key(position)
+            price = 1.0 if key is None else lookup.level(key, day)
+            rate = lookup.fx_rate(currency, base_currency, day)
+            if price is None or rate is None:
+                missing.append(symbol if price is None else f"{symbol}:{currency}")
+                continue
+            try:
+                quantity = float(position.get("quantity"))  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                missing.append(symbol)
+                continue
+            value = quantity * price * rate
+            if not math.isfinite(value):
+                missing.append(symbol)
+                continue
+
+            totals["nav"] += value
+            region = str(position.get("region") or "OTHER").upper()
+            if region in ("US", "KR"):
+                totals[region] += value
+            if str(position.get("asset_class")) == "crypto":
+                totals["crypto"] += value
+                if symbol in CRYPTO_CORE_SYMBOLS:
+                    totals["crypto_core"] += value
+            if bool(position.get("is_leveraged")):
+                totals["leverage"] += value
+
+        if missing:
+            skipped_days[day.isoformat()] = sorted(set(missing))
+            continue
+        nav = totals["nav"]
+        if nav <= 0:
+            skipped_days[day.isoformat()] = ["non_positive_nav"]
+            continue
+
+        crypto = totals["crypto"]
+        # portfolio_snapshots only accepts weights in [0, 1]; net shorts cannot be snapshotted.
+        if any(not (0.0 <= totals[key] / nav <= 1.0) for key in ("US", "KR", "crypto", "leverage")):
+            skipped_days[day.isoformat()] = ["weights_out_of_range"]
+            continue
+        valuations.append(
+            {
+                "as_of": day,
+                "nav": nav,
+                "us_weight": totals["US"] / nav,
+                "kr_weight": totals["KR"] / nav,
+                "crypto_weight": crypto / nav,
+                "leverage_weight": totals["leverage"] / nav,
+                "positions": len(by_day[day]),
+                "metrics": {
+                    EXPOSURE_METRIC_BTC_ETH: totals["crypto_core"] / crypto if crypto > 0 else None,
+                    EXPOSURE_METRIC_ALT: (crypto - totals["crypto_core"]) / crypto if crypto > 0 else None,
+                    EXPOSURE_METRIC_LEVERAGE: totals["leverage"] / nav,
+                },
+            }
+        )
+
+    skipped: dict[str, object] = {"skipped_days": skipped_days}
+    if invalid:
+        skipped["invalid_positions"] = invalid
+    return valuations, skipped
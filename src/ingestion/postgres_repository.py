@@ -1,12 +1,186 @@
+import csv
+import io
 import json
-from collections.abc import Callable, Mapping
-from datetime import datetime, timezone
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import date, datetime, time, timedelta, timezone
 from uuid import uuid4
 from typing import Optional, Protocol, cast
 
 import psycopg2
-
-from src.research.contracts import NormalizedSeriesPoint
+import psycopg2.pool
+
+from src.research.benchmark import (
+    BENCHMARK_COMPONENTS,
+    BENCHMARK_MAX_FILL_DAYS,
+    COMPONENT_POINT_LIMIT,
+    benchmark_nav_rows,
+    benchmark_weights_version,
+    build_component_levels,
+    load_benchmark_weights,
+)
+from src.ingestion.payload_blobs import (
+    PAYLOAD_BLOB_ENCODING,
+    KnownBlobHashes,
+    canonical_payload_hash,
+    compress_payload,
+    decode_payload,
+)
+from src.ingestion.revision_store import PutResult
+from src.research.contracts import CanonicalFact, NormalizedSeriesPoint, SeriesBlock, series_blocks_from_points
+
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_COUNTER_MODES = ("counter", "estimate", "exact")
+STATUS_COUNTER_STORES = {
+    "raw_events": "raw_event_store",
+    "canonical_facts": "canonical_fact_store",
+    "quarantine_events": "quarantine_batches",
+}
+
+LEARNING_METRIC_SOURCES = ("rollup", "raw")
+
+# Fresh aggregates for the trigger-maintained learning rollups (migration 015), keyed by table.
+_LEARNING_ROLLUP_REBUILDS: dict[str, tuple[tuple[str, ...], tuple[str, ...], str]] = {
+    "learning_forecast_rollup": (
+        ("horizon", "day"),
+        ("forecast_count",),
+        """
+        SELECT horizon, (as_of AT TIME ZONE 'UTC')::date AS day, COUNT(*) AS forecast_count
+        FROM forecast_records
+        GROUP BY 1, 2
+        """,
+    ),
+    "learning_realization_rollup": (
+        ("horizon", "day"),
+        ("realized_count", "hit_count", "abs_error_sum", "signed_error_sum"),
+        """
+        SELECT
+            fr.horizon,
+            (rr.evaluated_at AT TIME ZONE 'UTC')::date AS day,
+            COUNT(*) AS realized_count,
+            COUNT(*) FILTER (WHERE rr.hit) AS hit_count,
+            SUM(ABS(rr.forecast_error)) AS abs_error_sum,
+            SUM(rr.forecast_error) AS signed_error_sum
+        FROM realization_records rr
+        JOIN forecast_records fr ON fr.id = rr.forecast_id
+        GROUP BY 1, 2
+        """,
+    ),
+    "forecast_error_category_rollup": (
+        ("horizon", "category", "day"),
+        ("attribution_count", "contribution_count", "contribution_sum", "abs_contribution_sum"),
+        """
+        SELECT
+            fr.horizon,
+            fea.category,
+            (rr.evaluated_at AT TIME ZONE 'UTC')::date AS day,
+            COUNT(*) AS attribution_count,
+            COUNT(fea.contribution) AS contribution_count,
+            COALESCE(SUM(fea.contribution), 0) AS contribution_sum,
+            COALESCE(SUM(ABS(fea.contribution)), 0) AS abs_contribution_sum
+        FROM forecast_error_attributions fea
+        JOIN realization_records rr ON rr.id = fea.realization_id
+        JOIN forecast_records fr ON fr.id = rr.forecast_id
+        GROUP BY 1, 2, 3
+        """,
+    ),
+}
+
+# Multi-row forecast upsert keyed by (thesis_id, horizon, as_of). Returns one row per input in
+# input order: (ordinal, forecast id, inserted?, already realized?).
+_BULK_FORECAST_UPSERT_SQL = """
+    WITH upserted AS (
+        INSERT INTO forecast_records(
+            thesis_id,
+            horizon,
+            expected_return_low,
+            expected_return_high,
+            expected_volatility,
+            expected_drawdown,
+            confidence,
+            key_drivers,
+            evidence_hard,
+            evidence_soft,
+            as_of
+        )
+        SELECT
+            u.thesis_id,
+            u.horizon,
+            u.expected_return_low,
+            u.expected_return_high,
+            u.expected_volatility,
+            u.expected_drawdown,
+            u.confidence,
+            u.key_drivers::jsonb,
+            u.evidence_hard::jsonb,
+            u.evidence_soft::jsonb,
+            u.as_of
+        FROM unnest(
+            %s::text[], %s::text[], %s::float8[], %s::float8[], %s::float8[],
+            %s::float8[], %s::float8[], %s::text[], %s::text[], %s::text[], %s::timestamptz[]
+        ) AS u(
+            thesis_id, horizon, expected_return_low, expected_return_high, expected_volatility,
+            expected_drawdown, confidence, key_drivers, evidence_hard, evidence_soft, as_of
+        )
+        ON CONFLICT (thesis_id, horizon, as_of) DO UPDATE SET
+            expected_return_low = EXCLUDED.expected_return_low,
+            expected_return_high = EXCLUDED.expected_return_high,
+            expected_volatility = EXCLUDED.expected_volatility,
+            expected_drawdown = EXCLUDED.expected_drawdown,
+            confidence = EXCLUDED.confidence,
+            key_drivers = EXCLUDED.key_drivers,
+            evidence_hard = EXCLUDED.evidence_hard,
+            evidence_soft = EXCLUDED.evidence_soft
+        RETURNING id, thesis_id, horizon, as_of, (xmax = 0) AS inserted
+    )
+    SELECT
+        k.ord,
+        up.id,
+        up.inserted,
+        EXISTS (
+            SELECT 1 FROM realization_records rr WHERE rr.forecast_id = up.id
+        ) AS has_realization
+    FROM unnest(%s::text[], %s::text[], %s::timestamptz[])
+        WITH ORDINALITY AS k(thesis_id, horizon, as_of, ord)
+    JOIN upserted up
+      ON up.thesis_id = k.thesis_id
+     AND up.horizon = k.horizon
+     AND up.as_of = k.as_of
+    ORDER BY k.ord
+"""
+
+# hit / forecast_error follow write_realization_from_outcome: inclusive range, mid - realized.
+# NOT EXISTS keeps concurrent evaluators from writing a second realization for a forecast.
+_BULK_REALIZATION_INSERT_SQL = """
+    INSERT INTO realization_records(
+        forecast_id,
+        realized_return,
+        realized_volatility,
+        max_drawdown,
+        hit,
+        forecast_error,
+        evaluated_at
+    )
+    SELECT
+        u.forecast_id,
+        u.realized_return,
+        u.realized_volatility,
+        u.max_drawdown,
+        u.realized_return BETWEEN fr.expected_return_low AND fr.expected_return_high,
+        (fr.expected_return_low + fr.expected_return_high) / 2 - u.realized_return,
+        u.evaluated_at
+    FROM unnest(%s::bigint[], %s::float8[], %s::float8[], %s::float8[], %s::timestamptz[])
+        AS u(forecast_id, realized_return, realized_volatility, max_drawdown, evaluated_at)
+    JOIN forecast_records fr ON fr.id = u.forecast_id
+    WHERE NOT EXISTS (
+        SELECT 1 FROM realization_records existing WHERE existing.forecast_id = u.forecast_id
+    )
+    RETURNING id, forecast_id
+"""
 
 
 class CursorProtocol(Protocol):
@@ -29,7 +203,192 @@ class ConnectionProtocol(Protocol):
     def close(self) -> None: ...
 
 
+class _PooledConnection:
+    """Connection proxy that hands the connection back to its pool on close()."""
+
+    def __init__(
+        self,
+        pool: "psycopg2.pool.ThreadedConnectionPool",
+        slots: threading.BoundedSemaphore,
+        conn: object,
+    ) -> None:
+        self._pool = pool
+        self._slots = slots
+        self._conn: Optional[object] = conn
+
+    def __getattr__(self, name: str) -> object:
+        if self._conn is None:
+            raise AttributeError(name)
+        return getattr(self._conn, name)
+
+    def cursor(self) -> CursorProtocol:
+        return cast(CursorProtocol, getattr(self._conn, "cursor")())
+
+    def commit(self) -> None:
+        getattr(self._conn, "commit")()
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        try:
+            # putconn rolls back any transaction left open by a read.
+            self._pool.putconn(conn)
+        finally:
+            self._slots.release()
+
+
+class _ConnectionPoolFactory:
+    """Lazily created, thread-safe psycopg2 pool usable as a connection_factory.
+
+    Callers block (up to ``acquire_timeout_seconds``) instead of failing when
+    every pooled connection is checked out. A ``statement_timeout_ms`` is set
+    server-side on every pooled connection, so a query its caller gave up on
+    is cancelled and its connection returns to the pool.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_connections: int,
+        max_connections: int,
+        acquire_timeout_seconds: float,
+        statement_timeout_ms: Optional[int] = None,
+    ) -> None:
+        self._dsn = dsn
+        self._min_connections = max(0, min_connections)
+        self._max_connections = max(1, max_connections)
+        self._acquire_timeout_seconds = acquire_timeout_seconds
+        self._statement_timeout_ms = statement_timeout_ms
+        self._slots = threading.BoundedSemaphore(self._max_connections)
+        self._lock = threading.Lock()
+        self._pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+
+    def _get_pool(self) -> "psycopg2.pool.ThreadedConnectionPool":
+        with self._lock:
+            if self._pool is None:
+                connect_kwargs: dict[str, str] = {}
+                if self._statement_timeout_ms:
+                    connect_kwargs["options"] = f"-c statement_timeout={int(self._statement_timeout_ms)}"
+                self._pool = psycopg2.pool.ThreadedConnectionPool(
+                    self._min_connections,
+                    self._max_connections,
+                    self._dsn,
+                    **connect_kwargs,
+                )
+            return self._pool
+
+    def __call__(self) -> ConnectionProtocol:
+        if not self._slots.acquire(timeout=self._acquire_timeout_seconds):
+            raise TimeoutError("timed out waiting for a pooled database connection")
+        try:
+            pool = self._get_pool()
+            conn = pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+        return cast(ConnectionProtocol, _PooledConnection(pool, self._slots, conn))
+
+
+PORTFOLIO_SNAPSHOT_COLUMNS: tuple[str, ...] = (
+    "as_of",
+    "nav",
+    "us_weight",
+    "kr_weight",
+    "crypto_weight",
+    "leverage_weight",
+)
+
+
+class _CsvRowStream(io.TextIOBase):
+    """Read-only text stream that renders rows to CSV lazily, for COPY ... FROM STDIN."""
+
+    def __init__(self, rows: Iterable[Iterable[object]]) -> None:
+        self._rows = iter(rows)
+        self._buffer = ""
+        self._line = io.StringIO()
+        self._writer = csv.writer(self._line, lineterminator="\n")
+        self.rows_written = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        while size is None or size < 0 or len(self._buffer) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            # csv writes None as an empty unquoted field, which COPY reads as NULL.
+            self._writer.writerow(row)
+            self._buffer += self._line.getvalue()
+            self._line.seek(0)
+            self._line.truncate()
+            self.rows_written += 1
+        if size is None or size < 0:
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    def readline(self, size: int | None = -1) -> str:
+        return self.read(size)
+
+
+# Tables the operator and end-user views read; their write counters form the view data version.
+VIEW_DATA_TABLES: tuple[str, ...] = (
+    "ingestion_runs",
+    "raw_event_store",
+    "canonical_fact_store",
+    "quarantine_batches",
+    "macro_series_points",
+    "macro_analysis_results",
+    "stock_analysis_results",
+    "investment_theses",
+    "forecast_records",
+    "realization_records",
+    "forecast_error_attributions",
+    "refresh_requests",
+    "portfolio_snapshots",
+    "portfolio_positions",
+    "benchmark_nav_daily",
+    "dashboard_snapshots",
+)
+# Per-table markers used when the statistics view cannot be read.
+VIEW_DATA_VERSION_FALLBACK_PROBES: tuple[tuple[str, str], ...] = (
+    ("latest_run_finished_at", "SELECT MAX(finished_at) FROM ingestion_runs"),
+    ("latest_portfolio_snapshot_id", "SELECT MAX(id) FROM portfolio_snapshots"),
+    ("latest_portfolio_snapshot_at", "SELECT MAX(created_at) FROM portfolio_snapshots"),
+    ("latest_macro_analysis_id", "SELECT MAX(id) FROM macro_analysis_results"),
+    ("latest_dashboard_snapshot_at", "SELECT MAX(computed_at) FROM dashboard_snapshots"),
+    ("latest_refresh_request", "SELECT MAX(COALESCE(handled_at, requested_at)) FROM refresh_requests"),
+    ("latest_forecast_id", "SELECT MAX(id) FROM forecast_records"),
+    ("latest_realization_id", "SELECT MAX(id) FROM realization_records"),
+    ("latest_attribution_id", "SELECT MAX(id) FROM forecast_error_attributions"),
+)
+
+
 class PostgresRepository:
+    @classmethod
+    def pooled(
+        cls,
+        dsn: str,
+        min_connections: int = 1,
+        max_connections: int = 8,
+        acquire_timeout_seconds: float = 10.0,
+        statement_timeout_ms: Optional[int] = None,
+    ) -> "PostgresRepository":
+        """Repository whose per-call connections come from a shared thread-safe pool."""
+        return cls(
+            dsn=dsn,
+            connection_factory=_ConnectionPoolFactory(
+                dsn,
+                min_connections=min_connections,
+                max_connections=max_connections,
+                acquire_timeout_seconds=acquire_timeout_seconds,
+                statement_timeout_ms=statement_timeout_ms,
+            ),
+        )
+
     def __init__(
         self,
         dsn: str = "",
@@ -39,6 +398,19 @@ class PostgresRepository:
         self._connection_factory: Optional[Callable[[], ConnectionProtocol]] = (
             connection_factory
         )
+        self._known_blob_hashes = KnownBlobHashes()
+
+    @property
+    def cache_scope(self) -> str | None:
+        """Key for process-level caches of data read through this repository (None: do not cache)."""
+        return self._dsn or None
+
+    @staticmethod
+    def _rollback_quietly(conn: ConnectionProtocol) -> None:
+        # A failed statement aborts the transaction; clear it before running a fallback query.
+        rollback = getattr(conn, "rollback", None)
+        if callable(rollback):
+            rollback()
 
     @staticmethod
     def _require_hard_evidence(
@@ -437,6 +809,371 @@ class PostgresRepository:
         conn.close()
         return int(row[0])
 
+    @staticmethod
+    def _bulk_forecast_upsert_params(forecasts: list[Mapping[str, object]]) -> tuple[object, ...]:
+        return (
+            [f["thesis_id"] for f in forecasts],
+            [f["horizon"] for f in forecasts],
+            [f["expected_return_low"] for f in forecasts],
+            [f["expected_return_high"] for f in forecasts],
+            [f.get("expected_volatility") for f in forecasts],
+            [f.get("expected_drawdown") for f in forecasts],
+            [f["confidence"] for f in forecasts],
+            [json.dumps(f.get("key_drivers", []), default=str) for f in forecasts],
+            [json.dumps(f.get("evidence_hard", []), default=str) for f in forecasts],
+            [json.dumps(f.get("evidence_soft", []), default=str) for f in forecasts],
+            [f["as_of"] for f in forecasts],
+            [f["thesis_id"] for f in forecasts],
+            [f["horizon"] for f in forecasts],
+            [f["as_of"] for f in forecasts],
+        )
+
+    def write_forecast_record_chunks(
+        self,
+        chunks: Iterable[list[tuple[object, Mapping[str, object]]]],
+    ) -> Iterator[list[tuple[object, dict[str, object]]]]:
+        """Idempotently upsert forecast records chunk by chunk over a single connection.
+
+        *chunks* yields lists of ``(ref, record)`` pairs; for every chunk this yields
+        ``(ref, result)`` pairs in input order where ``result["status"]`` is
+        ``inserted``, ``deduplicated`` or ``error``. Each chunk commits on its own,
+        so a failing chunk is rolled back and reported without losing earlier ones.
+        """
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            for chunk in chunks:
+                results: dict[int, dict[str, object]] = {}
+                candidates: list[tuple[int, Mapping[str, object]]] = []
+                for idx, (_, record) in enumerate(chunk):
+                    try:
+                        self._require_hard_evidence(record.get("evidence_hard"), "forecast record")
+                    except ValueError as exc:
+                        results[idx] = {"status": "error", "error": str(exc)}
+                        continue
+                    candidates.append((idx, record))
+
+                try:
+                    if candidates:
+                        cursor.execute(
+                            "SELECT thesis_id FROM investment_theses WHERE thesis_id = ANY(%s)",
+                            (sorted({str(record["thesis_id"]) for _, record in candidates}),),
+                        )
+                        known_theses = {str(row[0]) for row in cursor.fetchall()}
+                        upsert: dict[tuple[object, object, object], tuple[int, Mapping[str, object]]] = {}
+                        duplicates: list[tuple[int, tuple[object, object, object]]] = []
+                        for idx, record in candidates:
+                            if str(record["thesis_id"]) not in known_theses:
+                                results[idx] = {
+                                    "status": "error",
+                                    "error": f"unknown thesis_id: {record['thesis_id']}",
+                                }
+                                continue
+                            key = (record["thesis_id"], record["horizon"], record["as_of"])
+                            if key in upsert:
+                                # ON CONFLICT cannot touch a row twice in one statement; last line wins.
+                                duplicates.append((upsert[key][0], key))
+                            upsert[key] = (idx, record)
+
+                        if upsert:
+                            ordered = list(upsert.values())
+                            cursor.execute(
+                                _BULK_FORECAST_UPSERT_SQL,
+                                self._bulk_forecast_upsert_params([record for _, record in ordered]),
+                            )
+                            for row in cursor.fetchall():
+                                idx = ordered[int(cast(int, row[0])) - 1][0]
+                                results[idx] = {
+                                    "status": "inserted" if bool(row[2]) else "deduplicated",
+                                    "forecast_id": int(cast(int, row[1])),
+                                }
+                            for idx, key in duplicates:
+                                winner = results.get(upsert[key][0], {})
+                                results[idx] = {"status": "deduplicated", "forecast_id": winner.get("forecast_id")}
+                        conn.commit()
+                except Exception as exc:
+                    self._rollback_quietly(conn)
+                    for idx, _ in candidates:
+                        results[idx] = {"status": "error", "error": f"chunk failed: {exc}"}
+
+                yield [
+                    (ref, results.get(idx, {"status": "error", "error": "no result returned"}))
+                    for idx, (ref, _) in enumerate(chunk)
+                ]
+        finally:
+            cursor.close()
+            conn.close()
+
+    def write_learning_samples_bulk(self, samples: list[Mapping[str, object]]) -> dict[str, int]:
+        """Upsert thesis/forecast/realization/attribution samples in one transaction.
+
+        Each sample carries ``thesis`` and ``forecast`` mappings plus optional
+        ``realization`` and ``attribution`` mappings. Forecasts that already have a
+        realization are left untouched, so re-running a seed is idempotent. The
+        whole batch costs four statements regardless of sample count.
+        """
+        by_key: dict[tuple[object, object, object], Mapping[str, object]] = {}
+        for sample in samples:
+            thesis = cast(Mapping[str, object], sample["thesis"])
+            forecast = cast(Mapping[str, object], sample["forecast"])
+            self._require_hard_evidence(thesis.get("evidence_hard"), "investment thesis")
+            self._require_hard_evidence(forecast.get("evidence_hard"), "forecast record")
+            by_key[(forecast["thesis_id"], forecast["horizon"], forecast["as_of"])] = sample
+        ordered = list(by_key.values())
+        if not ordered:
+            return {
+                "thesis_upserts": 0,
+                "forecast_upserts": 0,
+                "forecast_inserts": 0,
+                "realization_inserts": 0,
+                "attribution_inserts": 0,
+            }
+
+        theses: dict[object, Mapping[str, object]] = {}
+        for sample in ordered:
+            thesis = cast(Mapping[str, object], sample["thesis"])
+            theses[thesis["thesis_id"]] = thesis
+        forecasts = [cast(Mapping[str, object], sample["forecast"]) for sample in ordered]
+
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                INSERT INTO investment_theses(
+                    thesis_id,
+                    created_by,
+                    scope_level,
+                    target_id,
+                    title,
+                    summary,
+                    evidence_hard,
+                    evidence_soft,
+                    as_of,
+                    lineage_id
+                )
+                SELECT
+                    u.thesis_id,
+                    u.created_by,
+                    u.scope_level,
+                    u.target_id,
+                    u.title,
+                    u.summary,
+                    u.evidence_hard::jsonb,
+                    u.evidence_soft::jsonb,
+                    u.as_of,
+                    u.lineage_id
+                FROM unnest(
+                    %s::text[], %s::text[], %s::text[], %s::text[], %s::text[],
+                    %s::text[], %s::text[], %s::text[], %s::timestamptz[], %s::text[]
+                ) AS u(
+                    thesis_id, created_by, scope_level, target_id, title,
+                    summary, evidence_hard, evidence_soft, as_of, lineage_id
+                )
+                ON CONFLICT (thesis_id) DO UPDATE SET
+                    created_by = EXCLUDED.created_by,
+                    scope_level = EXCLUDED.scope_level,
+                    target_id = EXCLUDED.target_id,
+                    title = EXCLUDED.title,
+                    summary = EXCLUDED.summary,
+                    evidence_hard = EXCLUDED.evidence_hard,
+                    evidence_soft = EXCLUDED.evidence_soft,
+                    as_of = EXCLUDED.as_of,
+                    lineage_id = EXCLUDED.lineage_id
+                """,
+                (
+                    [t["thesis_id"] for t in theses.values()],
+                    [t.get("created_by", "system") for t in theses.values()],
+                    [t["scope_level"] for t in theses.values()],
+                    [t["target_id"] for t in theses.values()],
+                    [t["title"] for t in theses.values()],
+                    [t["summary"] for t in theses.values()],
+                    [json.dumps(t.get("evidence_hard", []), default=str) for t in theses.values()],
+                    [json.dumps(t.get("evidence_soft", []), default=str) for t in theses.values()],
+                    [t["as_of"] for t in theses.values()],
+                    [t["lineage_id"] for t in theses.values()],
+                ),
+            )
+
+            # Upsert forecasts and resolve which ones already have a realization in one round trip.
+            cursor.execute(_BULK_FORECAST_UPSERT_SQL, self._bulk_forecast_upsert_params(forecasts))
+            resolved = cursor.fetchall()
+            forecast_inserts = sum(1 for row in resolved if bool(row[2]))
+
+            pending: list[tuple[int, Mapping[str, object]]] = []
+            for row in resolved:
+                sample = ordered[int(cast(int, row[0])) - 1]
+                realization = sample.get("realization")
+                if bool(row[3]) or not isinstance(realization, Mapping):
+                    continue
+                pending.append((int(cast(int, row[1])), sample))
+
+            realization_ids: dict[int, int] = {}
+            if pending:
+                cursor.execute(
+                    _BULK_REALIZATION_INSERT_SQL,
+                    (
+                        [forecast_id for forecast_id, _ in pending],
+                        [cast(Mapping[str, object], s["realization"])["realized_return"] for _, s in pending],
+                        [cast(Mapping[str, object], s["realization"]).get("realized_volatility") for _, s in pending],
+                        [cast(Mapping[str, object], s["realization"]).get("max_drawdown") for _, s in pending],
+                        [cast(Mapping[str, object], s["realization"])["evaluated_at"] for _, s in pending],
+                    ),
+                )
+                realization_ids = {
+                    int(cast(int, row[1])): int(cast(int, row[0])) for row in cursor.fetchall()
+                }
+
+            attributions: list[tuple[int, Mapping[str, object]]] = []
+            for forecast_id, sample in pending:
+                attribution = sample.get("attribution")
+                if forecast_id in realization_ids and isinstance(attribution, Mapping):
+                    attributions.append((realization_ids[forecast_id], attribution))
+            if attributions:
+                cursor.execute(
+                    """
+                    INSERT INTO forecast_error_attributions(
+                        realization_id,
+                        category,
+                        contribution,
+                        note,
+                        evidence_hard,
+                        evidence_soft
+                    )
+                    SELECT
+                        u.realization_id,
+                        u.category,
+                        u.contribution,
+                        u.note,
+                        u.evidence_hard::jsonb,
+                        u.evidence_soft::jsonb
+                    FROM unnest(%s::bigint[], %s::text[], %s::float8[], %s::text[], %s::text[], %s::text[])
+                        AS u(realization_id, category, contribution, note, evidence_hard, evidence_soft)
+                    """,
+                    (
+                        [realization_id for realization_id, _ in attributions],
+                        [a["category"] for _, a in attributions],
+                        [a.get("contribution") for _, a in attributions],
+                        [a.get("note") for _, a in attributions],
+                        [json.dumps(a.get("evidence_hard", []), default=str) for _, a in attributions],
+                        [json.dumps(a.get("evidence_soft", []), default=str) for _, a in attributions],
+                    ),
+                )
+
+            conn.commit()
+            return {
+                "thesis_upserts": len(theses),
+                "forecast_upserts": len(resolved),
+                "forecast_inserts": forecast_inserts,
+                "realization_inserts": len(realization_ids),
+                "attribution_inserts": len(attributions),
+            }
+        finally:
+            cursor.close()
+            conn.close()
+
+    def read_matured_unrealized_forecasts(
+        self,
+        as_of: datetime,
+        limit: int = 5000,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> list[dict[str, object]]:
+        """Forecasts whose horizon has elapsed by *as_of* and that have no realization yet.
+
+        Ordered by (as_of, id); pass the last row's ``(as_of, forecast_id)`` as *after* to
+        read the next page, so forecasts that stay unrealized do not hide newer ones.
+        """
+        after_as_of, after_id = after if after is not None else (None, None)
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT
+                    fr.id AS forecast_id,
+                    fr.thesis_id,
+                    fr.horizon,
+                    fr.as_of,
+                    fr.expected_return_low,
+                    fr.expected_return_high,
+                    it.scope_level,
+                    it.target_id
+                FROM forecast_records fr
+                JOIN investment_theses it ON it.thesis_id = fr.thesis_id
+                WHERE fr.as_of + CASE fr.horizon
+                        WHEN '1W' THEN INTERVAL '7 days'
+                        WHEN '1M' THEN INTERVAL '30 days'
+                        WHEN '3M' THEN INTERVAL '90 days'
+                    END <= %s
+                  AND NOT EXISTS (
+                      SELECT 1 FROM realization_records rr WHERE rr.forecast_id = fr.id
+                  )
+                  AND (%s::timestamptz IS NULL OR (fr.as_of, fr.id) > (%s::timestamptz, %s::bigint))
+                ORDER BY fr.as_of ASC, fr.id ASC
+                LIMIT %s
+                """,
+                (as_of, after_as_of, after_as_of, after_id, limit),
+            )
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in rows]
+        finally:
+            cursor.close()
+            conn.close()
+
+    def read_macro_series_window(
+        self,
+        metric_keys: list[str],
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, object]]:
+        """All points for *metric_keys* in [start, end], in one index-backed read."""
+        if not metric_keys:
+            return []
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT metric_key, as_of, value
+                FROM macro_series_points
+                WHERE metric_key = ANY(%s)
+                  AND as_of BETWEEN %s AND %s
+                ORDER BY metric_key, as_of
+                """,
+                (sorted(set(metric_keys)), start, end),
+            )
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in rows]
+        finally:
+            cursor.close()
+            conn.close()
+
+    def write_realizations_bulk(self, realizations: list[Mapping[str, object]]) -> dict[int, int]:
+        """Insert realizations in one statement; returns {forecast_id: realization_id} for new rows."""
+        if not realizations:
+            return {}
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                _BULK_REALIZATION_INSERT_SQL,
+                (
+                    [r["forecast_id"] for r in realizations],
+                    [r["realized_return"] for r in realizations],
+                    [r.get("realized_volatility") for r in realizations],
+                    [r.get("max_drawdown") for r in realizations],
+                    [r["evaluated_at"] for r in realizations],
+                ),
+            )
+            inserted = {int(cast(int, row[1])): int(cast(int, row[0])) for row in cursor.fetchall()}
+            conn.commit()
+            return inserted
+        finally:
+            cursor.close()
+            conn.close()
+
     def write_forecast_error_attribution(self, attribution: Mapping[str, object]) -> int:
         conn: ConnectionProtocol = self._connect()
         cursor: CursorProtocol = conn.cursor()
@@ -584,28 +1321,143 @@ class PostgresRepository:
                         }
                     )
 
-            return {
-                "attribution_id": payload.get("attribution_id"),
-                "forecast_id": payload.get("forecast_id"),
-                "thesis_id": payload.get("thesis_id"),
-                "timestamps": {
-                    "as_of": payload.get("as_of"),
-                    "evaluated_at": payload.get("evaluated_at"),
-                    "created_at": payload.get("created_at"),
-                },
-                "hard_evidence_refs": hard_refs,
-                "hard_evidence_preview": _preview(evidence_hard),
-                "soft_evidence_preview": _preview(evidence_soft),
-                "lineage_summary": [
-                    ref.get("lineage_id") for ref in hard_refs if ref.get("lineage_id")
-                ],
-            }
+            return self._attribution_detail_payload(
+                payload,
+                hard_refs=hard_refs,
+                hard_evidence_preview=_preview(evidence_hard),
+                soft_evidence_preview=_preview(evidence_soft),
+            )
         except Exception:
             return None
         finally:
             cursor.close()
             conn.close()
 
+    def read_forecast_error_attribution_details(
+        self,
+        attribution_ids: list[int],
+        max_preview_chars: int = 240,
+    ) -> dict[int, dict[str, object]]:
+        """Read bounded evidence detail payloads for many attribution rows at once.
+
+        Evidence previews are truncated and HARD evidence refs are projected in
+        SQL so full evidence payloads never leave the database. Returns a map
+        keyed by attribution_id; missing learning-loop tables yield {}.
+        """
+        ids = sorted({int(attribution_id) for attribution_id in attribution_ids})
+        if not ids:
+            return {}
+
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT
+                    fea.id AS attribution_id,
+                    rr.forecast_id,
+                    fr.thesis_id,
+                    fr.as_of,
+                    rr.evaluated_at,
+                    fea.created_at,
+                    COALESCE(
+                        (
+                            SELECT jsonb_agg(
+                                jsonb_build_object(
+                                    'source', item -> 'source',
+                                    'metric', COALESCE(
+                                        NULLIF(item -> 'metric', 'null'::jsonb),
+                                        item -> 'metric_key'
+                                    ),
+                                    'entity_id', item -> 'entity_id',
+                                    'raw_event_id', item -> 'raw_event_id',
+                                    'canonical_fact_id', item -> 'canonical_fact_id',
+                                    'lineage_id', item -> 'lineage_id',
+                                    'as_of', item -> 'as_of',
+                                    'available_at', item -> 'available_at'
+                                )
+                                ORDER BY ordinality
+                            )
+                            FROM jsonb_array_elements(
+                                CASE
+                                    WHEN jsonb_typeof(fea.evidence_hard) = 'array'
+                                    THEN fea.evidence_hard
+                                    ELSE '[]'::jsonb
+                                END
+                            ) WITH ORDINALITY AS refs(item, ordinality)
+                            WHERE jsonb_typeof(item) = 'object'
+                        ),
+                        '[]'::jsonb
+                    ) AS hard_evidence_refs,
+                    CASE
+                        WHEN char_length(fea.evidence_hard::text) <= %s
+                        THEN fea.evidence_hard::text
+                        ELSE left(fea.evidence_hard::text, %s) || '…(truncated)'
+                    END AS hard_evidence_preview,
+                    CASE
+                        WHEN char_length(fea.evidence_soft::text) <= %s
+                        THEN fea.evidence_soft::text
+                        ELSE left(fea.evidence_soft::text, %s) || '…(truncated)'
+                    END AS soft_evidence_preview
+                FROM forecast_error_attributions fea
+                JOIN realization_records rr ON rr.id = fea.realization_id
+                JOIN forecast_records fr ON fr.id = rr.forecast_id
+                WHERE fea.id = ANY(%s)
+                """,
+                (
+                    max_preview_chars,
+                    max_preview_chars,
+                    max_preview_chars,
+                    max_preview_chars,
+                    ids,
+                ),
+            )
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+        except Exception:
+            return {}
+        finally:
+            cursor.close()
+            conn.close()
+
+        details: dict[int, dict[str, object]] = {}
+        for row in rows:
+            payload = dict(zip(columns, row))
+            refs = payload.get("hard_evidence_refs")
+            hard_refs = [dict(ref) for ref in refs if isinstance(ref, Mapping)] if isinstance(refs, list) else []
+            detail = self._attribution_detail_payload(
+                payload,
+                hard_refs=hard_refs,
+                hard_evidence_preview=str(payload.get("hard_evidence_preview") or "[]"),
+                soft_evidence_preview=str(payload.get("soft_evidence_preview") or "[]"),
+            )
+            details[int(cast(int, payload["attribution_id"]))] = detail
+        return details
+
+    @staticmethod
+    def _attribution_detail_payload(
+        payload: Mapping[str, object],
+        hard_refs: list[dict[str, object]],
+        hard_evidence_preview: str,
+        soft_evidence_preview: str,
+    ) -> dict[str, object]:
+        return {
+            "attribution_id": payload.get("attribution_id"),
+            "forecast_id": payload.get("forecast_id"),
+            "thesis_id": payload.get("thesis_id"),
+            "timestamps": {
+                "as_of": payload.get("as_of"),
+                "evaluated_at": payload.get("evaluated_at"),
+                "created_at": payload.get("created_at"),
+            },
+            "hard_evidence_refs": hard_refs,
+            "hard_evidence_preview": hard_evidence_preview,
+            "soft_evidence_preview": soft_evidence_preview,
+            "lineage_summary": [
+                ref.get("lineage_id") for ref in hard_refs if ref.get("lineage_id")
+            ],
+        }
+
     def read_expected_vs_realized(
         self,
         horizon: str = "1M",
@@ -669,14 +1521,42 @@ class PostgresRepository:
         self,
         horizon: str = "1M",
         limit: int = 20,
+        source: Optional[str] = None,
     ) -> list[dict[str, object]]:
         """Aggregate attribution categories for forecast-error learning automation.
 
+        Reads the per-day ``forecast_error_category_rollup`` by default and falls
+        back to aggregating the raw join when the rollup is unavailable or empty.
         Missing learning-loop tables must not crash operator dashboards.
         """
+        resolved_source = self._learning_metric_source(source)
         conn: ConnectionProtocol = self._connect()
         cursor: CursorProtocol = conn.cursor()
         try:
+            if resolved_source == "rollup":
+                try:
+                    cursor.execute(
+                        """
+                        SELECT
+                            category,
+                            SUM(attribution_count) AS attribution_count,
+                            SUM(contribution_sum) / NULLIF(SUM(contribution_count), 0) AS mean_contribution,
+                            SUM(abs_contribution_sum) / NULLIF(SUM(contribution_count), 0) AS mean_abs_contribution
+                        FROM forecast_error_category_rollup
+                        WHERE horizon = %s
+                        GROUP BY category
+                        ORDER BY attribution_count DESC, category ASC
+                        LIMIT %s
+                        """,
+                        (horizon, limit),
+                    )
+                    rows = cursor.fetchall()
+                    columns = [desc[0] for desc in cursor.description]
+                    if rows:
+                        return [dict(zip(columns, row)) for row in rows]
+                except Exception:
+                    self._rollback_quietly(conn)
+
             cursor.execute(
                 """
                 SELECT
@@ -703,47 +1583,436 @@ class PostgresRepository:
             cursor.close()
             conn.close()
 
-    def write_raw(self, row: Mapping[str, object]) -> None:
+    def read_learning_calibration(
+        self,
+        horizon: str = "1M",
+        windows: tuple[int, ...] = (20, 60),
+        bins: int = 5,
+        limit: int = 200,
+    ) -> dict[str, object]:
+        """Rolling calibration series and a confidence reliability curve for one horizon.
+
+        Rolling metrics are computed by SQL window functions over the realized
+        forecasts ordered by ``evaluated_at``; only the newest *limit* points are
+        returned. ``interval_coverage`` is the stored ``hit`` flag (realized return
+        inside the forecast range); ``directional_hit_rate`` compares the sign of
+        the realized return with the range midpoint.
+        """
+        window_sizes = sorted({int(w) for w in windows if int(w) > 0})
+        if not window_sizes:
+            raise ValueError("windows must contain at least one positive size")
+        if bins < 1:
+            raise ValueError("bins must be >= 1")
+
+        # Window sizes are validated ints, so inlining them into the frame clause is safe.
+        rolling_columns: list[str] = []
+        for size in window_sizes:
+            frame = f"OVER (ORDER BY evaluated_at, realization_id ROWS BETWEEN {size - 1} PRECEDING AND CURRENT ROW)"
+            rolling_columns.extend(
+                [
+                    f"COUNT(*) {frame} AS n_{size}",
+                    f"AVG(directional_hit) {frame} AS directional_hit_rate_{size}",
+                    f"AVG(covered) {frame} AS interval_coverage_{size}",
+                    f"AVG(ABS(forecast_error)) {frame} AS mean_abs_error_{size}",
+                    f"AVG(forecast_error) {frame} AS signed_bias_{size}",
+                    f"AVG(confidence) {frame} AS mean_confidence_{size}",
+                ]
+            )
+
         conn: ConnectionProtocol = self._connect()
         cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                f"""
+                WITH realized AS (
+                    SELECT
+                        rr.id AS realization_id,
+                        rr.forecast_id,
+                        rr.evaluated_at,
+                        rr.forecast_error,
+                        fr.confidence,
+                        CASE WHEN rr.hit THEN 1.0 ELSE 0.0 END AS covered,
+                        CASE
+                            WHEN SIGN(rr.realized_return)
+                                = SIGN((fr.expected_return_low + fr.expected_return_high) / 2)
+                            THEN 1.0 ELSE 0.0
+                        END AS directional_hit
+                    FROM realization_records rr
+                    JOIN forecast_records fr ON fr.id = rr.forecast_id
+                    WHERE fr.horizon = %s
+                ),
+                rolling AS (
+                    SELECT
+                        realization_id,
+                        forecast_id,
+                        evaluated_at,
+                        {", ".join(rolling_columns)}
+                    FROM realized
+                )
+                SELECT *
+                FROM rolling
+                ORDER BY evaluated_at DESC, realization_id DESC
+                LIMIT %s
+                """,
+                (horizon, limit),
+            )
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            series: list[dict[str, object]] = []
+            for raw in reversed(rows):
+                record = dict(zip(columns, raw))
+                series.append(
+                    {
+                        "realization_id": record.get("realization_id"),
+                        "forecast_id": record.get("forecast_id"),
+                        "evaluated_at": record.get("evaluated_at"),
+                        "windows": {
+                            str(size): {
+                                "n": record.get(f"n_{size}"),
+                                "directional_hit_rate": record.get(f"directional_hit_rate_{size}"),
+                                "interval_coverage": record.get(f"interval_coverage_{size}"),
+                                "mean_abs_error": record.get(f"mean_abs_error_{size}"),
+                                "signed_bias": record.get(f"signed_bias_{size}"),
+                                "mean_confidence": record.get(f"mean_confidence_{size}"),
+                            }
+                            for size in window_sizes
+                        },
+                    }
+                )
 
-        now = datetime.now(timezone.utc)
-        cursor.execute(
-            """
-            INSERT INTO raw_event_store(
-                source,
-                entity_id,
-                as_of,
-                available_at,
-                ingested_at,
-                lineage_id,
-                schema_version,
-                license_tier,
-                payload
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb)
-            """,
-            (
-                str(row.get("source", "unknown")),
-                str(row.get("entity_id", "unknown")),
-                now,
-                now,
-                now,
-                str(row.get("lineage_id", uuid4())),
-                str(row.get("schema_version", "v1")),
-                str(row.get("license_tier", "gold")),
-                json.dumps(dict(row), default=str),
-            ),
-        )
-        conn.commit()
-        cursor.close()
-        conn.close()
+            # Out-of-range confidences are clamped into the first/last bin and NULLs are
+            # left out, so every bin appears once.
+            cursor.execute(
+                """
+                SELECT
+                    GREATEST(LEAST(width_bucket(fr.confidence, 0, 1, %s), %s), 1) AS bin,
+                    COUNT(*) AS n,
+                    AVG(fr.confidence) AS mean_confidence,
+                    AVG(CASE WHEN rr.hit THEN 1.0 ELSE 0.0 END) AS interval_coverage
+                FROM realization_records rr
+                JOIN forecast_records fr ON fr.id = rr.forecast_id
+                WHERE fr.horizon = %s AND fr.confidence IS NOT NULL
+                GROUP BY 1
+                ORDER BY 1
+                """,
+                (bins, bins, horizon),
+            )
+            curve_rows = cursor.fetchall()
+            curve_columns = [desc[0] for desc in cursor.description]
+            reliability: list[dict[str, object]] = []
+            for raw in curve_rows:
+                record = dict(zip(curve_columns, raw))
+                bin_index = int(cast(int, record["bin"]))
+                reliability.append(
+                    {
+                        "bin": bin_index,
+                        "confidence_low": (bin_index - 1) / bins,
+                        "confidence_high": bin_index / bins,
+                        "n": record.get("n"),
+                        "mean_confidence": record.get("mean_confidence"),
+                        "interval_coverage": record.get("interval_coverage"),
+                    }
+                )
 
-    def write_canonical(self, row: Mapping[str, object]) -> None:
+            return {
+                "horizon": horizon,
+                "windows": window_sizes,
+                "series": series,
+                "latest": series[-1]["windows"] if series else {},
+                "reliability": reliability,
+            }
+        finally:
+            cursor.close()
+            conn.close()
+
+    @staticmethod
+    def _learning_metric_source(source: Optional[str]) -> str:
+        resolved = (source or os.getenv("LEARNING_METRICS_SOURCE") or "rollup").strip().lower()
+        return resolved if resolved in LEARNING_METRIC_SOURCES else "rollup"
+
+    def rebuild_learning_rollups(self, dry_run: bool = False) -> dict[str, dict[str, int]]:
+        """Compare learning rollups with a fresh aggregate and, unless *dry_run*, replace them.
+
+        Rollup tables are locked first so trigger updates from concurrent inserts
+        wait for the rebuild instead of being lost.
+        """
         conn: ConnectionProtocol = self._connect()
         cursor: CursorProtocol = conn.cursor()
-
-        now = datetime.now(timezone.utc)
-        cursor.execute(
+        report: dict[str, dict[str, int]] = {}
+        try:
+            cursor.execute(
+                "LOCK TABLE " + ", ".join(_LEARNING_ROLLUP_REBUILDS) + " IN SHARE ROW EXCLUSIVE MODE",
+                (),
+            )
+            for table, (keys, values, fresh_sql) in _LEARNING_ROLLUP_REBUILDS.items():
+                mismatch = " OR ".join(
+                    f"ABS(COALESCE(cur.{value}, 0) - COALESCE(fresh.{value}, 0)) > 1e-9" for value in values
+                )
+                cursor.execute(
+                    f"""
+                    WITH fresh AS ({fresh_sql})
+                    SELECT
+                        COUNT(*) FILTER (WHERE cur.{keys[0]} IS NULL) AS missing_rows,
+                        COUNT(*) FILTER (WHERE fresh.{keys[0]} IS NULL) AS orphan_rows,
+                        COUNT(*) FILTER (
+                            WHERE cur.{keys[0]} IS NOT NULL AND fresh.{keys[0]} IS NOT NULL AND ({mismatch})
+                        ) AS drifted_rows,
+                        COUNT(fresh.{keys[0]}) AS fresh_rows
+                    FROM fresh
+                    FULL OUTER JOIN {table} cur USING ({", ".join(keys)})
+                    """,
+                    (),
+                )
+                row = cursor.fetchone() or (0, 0, 0, 0)
+                report[table] = {
+                    "missing_rows": int(cast(int, row[0] or 0)),
+                    "orphan_rows": int(cast(int, row[1] or 0)),
+                    "drifted_rows": int(cast(int, row[2] or 0)),
+                    "fresh_rows": int(cast(int, row[3] or 0)),
+                }
+                if dry_run:
+                    continue
+                columns = ", ".join(keys + values)
+                cursor.execute(f"DELETE FROM {table}", ())
+                cursor.execute(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM ({fresh_sql}) AS fresh", ())
+
+            if not dry_run:
+                conn.commit()
+            return report
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _put_payload_blob(self, cursor: CursorProtocol, payload: Mapping[str, object]) -> str:
+        """Store *payload* in raw_payload_blobs unless already there; returns its hash.
+
+        Hashes committed by this repository are remembered, so an unchanged payload
+        costs no round trip; otherwise a hash probe runs before the compressed body
+        is built and sent.
+        """
+        digest = canonical_payload_hash(payload)
+        if digest in self._known_blob_hashes:
+            return digest
+        cursor.execute("SELECT 1 FROM raw_payload_blobs WHERE payload_hash = %s", (digest,))
+        if cursor.fetchone() is None:
+            body, byte_size = compress_payload(payload)
+            cursor.execute(
+                """
+                INSERT INTO raw_payload_blobs(payload_hash, encoding, byte_size, body)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (payload_hash) DO NOTHING
+                """,
+                (digest, PAYLOAD_BLOB_ENCODING, byte_size, body),
+            )
+        return digest
+
+    def read_payload_revision(self, idempotency_key: str) -> Optional[tuple[int, str]]:
+        """(revision_number, payload_hash) of the newest revision of *idempotency_key*."""
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT revision_number, payload_hash
+                FROM payload_revisions
+                WHERE idempotency_key = %s
+                ORDER BY revision_number DESC
+                LIMIT 1
+                """,
+                (idempotency_key,),
+            )
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+            conn.close()
+        return None if row is None else (int(row[0]), str(row[1]))
+
+    def put_payload_revision(self, idempotency_key: str, payload_hash: str) -> PutResult:
+        """Append a revision unless *payload_hash* is already the newest one.
+
+        The next revision number is taken in the INSERT itself; losing a race to a
+        concurrent writer hits the primary key and is retried against the new latest row.
+        """
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            for _ in range(3):
+                cursor.execute(
+                    """
+                    WITH latest AS (
+                        SELECT revision_number, payload_hash
+                        FROM payload_revisions
+                        WHERE idempotency_key = %s
+                        ORDER BY revision_number DESC
+                        LIMIT 1
+                    )
+                    INSERT INTO payload_revisions(idempotency_key, revision_number, payload_hash)
+                    SELECT %s, COALESCE((SELECT revision_number FROM latest), 0) + 1, %s
+                    WHERE NOT EXISTS (SELECT 1 FROM latest WHERE payload_hash = %s)
+                    ON CONFLICT (idempotency_key, revision_number) DO NOTHING
+                    RETURNING revision_number
+                    """,
+                    (idempotency_key, idempotency_key, payload_hash, payload_hash),
+                )
+                inserted = cursor.fetchone()
+                conn.commit()
+                if inserted is not None:
+                    revision_number = int(inserted[0])
+                    return PutResult(
+                        status="inserted" if revision_number == 1 else "revision",
+                        revision_number=revision_number,
+                    )
+                cursor.execute(
+                    """
+                    SELECT revision_number, payload_hash
+                    FROM payload_revisions
+                    WHERE idempotency_key = %s
+                    ORDER BY revision_number DESC
+                    LIMIT 1
+                    """,
+                    (idempotency_key,),
+                )
+                latest = cursor.fetchone()
+                if latest is not None and str(latest[1]) == payload_hash:
+                    return PutResult(status="noop", revision_number=int(latest[0]))
+            raise RuntimeError(f"could not record a revision for {idempotency_key!r}")
+        except Exception:
+            self._rollback_quietly(conn)
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+    def read_source_schema(self, source: str) -> Optional[dict[str, object]]:
+        """Accepted record schema of *source* for the quality profiler, or None."""
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT fingerprint, field_types, required_fields
+                FROM source_schema_fingerprints
+                WHERE source = %s
+                """,
+                (source,),
+            )
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+            conn.close()
+        if row is None:
+            return None
+        # psycopg2 decodes JSONB; plain text comes back from other drivers.
+        field_types = json.loads(row[1]) if isinstance(row[1], str) else row[1]
+        required_fields = json.loads(row[2]) if isinstance(row[2], str) else row[2]
+        return {
+            "fingerprint": str(row[0]),
+            "field_types": dict(field_types or {}),
+            "required_fields": list(required_fields or []),
+        }
+
+    def write_source_schema(
+        self,
+        source: str,
+        fingerprint: str,
+        field_types: Mapping[str, str],
+        required_fields: Sequence[str],
+    ) -> None:
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                INSERT INTO source_schema_fingerprints(source, fingerprint, field_types, required_fields)
+                VALUES (%s, %s, %s::jsonb, %s::jsonb)
+                ON CONFLICT (source) DO UPDATE
+                SET fingerprint = EXCLUDED.fingerprint,
+                    field_types = EXCLUDED.field_types,
+                    required_fields = EXCLUDED.required_fields,
+                    updated_at = NOW()
+                """,
+                (
+                    source,
+                    fingerprint,
+                    json.dumps(dict(sorted(field_types.items()))),
+                    json.dumps(sorted(required_fields)),
+                ),
+            )
+            conn.commit()
+        except Exception:
+            self._rollback_quietly(conn)
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+    def delete_source_schema(self, source: str) -> bool:
+        """Forget *source*'s accepted schema; the next promoted batch becomes the new one."""
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                "DELETE FROM source_schema_fingerprints WHERE source = %s RETURNING source",
+                (source,),
+            )
+            deleted = cursor.fetchone() is not None
+            conn.commit()
+            return deleted
+        except Exception:
+            self._rollback_quietly(conn)
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+    def write_raw(self, row: Mapping[str, object]) -> None:
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+
+        now = datetime.now(timezone.utc)
+        try:
+            digest = self._put_payload_blob(cursor, row)
+            cursor.execute(
+                """
+                INSERT INTO raw_event_store(
+                    source,
+                    entity_id,
+                    as_of,
+                    available_at,
+                    ingested_at,
+                    lineage_id,
+                    schema_version,
+                    license_tier,
+                    payload_hash
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    str(row.get("source", "unknown")),
+                    str(row.get("entity_id", "unknown")),
+                    now,
+                    now,
+                    now,
+                    str(row.get("lineage_id", uuid4())),
+                    str(row.get("schema_version", "v1")),
+                    str(row.get("license_tier", "gold")),
+                    digest,
+                ),
+            )
+            conn.commit()
+            self._known_blob_hashes.add(digest)
+        except Exception:
+            self._rollback_quietly(conn)
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+    def write_canonical(self, row: Mapping[str, object]) -> None:
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+
+        now = datetime.now(timezone.utc)
+        cursor.execute(
             """
             INSERT INTO canonical_fact_store(
                 source,
@@ -775,20 +2044,186 @@ class PostgresRepository:
         cursor.close()
         conn.close()
 
+    def write_canonical_facts(self, facts: Sequence[CanonicalFact]) -> int:
+        """Insert extracted facts in one statement; returns how many rows were new.
+
+        A fact whose (source, entity, metric, period) already has the same value as its
+        newest row is skipped, so re-ingesting a payload does not grow the store. Restated
+        values are appended (including a return to an earlier value, A -> B -> A) and
+        read_canonical_facts returns the newest.
+        """
+        if not facts:
+            return 0
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                WITH incoming AS (
+                    SELECT *
+                    FROM unnest(
+                        %s::text[],
+                        %s::text[],
+                        %s::text[],
+                        %s::timestamptz[],
+                        %s::timestamptz[],
+                        %s::numeric[],
+                        %s::text[]
+                    ) AS f(source, entity_id, metric_name, as_of, available_at, metric_value, lineage_id)
+                )
+                INSERT INTO canonical_fact_store(
+                    source,
+                    entity_id,
+                    as_of,
+                    available_at,
+                    ingested_at,
+                    license_tier,
+                    lineage_id,
+                    metric_name,
+                    metric_value,
+                    schema_version
+                )
+                SELECT f.source, f.entity_id, f.as_of, f.available_at, NOW(), 'gold', f.lineage_id,
+                       f.metric_name, f.metric_value, 'v1'
+                FROM incoming f
+                WHERE (
+                    -- The row read_canonical_facts currently serves for this period.
+                    SELECT c.metric_value
+                    FROM canonical_fact_store c
+                    WHERE c.source = f.source
+                      AND c.metric_name = f.metric_name
+                      AND c.as_of = f.as_of
+                      AND c.entity_id = f.entity_id
+                    ORDER BY c.available_at DESC, c.id DESC
+                    LIMIT 1
+                ) IS DISTINCT FROM f.metric_value
+                RETURNING id
+                """,
+                (
+                    [fact.source for fact in facts],
+                    [fact.entity_id for fact in facts],
+                    [fact.metric_name for fact in facts],
+                    [fact.as_of for fact in facts],
+                    [fact.available_at for fact in facts],
+                    [fact.metric_value for fact in facts],
+                    [fact.lineage_id for fact in facts],
+                ),
+            )
+            written = len(cursor.fetchall())
+            conn.commit()
+            return written
+        except Exception:
+            self._rollback_quietly(conn)
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
     def write_quarantine(self, reason: str, payload: Mapping[str, object]) -> None:
         conn: ConnectionProtocol = self._connect()
         cursor: CursorProtocol = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO quarantine_batches(batch_id, reason, payload)
-            VALUES (%s, %s, %s::jsonb)
-            """,
-            (str(uuid4()), reason, json.dumps(dict(payload), default=str)),
-        )
-        conn.commit()
-        cursor.close()
-        conn.close()
+        try:
+            digest = self._put_payload_blob(cursor, payload)
+            cursor.execute(
+                """
+                INSERT INTO quarantine_batches(batch_id, reason, payload_hash)
+                VALUES (%s, %s, %s)
+                """,
+                (str(uuid4()), reason, digest),
+            )
+            conn.commit()
+            self._known_blob_hashes.add(digest)
+        except Exception:
+            self._rollback_quietly(conn)
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+    @staticmethod
+    def _rehydrate_payloads(rows: list[dict[str, object]]) -> list[dict[str, object]]:
+        # Inline payloads (rows written before migration 018) are returned as stored.
+        decoded: dict[str, dict[str, object]] = {}
+        for row in rows:
+            body = row.pop("blob_body", None)
+            encoding = row.pop("blob_encoding", None)
+            digest = row.get("payload_hash")
+            if row.get("payload") is not None or body is None or not isinstance(digest, str):
+                continue
+            if digest not in decoded:
+                decoded[digest] = decode_payload(body, str(encoding or PAYLOAD_BLOB_ENCODING))
+            row["payload"] = decoded[digest]
+        return rows
+
+    def read_raw_events(
+        self,
+        limit: int = 20,
+        source: str | None = None,
+        entity_id: str | None = None,
+    ) -> list[dict[str, object]]:
+        """Newest raw events first, with payloads rehydrated from raw_payload_blobs."""
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT
+                    r.id,
+                    r.source,
+                    r.entity_id,
+                    r.ingested_at,
+                    r.lineage_id,
+                    r.schema_version,
+                    r.license_tier,
+                    r.payload,
+                    r.payload_hash,
+                    b.encoding AS blob_encoding,
+                    b.body AS blob_body
+                FROM raw_event_store r
+                LEFT JOIN raw_payload_blobs b ON b.payload_hash = r.payload_hash
+                WHERE (%s::text IS NULL OR r.source = %s)
+                  AND (%s::text IS NULL OR r.entity_id = %s)
+                ORDER BY r.id DESC
+                LIMIT %s
+                """,
+                (source, source, entity_id, entity_id, limit),
+            )
+            columns = [desc[0] for desc in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+            conn.close()
+        return self._rehydrate_payloads(rows)
+
+    def read_quarantine_batches(self, limit: int = 20) -> list[dict[str, object]]:
+        """Newest quarantine batches first, with payloads rehydrated from raw_payload_blobs."""
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT
+                    q.batch_id,
+                    q.reason,
+                    q.created_at,
+                    q.payload,
+                    q.payload_hash,
+                    b.encoding AS blob_encoding,
+                    b.body AS blob_body
+                FROM quarantine_batches q
+                LEFT JOIN raw_payload_blobs b ON b.payload_hash = q.payload_hash
+                ORDER BY q.id DESC
+                LIMIT %s
+                """,
+                (limit,),
+            )
+            columns = [desc[0] for desc in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+            conn.close()
+        return self._rehydrate_payloads(rows)
 
     def read_latest_runs(self, limit: int = 20) -> list[dict[str, object]]:
         conn: ConnectionProtocol = self._connect()
@@ -812,7 +2247,64 @@ class PostgresRepository:
             cursor.close()
             conn.close()
 
-    def read_status_counters(self) -> dict[str, int]:
+    def read_view_data_version(self) -> dict[str, object]:
+        """Markers that move whenever a table the dashboard views read is written.
+
+        Reads the cumulative insert/update/delete counters of VIEW_DATA_TABLES from
+        ``pg_stat_user_tables``, so ON CONFLICT upserts and status updates count too and
+        writers share no row or lock. The counters are reported after commit (typically
+        within a second), so a version never moves before its data is visible. If the
+        statistics cannot be read, each fallback marker is probed on its own, so one
+        missing table only drops its marker instead of disabling caching.
+        """
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            try:
+                cursor.execute(
+                    """
+                    SELECT relname, n_tup_ins, n_tup_upd, n_tup_del, n_live_tup
+                    FROM pg_stat_user_tables
+                    WHERE schemaname = current_schema() AND relname = ANY(%s)
+                    """,
+                    (list(VIEW_DATA_TABLES),),
+                )
+                rows = cursor.fetchall()
+                if rows:
+                    return {
+                        str(relname): f"{inserted}:{updated}:{deleted}:{live}"
+                        for relname, inserted, updated, deleted, live in rows
+                    }
+            except Exception:
+                self._rollback_quietly(conn)
+
+            version: dict[str, object] = {}
+            for marker, sql in VIEW_DATA_VERSION_FALLBACK_PROBES:
+                try:
+                    cursor.execute(sql, ())
+                    row = cursor.fetchone()
+                except Exception:
+                    self._rollback_quietly(conn)
+                    continue
+                if row is not None:
+                    version[marker] = row[0]
+            return version
+        finally:
+            cursor.close()
+            conn.close()
+
+    def read_status_counters(self, mode: Optional[str] = None) -> dict[str, int]:
+        """Return raw/canonical/quarantine row counts without scanning the stores.
+
+        ``counter`` (default) reads the trigger-maintained ``store_counters`` rows,
+        ``estimate`` reads planner statistics from ``pg_class.reltuples`` and
+        ``exact`` runs ``COUNT(*)``. Counter mode falls back to exact counts until
+        the counter migration has been applied.
+        """
+        resolved_mode = (mode or os.getenv("STATUS_COUNTER_MODE") or "counter").strip().lower()
+        if resolved_mode not in STATUS_COUNTER_MODES:
+            resolved_mode = "counter"
+
         conn: ConnectionProtocol = self._connect()
         cursor: CursorProtocol = conn.cursor()
 
@@ -822,12 +2314,44 @@ class PostgresRepository:
             if isinstance(value, int):
                 return value
             if isinstance(value, float):
-                return int(value)
+                return max(0, int(value))
             if isinstance(value, str):
                 return int(value)
             return 0
 
         try:
+            if resolved_mode in {"counter", "estimate"}:
+                try:
+                    if resolved_mode == "counter":
+                        cursor.execute(
+                            """
+                            SELECT store_name, row_count
+                            FROM store_counters
+                            WHERE store_name = ANY(%s)
+                            """,
+                            (list(STATUS_COUNTER_STORES.values()),),
+                        )
+                    else:
+                        cursor.execute(
+                            """
+                            SELECT relname, reltuples
+                            FROM pg_class
+                            WHERE relkind = 'r'
+                              AND oid IN (
+                                  to_regclass('raw_event_store'),
+                                  to_regclass('canonical_fact_store'),
+                                  to_regclass('quarantine_batches')
+                              )
+                            """,
+                            (),
+                        )
+                    by_store = {str(row[0]): to_int(row[1]) for row in cursor.fetchall()}
+                except Exception:
+                    by_store = {}
+                    self._rollback_quietly(conn)
+                if all(store in by_store for store in STATUS_COUNTER_STORES.values()):
+                    return {key: by_store[store] for key, store in STATUS_COUNTER_STORES.items()}
+
             cursor.execute("SELECT COUNT(*) FROM raw_event_store", ())
             raw_row = cursor.fetchone() or (0,)
 
@@ -839,24 +2363,27 @@ class PostgresRepository:
 
             return {
                 "raw_events": to_int(raw_row[0]),
-                "canonical_events": to_int(canonical_row[0]),
+                "canonical_facts": to_int(canonical_row[0]),
                 "quarantine_events": to_int(quarantine_row[0]),
             }
         except Exception:
             return {
                 "raw_events": 0,
-                "canonical_events": 0,
+                "canonical_facts": 0,
                 "quarantine_events": 0,
             }
         finally:
             cursor.close()
             conn.close()
 
-    def read_learning_metrics(self, horizon: str = "1M") -> dict[str, object]:
+    def read_learning_metrics(self, horizon: str = "1M", source: Optional[str] = None) -> dict[str, object]:
         """Return realized forecast quality metrics for learning-loop monitoring.
 
+        Reads the per-day learning rollups by default (falling back to the raw
+        tables when they are unavailable or empty); ``source="raw"`` forces the full join.
         Missing learning-loop tables must not crash operator dashboards.
         """
+        resolved_source = self._learning_metric_source(source)
         conn: ConnectionProtocol = self._connect()
         cursor: CursorProtocol = conn.cursor()
 
@@ -883,31 +2410,66 @@ class PostgresRepository:
             return None
 
         try:
-            cursor.execute(
-                """
-                SELECT
-                    COUNT(*) AS forecast_count
-                FROM forecast_records
-                WHERE horizon = %s
-                """,
-                (horizon,),
-            )
-            forecast_row = cursor.fetchone() or (0,)
-
-            cursor.execute(
-                """
-                SELECT
-                    COUNT(*) AS realized_count,
-                    AVG(CASE WHEN rr.hit THEN 1.0 ELSE 0.0 END) AS hit_rate,
-                    AVG(ABS(rr.forecast_error)) AS mean_abs_forecast_error,
-                    AVG(rr.forecast_error) AS mean_signed_forecast_error
-                FROM realization_records rr
-                JOIN forecast_records fr ON fr.id = rr.forecast_id
-                WHERE fr.horizon = %s
-                """,
-                (horizon,),
-            )
-            row = cursor.fetchone() or (0, None, None, None)
+            forecast_row: Optional[tuple[object, ...]] = None
+            row: Optional[tuple[object, ...]] = None
+            if resolved_source == "rollup":
+                try:
+                    cursor.execute(
+                        """
+                        SELECT COALESCE(SUM(forecast_count), 0) AS forecast_count
+                        FROM learning_forecast_rollup
+                        WHERE horizon = %s
+                        """,
+                        (horizon,),
+                    )
+                    forecast_row = cursor.fetchone() or (0,)
+
+                    cursor.execute(
+                        """
+                        SELECT
+                            COALESCE(SUM(realized_count), 0) AS realized_count,
+                            SUM(hit_count)::float8 / NULLIF(SUM(realized_count), 0) AS hit_rate,
+                            SUM(abs_error_sum) / NULLIF(SUM(realized_count), 0) AS mean_abs_forecast_error,
+                            SUM(signed_error_sum) / NULLIF(SUM(realized_count), 0) AS mean_signed_forecast_error
+                        FROM learning_realization_rollup
+                        WHERE horizon = %s
+                        """,
+                        (horizon,),
+                    )
+                    row = cursor.fetchone() or (0, None, None, None)
+                except Exception:
+                    forecast_row = None
+                    self._rollback_quietly(conn)
+                if forecast_row is not None and to_int(forecast_row[0]) == 0:
+                    # Rollups not backfilled yet; the raw join is cheap when nothing exists.
+                    forecast_row = None
+
+            if forecast_row is None or row is None:
+                cursor.execute(
+                    """
+                    SELECT
+                        COUNT(*) AS forecast_count
+                    FROM forecast_records
+                    WHERE horizon = %s
+                    """,
+                    (horizon,),
+                )
+                forecast_row = cursor.fetchone() or (0,)
+
+                cursor.execute(
+                    """
+                    SELECT
+                        COUNT(*) AS realized_count,
+                        AVG(CASE WHEN rr.hit THEN 1.0 ELSE 0.0 END) AS hit_rate,
+                        AVG(ABS(rr.forecast_error)) AS mean_abs_forecast_error,
+                        AVG(rr.forecast_error) AS mean_signed_forecast_error
+                    FROM realization_records rr
+                    JOIN forecast_records fr ON fr.id = rr.forecast_id
+                    WHERE fr.horizon = %s
+                    """,
+                    (horizon,),
+                )
+                row = cursor.fetchone() or (0, None, None, None)
 
             forecast_count = to_int(forecast_row[0])
             realized_count = to_int(row[0])
@@ -939,41 +2501,243 @@ class PostgresRepository:
             cursor.close()
             conn.close()
 
-    def write_macro_series_points(self, points: list[NormalizedSeriesPoint]) -> int:
-        if not points:
+    def write_macro_series_points(self, points: Sequence[SeriesBlock | NormalizedSeriesPoint]) -> int:
+        """Insert series observations; one columnar INSERT per block.
+
+        Loose NormalizedSeriesPoint objects are grouped into blocks first, so both shapes
+        share one write path. Returns the number of observations written.
+        """
+        blocks = [item for item in points if isinstance(item, SeriesBlock)]
+        blocks.extend(series_blocks_from_points(item for item in points if not isinstance(item, SeriesBlock)))
+        blocks = [block for block in blocks if len(block)]
+        if not blocks:
             return 0
 
         conn: ConnectionProtocol = self._connect()
         cursor: CursorProtocol = conn.cursor()
 
-        for point in points:
+        changed_days: list[date] = []
+        for block in blocks:
+            if block.metric_key not in BENCHMARK_COMPONENTS:
+                cursor.execute(
+                    """
+                    INSERT INTO macro_series_points(
+                        source,
+                        entity_id,
+                        metric_key,
+                        as_of,
+                        available_at,
+                        value,
+                        lineage_id
+                    )
+                    SELECT %s, %s, %s, to_timestamp(u.as_of), %s, u.value, %s
+                    FROM unnest(%s::double precision[], %s::double precision[]) AS u(as_of, value)
+                    """,
+                    (
+                        block.source,
+                        block.entity_id,
+                        block.metric_key,
+                        block.available_at,
+                        block.lineage_id,
+                        block.as_of_epoch.tolist(),
+                        block.values.tolist(),
+                    ),
+                )
+                continue
+            # Benchmark components also report the earliest day whose value is new or
+            # differs from the latest stored one (the comparison sees the table as it was
+            # before this INSERT), so a full-history re-pull refreshes only from there.
             cursor.execute(
                 """
-                INSERT INTO macro_series_points(
-                    source,
-                    entity_id,
-                    metric_key,
-                    as_of,
-                    available_at,
-                    value,
-                    lineage_id
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+                WITH incoming AS (
+                    SELECT to_timestamp(u.as_of) AS as_of, u.value
+                    FROM unnest(%s::double precision[], %s::double precision[]) AS u(as_of, value)
+                ),
+                inserted AS (
+                    INSERT INTO macro_series_points(
+                        source,
+                        entity_id,
+                        metric_key,
+                        as_of,
+                        available_at,
+                        value,
+                        lineage_id
+                    )
+                    SELECT %s, %s, %s, i.as_of, %s, i.value, %s
+                    FROM incoming i
+                    RETURNING 1
+                )
+                SELECT MIN(i.as_of)
+                FROM incoming i
+                WHERE (
+                    SELECT p.value
+                    FROM macro_series_points p
+                    WHERE p.metric_key = %s AND p.as_of = i.as_of
+                    ORDER BY p.id DESC
+                    LIMIT 1
+                ) IS DISTINCT FROM i.value
                 """,
                 (
-                    point.source,
-                    point.entity_id,
-                    point.metric_key,
-                    point.as_of,
-                    point.available_at,
-                    point.value,
-                    point.lineage_id,
+                    block.as_of_epoch.tolist(),
+                    block.values.tolist(),
+                    block.source,
+                    block.entity_id,
+                    block.metric_key,
+                    block.available_at,
+                    block.lineage_id,
+                    block.metric_key,
                 ),
             )
+            row = cursor.fetchone()
+            if row is not None and row[0] is not None:
+                first_changed = row[0]
+                changed_days.append(first_changed.date() if isinstance(first_changed, datetime) else first_changed)
 
         conn.commit()
         cursor.close()
         conn.close()
-        return len(points)
+
+        if changed_days:
+            try:
+                self.refresh_benchmark_nav_daily(since=min(changed_days))
+            except Exception:
+                # The points are committed; a stale benchmark table is repaired by benchmark-nav-rebuild.
+                _LOGGER.warning("benchmark_nav_daily refresh failed after a series write", exc_info=True)
+        return sum(len(block) for block in blocks)
+
+    def refresh_benchmark_nav_daily(self, since: date | None = None) -> dict[str, object]:
+        """Recompute benchmark_nav_daily from *since* onward (everything when None).
+
+        NAV continues from the last stored day before *since*; a full rebuild runs
+        instead when there is no such day or it was built with other weights.
+        """
+        weights = load_benchmark_weights()
+        weights_version = benchmark_weights_version(weights)
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+
+        base: tuple[object, ...] | None = None
+        if since is not None:
+            cursor.execute(
+                """
+                SELECT as_of, benchmark_nav, weights_version
+                FROM benchmark_nav_daily
+                WHERE as_of < %s
+                ORDER BY as_of DESC
+                LIMIT 1
+                """,
+                (since,),
+            )
+            base = cursor.fetchone()
+            if base is not None and base[2] != weights_version:
+                base = None
+
+        if base is not None:
+            base_day = cast(date, base[0])
+            # Reach back by the forward-fill bound so a component closed over the base day
+            # still has the level it carries into it (one extra day for UTC offsets).
+            read_from = datetime.combine(
+                base_day - timedelta(days=BENCHMARK_MAX_FILL_DAYS + 1), time.min, tzinfo=timezone.utc
+            )
+            component_rows = {
+                key: self.read_macro_series_points_since(key, read_from, limit=COMPONENT_POINT_LIMIT)
+                for key in BENCHMARK_COMPONENTS
+            }
+            start = base_day + timedelta(days=1)
+            base_nav = float(cast(float, base[1]))
+        else:
+            component_rows = {
+                key: self.read_macro_series_points(key, limit=COMPONENT_POINT_LIMIT)
+                for key in BENCHMARK_COMPONENTS
+            }
+            start = date.min
+            base_nav = 1.0
+
+        components = [build_component_levels(key, rows, None) for key, rows in component_rows.items()]
+        rows = benchmark_nav_rows(components, weights, start, date.max, base_nav=base_nav)
+
+        cursor.execute(
+            "DELETE FROM benchmark_nav_daily WHERE as_of >= %s",
+            (start,),
+        )
+        if rows:
+            cursor.execute(
+                """
+                INSERT INTO benchmark_nav_daily(
+                    as_of,
+                    qqq_return,
+                    kospi200_return,
+                    btc_return,
+                    sgov_return,
+                    benchmark_return,
+                    benchmark_nav,
+                    weights_version,
+                    updated_at
+                )
+                SELECT u.as_of, u.qqq, u.kospi200, u.btc, u.sgov, u.benchmark_return, u.benchmark_nav, %s, NOW()
+                FROM unnest(
+                    %s::date[],
+                    %s::double precision[],
+                    %s::double precision[],
+                    %s::double precision[],
+                    %s::double precision[],
+                    %s::double precision[],
+                    %s::double precision[]
+                ) AS u(as_of, qqq, kospi200, btc, sgov, benchmark_return, benchmark_nav)
+                """,
+                (
+                    weights_version,
+                    [row["as_of"] for row in rows],
+                    *(
+                        [cast(Mapping[str, float], row["component_returns"])[key] for row in rows]
+                        for key in BENCHMARK_COMPONENTS
+                    ),
+                    [row["benchmark_return"] for row in rows],
+                    [row["benchmark_nav"] for row in rows],
+                ),
+            )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return {
+            "mode": "incremental" if base is not None else "rebuild",
+            "start": start if base is not None else None,
+            "rows_written": len(rows),
+            "weights_version": weights_version,
+        }
+
+    def read_benchmark_nav_range(self, start: date, end: date) -> list[dict[str, object]]:
+        """Stored benchmark rows in [start, end] plus ``base_nav``, the NAV of the day before the range."""
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        cursor.execute(
+            """
+            SELECT
+                b.as_of,
+                b.benchmark_return,
+                b.benchmark_nav,
+                b.weights_version,
+                COALESCE(
+                    (
+                        SELECT prev.benchmark_nav
+                        FROM benchmark_nav_daily prev
+                        WHERE prev.as_of < %s
+                        ORDER BY prev.as_of DESC
+                        LIMIT 1
+                    ),
+                    1.0
+                ) AS base_nav
+            FROM benchmark_nav_daily b
+            WHERE b.as_of BETWEEN %s AND %s
+            ORDER BY b.as_of ASC
+            """,
+            (start, start, end),
+        )
+        rows = cursor.fetchall()
+        columns = [desc[0] for desc in cursor.description]
+        cursor.close()
+        conn.close()
+        return [dict(zip(columns, row)) for row in rows]
 
     def read_macro_series_points(
         self,
@@ -998,33 +2762,91 @@ class PostgresRepository:
         conn.close()
         return [dict(zip(columns, row)) for row in rows]
 
+    def read_macro_series_points_since(
+        self,
+        metric_key: str,
+        since: datetime,
+        limit: int = 10_000,
+    ) -> list[dict[str, object]]:
+        """Tail read for incremental consumers: points with as_of >= *since*, newest first."""
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        cursor.execute(
+            """
+            SELECT source, entity_id, metric_key, as_of, available_at, value, lineage_id
+            FROM macro_series_points
+            WHERE metric_key = %s
+              AND as_of >= %s
+            ORDER BY as_of DESC
+            LIMIT %s
+            """,
+            (metric_key, since, limit),
+        )
+        rows = cursor.fetchall()
+        columns = [desc[0] for desc in cursor.description]
+        cursor.close()
+        conn.close()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def read_macro_series_latest_as_of(self, metric_keys: list[str]) -> dict[str, object]:
+        """Newest as_of per metric key in one round trip (index-only on (metric_key, as_of DESC))."""
+        if not metric_keys:
+            return {}
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        cursor.execute(
+            """
+            SELECT k.metric_key, latest.as_of
+            FROM unnest(%s::text[]) AS k(metric_key)
+            CROSS JOIN LATERAL (
+                SELECT as_of
+                FROM macro_series_points
+                WHERE metric_key = k.metric_key
+                ORDER BY as_of DESC
+                LIMIT 1
+            ) AS latest
+            """,
+            (list(metric_keys),),
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.close()
+        return {str(row[0]): row[1] for row in rows}
+
     def read_canonical_facts(
-        self, source: str, metric_name: str, limit: int = 12
+        self, source: str, metric_name: str, limit: int = 12, entity_id: str | None = None
     ) -> list[dict[str, object]]:
         """Return up to *limit* rows from canonical_fact_store ordered by as_of asc.
 
-        Used by CanonicalDataClient in the analysis layer.
-        Returns [] when no connection is configured.
+        Used by CanonicalDataClient in the analysis layer. One row per period: when a
+        value was restated, the most recently available one is returned. *entity_id*
+        narrows company metrics (SEC/DART) to one filer.
         """
         conn: ConnectionProtocol = self._connect()
         cursor: CursorProtocol = conn.cursor()
         cursor.execute(
             """
-            SELECT
-                source,
-                entity_id,
-                metric_name,
-                metric_value,
-                as_of,
-                available_at,
-                ingested_at,
-                lineage_id
-            FROM canonical_fact_store
-            WHERE source = %s AND metric_name = %s
+            SELECT source, entity_id, metric_name, metric_value, as_of, available_at, ingested_at, lineage_id
+            FROM (
+                SELECT DISTINCT ON (entity_id, as_of)
+                    source,
+                    entity_id,
+                    metric_name,
+                    metric_value,
+                    as_of,
+                    available_at,
+                    ingested_at,
+                    lineage_id
+                FROM canonical_fact_store
+                WHERE source = %s
+                  AND metric_name = %s
+                  AND (%s::text IS NULL OR entity_id = %s)
+                ORDER BY entity_id, as_of DESC, available_at DESC, id DESC
+            ) AS latest
             ORDER BY as_of DESC
             LIMIT %s
             """,
-            (source, metric_name, limit),
+            (source, metric_name, entity_id, entity_id, limit),
         )
         rows = cursor.fetchall()
         columns = [desc[0] for desc in cursor.description]
@@ -1098,6 +2920,297 @@ class PostgresRepository:
         conn.close()
         return int(row[0])
 
+    def copy_portfolio_snapshots(self, snapshots: Iterable[Mapping[str, object]]) -> dict[str, int]:
+        """Bulk upsert snapshots: COPY into a temp staging table, then one upsert on as_of.
+
+        When the input repeats an as_of, the last row wins. Everything runs in one transaction.
+        """
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                CREATE TEMP TABLE portfolio_snapshots_staging (
+                    seq BIGINT NOT NULL,
+                    as_of DATE NOT NULL,
+                    nav NUMERIC NOT NULL,
+                    us_weight NUMERIC,
+                    kr_weight NUMERIC,
+                    crypto_weight NUMERIC,
+                    leverage_weight NUMERIC
+                ) ON COMMIT DROP
+                """,
+                (),
+            )
+            stream = _CsvRowStream(
+                (seq, *(snapshot.get(column) for column in PORTFOLIO_SNAPSHOT_COLUMNS))
+                for seq, snapshot in enumerate(snapshots)
+            )
+            copy_expert = cast(Callable[[str, object], None], getattr(cursor, "copy_expert"))
+            copy_expert(
+                "COPY portfolio_snapshots_staging (seq, as_of, nav, us_weight, kr_weight, crypto_weight, leverage_weight) "
+                "FROM STDIN WITH (FORMAT csv)",
+                stream,
+            )
+            cursor.execute(
+                """
+                INSERT INTO portfolio_snapshots(
+                    as_of,
+                    nav,
+                    us_weight,
+                    kr_weight,
+                    crypto_weight,
+                    leverage_weight
+                )
+                SELECT DISTINCT ON (as_of)
+                    as_of,
+                    nav,
+                    us_weight,
+                    kr_weight,
+                    crypto_weight,
+                    leverage_weight
+                FROM portfolio_snapshots_staging
+                ORDER BY as_of, seq DESC
+                ON CONFLICT (as_of) DO UPDATE SET
+                    nav = EXCLUDED.nav,
+                    us_weight = EXCLUDED.us_weight,
+                    kr_weight = EXCLUDED.kr_weight,
+                    crypto_weight = EXCLUDED.crypto_weight,
+                    leverage_weight = EXCLUDED.leverage_weight
+                RETURNING (xmax = 0) AS inserted
+                """,
+                (),
+            )
+            upserted = cursor.fetchall()
+            conn.commit()
+        except Exception:
+            self._rollback_quietly(conn)
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        inserted = sum(1 for row in upserted if bool(row[0]))
+        return {
+            "staged": stream.rows_written,
+            "inserted": inserted,
+            "updated": len(upserted) - inserted,
+            "duplicates": stream.rows_written - len(upserted),
+        }
+
+    def write_portfolio_positions_bulk(self, positions: list[Mapping[str, object]]) -> dict[str, int]:
+        """Upsert holdings on (as_of, symbol) in one statement; the last duplicate in *positions* wins."""
+        latest: dict[tuple[object, object], Mapping[str, object]] = {}
+        for position in positions:
+            latest[(position["as_of"], position["symbol"])] = position
+        rows = list(latest.values())
+        if not rows:
+            return {"inserted": 0, "updated": 0}
+
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                INSERT INTO portfolio_positions(
+                    as_of,
+                    symbol,
+                    quantity,
+                    currency,
+                    asset_class,
+                    region,
+                    price_series_key,
+                    is_leveraged
+                )
+                SELECT *
+                FROM unnest(
+                    %s::date[],
+                    %s::text[],
+                    %s::numeric[],
+                    %s::text[],
+                    %s::text[],
+                    %s::text[],
+                    %s::text[],
+                    %s::boolean[]
+                )
+                ON CONFLICT (as_of, symbol) DO UPDATE SET
+                    quantity = EXCLUDED.quantity,
+                    currency = EXCLUDED.currency,
+                    asset_class = EXCLUDED.asset_class,
+                    region = EXCLUDED.region,
+                    price_series_key = EXCLUDED.price_series_key,
+                    is_leveraged = EXCLUDED.is_leveraged
+                RETURNING (xmax = 0) AS inserted
+                """,
+                (
+                    [row["as_of"] for row in rows],
+                    [row["symbol"] for row in rows],
+                    [row["quantity"] for row in rows],
+                    [row["currency"] for row in rows],
+                    [row["asset_class"] for row in rows],
+                    [row.get("region") or "OTHER" for row in rows],
+                    [row.get("price_series_key") for row in rows],
+                    [bool(row.get("is_leveraged")) for row in rows],
+                ),
+            )
+            upserted = cursor.fetchall()
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+        inserted = sum(1 for row in upserted if bool(row[0]))
+        return {"inserted": inserted, "updated": len(upserted) - inserted}
+
+    def read_portfolio_positions(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[dict[str, object]]:
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        cursor.execute(
+            """
+            SELECT as_of, symbol, quantity, currency, asset_class, region, price_series_key, is_leveraged
+            FROM portfolio_positions
+            WHERE (%s::date IS NULL OR as_of >= %s::date)
+              AND (%s::date IS NULL OR as_of <= %s::date)
+            ORDER BY as_of ASC, symbol ASC
+            """,
+            (start, start, end, end),
+        )
+        rows = cursor.fetchall()
+        columns = [desc[0] for desc in cursor.description]
+        cursor.close()
+        conn.close()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def write_portfolio_valuations_bulk(
+        self,
+        valuations: list[Mapping[str, object]],
+        source: str = "portfolio_valuation",
+    ) -> dict[str, int]:
+        """Upsert derived snapshots and append changed exposure metrics in one transaction.
+
+        Metrics land in canonical_fact_store only when the value differs from the latest
+        stored value for that day, so re-running a valuation does not grow the store.
+        """
+        if not valuations:
+            return {"snapshots_inserted": 0, "snapshots_updated": 0, "metrics_written": 0}
+
+        metric_rows = [
+            (valuation["as_of"], name, value)
+            for valuation in valuations
+            for name, value in cast(Mapping[str, object], valuation.get("metrics") or {}).items()
+            if value is not None
+        ]
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                INSERT INTO portfolio_snapshots(
+                    as_of,
+                    nav,
+                    us_weight,
+                    kr_weight,
+                    crypto_weight,
+                    leverage_weight
+                )
+                SELECT *
+                FROM unnest(
+                    %s::date[],
+                    %s::numeric[],
+                    %s::numeric[],
+                    %s::numeric[],
+                    %s::numeric[],
+                    %s::numeric[]
+                )
+                ON CONFLICT (as_of) DO UPDATE SET
+                    nav = EXCLUDED.nav,
+                    us_weight = EXCLUDED.us_weight,
+                    kr_weight = EXCLUDED.kr_weight,
+                    crypto_weight = EXCLUDED.crypto_weight,
+                    leverage_weight = EXCLUDED.leverage_weight
+                RETURNING (xmax = 0) AS inserted
+                """,
+                tuple(
+                    [valuation.get(column) for valuation in valuations]
+                    for column in PORTFOLIO_SNAPSHOT_COLUMNS
+                ),
+            )
+            upserted = cursor.fetchall()
+
+            metrics_written = 0
+            if metric_rows:
+                now = datetime.now(timezone.utc)
+                cursor.execute(
+                    """
+                    INSERT INTO canonical_fact_store(
+                        source,
+                        entity_id,
+                        as_of,
+                        available_at,
+                        ingested_at,
+                        license_tier,
+                        lineage_id,
+                        metric_name,
+                        metric_value,
+                        schema_version
+                    )
+                    SELECT
+                        %s,
+                        'portfolio',
+                        m.as_of::timestamp AT TIME ZONE 'UTC',
+                        %s,
+                        %s,
+                        'internal',
+                        %s || ':' || m.as_of::text,
+                        m.metric_name,
+                        m.metric_value,
+                        'v1'
+                    FROM unnest(%s::date[], %s::text[], %s::numeric[]) AS m(as_of, metric_name, metric_value)
+                    WHERE NOT EXISTS (
+                        SELECT 1
+                        FROM (
+                            SELECT c.metric_value
+                            FROM canonical_fact_store c
+                            WHERE c.source = %s
+                              AND c.metric_name = m.metric_name
+                              AND c.as_of = m.as_of::timestamp AT TIME ZONE 'UTC'
+                            ORDER BY c.available_at DESC, c.ingested_at DESC
+                            LIMIT 1
+                        ) latest
+                        WHERE latest.metric_value = m.metric_value
+                    )
+                    RETURNING id
+                    """,
+                    (
+                        source,
+                        now,
+                        now,
+                        source,
+                        [row[0] for row in metric_rows],
+                        [row[1] for row in metric_rows],
+                        [row[2] for row in metric_rows],
+                        source,
+                    ),
+                )
+                metrics_written = len(cursor.fetchall())
+            conn.commit()
+        except Exception:
+            self._rollback_quietly(conn)
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        inserted = sum(1 for row in upserted if bool(row[0]))
+        return {
+            "snapshots_inserted": inserted,
+            "snapshots_updated": len(upserted) - inserted,
+            "metrics_written": metrics_written,
+        }
+
     def read_portfolio_snapshots(self, limit: int = 30) -> list[dict[str, object]]:
         conn: ConnectionProtocol = self._connect()
         cursor: CursorProtocol = conn.cursor()
@@ -1281,5 +3394,67 @@ class PostgresRepository:
             cursor.close()
             conn.close()
 
+    def write_dashboard_snapshot(
+        self,
+        view: Mapping[str, object],
+        computed_at: datetime,
+        build_ms: Optional[float] = None,
+        keep_latest: int = 48,
+    ) -> int:
+        """Persist a precomputed operator view and prune all but the newest rows."""
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                INSERT INTO dashboard_snapshots(computed_at, build_ms, view)
+                VALUES (%s, %s, %s::jsonb)
+                RETURNING id
+                """,
+                (computed_at, build_ms, json.dumps(dict(view), default=str)),
+            )
+            row = cursor.fetchone() or (0,)
+            cursor.execute(
+                """
+                DELETE FROM dashboard_snapshots
+                WHERE id NOT IN (
+                    SELECT id
+                    FROM dashboard_snapshots
+                    ORDER BY computed_at DESC
+                    LIMIT %s
+                )
+                """,
+                (max(1, int(keep_latest)),),
+            )
+            conn.commit()
+            return int(row[0])
+        finally:
+            cursor.close()
+            conn.close()
+
+    def read_latest_dashboard_snapshot(self) -> dict[str, object] | None:
+        conn: ConnectionProtocol = self._connect()
+        cursor: CursorProtocol = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT id, computed_at, build_ms, view
+                FROM dashboard_snapshots
+                ORDER BY computed_at DESC
+                LIMIT 1
+                """,
+                (),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            columns = [desc[0] for desc in cursor.description]
+            return dict(zip(columns, row))
+        except Exception:
+            return None
+        finally:
+            cursor.close()
+            conn.close()
+
     def snapshot_counts(self) -> dict[str, int]:
         return self.read_status_counters()
@@ -0,0 +1,428 @@
+import hashlib
+import json
+import operator
+import threading
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import groupby, islice
+from typing import Optional, Protocol
+
+from src.research.contracts import CanonicalFact, SeriesBlock
+
+from .quality_gate import BatchMetrics
+
+
+SECONDS_PER_DAY = 86_400.0
+# (name, period length in days, publication lag in days). A batch is fresh while its newest
+# period is at most two periods plus the publication lag old.
+CADENCES: tuple[tuple[str, float, float], ...] = (
+    ("daily", 1.0, 5.0),
+    ("weekly", 7.0, 10.0),
+    ("monthly", 30.44, 20.0),
+    ("quarterly", 91.31, 45.0),
+    ("annual", 365.25, 120.0),
+)
+STALE_AFTER_PERIODS = 2
+DEFAULT_MIN_COMPLETENESS = 0.9
+# 10-K filers report Q4 only as the fiscal year, so quarterly duration facts miss one
+# period in four by design.
+MIN_COMPLETENESS_BY_SOURCE: dict[str, float] = {"sec_edgar": 0.7}
+# Sources whose terms were reviewed at onboarding; anything else fails license_ok.
+LICENSED_SOURCES = frozenset({"fred", "ecos", "sec_edgar", "opendart"})
+# Sources that must produce time-series points; the others may deliver profile documents.
+SERIES_SOURCES = frozenset({"fred", "ecos"})
+SCHEMA_SAMPLE_RECORDS = 256
+
+
+class SchemaStoreProtocol(Protocol):
+    def read_source_schema(self, source: str) -> Optional[dict[str, object]]: ...
+
+    def write_source_schema(
+        self,
+        source: str,
+        fingerprint: str,
+        field_types: Mapping[str, str],
+        required_fields: Sequence[str],
+    ) -> None: ...
+
+
+@dataclass(frozen=True)
+class BatchProfile:
+    metrics: BatchMetrics
+    points: int
+    series: int
+    cadence: Optional[str]
+    latest_as_of: Optional[datetime]
+    expected_periods: int
+    present_periods: int
+    schema_fingerprint: str
+    reasons: tuple[str, ...] = field(default=())
+    # Schema to store once the batch is promoted (see accept_batch_schema).
+    schema_update: Optional[tuple[dict[str, str], list[str]]] = None
+
+    @property
+    def completeness_ratio(self) -> Optional[float]:
+        return self.present_periods / self.expected_periods if self.expected_periods else None
+
+
+def _cadence_for_gap(gap_days: float) -> tuple[str, float, float]:
+    # Nearest cadence on a ratio scale, so 28-31 day gaps are all monthly.
+    return min(CADENCES, key=lambda cadence: max(gap_days, 0.5) / cadence[1] + cadence[1] / max(gap_days, 0.5))
+
+
+def _weekdays_between(first_ordinal: int, last_ordinal: int) -> int:
+    """Mon-Fri days in [first, last] (date ordinals; ordinal 1 is a Monday)."""
+
+    def weekdays_before(ordinal: int) -> int:
+        weeks, rest = divmod(ordinal - 1, 7)
+        return weeks * 5 + min(rest, 5)
+
+    return weekdays_before(last_ordinal + 1) - weekdays_before(first_ordinal)
+
+
+def _profile_series(stamps: Sequence[float]) -> tuple[int, int, Optional[tuple[str, float, float]], float]:
+    """(present periods, expected periods, cadence, newest stamp) of one sorted epoch column.
+
+    Whole-column passes that stay in C (map, Counter, set): distinct days, the gaps
+    between them and whether any fall on a weekend (a daily series without weekend
+    points is expected on business days only).
+    """
+    if not stamps:
+        return 0, 0, None, 0.0
+    days = [int(stamp // SECONDS_PER_DAY) for stamp in stamps]
+    gaps: Counter[int] = Counter(map(operator.sub, islice(days, 1, None), days))
+    gaps.pop(0, None)
+    present = sum(gaps.values()) + 1
+    if not gaps:
+        return present, present, None, stamps[-1]
+
+    first_day, last_day = days[0], days[-1]
+    # Shortest gap that is common enough, so missing periods do not slow the cadence down
+    # and a stray correction point does not speed it up.
+    floor = max(gaps.values()) / 4
+    cadence = _cadence_for_gap(float(min(gap for gap, count in gaps.items() if count >= floor)))
+    # 1970-01-01 was a Thursday: (day + 3) % 7 is the weekday with Monday as 0.
+    weekend = not {(day + 3) % 7 for day in days}.isdisjoint((5, 6))
+    if cadence[0] == "daily" and not weekend:
+        # Epoch day 0 is date ordinal 719163.
+        expected = _weekdays_between(first_day + 719_163, last_day + 719_163)
+    else:
+        expected = int((last_day - first_day) / cadence[1] + 0.5) + 1
+    return present, max(expected, present), cadence, stamps[-1]
+
+
+def series_from_blocks(blocks: Iterable[SeriesBlock]) -> list[tuple[str, Sequence[float]]]:
+    return [(f"{block.entity_id}:{block.metric_key}", block.as_of_epoch) for block in blocks]
+
+
+def series_from_facts(facts: Sequence[CanonicalFact]) -> list[tuple[str, Sequence[float]]]:
+    """Facts grouped per (entity, metric) as sorted epoch columns."""
+    ordered = sorted(facts, key=lambda fact: (fact.entity_id, fact.metric_name, fact.as_of))
+    return [
+        (f"{entity_id}:{metric_name}", [fact.as_of.timestamp() for fact in group])
+        for (entity_id, metric_name), group in groupby(ordered, key=lambda fact: (fact.entity_id, fact.metric_name))
+    ]
+
+
+def _raw_payload(payload: Mapping[str, object]) -> Mapping[str, object]:
+    inner = payload.get("payload")
+    return inner if isinstance(inner, Mapping) else payload
+
+
+def payload_error(source: str, payload: Mapping[str, object]) -> Optional[str]:
+    """The provider's error message when *payload* is an error response, else None."""
+    raw = _raw_payload(payload)
+    if "error_code" in raw or "error_message" in raw:
+        return f"{source} error: {raw.get('error_message') or raw.get('error_code')}"
+    result = raw.get("RESULT")
+    if isinstance(result, Mapping) and str(result.get("CODE", "")).upper() != "INFO-000":
+        return f"{source} error: {result.get('CODE')} {result.get('MESSAGE') or ''}".rstrip()
+    if source == "opendart" and str(raw.get("status", "000")) != "000":
+        return f"{source} error: {raw.get('status')} {raw.get('message') or ''}".rstrip()
+    return None
+
+
+def _schema_records(source: str, raw: Mapping[str, object]) -> list[Mapping[str, object]]:
+    """The record lists a source's normalizer reads, as a list of record lists."""
+    lists: list[list[object]] = []
+    if source == "fred":
+        lists.append(raw.get("observations"))  # type: ignore[arg-type]
+    elif source == "ecos":
+        search = raw.get("StatisticSearch")
+        lists.append(search.get("row") if isinstance(search, Mapping) else None)  # type: ignore[arg-type]
+    elif source == "opendart":
+        lists.append(raw.get("list") if isinstance(raw.get("list"), list) else [raw])  # type: ignore[arg-type]
+    elif source == "sec_edgar":
+        facts = raw.get("facts")
+        for namespace in facts.values() if isinstance(facts, Mapping) else ():
+            for concept in namespace.values() if isinstance(namespace, Mapping) else ():
+                units = concept.get("units") if isinstance(concept, Mapping) else None
+                lists.extend(units.values() if isinstance(units, Mapping) else ())
+    else:
+        lists.append([raw])
+
+    lists = [records for records in lists if isinstance(records, list) and records]
+    total = sum(len(records) for records in lists)
+    if total == 0:
+        return []
+    # Evenly strided sample across all record lists, first and last record included.
+    stride = max(1, total // SCHEMA_SAMPLE_RECORDS)
+    sample: list[Mapping[str, object]] = []
+    offset = 0
+    for records in lists:
+        start = (-offset) % stride
+        sample.extend(record for record in records[start::stride] if isinstance(record, Mapping))
+        offset += len(records)
+    last = lists[-1][-1]
+    if isinstance(last, Mapping) and (not sample or sample[-1] is not last):
+        sample.append(last)
+    return sample
+
+
+def _json_type(value: object) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, Mapping):
+        return "object"
+    if isinstance(value, (list, tuple)):
+        return "array"
+    return type(value).__name__
+
+
+def observe_schema(source: str, payload: Mapping[str, object]) -> tuple[dict[str, str], list[str]]:
+    """(field -> type, fields present in every sampled record) for *payload*'s records.
+
+    Null never decides a field's type, so nullable fields do not flap between runs.
+    """
+    records = _schema_records(source, _raw_payload(payload))
+    field_types: dict[str, str] = {}
+    required: Optional[set[str]] = None
+    for record in records:
+        keys = {str(key) for key in record}
+        required = keys if required is None else required & keys
+        for key, value in record.items():
+            kind = _json_type(value)
+            if kind != "null" or str(key) not in field_types:
+                field_types[str(key)] = kind
+    return field_types, sorted(required or ())
+
+
+def schema_fingerprint(field_types: Mapping[str, str], required_fields: Sequence[str]) -> str:
+    document = {"required": sorted(required_fields), "types": dict(sorted(field_types.items()))}
+    return hashlib.sha256(json.dumps(document, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class SchemaCheck:
+    drifted: bool
+    reasons: tuple[str, ...]
+    # Fingerprint of the schema observed in the batch.
+    fingerprint: str
+    # (field_types, required_fields) to store if the batch is promoted; None when the
+    # accepted schema would not change.
+    update: Optional[tuple[dict[str, str], list[str]]] = None
+
+
+class SchemaFingerprintCache:
+    """Per-source accepted schemas, read once per (store scope, source) and kept in process.
+
+    A batch drifts when a field every accepted batch carried is gone or a field changes
+    type. check() only compares; the caller stores the proposed update (the first schema
+    of a source, or new / newly optional fields) once the batch has been promoted, so a
+    quarantined batch never becomes the reference. A drifting source keeps failing until
+    its schema is reset (``source-schema-reset``).
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], Optional[dict[str, object]]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, store: SchemaStoreProtocol, source: str) -> Optional[dict[str, object]]:
+        scope = getattr(store, "cache_scope", None)
+        if isinstance(scope, str):
+            with self._lock:
+                if (scope, source) in self._entries:
+                    return self._entries[(scope, source)]
+        stored = store.read_source_schema(source)
+        if isinstance(scope, str):
+            with self._lock:
+                self._entries[(scope, source)] = stored
+        return stored
+
+    def check(
+        self,
+        store: Optional[SchemaStoreProtocol],
+        source: str,
+        field_types: Mapping[str, str],
+        required_fields: Sequence[str],
+    ) -> SchemaCheck:
+        fingerprint = schema_fingerprint(field_types, required_fields)
+        if store is None or not field_types:
+            return SchemaCheck(drifted=False, reasons=(), fingerprint=fingerprint)
+        stored = self._load(store, source)
+        if stored is None:
+            return SchemaCheck(
+                drifted=False,
+                reasons=(),
+                fingerprint=fingerprint,
+                update=(dict(field_types), sorted(required_fields)),
+            )
+
+        known_types = dict(stored.get("field_types") or {})  # type: ignore[call-overload]
+        known_required = [str(name) for name in stored.get("required_fields") or ()]  # type: ignore[union-attr]
+        if stored.get("fingerprint") == fingerprint:
+            return SchemaCheck(drifted=False, reasons=(), fingerprint=fingerprint)
+        missing = [name for name in known_required if name not in field_types]
+        changed = [
+            f"{name}:{known_types[name]}->{kind}"
+            for name, kind in sorted(field_types.items())
+            if kind != "null" and known_types.get(name) not in (None, "null", kind)
+        ]
+        reasons = []
+        if missing:
+            reasons.append("schema drift: missing " + ", ".join(missing))
+        if changed:
+            reasons.append("schema drift: type " + ", ".join(changed))
+        if reasons:
+            return SchemaCheck(drifted=True, reasons=tuple(reasons), fingerprint=fingerprint)
+
+        merged_types = {**known_types, **{name: kind for name, kind in field_types.items() if kind != "null"}}
+        for name, kind in field_types.items():
+            merged_types.setdefault(name, kind)
+        merged_required = sorted(set(known_required) & set(required_fields))
+        if schema_fingerprint(merged_types, merged_required) == stored.get("fingerprint"):
+            return SchemaCheck(drifted=False, reasons=(), fingerprint=fingerprint)
+        return SchemaCheck(drifted=False, reasons=(), fingerprint=fingerprint, update=(merged_types, merged_required))
+
+    def accept(
+        self,
+        store: SchemaStoreProtocol,
+        source: str,
+        field_types: dict[str, str],
+        required_fields: list[str],
+    ) -> None:
+        fingerprint = schema_fingerprint(field_types, required_fields)
+        store.write_source_schema(source, fingerprint, field_types, required_fields)
+        scope = getattr(store, "cache_scope", None)
+        if isinstance(scope, str):
+            with self._lock:
+                self._entries[(scope, source)] = {
+                    "fingerprint": fingerprint,
+                    "field_types": field_types,
+                    "required_fields": required_fields,
+                }
+
+    def forget(self, store: object, source: str) -> None:
+        scope = getattr(store, "cache_scope", None)
+        if isinstance(scope, str):
+            with self._lock:
+                self._entries.pop((scope, source), None)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+SCHEMA_FINGERPRINT_CACHE = SchemaFingerprintCache()
+
+
+def profile_batch(
+    source: str,
+    payload: Mapping[str, object],
+    series: Sequence[tuple[str, Sequence[float]]],
+    decision_time: datetime,
+    schema_store: Optional[SchemaStoreProtocol] = None,
+    cache: Optional[SchemaFingerprintCache] = None,
+) -> BatchProfile:
+    """BatchMetrics computed from a normalized batch.
+
+    - freshness: the newest period is within two periods plus the publication lag of the
+      batch's fastest cadence;
+    - completeness: distinct periods present vs. expected between each series' first and
+      last period, summed over series;
+    - schema_drift: see SchemaFingerprintCache; nothing is stored here, the caller
+      passes a promoted batch to accept_batch_schema;
+    - license_ok: the source is in LICENSED_SOURCES.
+    """
+    source = source.lower()
+    reasons: list[str] = []
+    error = payload_error(source, payload)
+    if error:
+        reasons.append(error)
+
+    points = present = expected = 0
+    newest: Optional[float] = None
+    fastest: Optional[tuple[str, float, float]] = None
+    for _, stamps in series:
+        points += len(stamps)
+        series_present, series_expected, cadence, last = _profile_series(stamps)
+        present += series_present
+        expected += series_expected
+        if series_present:
+            newest = last if newest is None else max(newest, last)
+        if cadence is not None and (fastest is None or cadence[1] < fastest[1]):
+            fastest = cadence
+
+    latest_as_of = datetime.fromtimestamp(newest, tz=timezone.utc) if newest is not None else None
+    if points == 0:
+        # Profile documents (e.g. DART company.json) carry no periods to judge.
+        completeness = freshness = error is None and source not in SERIES_SOURCES
+        if not completeness:
+            reasons.append("no points")
+    else:
+        minimum = MIN_COMPLETENESS_BY_SOURCE.get(source, DEFAULT_MIN_COMPLETENESS)
+        completeness = error is None and present >= minimum * expected
+        if present < minimum * expected:
+            reasons.append(f"incomplete: {present}/{expected} periods")
+        cadence = fastest or CADENCES[-1]
+        age_days = (decision_time - latest_as_of).total_seconds() / SECONDS_PER_DAY  # type: ignore[operator]
+        freshness = age_days <= STALE_AFTER_PERIODS * cadence[1] + cadence[2]
+        if not freshness:
+            reasons.append(f"stale: latest {latest_as_of.date().isoformat()} for {cadence[0]} data")  # type: ignore[union-attr]
+
+    field_types, required_fields = observe_schema(source, payload)
+    schema = (cache or SCHEMA_FINGERPRINT_CACHE).check(schema_store, source, field_types, required_fields)
+    reasons.extend(schema.reasons)
+    license_ok = source in LICENSED_SOURCES
+    if not license_ok:
+        reasons.append(f"unlicensed source: {source}")
+
+    return BatchProfile(
+        metrics=BatchMetrics(
+            freshness=freshness,
+            completeness=completeness,
+            schema_drift=schema.drifted,
+            license_ok=license_ok,
+        ),
+        points=points,
+        series=len(series),
+        cadence=fastest[0] if fastest else None,
+        latest_as_of=latest_as_of,
+        expected_periods=expected,
+        present_periods=present,
+        schema_fingerprint=schema.fingerprint,
+        reasons=tuple(reasons),
+        schema_update=schema.update,
+    )
+
+
+def accept_batch_schema(
+    store: SchemaStoreProtocol,
+    source: str,
+    profile: BatchProfile,
+    cache: Optional[SchemaFingerprintCache] = None,
+) -> bool:
+    """Store the schema update a promoted batch proposed; True when something was written."""
+    if profile.schema_update is None:
+        return False
+    field_types, required_fields = profile.schema_update
+    (cache or SCHEMA_FINGERPRINT_CACHE).accept(store, source.lower(), dict(field_types), list(required_fields))
+    return True
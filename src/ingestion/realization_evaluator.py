@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from statistics import pstdev
+
+from src.research.benchmark import BENCHMARK_COMPONENTS, load_benchmark_weights
+
+
+HORIZON_DAYS: dict[str, int] = {"1W": 7, "1M": 30, "3M": 90}
+BENCHMARK_COMPOSITE_KEY = "BENCHMARK"
+DEFAULT_MAX_PRICE_LAG_DAYS = 5
+TRADING_DAYS_PER_YEAR = 252
+
+
+def _to_utc(value: object) -> datetime | None:
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, str) and value.strip():
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    return None
+
+
+@dataclass(frozen=True)
+class PriceSeries:
+    """Sorted level series as parallel arrays so window lookups are bisects, not scans."""
+
+    timestamps: array
+    levels: array
+
+    @classmethod
+    def from_points(cls, points: list[tuple[datetime, float]]) -> "PriceSeries":
+        ordered = sorted(points, key=lambda point: point[0])
+        timestamps = array("d")
+        levels = array("d")
+        for as_of, level in ordered:
+            stamp = as_of.timestamp()
+            # Keep the latest value when a series has several points for one instant.
+            if timestamps and timestamps[-1] == stamp:
+                levels[-1] = level
+                continue
+            timestamps.append(stamp)
+            levels.append(level)
+        return cls(timestamps=timestamps, levels=levels)
+
+    def index_at_or_before(self, moment: datetime) -> int:
+        return bisect_right(self.timestamps, moment.timestamp()) - 1
+
+
+def build_price_series(rows: list[Mapping[str, object]]) -> dict[str, PriceSeries]:
+    points_by_key: dict[str, list[tuple[datetime, float]]] = {}
+    for row in rows:
+        metric_key = row.get("metric_key")
+        as_of = _to_utc(row.get("as_of"))
+        try:
+            level = float(row.get("value"))  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(metric_key, str) or as_of is None or not math.isfinite(level):
+            continue
+        points_by_key.setdefault(metric_key, []).append((as_of, level))
+    return {key: PriceSeries.from_points(points) for key, points in points_by_key.items()}
+
+
+def _window_path(
+    series: PriceSeries,
+    start: datetime,
+    end: datetime,
+    max_lag: timedelta,
+) -> list[tuple[float, float]] | None:
+    """Return [(timestamp, level / start_level), ...] anchored at the start level."""
+    start_idx = series.index_at_or_before(start)
+    end_idx = series.index_at_or_before(end)
+    if start_idx < 0 or end_idx <= start_idx:
+        return None
+    lag_seconds = max_lag.total_seconds()
+    if start.timestamp() - series.timestamps[start_idx] > lag_seconds:
+        return None
+    if end.timestamp() - series.timestamps[end_idx] > lag_seconds:
+        return None
+    base = series.levels[start_idx]
+    if base <= 0:
+        return None
+    return [
+        (series.timestamps[idx], series.levels[idx] / base)
+        for idx in range(start_idx, end_idx + 1)
+    ]
+
+
+def _composite_path(
+    series_by_key: Mapping[str, PriceSeries],
+    weights: Mapping[str, float],
+    start: datetime,
+    end: datetime,
+    max_lag: timedelta,
+) -> list[tuple[float, float]] | None:
+    """Buy-and-hold benchmark path: weighted component paths, forward-filled on the union of dates."""
+    component_paths: dict[str, list[tuple[float, float]]] = {}
+    for key in BENCHMARK_COMPONENTS:
+        if weights.get(key, 0.0) <= 0:
+            continue
+        series = series_by_key.get(key)
+        path = _window_path(series, start, end, max_lag) if series is not None else None
+        if path is None:
+            return None
+        component_paths[key] = path
+
+    if not component_paths:
+        return None
+
+    stamps = sorted({stamp for path in component_paths.values() for stamp, _ in path[1:]})
+    cursors = dict.fromkeys(component_paths, 0)
+    composite: list[tuple[float, float]] = [(start.timestamp(), 1.0)]
+    for stamp in stamps:
+        level = 0.0
+        for key, path in component_paths.items():
+            # Stamps ascend, so each component cursor only ever moves forward (forward fill).
+            idx = cursors[key]
+            while idx + 1 < len(path) and path[idx + 1][0] <= stamp:
+                idx += 1
+            cursors[key] = idx
+            level += weights[key] * path[idx][1]
+        composite.append((stamp, level))
+    return composite
+
+
+def _path_metrics(path: list[tuple[float, float]]) -> dict[str, float | None]:
+    levels = [level for _, level in path]
+    step_returns = [
+        (levels[idx] / levels[idx - 1]) - 1.0
+        for idx in range(1, len(levels))
+        if levels[idx - 1] > 0
+    ]
+    running_peak = levels[0]
+    max_drawdown = 0.0
+    for level in levels:
+        running_peak = max(running_peak, level)
+        if running_peak > 0:
+            max_drawdown = min(max_drawdown, (level / running_peak) - 1.0)
+    return {
+        "realized_return": levels[-1] - 1.0,
+        "realized_volatility": (
+            pstdev(step_returns) * math.sqrt(TRADING_DAYS_PER_YEAR) if len(step_returns) >= 2 else None
+        ),
+        "max_drawdown": max_drawdown,
+    }
+
+
+def resolve_series_key(forecast: Mapping[str, object], available_keys: set[str]) -> str:
+    """Stock/sector theses use their target series when stored; everything else uses the benchmark."""
+    target_id = str(forecast.get("target_id") or "").strip().upper()
+    scope_level = str(forecast.get("scope_level") or "").strip().lower()
+    if scope_level != "portfolio" and target_id in available_keys:
+        return target_id
+    return BENCHMARK_COMPOSITE_KEY
+
+
+def plan_series_window(
+    forecasts: list[Mapping[str, object]],
+    max_price_lag_days: int = DEFAULT_MAX_PRICE_LAG_DAYS,
+) -> tuple[list[str], datetime, datetime]:
+    """Metric keys and [start, end] covering every forecast, so prices load in one read."""
+    starts = [start for start in (_to_utc(f.get("as_of")) for f in forecasts) if start is not None]
+    if not starts:
+        now = datetime.now(timezone.utc)
+        return [], now, now
+    metric_keys = list(BENCHMARK_COMPONENTS)
+    for forecast in forecasts:
+        target_id = str(forecast.get("target_id") or "").strip().upper()
+        if target_id and str(forecast.get("scope_level") or "").lower() != "portfolio":
+            metric_keys.append(target_id)
+    window_start = min(starts) - timedelta(days=max_price_lag_days)
+    window_end = max(starts) + timedelta(days=max(HORIZON_DAYS.values()))
+    return list(dict.fromkeys(metric_keys)), window_start, window_end
+
+
+def evaluate_matured_forecasts(
+    forecasts: list[Mapping[str, object]],
+    series_by_key: Mapping[str, PriceSeries],
+    max_price_lag_days: int = DEFAULT_MAX_PRICE_LAG_DAYS,
+) -> tuple[list[dict[str, object]], dict[str, int]]:
+    """Compute realizations for matured forecasts; returns (realizations, skipped counts by reason)."""
+    weights = load_benchmark_weights()
+    max_lag = timedelta(days=max_price_lag_days)
+    available_keys = set(series_by_key)
+    realizations: list[dict[str, object]] = []
+    skipped: dict[str, int] = {}
+
+    for forecast in forecasts:
+        start = _to_utc(forecast.get("as_of"))
+        horizon_days = HORIZON_DAYS.get(str(forecast.get("horizon")))
+        if start is None or horizon_days is None:
+            skipped["invalid_forecast"] = skipped.get("invalid_forecast", 0) + 1
+            continue
+        end = start + timedelta(days=horizon_days)
+
+        series_key = resolve_series_key(forecast, available_keys)
+        if series_key == BENCHMARK_COMPOSITE_KEY:
+            path = _composite_path(series_by_key, weights, start, end, max_lag)
+        else:
+            path = _window_path(series_by_key[series_key], start, end, max_lag)
+        if path is None:
+            skipped["missing_prices"] = skipped.get("missing_prices", 0) + 1
+            continue
+
+        realizations.append(
+            {
+                "forecast_id": forecast["forecast_id"],
+                "series_key": series_key,
+                "evaluated_at": end,
+                **_path_metrics(path),
+            }
+        )
+    return realizations, skipped
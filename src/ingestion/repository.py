@@ -1,4 +1,18 @@
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Optional
+
+from src.research.contracts import CanonicalFact, SeriesBlock
+
+from .revision_store import PutResult
+
+
+def _iter_macro_points(points: list[object]) -> Iterator[object]:
+    """Flatten SeriesBlock items into their points; other items pass through."""
+    for item in points:
+        if isinstance(item, SeriesBlock):
+            yield from item
+        else:
+            yield item
 
 
 class InMemoryRepository:
@@ -7,6 +21,38 @@ class InMemoryRepository:
         self.canonical_events: list[dict[str, object]] = []
         self.quarantine_events: list[dict[str, object]] = []
         self.macro_series_points: list[dict[str, object]] = []
+        self.payload_revisions: dict[str, list[str]] = {}
+        self.source_schemas: dict[str, dict[str, object]] = {}
+
+    def read_payload_revision(self, idempotency_key: str) -> Optional[tuple[int, str]]:
+        hashes = self.payload_revisions.get(idempotency_key)
+        return (len(hashes), hashes[-1]) if hashes else None
+
+    def put_payload_revision(self, idempotency_key: str, payload_hash: str) -> PutResult:
+        hashes = self.payload_revisions.setdefault(idempotency_key, [])
+        if hashes and hashes[-1] == payload_hash:
+            return PutResult(status="noop", revision_number=len(hashes))
+        hashes.append(payload_hash)
+        return PutResult(status="inserted" if len(hashes) == 1 else "revision", revision_number=len(hashes))
+
+    def read_source_schema(self, source: str) -> Optional[dict[str, object]]:
+        return self.source_schemas.get(source)
+
+    def write_source_schema(
+        self,
+        source: str,
+        fingerprint: str,
+        field_types: Mapping[str, str],
+        required_fields: Sequence[str],
+    ) -> None:
+        self.source_schemas[source] = {
+            "fingerprint": fingerprint,
+            "field_types": dict(field_types),
+            "required_fields": list(required_fields),
+        }
+
+    def delete_source_schema(self, source: str) -> bool:
+        return self.source_schemas.pop(source, None) is not None
 
     def write_raw(self, row: Mapping[str, object]) -> None:
         self.raw_events.append(dict(row))
@@ -14,11 +60,38 @@ class InMemoryRepository:
     def write_canonical(self, row: Mapping[str, object]) -> None:
         self.canonical_events.append(dict(row))
 
+    def write_canonical_facts(self, facts: list[CanonicalFact]) -> int:
+        # Only the newest value per period counts, so A -> B -> A appends the final A.
+        latest = {
+            (row.get("source"), row.get("entity_id"), row.get("metric_name"), row.get("as_of")): row.get("metric_value")
+            for row in self.canonical_events
+        }
+        written = 0
+        for fact in facts:
+            key = (fact.source, fact.entity_id, fact.metric_name, fact.as_of)
+            if key in latest and latest[key] == fact.metric_value:
+                continue
+            latest[key] = fact.metric_value
+            self.canonical_events.append(
+                {
+                    "source": fact.source,
+                    "entity_id": fact.entity_id,
+                    "metric_name": fact.metric_name,
+                    "metric_value": fact.metric_value,
+                    "as_of": fact.as_of,
+                    "available_at": fact.available_at,
+                    "lineage_id": fact.lineage_id,
+                }
+            )
+            written += 1
+        return written
+
     def write_quarantine(self, reason: str, payload: Mapping[str, object]) -> None:
         self.quarantine_events.append({"reason": reason, "payload": dict(payload)})
 
     def write_macro_series_points(self, points: list[object]) -> int:
-        for point in points:
+        written = 0
+        for point in _iter_macro_points(points):
             self.macro_series_points.append(
                 {
                     "source": getattr(point, "source", "unknown"),
@@ -30,22 +103,25 @@ class InMemoryRepository:
                     "lineage_id": getattr(point, "lineage_id", None),
                 }
             )
-        return len(points)
+            written += 1
+        return written
 
     def read_canonical_facts(
-        self, source: str, metric_name: str, limit: int = 12
+        self, source: str, metric_name: str, limit: int = 12, entity_id: str | None = None
     ) -> list[dict[str, object]]:
         rows = [
             row
             for row in self.canonical_events
-            if row.get("source") == source and row.get("metric_name") == metric_name
+            if row.get("source") == source
+            and row.get("metric_name") == metric_name
+            and (entity_id is None or row.get("entity_id") == entity_id)
         ]
         return rows[-limit:]
 
     def snapshot_counts(self) -> dict[str, int]:
         return {
             "raw_events": len(self.raw_events),
-            "canonical_events": len(self.canonical_events),
+            "canonical_facts": len(self.canonical_events),
             "quarantine_events": len(self.quarantine_events),
             "macro_series_points": len(self.macro_series_points),
         }
@@ -1,7 +1,19 @@
-import hashlib
-import json
+import threading
+from collections import OrderedDict
 from collections.abc import Mapping
 from dataclasses import dataclass
+from typing import Optional, Protocol
+
+from .payload_blobs import HashedPayload, canonical_payload_hash
+
+
+DEFAULT_REVISION_CACHE_MAX_KEYS = 1024
+# Fields a provider stamps with the request date rather than the data's content: FRED
+# sets realtime_start/realtime_end to the day of the request, on the response and on
+# every observation, so they would make every daily pull look like a new revision.
+VINTAGE_FIELDS: dict[str, frozenset[str]] = {
+    "fred": frozenset({"realtime_start", "realtime_end"}),
+}
 
 
 @dataclass(frozen=True)
@@ -10,14 +22,99 @@ class PutResult:
     revision_number: int
 
 
+def _without_fields(value: object, fields: frozenset[str]) -> object:
+    if isinstance(value, Mapping):
+        return {key: _without_fields(item, fields) for key, item in value.items() if key not in fields}
+    if isinstance(value, (list, tuple)):
+        return [_without_fields(item, fields) for item in value]
+    return value
+
+
+def revision_content(source: str, payload: Mapping[str, object]) -> Mapping[str, object]:
+    """The part of *payload* a revision is compared on: *source*'s vintage fields dropped.
+
+    Payloads of sources without vintage fields are returned as is (the same object, so a
+    HashedPayload keeps its memoized hash).
+    """
+    fields = VINTAGE_FIELDS.get(source.lower())
+    if not fields:
+        return payload
+    data = payload.data if isinstance(payload, HashedPayload) else payload
+    return HashedPayload(_without_fields(data, fields))  # type: ignore[arg-type]
+
+
+class RevisionBackendProtocol(Protocol):
+    def read_payload_revision(self, idempotency_key: str) -> Optional[tuple[int, str]]: ...
+
+    def put_payload_revision(self, idempotency_key: str, payload_hash: str) -> PutResult: ...
+
+
 class RevisionStore:
-    def __init__(self) -> None:
+    """Revision history per idempotency key: unchanged payloads are ``noop``.
+
+    Without a backend the history lives in this object. With one (the data repository),
+    revisions persist across runs and this object keeps an LRU of the latest
+    (revision, hash) per key so a repeated unchanged payload needs no query. The cache
+    only holds what this store read or wrote, so a newer revision written elsewhere is
+    seen once the key is evicted or the process restarts.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[RevisionBackendProtocol] = None,
+        max_cached_keys: int = DEFAULT_REVISION_CACHE_MAX_KEYS,
+    ) -> None:
         self._rows: dict[str, list[str]] = {}
+        self._backend = backend
+        self.max_cached_keys = max(1, max_cached_keys)
+        self._latest: OrderedDict[str, tuple[int, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {"hits": 0, "loads": 0}
+
+    def _remember(self, idempotency_key: str, revision_number: int, payload_hash: str) -> None:
+        with self._lock:
+            self._latest[idempotency_key] = (revision_number, payload_hash)
+            self._latest.move_to_end(idempotency_key)
+            while len(self._latest) > self.max_cached_keys:
+                self._latest.popitem(last=False)
+
+    def latest(self, idempotency_key: str) -> Optional[tuple[int, str]]:
+        """(revision_number, payload_hash) of the newest revision, or None."""
+        if self._backend is None:
+            hashes = self._rows.get(idempotency_key)
+            return (len(hashes), hashes[-1]) if hashes else None
+        with self._lock:
+            cached = self._latest.get(idempotency_key)
+            if cached is not None:
+                self._latest.move_to_end(idempotency_key)
+                self.stats["hits"] += 1
+                return cached
+        latest = self._backend.read_payload_revision(idempotency_key)
+        with self._lock:
+            self.stats["loads"] += 1
+        if latest is not None:
+            self._remember(idempotency_key, latest[0], latest[1])
+        return latest
+
+    def is_unchanged(self, idempotency_key: str, payload: Mapping[str, object]) -> bool:
+        """True when *payload* matches the newest revision; nothing is recorded."""
+        latest = self.latest(idempotency_key)
+        return latest is not None and latest[1] == canonical_payload_hash(payload)
 
     def put(self, idempotency_key: str, payload: Mapping[str, object]) -> PutResult:
-        payload_hash = hashlib.sha256(
-            json.dumps(payload, sort_keys=True).encode("utf-8")
-        ).hexdigest()
+        payload_hash = canonical_payload_hash(payload)
+        if self._backend is not None:
+            # The backend detects a noop itself; only a cached match saves the round trip.
+            with self._lock:
+                cached = self._latest.get(idempotency_key)
+                if cached is not None and cached[1] == payload_hash:
+                    self._latest.move_to_end(idempotency_key)
+                    self.stats["hits"] += 1
+                    return PutResult(status="noop", revision_number=cached[0])
+            result = self._backend.put_payload_revision(idempotency_key, payload_hash)
+            self._remember(idempotency_key, result.revision_number, payload_hash)
+            return result
+
         hashes = self._rows.setdefault(idempotency_key, [])
         if not hashes:
             hashes.append(payload_hash)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+
+DEFAULT_VIEW_CACHE_TTL_SECONDS = 300
+DEFAULT_VIEW_CACHE_MAX_ENTRIES = 64
+
+
+@dataclass(frozen=True)
+class CachedView:
+    value: object
+    computed_at: datetime
+    data_version: str | None
+    hit: bool
+
+    def age_seconds(self, now: datetime | None = None) -> float:
+        return max(0.0, ((now or datetime.now(timezone.utc)) - self.computed_at).total_seconds())
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    value: object
+    computed_at: datetime
+    stored_monotonic: float
+
+
+class ViewCache:
+    """Process-wide TTL cache for rendered view models.
+
+    Entries are keyed by view name, DSN, loader parameters and the current data
+    version, so a new ingestion run or portfolio snapshot yields a new key and the
+    stale entry simply ages out of the LRU.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_VIEW_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_VIEW_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[tuple[Hashable, ...], _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_load(
+        self,
+        name: str,
+        dsn: str,
+        loader: Callable[..., object],
+        *params: Hashable,
+        data_version: str | None,
+    ) -> CachedView:
+        # Without a data version there is no way to notice new data, so do not cache.
+        if data_version is None or self.ttl_seconds <= 0:
+            return CachedView(
+                value=loader(dsn, *params),
+                computed_at=datetime.now(timezone.utc),
+                data_version=data_version,
+                hit=False,
+            )
+
+        key = (name, dsn, params, data_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry.stored_monotonic <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                return CachedView(
+                    value=entry.value,
+                    computed_at=entry.computed_at,
+                    data_version=data_version,
+                    hit=True,
+                )
+
+        # Load outside the lock so one slow view does not block other sessions.
+        value = loader(dsn, *params)
+        entry = _CacheEntry(
+            value=value,
+            computed_at=datetime.now(timezone.utc),
+            stored_monotonic=self._clock(),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return CachedView(value=value, computed_at=entry.computed_at, data_version=data_version, hit=False)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _view_cache_ttl_seconds() -> float:
+    raw = os.getenv("VIEW_CACHE_TTL_SECONDS")
+    if raw is None or raw.strip() == "":
+        return DEFAULT_VIEW_CACHE_TTL_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return DEFAULT_VIEW_CACHE_TTL_SECONDS
+
+
+VIEW_CACHE = ViewCache(ttl_seconds=_view_cache_ttl_seconds())
+
+
+def read_data_version(repository: object) -> str | None:
+    """Return an invalidation key that changes whenever new data lands, or None."""
+    read_version = getattr(repository, "read_view_data_version", None)
+    if not callable(read_version):
+        return None
+    try:
+        version = read_version()
+    except Exception:
+        return None
+    if not isinstance(version, dict) or not version:
+        return None
+    return json.dumps(version, sort_keys=True, default=str)
+
+
+def format_cache_caption(cached: CachedView, now: datetime | None = None) -> str:
+    state = "cached" if cached.hit else "fresh"
+    return (
+        f"Data as of {cached.computed_at.strftime('%Y-%m-%d %H:%M:%S')} UTC "
+        f"· cache age {cached.age_seconds(now):.0f}s ({state})"
+    )
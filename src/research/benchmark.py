@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import os
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import accumulate
+from operator import mul
+
+from .trading_calendar import CALENDARS, TradingCalendar, align_many
+
+BENCHMARK_COMPONENTS: tuple[str, ...] = ("QQQ", "KOSPI200", "BTC", "SGOV")
+DEFAULT_BENCHMARK_WEIGHTS: dict[str, float] = {
+    "QQQ": 0.45,
+    "KOSPI200": 0.25,
+    "BTC": 0.20,
+    "SGOV": 0.10,
+}
+WEIGHT_ENV_MAP: dict[str, str] = {
+    "QQQ": "BENCHMARK_WEIGHT_QQQ",
+    "KOSPI200": "BENCHMARK_WEIGHT_KOSPI200",
+    "BTC": "BENCHMARK_WEIGHT_BTC",
+    "SGOV": "BENCHMARK_WEIGHT_SGOV",
+}
+
+
+def parse_as_of(raw: object) -> date | None:
+    if raw is None:
+        return None
+    if isinstance(raw, datetime):
+        return raw.date()
+    if isinstance(raw, date):
+        return raw
+    text = str(raw).strip()
+    if not text:
+        return None
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        return None
+
+
+def load_benchmark_weights() -> dict[str, float]:
+    weights = dict(DEFAULT_BENCHMARK_WEIGHTS)
+    for key, env_name in WEIGHT_ENV_MAP.items():
+        raw = os.getenv(env_name)
+        if raw is None or raw.strip() == "":
+            continue
+        try:
+            parsed = float(raw)
+        except ValueError:
+            continue
+        if parsed < 0:
+            continue
+        weights[key] = parsed
+
+    total_weight = sum(weights.values())
+    if total_weight <= 0:
+        return dict(DEFAULT_BENCHMARK_WEIGHTS)
+
+    # Keep benchmark return scale stable even when env overrides are partially set.
+    return {key: value / total_weight for key, value in weights.items()}
+
+
+COMPONENT_POINT_LIMIT = 10_000
+# Benchmark days are sessions of either equity market; crypto weekend moves land on the next one.
+BENCHMARK_CALENDAR = "US|KR"
+# Longer than any KRX/NYSE holiday run; a staler component level is treated as a data gap.
+BENCHMARK_MAX_FILL_DAYS = 10
+
+
+@dataclass(frozen=True)
+class ComponentLevels:
+    """Daily levels for one component as parallel ordinal-day arrays.
+
+    ``last_as_of`` is the newest raw ``as_of`` the series was built from; together with the
+    metric key it is the cache validity key. Returns are taken after calendar alignment
+    (see benchmark_nav_rows), so only levels are kept.
+    """
+
+    metric_key: str
+    last_as_of: object
+    level_days: array
+    levels: array
+
+
+def daily_levels_from_rows(rows: list[object]) -> dict[int, float]:
+    # Rows arrive newest first; the first valid value per day wins (latest intraday point).
+    levels: dict[int, float] = {}
+    for row in rows:
+        if not isinstance(row, Mapping):
+            continue
+        day = parse_as_of(row.get("as_of"))
+        if day is None:
+            continue
+        ordinal = day.toordinal()
+        if ordinal in levels:
+            continue
+        value = row.get("value")
+        try:
+            levels[ordinal] = float(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            continue
+    return levels
+
+
+def build_component_levels(metric_key: str, rows: list[object], last_as_of: object) -> ComponentLevels:
+    daily = daily_levels_from_rows(rows)
+    level_days = array("l", sorted(daily))
+    levels = array("d", (daily[day] for day in level_days))
+    return ComponentLevels(metric_key, last_as_of, level_days, levels)
+
+
+def benchmark_weights_version(weights: Mapping[str, float]) -> str:
+    """Stable tag for a normalized weight set; stored rows with another tag are stale."""
+    return ",".join(f"{key}={weights.get(key, 0.0):.6f}" for key in BENCHMARK_COMPONENTS)
+
+
+def benchmark_nav_rows(
+    components: list[ComponentLevels],
+    weights: Mapping[str, float],
+    start: date,
+    end: date,
+    base_nav: float = 1.0,
+    calendar: TradingCalendar | None = None,
+) -> list[dict[str, object]]:
+    """Weighted daily returns and NAV on the benchmark calendar (US or KR sessions).
+
+    Component levels are forward-filled onto the calendar, so a market holiday is a zero
+    return for that component instead of a missing benchmark day. Rows are {as_of (date),
+    component_returns, benchmark_return, benchmark_nav}; NAV compounds from *base_nav* so an
+    incremental refresh can continue a stored series.
+    """
+    if not components or any(len(component.level_days) == 0 for component in components):
+        return []
+    calendar = calendar if calendar is not None else CALENDARS[BENCHMARK_CALENDAR]
+    first_common = max(component.level_days[0] for component in components)
+    # Stop at the last day every component has reached; later days would only carry stale levels.
+    last_common = min(component.level_days[-1] for component in components)
+    if min(end.toordinal(), last_common) < max(start.toordinal(), first_common + 1):
+        return []
+
+    sessions = calendar.sessions(date.fromordinal(first_common + 1), date.fromordinal(min(end.toordinal(), last_common)))
+    grid, levels = align_many(
+        {component.metric_key: (component.level_days, component.levels) for component in components},
+        [first_common, *sessions],
+        BENCHMARK_MAX_FILL_DAYS,
+    )
+
+    # Column-wise returns between consecutive aligned calendar days.
+    # The first row needs a previous aligned day to take its return from.
+    first_row = max(1, bisect_left(grid, max(start.toordinal(), first_common + 1)))
+    component_columns: dict[str, list[float]] = {}
+    benchmark_returns = array("d", bytes(8 * max(0, len(grid) - first_row)))
+    for component in components:
+        weight = weights.get(component.metric_key, 0.0)
+        column_levels = levels[component.metric_key]
+        column: list[float] = []
+        for idx in range(first_row, len(grid)):
+            previous = column_levels[idx - 1]
+            value = (column_levels[idx] / previous) - 1.0 if previous != 0 else 0.0
+            column.append(value)
+            benchmark_returns[idx - first_row] += weight * value
+        component_columns[component.metric_key] = column
+
+    navs = accumulate((1.0 + value for value in benchmark_returns), mul, initial=base_nav)
+    next(navs)
+    return [
+        {
+            "as_of": date.fromordinal(day),
+            "component_returns": {key: column[idx] for key, column in component_columns.items()},
+            "benchmark_return": benchmark_return,
+            "benchmark_nav": nav,
+        }
+        for idx, (day, benchmark_return, nav) in enumerate(zip(grid[first_row:], benchmark_returns, navs))
+    ]
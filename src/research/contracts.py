@@ -1,5 +1,8 @@
-from dataclasses import dataclass
-from datetime import datetime
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from heapq import merge
 from typing import Literal
 
 
@@ -16,3 +19,79 @@ class NormalizedSeriesPoint:
     value: float
     lineage_id: str
     evidence_tier: EvidenceTier = "HARD"
+
+
+@dataclass(frozen=True)
+class SeriesBlock:
+    """One metric's observations as columns, with the metadata every point shares.
+
+    ``as_of_epoch`` holds UTC epoch seconds in ascending order, parallel to ``values``;
+    iterating a block yields the equivalent NormalizedSeriesPoint objects.
+    """
+
+    source: str
+    entity_id: str
+    metric_key: str
+    available_at: datetime
+    lineage_id: str
+    as_of_epoch: array = field(default_factory=lambda: array("d"))
+    values: array = field(default_factory=lambda: array("d"))
+    evidence_tier: EvidenceTier = "HARD"
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[NormalizedSeriesPoint]:
+        for stamp, value in zip(self.as_of_epoch, self.values):
+            yield NormalizedSeriesPoint(
+                source=self.source,
+                entity_id=self.entity_id,
+                metric_key=self.metric_key,
+                as_of=datetime.fromtimestamp(stamp, tz=timezone.utc),
+                available_at=self.available_at,
+                value=value,
+                lineage_id=self.lineage_id,
+                evidence_tier=self.evidence_tier,
+            )
+
+
+def series_blocks_from_points(points: Iterable[NormalizedSeriesPoint]) -> list[SeriesBlock]:
+    """Group points into blocks by shared metadata, keeping each block sorted by as_of."""
+    grouped: dict[tuple[object, ...], list[tuple[float, float]]] = {}
+    for point in points:
+        key = (point.source, point.entity_id, point.metric_key, point.available_at, point.lineage_id, point.evidence_tier)
+        grouped.setdefault(key, []).append((point.as_of.timestamp(), point.value))
+    blocks: list[SeriesBlock] = []
+    for (source, entity_id, metric_key, available_at, lineage_id, tier), rows in grouped.items():
+        rows.sort(key=lambda row: row[0])
+        blocks.append(
+            SeriesBlock(
+                source=source,  # type: ignore[arg-type]
+                entity_id=entity_id,  # type: ignore[arg-type]
+                metric_key=metric_key,  # type: ignore[arg-type]
+                available_at=available_at,  # type: ignore[arg-type]
+                lineage_id=lineage_id,  # type: ignore[arg-type]
+                as_of_epoch=array("d", (stamp for stamp, _ in rows)),
+                values=array("d", (value for _, value in rows)),
+                evidence_tier=tier,  # type: ignore[arg-type]
+            )
+        )
+    return blocks
+
+
+def iter_series_points(blocks: Iterable[SeriesBlock]) -> Iterator[NormalizedSeriesPoint]:
+    """Compatibility view: every block's points merged in as_of order."""
+    return merge(*blocks, key=lambda point: point.as_of)
+
+
+@dataclass(frozen=True)
+class CanonicalFact:
+    """One (entity, metric, period) value destined for canonical_fact_store."""
+
+    source: str
+    entity_id: str
+    metric_name: str
+    as_of: datetime
+    available_at: datetime
+    metric_value: float
+    lineage_id: str
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+
+
+DEFAULT_BASE_CURRENCY = "USD"
+
+# Series ingested under their source ids, keyed by the FX_<FROM><TO> name they stand in for.
+# FRED DEXKOUS is KRW per one USD, i.e. FX_USDKRW.
+FX_SERIES_ALIASES: dict[str, tuple[str, ...]] = {
+    "FX_USDKRW": ("DEXKOUS",),
+}
+
+
+def load_base_currency(env_name: str = "PORTFOLIO_BASE_CURRENCY") -> str:
+    raw = (os.getenv(env_name) or "").strip().upper()
+    return raw if len(raw) == 3 and raw.isalpha() else DEFAULT_BASE_CURRENCY
+
+
+def fx_series_keys(currency: str, base_currency: str) -> tuple[str, str]:
+    """(direct, inverse) series keys: FX_KRWUSD is USD per KRW, FX_USDKRW is KRW per USD."""
+    return f"FX_{currency}{base_currency}", f"FX_{base_currency}{currency}"
+
+
+def fx_candidate_keys(currency: str, base_currency: str) -> list[tuple[str, bool]]:
+    """Metric keys that can price *currency* in *base_currency*, in preference order.
+
+    Each entry is (metric_key, inverted); inverted series quote *currency* per base unit.
+    """
+    direct, inverse = fx_series_keys(currency, base_currency)
+    candidates = [(direct, False)]
+    candidates.extend((alias, False) for alias in FX_SERIES_ALIASES.get(direct, ()))
+    candidates.append((inverse, True))
+    candidates.extend((alias, True) for alias in FX_SERIES_ALIASES.get(inverse, ()))
+    return candidates
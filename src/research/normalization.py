@@ -1,8 +1,9 @@
 import re
+from array import array
 from datetime import datetime, timezone
-from typing import Iterable, Mapping, Optional
+from typing import Callable, Iterable, Iterator, Mapping, Optional
 
-from .contracts import NormalizedSeriesPoint
+from .contracts import CanonicalFact, NormalizedSeriesPoint, SeriesBlock, iter_series_points
 
 
 def _parse_datetime(value: object) -> Optional[datetime]:
@@ -36,6 +37,78 @@ def _parse_datetime(value: object) -> Optional[datetime]:
         return None
 
 
+_DATE_CACHE_MAX_ENTRIES = 65_536
+# Parsed date strings are shared across payloads: monthly/quarterly series from many
+# entities repeat the same few hundred period labels.
+_DATE_CACHE: dict[str, Optional[datetime]] = {}
+
+
+def _iso_utc(text: str) -> Optional[datetime]:
+    # A literal +00:00 offset yields timezone.utc and is much cheaper than .replace(tzinfo=...).
+    try:
+        return datetime.fromisoformat(text + "T00:00:00+00:00")
+    except ValueError:
+        return None
+
+
+def _quarter_start(year: str, quarter: str) -> datetime:
+    return datetime(int(year), (int(quarter) - 1) * 3 + 1, 1, tzinfo=timezone.utc)
+
+
+# (shape, specialized parser) pairs. Each parser agrees with _parse_datetime on every
+# string matching its shape, or returns None to hand the value to _parse_datetime.
+_DATE_SHAPES: tuple[tuple["re.Pattern[str]", Callable[[str], Optional[datetime]]], ...] = (
+    (re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII), _iso_utc),
+    (re.compile(r"\d{8}", re.ASCII), lambda v: _iso_utc(f"{v[:4]}-{v[4:6]}-{v[6:]}")),
+    (re.compile(r"\d{6}", re.ASCII), lambda v: _iso_utc(f"{v[:4]}-{v[4:]}-01")),
+    (re.compile(r"\d{4}-\d{2}", re.ASCII), lambda v: _iso_utc(v + "-01")),
+    (re.compile(r"\d{4}", re.ASCII), lambda v: _iso_utc(v + "-01-01")),
+    (re.compile(r"(\d{4})-?[Qq]([1-4])", re.ASCII), lambda v: _quarter_start(v[:4], v[-1])),
+)
+
+
+def _sniff_date_parser(sample: str) -> Optional[Callable[[str], Optional[datetime]]]:
+    """Specialized parser for the column shape of *sample*, or None when no shape fits."""
+    for shape, parse in _DATE_SHAPES:
+        if shape.fullmatch(sample):
+
+            def parse_column(value: str, shape: "re.Pattern[str]" = shape, parse=parse) -> Optional[datetime]:
+                return parse(value) if shape.fullmatch(value) else None
+
+            return parse_column
+    return None
+
+
+class DateColumnParser:
+    """Parse one column of date values with a format sniffed from its first string.
+
+    Values that do not fit the sniffed shape fall back to _parse_datetime one by one, so
+    results always match the generic parser.
+    """
+
+    def __init__(self) -> None:
+        self._fast: Optional[Callable[[str], Optional[datetime]]] = None
+        self._sniffed = False
+
+    def __call__(self, value: object) -> Optional[datetime]:
+        if not isinstance(value, str) or not value:
+            return _parse_datetime(value)
+        cached = _DATE_CACHE.get(value)
+        if cached is not None:
+            return cached
+        if not self._sniffed:
+            self._fast = _sniff_date_parser(value)
+            self._sniffed = True
+        parsed = self._fast(value) if self._fast is not None else None
+        if parsed is None:
+            parsed = _parse_datetime(value)
+        if parsed is not None:
+            if len(_DATE_CACHE) >= _DATE_CACHE_MAX_ENTRIES:
+                _DATE_CACHE.clear()
+            _DATE_CACHE[value] = parsed
+        return parsed
+
+
 def _to_float(value: object) -> Optional[float]:
     if isinstance(value, bool):
         return float(value)
@@ -52,54 +125,67 @@ def _to_float(value: object) -> Optional[float]:
     return None
 
 
-def normalize_fred_payload(
-    payload: Mapping[str, object],
+def _build_blocks(
+    source: str,
     entity_id: str,
     available_at: datetime,
     lineage_id: str,
-) -> list[NormalizedSeriesPoint]:
-    points: list[NormalizedSeriesPoint] = []
+    rows: Iterable[tuple[str, datetime, float]],
+) -> list[SeriesBlock]:
+    """Column-append (metric_key, as_of, value) rows into one block per metric, sorted by as_of."""
+    columns: dict[str, tuple[array, array]] = {}
+    for metric_key, as_of, value in rows:
+        stamps, values = columns.setdefault(metric_key, (array("d"), array("d")))
+        stamps.append(as_of.timestamp())
+        values.append(value)
+
+    blocks: list[SeriesBlock] = []
+    for metric_key, (stamps, values) in columns.items():
+        # Stable order keeps repeated dates in payload order, as the point sort did.
+        order = sorted(range(len(stamps)), key=stamps.__getitem__)
+        if any(order[idx] != idx for idx in range(len(order))):
+            stamps = array("d", (stamps[idx] for idx in order))
+            values = array("d", (values[idx] for idx in order))
+        blocks.append(
+            SeriesBlock(
+                source=source,
+                entity_id=entity_id,
+                metric_key=metric_key,
+                available_at=available_at,
+                lineage_id=lineage_id,
+                as_of_epoch=stamps,
+                values=values,
+            )
+        )
+    return blocks
+
+
+def _fred_rows(payload: Mapping[str, object], entity_id: str) -> Iterator[tuple[str, datetime, float]]:
     observations = payload.get("observations")
     if not isinstance(observations, list):
-        return points
+        return
 
+    parse_date = DateColumnParser()
     for row in observations:
         if not isinstance(row, Mapping):
             continue
-        as_of = _parse_datetime(row.get("date"))
+        as_of = parse_date(row.get("date"))
         value = _to_float(row.get("value"))
         if as_of is None or value is None:
             continue
-        points.append(
-            NormalizedSeriesPoint(
-                source="fred",
-                entity_id=entity_id,
-                metric_key=entity_id,
-                as_of=as_of,
-                available_at=available_at,
-                value=value,
-                lineage_id=lineage_id,
-            )
-        )
+        yield entity_id, as_of, value
 
-    return sorted(points, key=lambda p: p.as_of)
 
-
-def normalize_ecos_payload(
-    payload: Mapping[str, object],
-    entity_id: str,
-    available_at: datetime,
-    lineage_id: str,
-) -> list[NormalizedSeriesPoint]:
-    points: list[NormalizedSeriesPoint] = []
+def _ecos_rows(payload: Mapping[str, object], entity_id: str) -> Iterator[tuple[str, datetime, float]]:
     statistic_search = payload.get("StatisticSearch")
     if not isinstance(statistic_search, Mapping):
-        return points
+        return
 
     rows = statistic_search.get("row")
     if not isinstance(rows, list):
-        return points
+        return
 
+    parse_date = DateColumnParser()
     for row in rows:
         if not isinstance(row, Mapping):
             continue
@@ -108,37 +194,251 @@ def normalize_ecos_payload(
         as_of_raw = row.get("TIME") or row.get("TRM") or row.get("date")
         value_raw = row.get("DATA_VALUE") or row.get("value")
 
-        as_of = _parse_datetime(as_of_raw)
+        as_of = parse_date(as_of_raw)
         value = _to_float(value_raw)
         if as_of is None or value is None:
             continue
+        yield metric_key, as_of, value
 
-        points.append(
-            NormalizedSeriesPoint(
-                source="ecos",
-                entity_id=entity_id,
-                metric_key=metric_key,
-                as_of=as_of,
-                available_at=available_at,
-                value=value,
-                lineage_id=lineage_id,
-            )
-        )
 
-    return sorted(points, key=lambda p: p.as_of)
+def normalize_fred_blocks(
+    payload: Mapping[str, object],
+    entity_id: str,
+    available_at: datetime,
+    lineage_id: str,
+) -> list[SeriesBlock]:
+    return _build_blocks("fred", entity_id, available_at, lineage_id, _fred_rows(payload, entity_id))
 
 
-def normalize_payload(
+def normalize_ecos_blocks(
+    payload: Mapping[str, object],
+    entity_id: str,
+    available_at: datetime,
+    lineage_id: str,
+) -> list[SeriesBlock]:
+    return _build_blocks("ecos", entity_id, available_at, lineage_id, _ecos_rows(payload, entity_id))
+
+
+def normalize_payload_blocks(
     source: str,
     payload: Mapping[str, object],
     entity_id: str,
     available_at: datetime,
     lineage_id: str,
-) -> list[NormalizedSeriesPoint]:
+) -> list[SeriesBlock]:
     raw_payload = payload.get("payload") if isinstance(payload.get("payload"), Mapping) else payload
 
     if source == "fred":
-        return normalize_fred_payload(raw_payload, entity_id, available_at, lineage_id)
+        return normalize_fred_blocks(raw_payload, entity_id, available_at, lineage_id)
     if source == "ecos":
-        return normalize_ecos_payload(raw_payload, entity_id, available_at, lineage_id)
+        return normalize_ecos_blocks(raw_payload, entity_id, available_at, lineage_id)
+    return []
+
+
+def normalize_fred_payload(
+    payload: Mapping[str, object],
+    entity_id: str,
+    available_at: datetime,
+    lineage_id: str,
+) -> list[NormalizedSeriesPoint]:
+    return list(iter_series_points(normalize_fred_blocks(payload, entity_id, available_at, lineage_id)))
+
+
+def normalize_ecos_payload(
+    payload: Mapping[str, object],
+    entity_id: str,
+    available_at: datetime,
+    lineage_id: str,
+) -> list[NormalizedSeriesPoint]:
+    return list(iter_series_points(normalize_ecos_blocks(payload, entity_id, available_at, lineage_id)))
+
+
+def normalize_payload(
+    source: str,
+    payload: Mapping[str, object],
+    entity_id: str,
+    available_at: datetime,
+    lineage_id: str,
+) -> list[NormalizedSeriesPoint]:
+    """Point-per-observation view of normalize_payload_blocks, for callers that need objects."""
+    return list(iter_series_points(normalize_payload_blocks(source, payload, entity_id, available_at, lineage_id)))
+
+
+_SEC_QUARTER_FRAME = re.compile(r"CY\d{4}Q[1-4]")
+_DART_DATE = re.compile(r"(\d{4})\.(\d{2})\.(\d{2})")
+# (date column, amount column, years before bsns_year) for each period a DART account row reports.
+_DART_PERIODS = (
+    ("thstrm_dt", "thstrm_amount", 0),
+    ("frmtrm_dt", "frmtrm_amount", 1),
+    ("bfefrmtrm_dt", "bfefrmtrm_amount", 2),
+)
+
+
+def _dedupe_facts(facts: Iterable[CanonicalFact]) -> list[CanonicalFact]:
+    # One fact per (entity, metric, period); the most recently available value wins.
+    latest: dict[tuple[str, str, datetime], CanonicalFact] = {}
+    for fact in facts:
+        key = (fact.entity_id, fact.metric_name, fact.as_of)
+        current = latest.get(key)
+        if current is None or fact.available_at >= current.available_at:
+            latest[key] = fact
+    return sorted(latest.values(), key=lambda fact: (fact.metric_name, fact.as_of))
+
+
+def normalize_sec_companyfacts(
+    payload: Mapping[str, object],
+    entity_id: str,
+    available_at: datetime,
+    lineage_id: str,
+) -> list[CanonicalFact]:
+    """us-gaap facts from an XBRL companyfacts payload, one per SEC frame.
+
+    Only frame-tagged entries are kept: SEC assigns a frame to the single fact that best
+    represents each calendar period, which drops comparatives repeated in later filings.
+    Metric names are ``us-gaap:<Tag>``, plus ``:<unit>`` for non-USD units and
+    ``:quarterly`` for quarter-length durations. as_of is the period end and
+    available_at the filing date.
+    """
+    facts_root = payload.get("facts")
+    us_gaap = facts_root.get("us-gaap") if isinstance(facts_root, Mapping) else None
+    if not isinstance(us_gaap, Mapping):
+        return []
+
+    parse_date = DateColumnParser()
+    facts: list[CanonicalFact] = []
+    for tag, concept in us_gaap.items():
+        units = concept.get("units") if isinstance(concept, Mapping) else None
+        if not isinstance(units, Mapping):
+            continue
+        for unit, entries in units.items():
+            if not isinstance(entries, list):
+                continue
+            base_name = f"us-gaap:{tag}" if unit == "USD" else f"us-gaap:{tag}:{unit}"
+            for entry in entries:
+                if not isinstance(entry, Mapping) or not isinstance(entry.get("frame"), str):
+                    continue
+                as_of = parse_date(entry.get("end"))
+                value = _to_float(entry.get("val"))
+                if as_of is None or value is None:
+                    continue
+                quarterly = _SEC_QUARTER_FRAME.fullmatch(str(entry["frame"])) is not None
+                facts.append(
+                    CanonicalFact(
+                        source="sec_edgar",
+                        entity_id=entity_id,
+                        metric_name=f"{base_name}:quarterly" if quarterly else base_name,
+                        as_of=as_of,
+                        available_at=parse_date(entry.get("filed")) or available_at,
+                        metric_value=value,
+                        lineage_id=lineage_id,
+                    )
+                )
+    return _dedupe_facts(facts)
+
+
+def _dart_period_end(raw: object, bsns_year: object, years_back: int) -> Optional[datetime]:
+    # "2023.12.31 현재" (balance sheet) or "2023.01.01 ~ 2023.12.31" (flows): use the last date.
+    if isinstance(raw, str):
+        matches = _DART_DATE.findall(raw)
+        if matches:
+            year, month, day = matches[-1]
+            return _iso_utc(f"{year}-{month}-{day}")
+    if isinstance(bsns_year, str) and bsns_year.isdigit():
+        return _iso_utc(f"{int(bsns_year) - years_back:04d}-12-31")
+    return None
+
+
+def normalize_opendart_accounts(
+    payload: Mapping[str, object],
+    entity_id: str,
+    available_at: datetime,
+    lineage_id: str,
+) -> list[CanonicalFact]:
+    """Account values from an OpenDART financial statement list (fnlttSinglAcnt*).
+
+    Metric names are ``<sj_div>:<account_id or account_nm>``, suffixed ``:OFS`` for
+    standalone statements. Current and prior-period columns each become a fact, and
+    available_at is the receipt date encoded in rcept_no. Payloads without an account
+    list, such as company profiles, yield nothing.
+    """
+    rows = payload.get("list")
+    if str(payload.get("status", "000")) != "000" or not isinstance(rows, list):
+        return []
+
+    facts: list[CanonicalFact] = []
+    for row in rows:
+        if not isinstance(row, Mapping):
+            continue
+        account = str(row.get("account_id") or "").strip()
+        if not account or account == "-표준계정코드 미사용-":
+            account = str(row.get("account_nm") or "").strip()
+        if not account:
+            continue
+        metric_name = f"{row.get('sj_div') or 'FS'}:{account}"
+        if row.get("fs_div") == "OFS":
+            metric_name += ":OFS"
+        receipt = str(row.get("rcept_no") or "")
+        filed = _iso_utc(f"{receipt[:4]}-{receipt[4:6]}-{receipt[6:8]}") if receipt[:8].isdigit() else None
+        for date_column, amount_column, years_back in _DART_PERIODS:
+            raw_amount = row.get(amount_column)
+            value = _to_float(raw_amount.replace(",", "")) if isinstance(raw_amount, str) else _to_float(raw_amount)
+            as_of = _dart_period_end(row.get(date_column), row.get("bsns_year"), years_back)
+            if value is None or as_of is None:
+                continue
+            facts.append(
+                CanonicalFact(
+                    source="opendart",
+                    entity_id=str(row.get("corp_code") or entity_id),
+                    metric_name=metric_name,
+                    as_of=as_of,
+                    available_at=filed or available_at,
+                    metric_value=value,
+                    lineage_id=lineage_id,
+                )
+            )
+    return _dedupe_facts(facts)
+
+
+def canonical_facts_from_blocks(blocks: list[SeriesBlock]) -> list[CanonicalFact]:
+    """FRED/ECOS series as canonical facts.
+
+    The metric name depends only on the series, never on how many came in one response:
+    a FRED series is named by its series id (entity_id), an ECOS item by
+    ``<stat_code>:<item>`` (``<entity_id>:<metric_key>``).
+    """
+    facts: list[CanonicalFact] = []
+    for block in blocks:
+        metric_name = block.entity_id if block.source == "fred" else f"{block.entity_id}:{block.metric_key}"
+        for stamp, value in zip(block.as_of_epoch, block.values):
+            facts.append(
+                CanonicalFact(
+                    source=block.source,
+                    entity_id=block.entity_id,
+                    metric_name=metric_name,
+                    as_of=datetime.fromtimestamp(stamp, tz=timezone.utc),
+                    available_at=block.available_at,
+                    metric_value=value,
+                    lineage_id=block.lineage_id,
+                )
+            )
+    return _dedupe_facts(facts)
+
+
+def normalize_canonical_facts(
+    source: str,
+    payload: Mapping[str, object],
+    entity_id: str,
+    available_at: datetime,
+    lineage_id: str,
+) -> list[CanonicalFact]:
+    raw_payload = payload.get("payload") if isinstance(payload.get("payload"), Mapping) else payload
+
+    if source == "sec_edgar":
+        return normalize_sec_companyfacts(raw_payload, entity_id, available_at, lineage_id)
+    if source == "opendart":
+        return normalize_opendart_accounts(raw_payload, entity_id, available_at, lineage_id)
+    if source in ("fred", "ecos"):
+        return canonical_facts_from_blocks(
+            normalize_payload_blocks(source, payload, entity_id, available_at, lineage_id)
+        )
     return []
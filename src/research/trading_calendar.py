@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import logging
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import date, timedelta
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lunar-calendar holidays cannot be derived by rule; KRX dates are listed for these years.
+# Other years fall back to the fixed-date holidays only and log a warning (extend the tables).
+KR_SEOLLAL: dict[int, date] = {
+    2020: date(2020, 1, 25),
+    2021: date(2021, 2, 12),
+    2022: date(2022, 2, 1),
+    2023: date(2023, 1, 22),
+    2024: date(2024, 2, 10),
+    2025: date(2025, 1, 29),
+    2026: date(2026, 2, 17),
+    2027: date(2027, 2, 7),
+    2028: date(2028, 1, 27),
+    2029: date(2029, 2, 13),
+    2030: date(2030, 2, 3),
+}
+KR_CHUSEOK: dict[int, date] = {
+    2020: date(2020, 10, 1),
+    2021: date(2021, 9, 21),
+    2022: date(2022, 9, 10),
+    2023: date(2023, 9, 29),
+    2024: date(2024, 9, 17),
+    2025: date(2025, 10, 6),
+    2026: date(2026, 9, 25),
+    2027: date(2027, 9, 15),
+    2028: date(2028, 10, 3),
+    2029: date(2029, 9, 22),
+    2030: date(2030, 9, 12),
+}
+KR_BUDDHAS_BIRTHDAY: dict[int, date] = {
+    2020: date(2020, 4, 30),
+    2021: date(2021, 5, 19),
+    2022: date(2022, 5, 8),
+    2023: date(2023, 5, 27),
+    2024: date(2024, 5, 15),
+    2025: date(2025, 5, 5),
+    2026: date(2026, 5, 24),
+    2027: date(2027, 5, 13),
+    2028: date(2028, 5, 2),
+    2029: date(2029, 5, 20),
+    2030: date(2030, 5, 9),
+}
+# Elections and one-off closures announced by the exchanges.
+KR_SPECIAL_CLOSURES = frozenset(
+    {
+        date(2020, 4, 15),
+        date(2020, 8, 17),
+        date(2022, 3, 9),
+        date(2022, 6, 1),
+        date(2023, 10, 2),
+        date(2024, 4, 10),
+        date(2024, 10, 1),
+        date(2025, 1, 27),
+        date(2025, 6, 3),
+        date(2026, 6, 3),
+    }
+)
+US_SPECIAL_CLOSURES = frozenset({date(2018, 12, 5), date(2025, 1, 9)})
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    last = date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    # Anonymous Gregorian algorithm.
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nyse_observed(day: date) -> date:
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def us_holidays(year: int) -> set[date]:
+    """NYSE full-day closures."""
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),
+        _nth_weekday(year, 2, 0, 3),
+        _easter(year) - timedelta(days=2),
+        _last_weekday(year, 5, 0),
+        _nyse_observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),
+        _nth_weekday(year, 11, 3, 4),
+        _nyse_observed(date(year, 12, 25)),
+    }
+    # A Saturday New Year is not moved back into the previous year.
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_nyse_observed(new_year))
+    if year >= 2022:
+        holidays.add(_nyse_observed(date(year, 6, 19)))
+    holidays.update(day for day in US_SPECIAL_CLOSURES if day.year == year)
+    return holidays
+
+
+def kr_holidays(year: int) -> set[date]:
+    """KRX closures: public holidays with substitutes, Labor Day and the year-end closing day."""
+    fixed = {
+        date(year, 1, 1),
+        date(year, 3, 1),
+        date(year, 5, 1),
+        date(year, 5, 5),
+        date(year, 6, 6),
+        date(year, 8, 15),
+        date(year, 10, 3),
+        date(year, 10, 9),
+        date(year, 12, 25),
+    }
+    if year not in KR_SEOLLAL or year not in KR_CHUSEOK or year not in KR_BUDDHAS_BIRTHDAY:
+        _LOGGER.warning(
+            "KRX lunar holidays are not listed for %s; Seollal, Chuseok and Buddha's Birthday are treated as sessions",
+            year,
+        )
+    lunar_spans: list[list[date]] = []
+    for table in (KR_SEOLLAL, KR_CHUSEOK):
+        center = table.get(year)
+        if center is not None:
+            lunar_spans.append([center - timedelta(days=1), center, center + timedelta(days=1)])
+    buddha = KR_BUDDHAS_BIRTHDAY.get(year)
+
+    holidays = set(fixed)
+    holidays.update(day for span in lunar_spans for day in span)
+    if buddha is not None:
+        holidays.add(buddha)
+
+    # Substitute holidays: (day, applies when it falls on) per the current holiday act.
+    substitutes: list[date] = []
+    for span in lunar_spans:
+        substitutes.extend(day for day in span if day.weekday() == 6 or day in fixed)
+    children = date(year, 5, 5)
+    if children.weekday() >= 5 or children == buddha:
+        substitutes.append(children)
+    if year >= 2021:
+        substitutes.extend(
+            day for day in (date(year, 3, 1), date(year, 8, 15), date(year, 10, 3), date(year, 10, 9)) if day.weekday() >= 5
+        )
+    if year >= 2023:
+        substitutes.extend(day for day in (buddha, date(year, 12, 25)) if day is not None and day.weekday() >= 5)
+    for day in sorted(substitutes):
+        candidate = day + timedelta(days=1)
+        while candidate.weekday() >= 5 or candidate in holidays:
+            candidate += timedelta(days=1)
+        holidays.add(candidate)
+
+    year_end = date(year, 12, 31)
+    while year_end.weekday() >= 5:
+        year_end -= timedelta(days=1)
+    holidays.add(year_end)
+    holidays.update(day for day in KR_SPECIAL_CLOSURES if day.year == year)
+    return holidays
+
+
+class TradingCalendar:
+    """Session days as per-year ordinal arrays, built once per year and then reused."""
+
+    def __init__(self, name: str, build_year: Callable[[int], array]) -> None:
+        self.name = name
+        self._build_year = build_year
+        self._years: dict[int, array] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_rules(
+        cls,
+        name: str,
+        weekdays: Iterable[int] = range(5),
+        holidays: Callable[[int], set[date]] | None = None,
+    ) -> "TradingCalendar":
+        open_weekdays = frozenset(weekdays)
+
+        def build_year(year: int) -> array:
+            closed = holidays(year) if holidays is not None else set()
+            first = date(year, 1, 1).toordinal()
+            last = date(year, 12, 31).toordinal()
+            return array(
+                "l",
+                (
+                    ordinal
+                    for ordinal in range(first, last + 1)
+                    if date.fromordinal(ordinal).weekday() in open_weekdays
+                    and date.fromordinal(ordinal) not in closed
+                ),
+            )
+
+        return cls(name, build_year)
+
+    def year_sessions(self, year: int) -> array:
+        with self._lock:
+            cached = self._years.get(year)
+        if cached is not None:
+            return cached
+        sessions = self._build_year(year)
+        with self._lock:
+            self._years[year] = sessions
+        return sessions
+
+    def sessions(self, start: date, end: date) -> array:
+        """Session ordinals in [start, end]."""
+        result = array("l")
+        if start > end:
+            return result
+        lo, hi = start.toordinal(), end.toordinal()
+        for year in range(start.year, end.year + 1):
+            days = self.year_sessions(year)
+            result.extend(days[bisect_left(days, lo) : bisect_right(days, hi)])
+        return result
+
+    def is_session(self, day: date) -> bool:
+        days = self.year_sessions(day.year)
+        idx = bisect_left(days, day.toordinal())
+        return idx < len(days) and days[idx] == day.toordinal()
+
+    def previous_session(self, day: date) -> date | None:
+        """Latest session strictly before *day* (searching back one year)."""
+        for year in (day.year, day.year - 1):
+            days = self.year_sessions(year)
+            idx = bisect_left(days, day.toordinal()) - 1
+            if idx >= 0:
+                return date.fromordinal(days[idx])
+        return None
+
+
+def union_calendar(name: str, calendars: Sequence[TradingCalendar]) -> TradingCalendar:
+    """Days on which any of *calendars* trades."""
+    return TradingCalendar(
+        name,
+        lambda year: array("l", sorted({day for calendar in calendars for day in calendar.year_sessions(year)})),
+    )
+
+
+US_CALENDAR = TradingCalendar.from_rules("US", holidays=us_holidays)
+KR_CALENDAR = TradingCalendar.from_rules("KR", holidays=kr_holidays)
+CALENDARS: dict[str, TradingCalendar] = {
+    "US": US_CALENDAR,
+    "KR": KR_CALENDAR,
+    "US|KR": union_calendar("US|KR", [US_CALENDAR, KR_CALENDAR]),
+}
+
+
+def align_asof(
+    days: Sequence[int],
+    values: Sequence[float],
+    grid: Sequence[int],
+    max_lag_days: int,
+) -> list[float | None]:
+    """Forward-fill sorted (*days*, *values*) onto sorted *grid* ordinals in one merge pass.
+
+    A grid day gets the latest value on or before it, or None when that value is older
+    than *max_lag_days* (a data gap rather than a market holiday).
+    """
+    aligned: list[float | None] = []
+    pos = -1
+    count = len(days)
+    for ordinal in grid:
+        while pos + 1 < count and days[pos + 1] <= ordinal:
+            pos += 1
+        if pos < 0 or ordinal - days[pos] > max_lag_days:
+            aligned.append(None)
+        else:
+            aligned.append(values[pos])
+    return aligned
+
+
+def align_many(
+    series: Mapping[str, tuple[Sequence[int], Sequence[float]]],
+    grid: Sequence[int],
+    max_lag_days: int,
+) -> tuple[list[int], dict[str, list[float]]]:
+    """Align every series to *grid* and keep only the grid days where all of them have a value."""
+    columns = {key: align_asof(days, values, grid, max_lag_days) for key, (days, values) in series.items()}
+    keep = [idx for idx in range(len(grid)) if all(column[idx] is not None for column in columns.values())]
+    return (
+        [grid[idx] for idx in keep],
+        {key: [column[idx] for idx in keep] for key, column in columns.items()},  # type: ignore[misc]
+    )
+
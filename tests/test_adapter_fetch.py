@@ -64,3 +64,13 @@ def test_ecos_adapter_builds_statistic_url():
     assert "ECOSKEY" in called_url
     assert "722Y001" in called_url
     assert result["source"] == "ecos"
+
+
+def test_ecos_adapter_window_ends_at_the_current_month():
+    from datetime import date
+
+    client = RecordingClient({"StatisticSearch": {"row": []}})
+    EcosAdapter(client=client, api_key="ECOSKEY").fetch_statistic("722Y001", as_of=date(2026, 10, 19))
+
+    called_url, _ = client.calls[0]
+    assert called_url.endswith("/722Y001/M/202211/202610")
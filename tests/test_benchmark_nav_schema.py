@@ -0,0 +1,10 @@
+from pathlib import Path
+
+
+def test_benchmark_nav_daily_migration_keys_rows_by_day():
+    sql = Path("migrations/016_benchmark_nav_daily.sql").read_text(encoding="utf-8")
+
+    assert "CREATE TABLE IF NOT EXISTS benchmark_nav_daily" in sql
+    assert "as_of DATE PRIMARY KEY" in sql
+    for column in ["qqq_return", "kospi200_return", "btc_return", "sgov_return", "benchmark_nav", "weights_version"]:
+        assert column in sql
@@ -178,3 +178,166 @@ def test_compute_benchmark_series_ignores_negative_weight_overrides(monkeypatch)
     )
     assert len(rows) == 1
     assert math.isclose(rows[0]["benchmark_return"], expected_return, rel_tol=1e-12)
+
+
+class VersionedBenchmarkRepository(FakeBenchmarkRepository):
+    cache_scope = "postgres://benchmark"
+
+    def __init__(self, metric_rows):
+        super().__init__(metric_rows)
+        self.full_reads = []
+        self.tail_reads = []
+
+    def read_macro_series_points(self, metric_key, limit=10000):
+        self.full_reads.append(metric_key)
+        return super().read_macro_series_points(metric_key, limit)
+
+    def read_macro_series_points_since(self, metric_key, since, limit=10000):
+        self.tail_reads.append((metric_key, since.date().isoformat()))
+        rows = [row for row in self.metric_rows.get(metric_key, []) if row["as_of"] >= since.date().isoformat()]
+        return rows[:limit]
+
+    def read_macro_series_latest_as_of(self, metric_keys):
+        return {key: self.metric_rows[key][0]["as_of"] for key in metric_keys if self.metric_rows.get(key)}
+
+
+def _component_rows(levels_by_day):
+    return [{"as_of": day, "value": value} for day, value in sorted(levels_by_day.items(), reverse=True)]
+
+
+def test_compute_benchmark_series_reuses_cached_components_and_refreshes_only_the_tail(monkeypatch):
+    from src.enduser.benchmark_service import ComponentLevelCache
+
+    for env_name in ("BENCHMARK_WEIGHT_QQQ", "BENCHMARK_WEIGHT_KOSPI200", "BENCHMARK_WEIGHT_BTC", "BENCHMARK_WEIGHT_SGOV"):
+        monkeypatch.delenv(env_name, raising=False)
+
+    base = {"2026-02-18": 100.0, "2026-02-19": 101.0, "2026-02-20": 102.0}
+    rows = {key: _component_rows(base) for key in ("QQQ", "KOSPI200", "BTC", "SGOV")}
+    repo = VersionedBenchmarkRepository(rows)
+    cache = ComponentLevelCache()
+
+    first = compute_benchmark_series(repo, "2026-02-18", "2026-02-28", cache=cache)
+    second = compute_benchmark_series(repo, "2026-02-18", "2026-02-28", cache=cache)
+
+    assert second == first
+    assert len(repo.full_reads) == 4
+    assert cache.stats == {"hits": 4, "tail_refreshes": 0, "full_loads": 4}
+
+    # QQQ revises its last day and gains a new one; the others are unchanged.
+    rows["QQQ"] = _component_rows({**base, "2026-02-20": 103.0, "2026-02-23": 104.0})
+    refreshed = compute_benchmark_series(repo, "2026-02-18", "2026-02-28", cache=cache)
+
+    assert len(repo.full_reads) == 4
+    assert repo.tail_reads == [("QQQ", "2026-02-19")]
+    assert cache.stats["tail_refreshes"] == 1
+
+    rebuilt = compute_benchmark_series(VersionedBenchmarkRepository(rows), "2026-02-18", "2026-02-28", cache=ComponentLevelCache())
+    assert refreshed == rebuilt
+    assert [row["as_of"] for row in refreshed] == ["2026-02-19", "2026-02-20"]
+    assert math.isclose(refreshed[-1]["benchmark_return"], 0.45 * (103.0 / 101.0 - 1.0) + 0.55 * (102.0 / 101.0 - 1.0))
+
+
+def test_compute_benchmark_series_does_not_cache_without_scope():
+    from src.enduser.benchmark_service import ComponentLevelCache
+
+    rows = {key: _component_rows({"2026-02-19": 100.0, "2026-02-20": 101.0}) for key in ("QQQ", "KOSPI200", "BTC", "SGOV")}
+    cache = ComponentLevelCache()
+
+    compute_benchmark_series(FakeBenchmarkRepository(rows), "2026-02-19", "2026-02-20", cache=cache)
+    compute_benchmark_series(FakeBenchmarkRepository(rows), "2026-02-19", "2026-02-20", cache=cache)
+
+    assert cache.stats == {"hits": 0, "tail_refreshes": 0, "full_loads": 8}
+
+
+def test_compute_benchmark_series_reads_materialized_rows_rebased_to_range(monkeypatch):
+    from src.enduser.benchmark_service import benchmark_weights_version, load_benchmark_weights
+
+    for env_name in ("BENCHMARK_WEIGHT_QQQ", "BENCHMARK_WEIGHT_KOSPI200", "BENCHMARK_WEIGHT_BTC", "BENCHMARK_WEIGHT_SGOV"):
+        monkeypatch.delenv(env_name, raising=False)
+    version = benchmark_weights_version(load_benchmark_weights())
+
+    class MaterializedRepository(FakeBenchmarkRepository):
+        def __init__(self, stored):
+            super().__init__({})
+            self.stored = stored
+
+        def read_benchmark_nav_range(self, start, end):
+            return self.stored
+
+        def read_macro_series_points(self, metric_key, limit=10000):
+            raise AssertionError("component points should not be read")
+
+    repo = MaterializedRepository(
+        [
+            {"as_of": "2026-02-19", "benchmark_return": 0.1, "benchmark_nav": 2.2, "weights_version": version, "base_nav": 2.0},
+            {"as_of": "2026-02-20", "benchmark_return": 0.0, "benchmark_nav": 2.2, "weights_version": version, "base_nav": 2.0},
+        ]
+    )
+
+    rows = compute_benchmark_series(repo, "2026-02-19", "2026-02-20")
+
+    assert [row["as_of"] for row in rows] == ["2026-02-19", "2026-02-20"]
+    assert math.isclose(rows[0]["benchmark_nav"], 1.1, rel_tol=1e-12)
+
+    repo.stored[0]["weights_version"] = "stale"
+    repo.read_macro_series_points = lambda metric_key, limit=10000: []
+    assert compute_benchmark_series(repo, "2026-02-19", "2026-02-20") == []
+
+
+
+def test_compute_benchmark_series_ignores_materialized_rows_behind_the_components(monkeypatch):
+    from src.enduser.benchmark_service import benchmark_weights_version, load_benchmark_weights
+
+    for env_name in ("BENCHMARK_WEIGHT_QQQ", "BENCHMARK_WEIGHT_KOSPI200", "BENCHMARK_WEIGHT_BTC", "BENCHMARK_WEIGHT_SGOV"):
+        monkeypatch.delenv(env_name, raising=False)
+    version = benchmark_weights_version(load_benchmark_weights())
+    levels = {"2026-02-19": 100.0, "2026-02-20": 101.0, "2026-02-23": 102.0}
+
+    class LaggingRepository(VersionedBenchmarkRepository):
+        def read_benchmark_nav_range(self, start, end):
+            # The last refresh failed after 2026-02-20.
+            return [
+                {"as_of": "2026-02-20", "benchmark_return": 0.01, "benchmark_nav": 1.01, "weights_version": version, "base_nav": 1.0},
+            ]
+
+    repo = LaggingRepository({key: _component_rows(levels) for key in ("QQQ", "KOSPI200", "BTC", "SGOV")})
+
+    rows = compute_benchmark_series(repo, "2026-02-19", "2026-02-28")
+
+    assert [row["as_of"] for row in rows] == ["2026-02-20", "2026-02-23"]
+    assert len(repo.full_reads) == 4
+    # A range ending on Saturday 2026-02-21 only needs stored rows through Friday.
+    assert compute_benchmark_series(repo, "2026-02-19", "2026-02-21") == [
+        {"as_of": "2026-02-20", "benchmark_return": 0.01, "benchmark_nav": 1.01},
+    ]
+
+def test_compute_benchmark_series_carries_closed_market_through_holidays(monkeypatch):
+    for env_name in ("BENCHMARK_WEIGHT_QQQ", "BENCHMARK_WEIGHT_KOSPI200", "BENCHMARK_WEIGHT_BTC", "BENCHMARK_WEIGHT_SGOV"):
+        monkeypatch.delenv(env_name, raising=False)
+
+    # 2026-02-16..18 is Seollal in Korea; 2026-02-16 is Presidents' Day in the US.
+    us_levels = {"2026-02-13": 100.0, "2026-02-17": 101.0, "2026-02-18": 102.0, "2026-02-19": 103.0}
+    kr_levels = {"2026-02-13": 200.0, "2026-02-19": 210.0}
+    btc_levels = {f"2026-02-{day}": 50_000.0 + 100 * (day - 13) for day in range(13, 20)}
+    repo = FakeBenchmarkRepository(
+        {
+            "QQQ": _component_rows(us_levels),
+            "SGOV": _component_rows(us_levels),
+            "KOSPI200": _component_rows(kr_levels),
+            "BTC": _component_rows(btc_levels),
+        }
+    )
+
+    rows = compute_benchmark_series(repo, "2026-02-13", "2026-02-19")
+
+    assert [row["as_of"] for row in rows] == ["2026-02-17", "2026-02-18", "2026-02-19"]
+    # KOSPI200 is flat while closed; BTC's weekend and holiday moves land on the next session.
+    assert math.isclose(rows[0]["benchmark_return"], 0.55 * 0.01 + 0.20 * (50_400.0 / 50_000.0 - 1.0))
+    assert math.isclose(
+        rows[-1]["benchmark_return"],
+        0.55 * (103.0 / 102.0 - 1.0) + 0.25 * 0.05 + 0.20 * (50_600.0 / 50_500.0 - 1.0),
+    )
+    total = 1.0
+    for row in rows:
+        total *= 1.0 + row["benchmark_return"]
+    assert math.isclose(rows[-1]["benchmark_nav"], total)
@@ -313,6 +313,67 @@ def test_create_forecast_record_command_uses_idempotent_repository(monkeypatch):
     assert row == {"forecast_id": 77, "deduplicated": True, "thesis_id": "thesis-1", "horizon": "1M"}
 
 
+def test_cli_exposes_forecast_record_import_command():
+    parser = cli.build_parser()
+    args = parser.parse_args(["forecast-record-import", "--file", "records.jsonl"])
+
+    assert args.command == "forecast-record-import"
+    assert args.file == "records.jsonl"
+    assert args.chunk_size == 200
+
+
+def test_import_forecast_records_command_streams_results_per_line(monkeypatch):
+    captured = {"chunks": []}
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def write_forecast_record_chunks(self, chunks):
+            for chunk in chunks:
+                captured["chunks"].append([line_no for line_no, _ in chunk])
+                yield [
+                    (line_no, {"status": "inserted" if line_no == 1 else "deduplicated", "forecast_id": line_no})
+                    for line_no, _ in chunk
+                ]
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    record = (
+        '{"thesis_id":"thesis-1","horizon":"1M","expected_return_low":0.01,"expected_return_high":0.05,'
+        '"confidence":0.6,"evidence_hard":[{"source":"fred"}],"as_of":"2026-02-22T00:00:00+00:00"}'
+    )
+    lines = [
+        (1, record),
+        (2, "{not json"),
+        (3, ""),
+        (4, record.replace('[{"source":"fred"}]', "[]")),
+        (5, record.replace('"1M"', '"6M"')),
+        (6, record),
+    ]
+    emitted = []
+
+    summary = cli.import_forecast_records_command(
+        path="unused.jsonl", chunk_size=1, emit=emitted.append, lines=lines
+    )
+
+    assert captured["chunks"] == [[1], [6]]
+    assert [(item["line"], item["status"]) for item in emitted] == [
+        (1, "inserted"),
+        (2, "error"),
+        (4, "error"),
+        (5, "error"),
+        (6, "deduplicated"),
+    ]
+    assert "evidence_hard_json must be a non-empty JSON array" in str(emitted[2]["error"])
+    assert summary["lines"] == 5
+    assert summary["inserted"] == 1
+    assert summary["deduplicated"] == 1
+    assert summary["errors"] == 3
+    assert summary["chunks"] == 2
+
+
 def test_create_forecast_record_command_rejects_invalid_range(monkeypatch):
     monkeypatch.setenv("DATABASE_URL", "postgres://example")
 
@@ -377,3 +438,427 @@ def test_run_learning_bootstrap_command_requires_database_url_for_non_dry_run(mo
             as_of="2026-02-22T00:00:00+00:00",
             dry_run=False,
         )
+
+
+def test_cli_exposes_dashboard_snapshot_command_with_defaults():
+    parser = cli.build_parser()
+    args = parser.parse_args(["dashboard-snapshot"])
+
+    assert args.command == "dashboard-snapshot"
+    assert args.limit == 20
+    assert args.keep_latest == 48
+
+
+def test_refresh_dashboard_snapshot_command_builds_once_and_persists_view(monkeypatch):
+    writes = []
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def write_dashboard_snapshot(self, view, computed_at, build_ms=None, keep_latest=48):
+            writes.append({"view": view, "build_ms": build_ms, "keep_latest": keep_latest})
+            return 9
+
+    dashboard_service = importlib.import_module("src.ingestion.dashboard_service")
+
+    def fake_build(repository, limit=20, *, prefetch_attribution_details=True):
+        assert prefetch_attribution_details is False
+        return {"counters": {}, "load_timings": {"degraded_calls": ["counters"]}}
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+    monkeypatch.setattr(dashboard_service, "build_dashboard_view", fake_build)
+
+    result = cli.refresh_dashboard_snapshot_command(keep_latest=3)
+
+    assert result["id"] == 9
+    assert result["degraded_calls"] == ["counters"]
+    assert writes[0]["keep_latest"] == 3
+    assert writes[0]["build_ms"] >= 0
+
+
+def test_run_learning_bootstrap_command_writes_plan_in_one_bulk_call(monkeypatch):
+    batches = []
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def write_learning_samples_bulk(self, samples):
+            batches.append(samples)
+            return {
+                "thesis_upserts": len(samples),
+                "forecast_upserts": len(samples),
+                "forecast_inserts": len(samples),
+                "realization_inserts": len(samples),
+                "attribution_inserts": len(samples),
+            }
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    result = cli.run_learning_bootstrap_command(
+        as_of="2026-02-22T00:00:00+00:00",
+        horizons="1W,1M",
+        min_samples="2,1",
+    )
+
+    assert len(batches) == 1
+    assert len(batches[0]) == 3
+    assert batches[0][0]["realization"]["realized_return"] == 0.025
+    assert result["forecast_upserts"] == 3
+    assert result["attribution_inserts"] == 3
+
+
+def test_run_evaluate_realizations_command_reads_prices_once_and_writes_in_bulk(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    calls = {"window": [], "writes": []}
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def read_matured_unrealized_forecasts(self, as_of, limit=5000, after=None):
+            assert after is None
+            return [
+                {"forecast_id": 1, "horizon": "1W", "as_of": start, "scope_level": "stock", "target_id": "AAPL"},
+                {"forecast_id": 2, "horizon": "1W", "as_of": start, "scope_level": "stock", "target_id": "MSFT"},
+            ]
+
+        def read_macro_series_window(self, metric_keys, start_at, end_at):
+            calls["window"].append(metric_keys)
+            return [
+                {"metric_key": "AAPL", "as_of": start + timedelta(days=day), "value": 100.0 + day}
+                for day in range(8)
+            ]
+
+        def write_realizations_bulk(self, realizations):
+            calls["writes"].append(realizations)
+            return {row["forecast_id"]: 900 + idx for idx, row in enumerate(realizations)}
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    result = cli.run_evaluate_realizations_command(as_of="2026-03-01T00:00:00+00:00")
+
+    assert len(calls["window"]) == 1
+    assert "MSFT" in calls["window"][0]
+    assert len(calls["writes"]) == 1
+    assert result["candidates"] == 2
+    assert result["evaluated"] == 1
+    assert result["realization_inserts"] == 1
+    assert result["skipped"] == {"missing_prices": 1}
+
+
+def test_run_evaluate_realizations_command_pages_past_unpriceable_forecasts(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    queue = [
+        {"forecast_id": idx, "horizon": "1W", "as_of": start + timedelta(days=idx), "scope_level": "stock", "target_id": target}
+        for idx, target in enumerate(["GONE", "GONE", "AAPL"], start=1)
+    ]
+    afters = []
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def read_matured_unrealized_forecasts(self, as_of, limit=5000, after=None):
+            afters.append(after)
+            rows = [row for row in queue if after is None or (row["as_of"], row["forecast_id"]) > after]
+            return rows[:limit]
+
+        def read_macro_series_window(self, metric_keys, start_at, end_at):
+            return [
+                {"metric_key": "AAPL", "as_of": start + timedelta(days=day), "value": 100.0 + day}
+                for day in range(20)
+            ]
+
+        def write_realizations_bulk(self, realizations):
+            return {row["forecast_id"]: 900 + idx for idx, row in enumerate(realizations)}
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    result = cli.run_evaluate_realizations_command(as_of="2026-03-01T00:00:00+00:00", limit=2)
+
+    assert afters == [None, (start + timedelta(days=2), 2)]
+    assert result["pages"] == 2
+    assert result["candidates"] == 3
+    assert result["realization_inserts"] == 1
+    assert result["skipped"] == {"missing_prices": 2}
+
+
+def test_cli_exposes_evaluate_realizations_command_with_defaults():
+    parser = cli.build_parser()
+    args = parser.parse_args(["evaluate-realizations"])
+
+    assert args.command == "evaluate-realizations"
+    assert args.as_of is None
+    assert args.limit == 5000
+    assert args.dry_run is False
+
+
+def test_run_learning_rollup_rebuild_command_flags_drift(monkeypatch):
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def rebuild_learning_rollups(self, dry_run=False):
+            assert dry_run is True
+            return {
+                "learning_forecast_rollup": {"missing_rows": 0, "orphan_rows": 0, "drifted_rows": 0, "fresh_rows": 3},
+                "learning_realization_rollup": {"missing_rows": 1, "orphan_rows": 0, "drifted_rows": 0, "fresh_rows": 2},
+            }
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    result = cli.run_learning_rollup_rebuild_command(dry_run=True)
+
+    assert result["consistent"] is False
+    assert result["tables"]["learning_realization_rollup"]["missing_rows"] == 1
+
+
+def test_read_learning_calibration_command_parses_windows(monkeypatch):
+    captured = {}
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def read_learning_calibration(self, horizon, windows, bins, limit):
+            captured.update({"horizon": horizon, "windows": windows, "bins": bins, "limit": limit})
+            return {"horizon": horizon, "windows": list(windows), "series": [], "latest": {}, "reliability": []}
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    result = cli.read_learning_calibration_command(horizon="3M", windows="10, 30", bins=4)
+
+    assert captured == {"horizon": "3M", "windows": (10, 30), "bins": 4, "limit": 200}
+    assert result["windows"] == [10, 30]
+
+    with pytest.raises(ValueError):
+        cli.read_learning_calibration_command(windows="ten")
+
+
+def test_benchmark_nav_rebuild_command_passes_since_day(monkeypatch):
+    calls = []
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def refresh_benchmark_nav_daily(self, since=None):
+            calls.append(since)
+            return {"mode": "rebuild", "rows_written": 3}
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    args = cli.build_parser().parse_args(["benchmark-nav-rebuild"])
+    assert args.since is None
+
+    result = cli.run_benchmark_nav_rebuild_command(since="2026-02-20")
+
+    assert [str(day) for day in calls] == ["2026-02-20"]
+    assert result["rows_written"] == 3
+    assert "elapsed_ms" in result
+
+
+
+def test_source_schema_reset_command_deletes_schema_and_forgets_cache(monkeypatch):
+    profiler = importlib.import_module("src.ingestion.quality_profiler")
+    deleted = []
+    forgotten = []
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def delete_source_schema(self, source):
+            deleted.append(source)
+            return True
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+    monkeypatch.setattr(
+        profiler.SCHEMA_FINGERPRINT_CACHE, "forget", lambda store, source: forgotten.append((store.dsn, source))
+    )
+
+    args = cli.build_parser().parse_args(["source-schema-reset", "--source", "FRED"])
+    result = cli.run_source_schema_reset_command(source=args.source)
+
+    assert deleted == ["fred"]
+    assert forgotten == [("postgres://example", "fred")]
+    assert result == {"source": "fred", "deleted": True}
+
+def test_import_portfolio_snapshots_command_rejects_invalid_rows_and_reports_counts(monkeypatch, tmp_path):
+    staged = []
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def copy_portfolio_snapshots(self, snapshots):
+            staged.extend(snapshots)
+            return {"staged": len(staged), "inserted": 1, "updated": 1, "duplicates": 0}
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    export = tmp_path / "snapshots.csv"
+    export.write_text(
+        "as_of,nav,us_weight,kr_weight,crypto_weight,leverage_weight\n"
+        "2026-01-02,100.0,0.45,0.25,0.2,\n"
+        "2026-01-03,101.0,,,,\n"
+        "2026-01-04,-5,,,,\n"
+        "2026-01-05,101.0,1.5,,,\n"
+        "not-a-date,101.0,,,,\n",
+        encoding="utf-8",
+    )
+
+    summary = cli.import_portfolio_snapshots_command(path=str(export))
+
+    assert [snapshot["as_of"] for snapshot in staged] == ["2026-01-02", "2026-01-03"]
+    assert staged[0]["us_weight"] == 0.45
+    assert staged[1]["leverage_weight"] is None
+    assert summary["rows"] == 5
+    assert summary["inserted"] == 1
+    assert summary["updated"] == 1
+    assert summary["rejected"] == 3
+    assert summary["rejections"] == [
+        {"line": 4, "error": "nav must be > 0"},
+        {"line": 5, "error": "us_weight must be between 0 and 1"},
+        {"line": 6, "error": "as_of must be ISO-8601 date (YYYY-MM-DD)"},
+    ]
+    assert "rows_per_second" in summary
+
+
+def test_import_portfolio_snapshots_command_reads_jsonl(monkeypatch, tmp_path):
+    staged = []
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def copy_portfolio_snapshots(self, snapshots):
+            staged.extend(snapshots)
+            return {"staged": len(staged), "inserted": len(staged), "updated": 0, "duplicates": 0}
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    export = tmp_path / "snapshots.jsonl"
+    export.write_text('{"as_of":"2026-01-02","nav":100}\n\n{bad\n', encoding="utf-8")
+
+    summary = cli.import_portfolio_snapshots_command(path=str(export))
+
+    assert staged == [
+        {"as_of": "2026-01-02", "nav": 100.0, "us_weight": None, "kr_weight": None, "crypto_weight": None, "leverage_weight": None}
+    ]
+    assert summary["rejected"] == 1
+    assert summary["rejections"][0]["line"] == 3
+    assert cli.build_parser().parse_args(["portfolio-snapshot-import", "--file", "x.csv"]).format == "auto"
+
+
+def test_import_portfolio_positions_command_validates_records(monkeypatch):
+    written = []
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def write_portfolio_positions_bulk(self, positions):
+            written.extend(positions)
+            return {"inserted": len(positions), "updated": 0}
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    summary = cli.import_portfolio_positions_command(
+        path="unused.csv",
+        records=[
+            (2, {"as_of": "2026-02-20", "symbol": "qqq", "quantity": "10", "currency": "usd", "asset_class": "ETF", "region": "us"}),
+            (3, {"as_of": "2026-02-20", "symbol": "TQQQ", "quantity": "1", "currency": "USD", "asset_class": "etf", "is_leveraged": "true"}),
+            (4, {"as_of": "2026-02-20", "symbol": "X", "quantity": "1", "currency": "DOLLARS", "asset_class": "etf"}),
+            (5, {"as_of": "2026-02-20", "symbol": "X", "quantity": "1", "currency": "USD", "asset_class": "option"}),
+        ],
+    )
+
+    assert [p["symbol"] for p in written] == ["QQQ", "TQQQ"]
+    assert written[0]["currency"] == "USD" and written[0]["region"] == "US"
+    assert written[1]["is_leveraged"] is True and written[1]["region"] == "OTHER"
+    assert summary["inserted"] == 2
+    assert summary["rejected"] == 2
+    assert summary["rejections"][0] == {"line": 4, "error": "currency must be a 3-letter ISO code"}
+
+
+def test_run_portfolio_valuation_command_values_and_writes_in_bulk(monkeypatch):
+    calls = {}
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def read_portfolio_positions(self, start=None, end=None):
+            calls["range"] = (start, end)
+            return [
+                {"as_of": "2026-02-20", "symbol": "QQQ", "quantity": 2, "currency": "USD", "asset_class": "etf", "region": "US"},
+                {"as_of": "2026-02-20", "symbol": "CASH", "quantity": 1000, "currency": "KRW", "asset_class": "cash", "region": "KR"},
+            ]
+
+        def read_macro_series_window(self, metric_keys, start, end):
+            calls["keys"] = metric_keys
+            return [
+                {"metric_key": "QQQ", "as_of": "2026-02-20T00:00:00+00:00", "value": 450.0},
+                {"metric_key": "FX_USDKRW", "as_of": "2026-02-20T00:00:00+00:00", "value": 1000.0},
+            ]
+
+        def write_portfolio_valuations_bulk(self, valuations):
+            calls["valuations"] = valuations
+            return {"snapshots_inserted": 1, "snapshots_updated": 0, "metrics_written": 1}
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    result = cli.run_portfolio_valuation_command(start="2026-02-01")
+
+    assert str(calls["range"][0]) == "2026-02-01" and calls["range"][1] is None
+    assert calls["keys"] == ["QQQ", "FX_KRWUSD", "FX_USDKRW", "DEXKOUS"]
+    assert calls["valuations"][0]["nav"] == 901.0
+    assert result["days_valued"] == 1
+    assert result["snapshots_inserted"] == 1
+    assert cli.build_parser().parse_args(["portfolio-valuate", "--dry-run"]).dry_run is True
+
+
+def test_run_portfolio_valuation_command_defaults_to_portfolio_base_currency(monkeypatch):
+    calls = {}
+
+    class FakeRepository:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        def read_portfolio_positions(self, start=None, end=None):
+            return [
+                {"as_of": "2026-02-20", "symbol": "QQQ", "quantity": 2, "currency": "USD", "asset_class": "etf", "region": "US"},
+            ]
+
+        def read_macro_series_window(self, metric_keys, start, end):
+            calls["keys"] = metric_keys
+            return []
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://example")
+    monkeypatch.setenv("PORTFOLIO_BASE_CURRENCY", "KRW")
+    monkeypatch.setattr(cli, "PostgresRepository", FakeRepository)
+
+    result = cli.run_portfolio_valuation_command(dry_run=True)
+
+    assert result["base_currency"] == "KRW"
+    assert "FX_USDKRW" in calls["keys"]
+    assert cli.build_parser().parse_args(["portfolio-valuate"]).base_currency == "KRW"
@@ -53,6 +53,47 @@ def test_dashboard_app_update_refresh_request_status_delegates_to_repository(mon
     }
 
 
+def test_dashboard_app_pooled_repository_builds_one_pool_per_dsn_across_threads(monkeypatch):
+    import threading
+    import time
+
+    created: list[dict[str, object]] = []
+
+    class FakeRepository:
+        @classmethod
+        def pooled(cls, dsn: str, **kwargs):
+            time.sleep(0.01)
+            created.append({"dsn": dsn, **kwargs})
+            return cls()
+
+    class FakeModule:
+        PostgresRepository = FakeRepository
+
+    original_import_module = dashboard_app.importlib.import_module
+
+    def fake_import_module(name: str):
+        if name == "src.ingestion.postgres_repository":
+            return FakeModule()
+        return original_import_module(name)
+
+    monkeypatch.setattr(dashboard_app.importlib, "import_module", fake_import_module)
+    monkeypatch.setattr(dashboard_app, "_POOLED_REPOSITORIES", {})
+    monkeypatch.setenv("DASHBOARD_CALL_TIMEOUT_SECONDS", "2.5")
+
+    repositories: list[object] = []
+    threads = [
+        threading.Thread(target=lambda: repositories.append(dashboard_app._pooled_repository("postgresql://demo")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert created == [{"dsn": "postgresql://demo", "statement_timeout_ms": 2500}]
+    assert len({id(repository) for repository in repositories}) == 1
+
+
 def test_dashboard_app_kpi_layout_is_tiered_and_bounded():
     tiers = dashboard_app.get_kpi_layout_tiers()
     assert all(len(keys) <= 6 for _, keys in tiers)
@@ -64,7 +105,7 @@ def test_dashboard_app_kpi_layout_is_tiered_and_bounded():
         "policy_summary",
         "evidence_gap_count",
         "raw_events",
-        "canonical_events",
+        "canonical_facts",
         "quarantine_events",
         "forecast_count",
         "realized_count",
@@ -88,7 +129,7 @@ def test_dashboard_app_builds_cards_from_view_model():
             "last_run_time": "2026-02-18T01:00:00Z",
             "counters": {
                 "raw_events": 100,
-                "canonical_events": 90,
+                "canonical_facts": 90,
                 "quarantine_events": 10,
             },
             "learning_metrics": {
@@ -185,7 +226,7 @@ def test_dashboard_app_treats_malformed_count_metrics_as_unknown_or_error():
         {
             "counters": {
                 "raw_events": "n/a",
-                "canonical_events": "",
+                "canonical_facts": "",
                 "quarantine_events": "unknown",
             },
             "learning_metrics": {
@@ -201,7 +242,7 @@ def test_dashboard_app_treats_malformed_count_metrics_as_unknown_or_error():
     )
 
     assert cards["raw_events"] == "n/a"
-    assert cards["canonical_events"] == "n/a"
+    assert cards["canonical_facts"] == "n/a"
     assert cards["quarantine_events"] == "n/a"
     assert cards["forecast_count"] == "n/a"
     assert cards["realized_count"] == "n/a"
@@ -246,7 +287,7 @@ def test_dashboard_app_parses_comma_grouped_integer_strings_for_count_metrics():
         {
             "counters": {
                 "raw_events": "1,234",
-                "canonical_events": "2,000",
+                "canonical_facts": "2,000",
                 "quarantine_events": "10",
             },
             "learning_metrics": {
@@ -262,7 +303,7 @@ def test_dashboard_app_parses_comma_grouped_integer_strings_for_count_metrics():
     )
 
     assert cards["raw_events"] == 1234
-    assert cards["canonical_events"] == 2000
+    assert cards["canonical_facts"] == 2000
     assert cards["forecast_count"] == 12345
     assert cards["realized_count"] == 6789
     assert cards["attribution_total"] == 1111
@@ -299,7 +340,7 @@ def test_dashboard_app_keeps_true_zero_values_as_ok_not_unknown():
         {
             "counters": {
                 "raw_events": "0",
-                "canonical_events": 0,
+                "canonical_facts": 0,
                 "quarantine_events": 0.0,
             },
             "learning_metrics": {
@@ -474,3 +515,30 @@ def test_dashboard_app_keeps_deployed_access_alert_off_when_status_ok():
     cards = dashboard_app.build_operator_cards({"deployed_access": {"status": "ok"}})
 
     assert cards["has_deployed_access_alert"] is False
+
+
+def test_dashboard_app_loads_attribution_detail_lazily_and_caches_per_session(monkeypatch):
+    calls: list[int] = []
+
+    def fake_load(dsn: str, attribution_id: int, max_preview_chars: int = 240):
+        calls.append(attribution_id)
+        return {"attribution_id": attribution_id}
+
+    monkeypatch.setattr(dashboard_app, "load_attribution_detail", fake_load)
+
+    class FakeStreamlit:
+        session_state: dict[str, object] = {}
+
+    st = FakeStreamlit()
+    view = {"attribution_gap_details": {}}
+
+    first = dashboard_app._resolve_attribution_detail(st, "postgresql://demo", view, 42)
+    second = dashboard_app._resolve_attribution_detail(st, "postgresql://demo", view, 42)
+    prefetched = dashboard_app._resolve_attribution_detail(
+        st, "postgresql://demo", {"attribution_gap_details": {7: {"attribution_id": 7}}}, 7
+    )
+
+    assert first == {"attribution_id": 42}
+    assert second == {"attribution_id": 42}
+    assert prefetched == {"attribution_id": 7}
+    assert calls == [42]
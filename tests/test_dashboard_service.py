@@ -1,4 +1,6 @@
 import importlib
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -20,7 +22,7 @@ class FakeDashboardRepo:
         ]
 
     def read_status_counters(self):
-        return {"raw_events": 100, "canonical_events": 90, "quarantine_events": 10}
+        return {"raw_events": 100, "canonical_facts": 90, "quarantine_events": 10}
 
     def read_learning_metrics(self, horizon="1M"):
         return {
@@ -118,6 +120,40 @@ def test_dashboard_service_builds_operator_view_model():
     assert len(view["recent_runs"]) == 2
 
 
+class BatchedDetailRepo(FakeDashboardRepo):
+    def __init__(self):
+        self.batched_calls = []
+
+    def read_forecast_error_attribution_detail(self, attribution_id: int, max_preview_chars: int = 240):
+        raise AssertionError("per-row detail lookup should not be used")
+
+    def read_forecast_error_attribution_details(self, attribution_ids, max_preview_chars=240):
+        self.batched_calls.append(list(attribution_ids))
+        return {
+            attribution_id: {"attribution_id": attribution_id, "hard_evidence_preview": "[]"}
+            for attribution_id in attribution_ids
+        }
+
+
+def test_dashboard_service_batches_attribution_detail_lookups():
+    repo = BatchedDetailRepo()
+
+    view = build_dashboard_view(repo)
+
+    assert repo.batched_calls == [[101, 102, 104]]
+    assert sorted(view["attribution_gap_details"]) == [101, 102, 104]
+
+
+def test_dashboard_service_skips_attribution_detail_prefetch_when_disabled():
+    repo = BatchedDetailRepo()
+
+    view = build_dashboard_view(repo, prefetch_attribution_details=False)
+
+    assert repo.batched_calls == []
+    assert view["attribution_gap_details"] == {}
+    assert len(view["attribution_gap_rows"]) == 4
+
+
 class FailingLearningRepo(FakeDashboardRepo):
     def read_learning_metrics(self, horizon="1M"):
         raise RuntimeError("psycopg2.errors.UndefinedTable")
@@ -160,7 +196,7 @@ def test_dashboard_service_falls_back_when_core_dashboard_queries_fail():
     assert view["last_run_status"] == "no-data"
     assert view["counters"] == {
         "raw_events": 0,
-        "canonical_events": 0,
+        "canonical_facts": 0,
         "quarantine_events": 0,
     }
     assert view["learning_metrics"]["forecast_count"] == 0
@@ -420,3 +456,84 @@ def test_dashboard_service_sets_unknown_when_access_json_invalid(monkeypatch: py
     view = build_dashboard_view(FakeDashboardRepo())
     assert view["deployed_access"]["status"] == "unknown"
     assert view["deployed_access"]["reason"] == "invalid_access_check_json"
+
+
+def test_dashboard_service_reports_per_call_latency():
+    view = build_dashboard_view(FakeDashboardRepo())
+
+    timings = view["load_timings"]
+    assert timings["degraded_calls"] == []
+    assert timings["calls"]["counters"]["status"] == "ok"
+    assert timings["calls"]["learning_metrics:3M"]["latency_ms"] >= 0
+    assert timings["calls"]["attribution_details"]["status"] == "ok"
+    # Sentinel and benchmark keys overlap; each series is read once.
+    assert sorted(key for key in timings["calls"] if key.startswith("macro_series_points:")) == [
+        "macro_series_points:BTC",
+        "macro_series_points:KOSPI200",
+        "macro_series_points:QQQ",
+        "macro_series_points:SGOV",
+    ]
+
+
+def test_dashboard_service_degrades_slow_panels_to_defaults_on_timeout():
+    release = threading.Event()
+
+    class SlowCounterRepo(FakeDashboardRepo):
+        def read_status_counters(self):
+            release.wait(2)
+            return {"raw_events": 999, "canonical_facts": 999, "quarantine_events": 999}
+
+    started = time.monotonic()
+    try:
+        view = build_dashboard_view(SlowCounterRepo(), call_timeout_seconds=0.05, total_deadline_seconds=1.0)
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 1.0
+    assert view["counters"] == {"raw_events": 0, "canonical_facts": 0, "quarantine_events": 0}
+    assert view["load_timings"]["calls"]["counters"]["status"] == "timeout"
+    assert view["load_timings"]["degraded_calls"] == ["counters"]
+    assert view["last_run_status"] == "success"
+
+
+def test_dashboard_service_marks_failed_calls_as_error_in_timings():
+    view = build_dashboard_view(BrokenDashboardRepo())
+
+    assert view["load_timings"]["calls"]["recent_runs"]["status"] == "error"
+    assert "counters" in view["load_timings"]["degraded_calls"]
+
+
+class SnapshotRepo:
+    def __init__(self, row):
+        self.row = row
+
+    def read_latest_dashboard_snapshot(self):
+        return self.row
+
+
+def test_read_fresh_dashboard_snapshot_returns_view_within_budget():
+    now = datetime(2026, 3, 1, 0, 10, tzinfo=timezone.utc)
+    repo = SnapshotRepo(
+        {
+            "id": 5,
+            "computed_at": datetime(2026, 3, 1, 0, 5, tzinfo=timezone.utc),
+            "view": '{"counters": {"raw_events": 4}, "deployed_access": {"status": "stale"}}',
+        }
+    )
+
+    view = dashboard_service.read_fresh_dashboard_snapshot(repo, max_age_seconds=600, now=now)
+
+    assert view is not None
+    assert view["counters"] == {"raw_events": 4}
+    assert view["data_source"]["kind"] == "snapshot"
+    assert view["data_source"]["age_seconds"] == 300
+    assert view["deployed_access"] != {"status": "stale"}
+
+
+def test_read_fresh_dashboard_snapshot_rejects_stale_or_missing_snapshot():
+    now = datetime(2026, 3, 1, 1, 0, tzinfo=timezone.utc)
+    stale = SnapshotRepo({"id": 5, "computed_at": "2026-03-01T00:00:00+00:00", "view": {"counters": {}}})
+
+    assert dashboard_service.read_fresh_dashboard_snapshot(stale, max_age_seconds=600, now=now) is None
+    assert dashboard_service.read_fresh_dashboard_snapshot(SnapshotRepo(None), max_age_seconds=600, now=now) is None
+    assert dashboard_service.read_fresh_dashboard_snapshot(object(), max_age_seconds=600, now=now) is None
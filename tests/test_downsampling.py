@@ -0,0 +1,61 @@
+import math
+
+import pytest
+
+from src.enduser.downsampling import (
+    downsample_rows,
+    lttb_indices,
+    max_drawdown_indices,
+    minmax_indices,
+)
+
+
+def _wave(count):
+    return [100.0 + 10.0 * math.sin(idx / 15.0) + idx * 0.01 for idx in range(count)]
+
+
+def test_lttb_keeps_endpoints_and_target_count():
+    values = _wave(5000)
+
+    kept = lttb_indices(values, 200)
+
+    assert len(kept) == 200
+    assert kept[0] == 0 and kept[-1] == 4999
+    assert kept == sorted(set(kept))
+    assert lttb_indices(values[:50], 200) == list(range(50))
+
+
+def test_minmax_keeps_bucket_extremes():
+    values = _wave(1000)
+
+    kept = minmax_indices(values, 100)
+
+    assert len(kept) <= 100
+    assert values.index(min(values)) in kept
+    assert values.index(max(values)) in kept
+
+
+def test_downsample_rows_preserves_drawdown_extremes_and_gaps():
+    values = [100.0 + idx * 0.1 for idx in range(3000)]
+    values[1234] = 60.0  # sharp one-day crash inside an otherwise smooth uptrend
+    rows = [
+        {"as_of": f"d{idx}", "nav": value, "bench": (value if idx % 7 else None)}
+        for idx, value in enumerate(values)
+    ]
+
+    reduced = downsample_rows(rows, ["nav", "bench"], max_points=100)
+
+    assert len(reduced) <= 106
+    kept = {row["as_of"] for row in reduced}
+    peak, trough = max_drawdown_indices(values)
+    assert trough == 1234
+    assert {f"d{peak}", "d1234", "d0", "d2999"} <= kept
+    assert downsample_rows(rows[:50], ["nav"], max_points=100) == rows[:50]
+
+    with pytest.raises(ValueError):
+        downsample_rows(rows, ["nav"], max_points=100, method="median")
+
+
+def test_max_drawdown_indices_returns_none_for_monotonic_series():
+    assert max_drawdown_indices([1.0, 2.0, 3.0]) is None
+    assert max_drawdown_indices([3.0, 1.0, 2.0, 0.5]) == (0, 3)
@@ -60,7 +60,7 @@ def test_run_enduser_app_renders_portfolio_and_signals_tabs(monkeypatch):
 
     monkeypatch.setitem(__import__("sys").modules, "streamlit", fake_streamlit)
     app = importlib.import_module("src.enduser.app")
-    monkeypatch.setattr(app, "_render_portfolio_tab", lambda _st, dsn: calls.setdefault("portfolio_dsn", dsn))
+    monkeypatch.setattr(app, "_render_portfolio_tab", lambda _st, dsn, _version=None: calls.setdefault("portfolio_dsn", dsn))
     monkeypatch.setattr(
         app,
         "read_latest_macro_regime_signal",
@@ -74,8 +74,12 @@ def test_run_enduser_app_renders_portfolio_and_signals_tabs(monkeypatch):
         },
     )
 
+    version_reads = []
+    monkeypatch.setattr(app, "read_data_version", lambda repository: version_reads.append(repository) or None)
+
     app.run_enduser_app("postgres://example")
 
+    assert len(version_reads) == 1
     assert calls["tabs"] == ["Portfolio", "Signals"]
     assert calls["portfolio_dsn"] == "postgres://example"
     assert calls["subheader"] == ["Macro regime signal"]
@@ -118,7 +122,7 @@ def test_run_enduser_app_wires_reader_payload_into_signal_card(monkeypatch):
         calls["render_payload"] = regime_signal
         calls["render_dsn"] = dsn
 
-    monkeypatch.setattr(app, "_render_portfolio_tab", lambda _st, _dsn: None)
+    monkeypatch.setattr(app, "_render_portfolio_tab", lambda _st, _dsn, _version=None: None)
     monkeypatch.setattr(app, "read_latest_macro_regime_signal", _fake_reader)
     monkeypatch.setattr(app, "render_macro_regime_card", _fake_render)
 
@@ -217,3 +221,49 @@ def test_enduser_entrypoint_requires_database_url(monkeypatch):
     enduser_app = importlib.import_module("enduser_app")
     with pytest.raises(ValueError, match="DATABASE_URL"):
         enduser_app.main()
+
+
+def test_render_portfolio_tab_renders_risk_section(monkeypatch):
+    calls: dict[str, object] = {"metrics": [], "line_chart": [], "area_chart": []}
+
+    class _Column:
+        def metric(self, label: str, value: str):
+            calls["metrics"].append((label, value))
+
+    fake_streamlit = types.SimpleNamespace(
+        info=lambda text: None,
+        warning=lambda text: None,
+        caption=lambda text: calls.setdefault("caption", []).append(text),
+        subheader=lambda text: calls.setdefault("subheader", []).append(text),
+        columns=lambda count: [_Column() for _ in range(count)],
+        line_chart=lambda *args, **kwargs: calls["line_chart"].append((args, kwargs)),
+        area_chart=lambda *args, **kwargs: calls["area_chart"].append((args, kwargs)),
+        bar_chart=lambda *args, **kwargs: None,
+    )
+    performance_payload = {
+        "nav_series": [{"as_of": "2026-01-01", "nav": 1000}, {"as_of": "2026-01-02", "nav": 900}],
+        "benchmark_series": [],
+        "risk": {
+            "var_confidence": 0.95,
+            "var": 0.03,
+            "cvar": 0.045,
+            "beta": 1.1,
+            "current_drawdown": -0.1,
+            "max_drawdown_duration_days": 1,
+            "rolling": {"20": [{"as_of": "2026-01-02", "volatility": 0.2}]},
+            "drawdown_series": [{"as_of": "2026-01-01", "drawdown": 0.0}, {"as_of": "2026-01-02", "drawdown": -0.1}],
+        },
+    }
+
+    app = importlib.import_module("src.enduser.app")
+    monkeypatch.setattr(app, "PostgresRepository", lambda dsn: object())
+    monkeypatch.setattr(app, "build_performance_view", lambda _repo: performance_payload)
+
+    app._render_portfolio_tab(fake_streamlit, "postgres://example")
+
+    assert "리스크" in calls["subheader"]
+    assert ("VaR 95%", "3.00%") in calls["metrics"]
+    assert ("CVaR 95%", "4.50%") in calls["metrics"]
+    assert calls["area_chart"]
+    assert calls["line_chart"][-1][1]["y"] == ["volatility_20d"]
+    assert "최장 낙폭 기간: 1일" in calls["caption"]
@@ -0,0 +1,82 @@
+import importlib
+from datetime import date
+
+import pytest
+
+
+fx_service = importlib.import_module("src.enduser.fx_service")
+
+
+def test_build_fx_rate_series_prefers_direct_key_and_inverts_fallbacks():
+    direct = fx_service.build_fx_rate_series(
+        "krw",
+        "usd",
+        [
+            {"metric_key": "FX_USDKRW", "as_of": "2026-02-20T00:00:00+00:00", "value": 1_000.0},
+            {"metric_key": "FX_KRWUSD", "as_of": "2026-02-20T00:00:00+00:00", "value": 0.0008},
+        ],
+    )
+    assert direct.source_key == "FX_KRWUSD"
+    assert list(direct.rates) == [0.0008]
+
+    fred = fx_service.build_fx_rate_series(
+        "KRW",
+        "USD",
+        [
+            {"metric_key": "DEXKOUS", "as_of": "2026-02-19", "value": 1_250.0},
+            {"metric_key": "DEXKOUS", "as_of": "2026-02-20", "value": "bad"},
+            {"metric_key": "DEXKOUS", "as_of": "2026-02-20", "value": 1_000.0},
+        ],
+    )
+    assert fred.source_key == "DEXKOUS"
+    assert list(fred.rates) == pytest.approx([0.0008, 0.001])
+
+
+def test_fx_rate_series_aligns_with_as_of_forward_fill_and_lag_bound():
+    series = fx_service.build_fx_rate_series(
+        "KRW",
+        "USD",
+        [
+            {"metric_key": "FX_USDKRW", "as_of": "2026-02-02", "value": 1_000.0},
+            {"metric_key": "FX_USDKRW", "as_of": "2026-02-05", "value": 1_250.0},
+        ],
+    )
+    days = [date(2026, 2, 1), date(2026, 2, 3), date(2026, 2, 5), date(2026, 2, 20), date(2026, 2, 2)]
+
+    assert series.align(days, max_lag_days=5) == pytest.approx([None, 0.001, 0.0008, None, 0.001], nan_ok=True)
+    assert series.convert([1_000.0] * 5, days, max_lag_days=5)[1:3] == pytest.approx([1.0, 0.8])
+    with pytest.raises(ValueError):
+        series.convert([1.0], days)
+
+
+def test_convert_values_loads_once_per_pair_and_range_until_new_points_arrive():
+    class FakeRepository:
+        cache_scope = "postgres://fx"
+
+        def __init__(self) -> None:
+            self.window_reads = 0
+            self.latest = "2026-02-20T00:00:00+00:00"
+
+        def read_macro_series_latest_as_of(self, metric_keys):
+            return {"FX_USDKRW": self.latest}
+
+        def read_macro_series_window(self, metric_keys, start, end):
+            self.window_reads += 1
+            assert metric_keys == ["FX_KRWUSD", "FX_USDKRW", "DEXKOUS"]
+            assert start.date() == date(2026, 2, 14)
+            return [{"metric_key": "FX_USDKRW", "as_of": "2026-02-19", "value": 1_000.0}]
+
+    repo = FakeRepository()
+    cache = fx_service.FxRateCache()
+    days = [date(2026, 2, 19), date(2026, 2, 20)]
+
+    first = fx_service.convert_values(repo, [1_000.0, 2_000.0], days, "KRW", "USD", cache=cache)
+    second = fx_service.convert_values(repo, [3_000.0, 4_000.0], days, "KRW", "USD", cache=cache)
+    repo.latest = "2026-02-21T00:00:00+00:00"
+    fx_service.convert_values(repo, [1.0, 1.0], days, "KRW", "USD", cache=cache)
+
+    assert first == pytest.approx([1.0, 2.0])
+    assert second == pytest.approx([3.0, 4.0])
+    assert cache.stats == {"hits": 1, "loads": 2}
+    assert repo.window_reads == 2
+    assert fx_service.convert_values(repo, [5, 6], days, "usd", "USD", cache=cache) == [5.0, 6.0]
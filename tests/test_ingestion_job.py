@@ -135,3 +135,280 @@ def test_ingestion_job_writes_macro_series_points_for_fred_source():
     assert result.dashboard["macro_series_points_written"] == 2
     assert len(repo.macro_series_points) == 2
     assert repo.macro_series_points[-1]["metric_key"] == "UNRATE"
+
+
+def test_ingestion_job_writes_sec_facts_instead_of_a_placeholder():
+    repo = InMemoryRepository()
+    source = SourceDescriptor(
+        name="sec_edgar",
+        utility=5,
+        reliability=5,
+        legal=5,
+        cost=3,
+        maintenance=3,
+    )
+    metrics = BatchMetrics(
+        freshness=True,
+        completeness=True,
+        schema_drift=False,
+        license_ok=True,
+    )
+    payload = {
+        "payload": {
+            "facts": {
+                "us-gaap": {
+                    "NetIncomeLoss": {
+                        "units": {
+                            "USD": [
+                                {"end": "2023-09-30", "val": 96995000000, "filed": "2023-11-03", "frame": "CY2023"},
+                                {"end": "2024-09-28", "val": 93736000000, "filed": "2024-11-01", "frame": "CY2024"},
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+    }
+    rows = [{"entity_id": "0000320193", "available_at": datetime(2026, 1, 2, tzinfo=timezone.utc)}]
+
+    def run():
+        return run_ingestion_job(
+            source=source,
+            metrics=metrics,
+            idempotency_key="sec|AAPL|2026-01-02|r1",
+            payload=payload,
+            rows=rows,
+            decision_time=datetime(2026, 1, 2, tzinfo=timezone.utc),
+            repository=repo,
+        )
+
+    result = run()
+
+    assert result.canonical_written == 1
+    assert result.dashboard["canonical_facts_written"] == 2
+    assert [row["metric_value"] for row in repo.read_canonical_facts("sec_edgar", "us-gaap:NetIncomeLoss")] == [
+        96995000000.0,
+        93736000000.0,
+    ]
+    # Re-ingesting the same payload adds nothing.
+    assert run().dashboard["canonical_facts_written"] == 0
+    assert len(repo.canonical_events) == 2
+
+
+def test_ingestion_job_skips_unchanged_payload_on_the_same_repository():
+    repo = InMemoryRepository()
+    source = SourceDescriptor(
+        name="fred",
+        utility=5,
+        reliability=5,
+        legal=5,
+        cost=3,
+        maintenance=3,
+    )
+    metrics = BatchMetrics(
+        freshness=True,
+        completeness=True,
+        schema_drift=False,
+        license_ok=True,
+    )
+    rows = [{"entity_id": "UNRATE", "available_at": datetime(2026, 1, 2, tzinfo=timezone.utc)}]
+
+    def run(observations):
+        return run_ingestion_job(
+            source=source,
+            metrics=metrics,
+            idempotency_key="fred|UNRATE|2026-01-02|manual",
+            payload={"payload": {"observations": observations}},
+            rows=rows,
+            decision_time=datetime(2026, 1, 2, tzinfo=timezone.utc),
+            repository=repo,
+        )
+
+    first = run([{"date": "2025-12-01", "value": "4.4"}])
+    repeat = run([{"date": "2025-12-01", "value": "4.4"}])
+    revised = run([{"date": "2025-12-01", "value": "4.5"}])
+
+    assert first.skipped_unchanged is False
+    assert repeat.skipped_unchanged is True
+    assert (repeat.raw_written, repeat.canonical_written) == (0, 0)
+    assert repeat.dashboard["macro_series_points_written"] == 0
+    assert revised.skipped_unchanged is False
+    assert len(repo.raw_events) == 2
+    assert len(repo.payload_revisions["fred|UNRATE|2026-01-02|manual"]) == 2
+
+
+def test_ingestion_job_skips_unchanged_payload_on_a_later_day_by_revision_key():
+    repo = InMemoryRepository()
+    source = SourceDescriptor(
+        name="fred",
+        utility=5,
+        reliability=5,
+        legal=5,
+        cost=3,
+        maintenance=3,
+    )
+    metrics = BatchMetrics(
+        freshness=True,
+        completeness=True,
+        schema_drift=False,
+        license_ok=True,
+    )
+
+    def run(day):
+        return run_ingestion_job(
+            source=source,
+            metrics=metrics,
+            idempotency_key=f"fred|UNRATE|{day}|manual",
+            payload={"payload": {"observations": [{"date": "2025-12-01", "value": "4.4"}]}},
+            rows=[{"entity_id": "UNRATE", "available_at": datetime(2026, 1, 2, tzinfo=timezone.utc)}],
+            decision_time=datetime(2026, 1, 3, tzinfo=timezone.utc),
+            repository=repo,
+            revision_key="fred|UNRATE",
+        )
+
+    assert run("2026-01-02").skipped_unchanged is False
+    assert run("2026-01-03").skipped_unchanged is True
+    assert len(repo.raw_events) == 1
+    assert list(repo.payload_revisions) == ["fred|UNRATE"]
+
+
+
+def test_ingestion_job_ignores_fred_realtime_stamps_when_comparing_revisions():
+    repo = InMemoryRepository()
+    source = SourceDescriptor(
+        name="fred",
+        utility=5,
+        reliability=5,
+        legal=5,
+        cost=3,
+        maintenance=3,
+    )
+    metrics = BatchMetrics(
+        freshness=True,
+        completeness=True,
+        schema_drift=False,
+        license_ok=True,
+    )
+
+    def run(day):
+        observations = [
+            {"realtime_start": day, "realtime_end": day, "date": "2025-12-01", "value": "4.4"},
+        ]
+        return run_ingestion_job(
+            source=source,
+            metrics=metrics,
+            idempotency_key=f"fred|UNRATE|{day}|manual",
+            payload={
+                "source": "fred",
+                "entity_id": "UNRATE",
+                "payload": {"realtime_start": day, "realtime_end": day, "observations": observations},
+            },
+            rows=[{"entity_id": "UNRATE", "available_at": datetime(2026, 1, 2, tzinfo=timezone.utc)}],
+            decision_time=datetime(2026, 1, 3, tzinfo=timezone.utc),
+            repository=repo,
+            revision_key="fred|UNRATE",
+        )
+
+    first = run("2026-01-02")
+    second = run("2026-01-03")
+
+    assert first.skipped_unchanged is False
+    assert second.skipped_unchanged is True
+    assert (second.raw_written, second.dashboard["macro_series_points_written"]) == (0, 0)
+    assert len(repo.raw_events) == 1
+    assert len(repo.payload_revisions["fred|UNRATE"]) == 1
+
+def test_ingestion_job_does_not_record_quarantined_payloads():
+    repo = InMemoryRepository()
+    source = SourceDescriptor(
+        name="edgar",
+        utility=5,
+        reliability=5,
+        legal=5,
+        cost=3,
+        maintenance=3,
+    )
+    metrics = BatchMetrics(
+        freshness=False,
+        completeness=True,
+        schema_drift=False,
+        license_ok=True,
+    )
+
+    for _ in range(2):
+        result = run_ingestion_job(
+            source=source,
+            metrics=metrics,
+            idempotency_key="edgar|AAPL|2026-01-01|r1",
+            payload={"eps": 1.2},
+            rows=[],
+            decision_time=datetime(2026, 1, 2, tzinfo=timezone.utc),
+            repository=repo,
+        )
+        assert result.quarantined == 1
+
+    assert repo.payload_revisions == {}
+
+
+def test_ingestion_job_profiles_batch_when_metrics_are_not_given():
+    repo = InMemoryRepository()
+    source = SourceDescriptor(
+        name="fred",
+        utility=5,
+        reliability=5,
+        legal=5,
+        cost=3,
+        maintenance=3,
+    )
+    months = [f"2025-{month:02d}-01" for month in range(1, 13)]
+
+    def run(observations, decision_time):
+        return run_ingestion_job(
+            source=source,
+            metrics=None,
+            idempotency_key=f"fred|UNRATE|{decision_time.date().isoformat()}|manual",
+            payload={"payload": {"observations": observations}},
+            rows=[{"entity_id": "UNRATE", "available_at": decision_time}],
+            decision_time=decision_time,
+            repository=repo,
+        )
+
+    fresh = run([{"date": month, "value": "4.4"} for month in months], datetime(2026, 1, 20, tzinfo=timezone.utc))
+    stale = run([{"date": month, "value": "4.5"} for month in months], datetime(2026, 6, 1, tzinfo=timezone.utc))
+
+    assert fresh.canonical_written == 1
+    assert fresh.dashboard["macro_series_points_written"] == 12
+    assert fresh.quality.cadence == "monthly"
+    assert fresh.quality.metrics.freshness is True
+    assert stale.quarantined == 1
+    assert stale.quality.metrics.freshness is False
+    assert repo.quarantine_events[-1]["reason"] == "quality_gate_failed"
+    assert "fred" in repo.source_schemas
+
+
+def test_ingestion_job_does_not_accept_the_schema_of_a_quarantined_batch():
+    repo = InMemoryRepository()
+    source = SourceDescriptor(
+        name="fred",
+        utility=5,
+        reliability=5,
+        legal=5,
+        cost=3,
+        maintenance=3,
+    )
+    months = [f"2025-{month:02d}-01" for month in range(1, 13)]
+    decision_time = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+    result = run_ingestion_job(
+        source=source,
+        metrics=None,
+        idempotency_key="fred|UNRATE|2026-06-01|manual",
+        payload={"payload": {"observations": [{"date": month, "value": 4.5} for month in months]}},
+        rows=[{"entity_id": "UNRATE", "available_at": decision_time}],
+        decision_time=decision_time,
+        repository=repo,
+    )
+
+    assert result.quarantined == 1
+    assert "fred" not in repo.source_schemas
+
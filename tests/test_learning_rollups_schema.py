@@ -0,0 +1,25 @@
+from pathlib import Path
+
+
+def test_learning_rollups_migration_maintains_rollups_on_insert():
+    sql = Path("migrations/015_learning_rollups.sql").read_text(encoding="utf-8")
+
+    for table in ["learning_forecast_rollup", "learning_realization_rollup", "forecast_error_category_rollup"]:
+        assert f"CREATE TABLE IF NOT EXISTS {table}" in sql
+    for source_table in ["forecast_records", "realization_records", "forecast_error_attributions"]:
+        assert f"AFTER INSERT ON {source_table}" in sql
+    assert "PRIMARY KEY (horizon, category, day)" in sql
+    assert "FOR EACH ROW" not in sql
+
+
+def test_learning_rollup_changes_migration_recomputes_touched_keys_on_update_and_delete():
+    sql = Path("migrations/021_learning_rollup_changes.sql").read_text(encoding="utf-8")
+
+    for source_table in ["forecast_records", "realization_records", "forecast_error_attributions"]:
+        assert f"AFTER UPDATE ON {source_table}\nREFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows" in sql
+        assert f"AFTER DELETE ON {source_table}\nREFERENCING OLD TABLE AS old_rows" in sql
+        assert f"AFTER TRUNCATE ON {source_table}" in sql
+    for table in ["learning_forecast_rollup", "learning_realization_rollup", "forecast_error_category_rollup"]:
+        assert f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE" in sql
+    assert "o.horizon IS DISTINCT FROM n.horizon OR o.as_of IS DISTINCT FROM n.as_of" in sql
+    assert "FOR EACH ROW" not in sql
@@ -1,3 +1,4 @@
+from array import array
 from datetime import datetime, timezone
 import importlib
 
@@ -94,3 +95,246 @@ def test_postgres_repository_reads_macro_series_points():
 
     assert "FROM macro_series_points" in cursor.executed[0][0]
     assert rows[0]["metric_key"] == "CPIAUCSL"
+
+
+class FetchOneCursor(FakeCursor):
+    def __init__(self, fetch_one_rows=None):
+        super().__init__()
+        self.fetch_one_rows = list(fetch_one_rows or [])
+
+    def fetchone(self):
+        return self.fetch_one_rows.pop(0) if self.fetch_one_rows else None
+
+
+def _benchmark_rows(levels_by_day):
+    return [
+        {"as_of": datetime.fromisoformat(f"{day}T00:00:00+00:00"), "value": value}
+        for day, value in sorted(levels_by_day.items(), reverse=True)
+    ]
+
+
+def test_write_macro_series_points_refreshes_benchmark_nav_for_component_points():
+    cursor = FetchOneCursor(
+        fetch_one_rows=[
+            (datetime(2026, 2, 20, tzinfo=timezone.utc),),
+            (datetime(2026, 2, 19, tzinfo=timezone.utc),),
+            (None,),
+        ]
+    )
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+    refreshed = []
+    repo.refresh_benchmark_nav_daily = lambda since=None: refreshed.append(since)
+
+    point = dict(
+        source="fred",
+        entity_id="x",
+        available_at=datetime(2026, 2, 21, tzinfo=timezone.utc),
+        value=1.0,
+        lineage_id="lin-1",
+    )
+    repo.write_macro_series_points(
+        [
+            NormalizedSeriesPoint(metric_key="CPIAUCSL", as_of=datetime(2026, 1, 1, tzinfo=timezone.utc), **point),
+            NormalizedSeriesPoint(metric_key="QQQ", as_of=datetime(2026, 2, 20, tzinfo=timezone.utc), **point),
+            NormalizedSeriesPoint(metric_key="BTC", as_of=datetime(2026, 2, 19, tzinfo=timezone.utc), **point),
+        ]
+    )
+    repo.write_macro_series_points(
+        [NormalizedSeriesPoint(metric_key="CPIAUCSL", as_of=datetime(2026, 1, 1, tzinfo=timezone.utc), **point)]
+    )
+    # An unchanged re-pull of a component inserts its rows but changes no benchmark day.
+    repo.write_macro_series_points(
+        [NormalizedSeriesPoint(metric_key="QQQ", as_of=datetime(2026, 2, 20, tzinfo=timezone.utc), **point)]
+    )
+
+    assert [str(day) for day in refreshed] == ["2026-02-19"]
+    assert "IS DISTINCT FROM i.value" in cursor.executed[-1][0]
+
+
+def test_write_macro_series_points_logs_a_failed_benchmark_refresh(caplog):
+    cursor = FetchOneCursor(fetch_one_rows=[(datetime(2026, 2, 20, tzinfo=timezone.utc),)])
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    def failing_refresh(since=None):
+        raise RuntimeError("benchmark_nav_daily missing")
+
+    repo.refresh_benchmark_nav_daily = failing_refresh
+    point = NormalizedSeriesPoint(
+        source="fred",
+        entity_id="QQQ",
+        metric_key="QQQ",
+        as_of=datetime(2026, 2, 20, tzinfo=timezone.utc),
+        available_at=datetime(2026, 2, 21, tzinfo=timezone.utc),
+        value=1.0,
+        lineage_id="lin-1",
+    )
+
+    with caplog.at_level("WARNING", logger="src.ingestion.postgres_repository"):
+        assert repo.write_macro_series_points([point]) == 1
+
+    assert "benchmark_nav_daily refresh failed" in caplog.text
+
+
+def test_refresh_benchmark_nav_daily_continues_from_stored_base_day(monkeypatch):
+    for env_name in ("BENCHMARK_WEIGHT_QQQ", "BENCHMARK_WEIGHT_KOSPI200", "BENCHMARK_WEIGHT_BTC", "BENCHMARK_WEIGHT_SGOV"):
+        monkeypatch.delenv(env_name, raising=False)
+    version = "QQQ=0.450000,KOSPI200=0.250000,BTC=0.200000,SGOV=0.100000"
+    base_day = datetime(2026, 2, 19).date()
+    cursor = FetchOneCursor([(base_day, 1.5, version)])
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+    tail_reads = []
+
+    def read_since(metric_key, since, limit=10000):
+        tail_reads.append((metric_key, since.date().isoformat()))
+        return _benchmark_rows({"2026-02-19": 100.0, "2026-02-20": 110.0})
+
+    repo.read_macro_series_points_since = read_since
+    repo.read_macro_series_points = lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("full read"))
+
+    result = repo.refresh_benchmark_nav_daily(since=datetime(2026, 2, 20).date())
+
+    assert result["mode"] == "incremental"
+    assert result["rows_written"] == 1
+    assert tail_reads[0] == ("QQQ", "2026-02-08")
+    delete_sql, delete_params = cursor.executed[1]
+    assert "DELETE FROM benchmark_nav_daily" in delete_sql
+    assert str(delete_params[0]) == "2026-02-20"
+    insert_sql, insert_params = cursor.executed[2]
+    assert "unnest(" in insert_sql
+    assert insert_params[0] == version
+    assert [str(day) for day in insert_params[1]] == ["2026-02-20"]
+    assert abs(insert_params[6][0] - 0.10) < 1e-12
+    assert abs(insert_params[7][0] - 1.65) < 1e-12
+
+
+def test_refresh_benchmark_nav_daily_rebuilds_when_weights_changed(monkeypatch):
+    monkeypatch.setenv("BENCHMARK_WEIGHT_QQQ", "1.0")
+    cursor = FetchOneCursor([(datetime(2026, 2, 19).date(), 1.5, "QQQ=0.450000,stale")])
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+    repo.read_macro_series_points = lambda metric_key, limit=100: _benchmark_rows(
+        {"2026-02-18": 100.0, "2026-02-19": 100.0, "2026-02-20": 110.0}
+    )
+
+    result = repo.refresh_benchmark_nav_daily(since=datetime(2026, 2, 20).date())
+
+    assert result["mode"] == "rebuild"
+    assert result["rows_written"] == 2
+    insert_params = cursor.executed[2][1]
+    assert [str(day) for day in insert_params[1]] == ["2026-02-19", "2026-02-20"]
+    assert abs(insert_params[7][-1] - 1.10) < 1e-12
+
+
+def test_write_macro_series_points_inserts_a_block_in_one_columnar_statement():
+    cursor = FetchOneCursor(fetch_one_rows=[(datetime(2026, 2, 20, tzinfo=timezone.utc),)])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+    refreshed = []
+    repo.refresh_benchmark_nav_daily = lambda since=None: refreshed.append(since)
+    first = datetime(2026, 2, 19, tzinfo=timezone.utc).timestamp()
+    block = contracts.SeriesBlock(
+        source="fred",
+        entity_id="QQQ",
+        metric_key="QQQ",
+        available_at=datetime(2026, 2, 21, tzinfo=timezone.utc),
+        lineage_id="lin-1",
+        as_of_epoch=array("d", [first, first + 86_400]),
+        values=array("d", [100.0, 101.0]),
+    )
+
+    written = repo.write_macro_series_points([block])
+
+    assert written == 2
+    assert len(cursor.executed) == 1
+    sql, params = cursor.executed[0]
+    assert "to_timestamp(u.as_of)" in sql
+    assert params[0] == [first, first + 86_400]
+    assert params[1] == [100.0, 101.0]
+    assert params[2:5] == ("fred", "QQQ", "QQQ")
+    # Only the day that differs from the stored series is refreshed, not the block start.
+    assert [str(day) for day in refreshed] == ["2026-02-20"]
+
+
+def test_postgres_repository_writes_canonical_facts_in_one_statement():
+    cursor = FakeCursor(fetch_rows=[(11,)])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+    fact = contracts.CanonicalFact(
+        source="sec_edgar",
+        entity_id="0000320193",
+        metric_name="us-gaap:Revenues",
+        as_of=datetime(2024, 9, 28, tzinfo=timezone.utc),
+        available_at=datetime(2024, 11, 1, tzinfo=timezone.utc),
+        metric_value=391035000000.0,
+        lineage_id="sec|AAPL|r1",
+    )
+
+    written = repo.write_canonical_facts([fact, fact])
+
+    assert written == 1
+    assert len(cursor.executed) == 1
+    sql, params = cursor.executed[0]
+    assert "INSERT INTO canonical_fact_store" in sql
+    # Compared with the newest row for the period only, so A -> B -> A stores the final A.
+    assert "ORDER BY c.available_at DESC, c.id DESC" in sql
+    assert "IS DISTINCT FROM f.metric_value" in sql
+    assert params[2] == ["us-gaap:Revenues", "us-gaap:Revenues"]
+    assert params[5] == [391035000000.0, 391035000000.0]
+    assert conn.committed is True
+    assert repo.write_canonical_facts([]) == 0
+
+
+def test_in_memory_canonical_facts_keep_a_restatement_back_to_an_earlier_value():
+    repo = importlib.import_module("src.ingestion.repository").InMemoryRepository()
+
+    def fact(value):
+        return contracts.CanonicalFact(
+            source="sec_edgar",
+            entity_id="0000320193",
+            metric_name="us-gaap:Revenues",
+            as_of=datetime(2024, 9, 28, tzinfo=timezone.utc),
+            available_at=datetime(2024, 11, 1, tzinfo=timezone.utc),
+            metric_value=value,
+            lineage_id="sec|AAPL|r1",
+        )
+
+    assert [repo.write_canonical_facts([fact(value)]) for value in (1.0, 2.0, 1.0, 1.0)] == [1, 1, 1, 0]
+    assert repo.read_canonical_facts("sec_edgar", "us-gaap:Revenues", limit=1)[0]["metric_value"] == 1.0
+
+
+def test_read_canonical_facts_filters_by_entity():
+    cursor = FakeCursor()
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    repo.read_canonical_facts("opendart", "IS:ifrs-full_Revenue", limit=4, entity_id="00126380")
+
+    sql, params = cursor.executed[0]
+    assert "DISTINCT ON (entity_id, as_of)" in sql
+    assert params == ("opendart", "IS:ifrs-full_Revenue", "00126380", "00126380", 4)
+
+
+def test_put_payload_revision_appends_next_revision_in_one_insert():
+    class RevisionCursor(FakeCursor):
+        def __init__(self, fetch_one_rows):
+            super().__init__()
+            self.fetch_one_rows = list(fetch_one_rows)
+
+        def fetchone(self):
+            return self.fetch_one_rows.pop(0)
+
+    cursor = RevisionCursor([(2,)])
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    result = repo.put_payload_revision("fred|UNRATE|2026-01-02|manual", "a" * 64)
+
+    sql, params = cursor.executed[0]
+    assert "INSERT INTO payload_revisions" in sql
+    assert "ON CONFLICT (idempotency_key, revision_number) DO NOTHING" in sql
+    assert params == ("fred|UNRATE|2026-01-02|manual", "fred|UNRATE|2026-01-02|manual", "a" * 64, "a" * 64)
+    assert (result.status, result.revision_number) == ("revision", 2)
+
+    # Nothing inserted and the newest row already has this hash: a noop.
+    cursor = RevisionCursor([None, (3, "b" * 64)])
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+    result = repo.put_payload_revision("fred|UNRATE|2026-01-02|manual", "b" * 64)
+    assert (result.status, result.revision_number) == ("noop", 3)
@@ -58,3 +58,25 @@ def test_manual_runner_returns_status_and_counts():
     assert summary["canonical_written"] == 1
     assert len(run_history_repo.records) == 1
     assert run_history_repo.records[0]["status"] == "success"
+
+
+def test_manual_runner_reports_profiled_quality_reasons_on_quarantine():
+    summary = run_manual_update(
+        source=SourceDescriptor(
+            name="fred",
+            utility=5,
+            reliability=5,
+            legal=5,
+            cost=3,
+            maintenance=3,
+        ),
+        metrics=None,
+        idempotency_key="fred|UNRATE|2026-02-18|manual",
+        payload={"payload": {"error_code": 400, "error_message": "Bad Request."}},
+        rows=[{"entity_id": "UNRATE", "available_at": datetime(2026, 2, 18, tzinfo=timezone.utc)}],
+        decision_time=datetime(2026, 2, 18, 1, 0, tzinfo=timezone.utc),
+        repository=InMemoryRepository(),
+    )
+
+    assert summary["status"] == "quarantine"
+    assert summary["error_message"] == "fred error: Bad Request.; no points"
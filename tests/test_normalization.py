@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 import importlib
 
+contracts = importlib.import_module("src.research.contracts")
 normalization = importlib.import_module("src.research.normalization")
 
 
@@ -87,3 +88,217 @@ def test_normalize_payload_unsupported_source_returns_empty():
     )
 
     assert points == []
+
+
+def test_normalize_payload_blocks_emits_one_columnar_block_per_metric():
+    blocks = normalization.normalize_payload_blocks(
+        source="ecos",
+        payload={
+            "payload": {
+                "StatisticSearch": {
+                    "row": [
+                        {"TIME": "20240103", "DATA_VALUE": "1300.5", "ITEM_NAME1": "KRW_USD"},
+                        {"TIME": "20240102", "DATA_VALUE": "1290.0", "ITEM_NAME1": "KRW_USD"},
+                        {"TIME": "20240102", "DATA_VALUE": "940.0", "ITEM_NAME1": "KRW_JPY"},
+                    ]
+                }
+            }
+        },
+        entity_id="731Y001",
+        available_at=datetime(2026, 2, 18, tzinfo=timezone.utc),
+        lineage_id="lin-5",
+    )
+
+    assert [(block.metric_key, len(block)) for block in blocks] == [("KRW_USD", 2), ("KRW_JPY", 1)]
+    usd = blocks[0]
+    assert usd.as_of_epoch.typecode == "d" and usd.values.typecode == "d"
+    assert list(usd.values) == [1290.0, 1300.5]
+    assert usd.as_of_epoch[0] == datetime(2024, 1, 2, tzinfo=timezone.utc).timestamp()
+
+    # The compatibility iterator yields the same points the point normalizer returns.
+    points = list(contracts.iter_series_points(blocks))
+    assert points == normalization.normalize_payload(
+        source="ecos",
+        payload={
+            "StatisticSearch": {
+                "row": [
+                    {"TIME": "20240103", "DATA_VALUE": "1300.5", "ITEM_NAME1": "KRW_USD"},
+                    {"TIME": "20240102", "DATA_VALUE": "1290.0", "ITEM_NAME1": "KRW_USD"},
+                    {"TIME": "20240102", "DATA_VALUE": "940.0", "ITEM_NAME1": "KRW_JPY"},
+                ]
+            }
+        },
+        entity_id="731Y001",
+        available_at=datetime(2026, 2, 18, tzinfo=timezone.utc),
+        lineage_id="lin-5",
+    )
+    assert [p.as_of.day for p in points] == [2, 2, 3]
+    assert all(p.lineage_id == "lin-5" and p.source == "ecos" for p in points)
+
+
+
+def test_canonical_facts_from_blocks_names_series_the_same_whatever_the_item_count():
+    def facts_for(source, payload, entity_id):
+        blocks = normalization.normalize_payload_blocks(
+            source=source,
+            payload={"payload": payload},
+            entity_id=entity_id,
+            available_at=datetime(2026, 2, 18, tzinfo=timezone.utc),
+            lineage_id="lin-6",
+        )
+        return {fact.metric_name for fact in normalization.canonical_facts_from_blocks(blocks)}
+
+    usd = {"TIME": "20240102", "DATA_VALUE": "1290.0", "ITEM_NAME1": "KRW_USD"}
+    jpy = {"TIME": "20240102", "DATA_VALUE": "940.0", "ITEM_NAME1": "KRW_JPY"}
+
+    assert facts_for("ecos", {"StatisticSearch": {"row": [usd]}}, "731Y001") == {"731Y001:KRW_USD"}
+    assert facts_for("ecos", {"StatisticSearch": {"row": [usd, jpy]}}, "731Y001") == {
+        "731Y001:KRW_USD",
+        "731Y001:KRW_JPY",
+    }
+    assert facts_for("fred", {"observations": [{"date": "2024-01-01", "value": "3.1"}]}, "CPIAUCSL") == {"CPIAUCSL"}
+
+def test_series_blocks_from_points_round_trips_loose_points():
+    point = contracts.NormalizedSeriesPoint(
+        source="fred",
+        entity_id="DGS10",
+        metric_key="DGS10",
+        as_of=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        available_at=datetime(2024, 1, 3, tzinfo=timezone.utc),
+        value=4.0,
+        lineage_id="lin-6",
+    )
+    earlier = contracts.NormalizedSeriesPoint(**{**point.__dict__, "as_of": datetime(2024, 1, 1, tzinfo=timezone.utc)})
+
+    blocks = contracts.series_blocks_from_points([point, earlier])
+
+    assert len(blocks) == 1
+    assert list(blocks[0]) == [earlier, point]
+
+
+def test_date_column_parser_matches_generic_parser_for_every_shape():
+    values = [
+        "2024-01-02",
+        "2024-02-30",
+        "20240102",
+        "20241301",
+        "202401",
+        "202413",
+        "2024-03",
+        "2024",
+        "0000",
+        "2024Q3",
+        "2024-q1",
+        " 2024-01-02",
+        "2024-01-02T09:30:00+09:00",
+        "not-a-date",
+        "",
+        None,
+        datetime(2024, 1, 2),
+    ]
+    for first in values:
+        normalization._DATE_CACHE.clear()
+        parse = normalization.DateColumnParser()
+        parse(first)
+        for value in values:
+            assert parse(value) == normalization._parse_datetime(value), (first, value)
+
+
+def test_date_parsing_benchmark_runs_on_a_small_payload():
+    bench = importlib.import_module("scripts.bench_date_parsing")
+
+    results = bench.run_benchmark(rows=200, repeat=1)
+
+    assert set(results) == {"fred_daily", "ecos_monthly"}
+    assert results["ecos_monthly"]["rows"] == 200
+
+
+def test_normalize_sec_companyfacts_keeps_one_fact_per_frame():
+    available_at = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    payload = {
+        "cik": 320193,
+        "facts": {
+            "us-gaap": {
+                "Revenues": {
+                    "units": {
+                        "USD": [
+                            {"end": "2024-12-28", "val": 124300000000, "filed": "2025-01-31", "frame": "CY2024Q4"},
+                            {"end": "2024-09-28", "val": 391035000000, "filed": "2024-11-01", "frame": "CY2024"},
+                            # Comparative repeated in a later filing: no frame, dropped.
+                            {"end": "2024-09-28", "val": 391035000000, "filed": "2025-10-31"},
+                        ]
+                    }
+                },
+                "EarningsPerShareDiluted": {
+                    "units": {"USD/shares": [{"end": "2024-09-28", "val": 6.08, "filed": "2024-11-01", "frame": "CY2024"}]}
+                },
+            },
+            "dei": {"EntityCommonStockSharesOutstanding": {"units": {"shares": [{"end": "2024-10-18", "val": 1}]}}},
+        },
+    }
+
+    facts = normalization.normalize_canonical_facts(
+        source="sec_edgar",
+        payload={"payload": payload},
+        entity_id="0000320193",
+        available_at=available_at,
+        lineage_id="sec|AAPL|r1",
+    )
+
+    assert [(fact.metric_name, fact.as_of.date().isoformat(), fact.metric_value) for fact in facts] == [
+        ("us-gaap:EarningsPerShareDiluted:USD/shares", "2024-09-28", 6.08),
+        ("us-gaap:Revenues", "2024-09-28", 391035000000.0),
+        ("us-gaap:Revenues:quarterly", "2024-12-28", 124300000000.0),
+    ]
+    assert facts[1].available_at == datetime(2024, 11, 1, tzinfo=timezone.utc)
+    assert {fact.entity_id for fact in facts} == {"0000320193"}
+
+
+def test_normalize_opendart_accounts_emits_current_and_prior_periods():
+    payload = {
+        "status": "000",
+        "list": [
+            {
+                "rcept_no": "20240312000736",
+                "bsns_year": "2023",
+                "corp_code": "00126380",
+                "sj_div": "IS",
+                "fs_div": "CFS",
+                "account_id": "ifrs-full_Revenue",
+                "account_nm": "매출액",
+                "thstrm_dt": "2023.01.01 ~ 2023.12.31",
+                "thstrm_amount": "258,935,494,000,000",
+                "frmtrm_dt": "2022.01.01 ~ 2022.12.31",
+                "frmtrm_amount": "302,231,360,000,000",
+            },
+            {
+                "rcept_no": "20240312000736",
+                "bsns_year": "2023",
+                "corp_code": "00126380",
+                "sj_div": "BS",
+                "fs_div": "OFS",
+                "account_id": "-표준계정코드 미사용-",
+                "account_nm": "기타자산",
+                "thstrm_dt": "2023.12.31 현재",
+                "thstrm_amount": "-",
+            },
+        ],
+    }
+
+    facts = normalization.normalize_canonical_facts(
+        source="opendart",
+        payload=payload,
+        entity_id="005930",
+        available_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        lineage_id="dart|005930|r1",
+    )
+
+    assert [(fact.metric_name, fact.as_of.date().isoformat(), fact.metric_value) for fact in facts] == [
+        ("IS:ifrs-full_Revenue", "2022-12-31", 302231360000000.0),
+        ("IS:ifrs-full_Revenue", "2023-12-31", 258935494000000.0),
+    ]
+    assert facts[0].entity_id == "00126380"
+    assert facts[0].available_at == datetime(2024, 3, 12, tzinfo=timezone.utc)
+    assert normalization.normalize_canonical_facts(
+        "opendart", {"status": "000", "corp_name": "삼성전자"}, "005930", datetime(2026, 2, 1, tzinfo=timezone.utc), "x"
+    ) == []
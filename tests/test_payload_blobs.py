@@ -0,0 +1,51 @@
+import hashlib
+import importlib
+import json
+from datetime import date
+
+
+payload_blobs = importlib.import_module("src.ingestion.payload_blobs")
+
+
+def _one_shot(payload):
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def test_streaming_canonical_bytes_match_one_shot_encoding():
+    payload = {
+        "z": [{"b": 1, "a": "한글"} for _ in range(700)],
+        "a": {"nested": {"y": (1, 2.5, None), "x": True}, "empty": {}, "codes": {3: "x", 1: "y"}},
+        "long": tuple(range(1000)),
+        "as_of": date(2026, 1, 2),
+    }
+
+    raw = payload_blobs.canonical_payload_bytes(payload)
+
+    assert raw == _one_shot(payload)
+    assert payload_blobs.canonical_payload_hash(payload) == hashlib.sha256(raw).hexdigest()
+    body, byte_size = payload_blobs.compress_payload(payload)
+    assert byte_size == len(raw)
+    assert payload_blobs.decode_payload(body) == json.loads(raw)
+
+
+def test_hashed_payload_computes_its_hash_once(monkeypatch):
+    calls = []
+    original = payload_blobs._stream_payload_hash
+    monkeypatch.setattr(
+        payload_blobs, "_stream_payload_hash", lambda payload: calls.append(1) or original(payload)
+    )
+    wrapped = payload_blobs.HashedPayload({"eps": 1.2})
+
+    hashes = {payload_blobs.canonical_payload_hash(wrapped) for _ in range(3)}
+
+    assert hashes == {hashlib.sha256(b'{"eps":1.2}').hexdigest()}
+    assert len(calls) == 1
+    assert dict(wrapped) == {"eps": 1.2}
+
+
+def test_payload_hashing_benchmark_runs_on_a_small_payload():
+    bench = importlib.import_module("scripts.bench_payload_hashing")
+
+    results = bench.run_benchmark(tags=5, entries=4, repeat=1)
+
+    assert set(results) >= {"one_shot_ms", "streaming_ms", "streaming_peak_mb", "job_three_sites_memoized_ms"}
@@ -9,7 +9,7 @@ performance_service = importlib.import_module("src.enduser.performance_service")
 def test_build_performance_view_returns_empty_metrics_when_no_snapshots(monkeypatch):
     class EmptyRepository:
         def read_portfolio_snapshots(self, limit: int = 365):
-            assert limit == 365
+            assert limit == performance_service.DEFAULT_PERFORMANCE_SNAPSHOT_LIMIT
             return []
 
     monkeypatch.setattr(performance_service, "compute_benchmark_series", lambda repository, start_date, end_date: [])
@@ -36,7 +36,7 @@ def test_build_performance_view_returns_empty_metrics_when_no_snapshots(monkeypa
 def test_build_performance_view_computes_total_return_mdd_sharpe_and_alpha(monkeypatch):
     class FakeRepository:
         def read_portfolio_snapshots(self, limit: int = 365):
-            assert limit == 365
+            assert limit == performance_service.DEFAULT_PERFORMANCE_SNAPSHOT_LIMIT
             # Repository returns newest-first; service should normalize to chronological order.
             return [
                 {
@@ -160,3 +160,58 @@ def test_build_performance_view_respects_leverage_cap_override(monkeypatch):
     assert view["leverage_weight_pct"] == pytest.approx(18.0)
     assert view["leverage_cap_pct"] == pytest.approx(15.0)
     assert view["leverage_cap_breached"] is True
+
+
+def test_build_performance_view_downsamples_chart_series_for_long_history(monkeypatch):
+    from datetime import date, timedelta
+
+    start = date(2020, 1, 1)
+
+    class LongHistoryRepository:
+        def read_portfolio_snapshots(self, limit: int = 365):
+            return [
+                {"as_of": (start + timedelta(days=idx)).isoformat(), "nav": 100 + (idx % 97) + idx * 0.05}
+                for idx in range(2500)
+            ]
+
+    monkeypatch.setenv("CHART_MAX_POINTS", "300")
+    monkeypatch.setattr(performance_service, "compute_benchmark_series", lambda repository, start_date, end_date: [])
+
+    view = performance_service.build_performance_view(LongHistoryRepository())
+
+    assert len(view["nav_series"]) == 2500
+    chart = view["chart_series"]
+    assert 3 <= len(chart) <= 310
+    assert chart[0]["as_of"] == view["nav_series"][0]["as_of"]
+    assert chart[-1]["as_of"] == view["nav_series"][-1]["as_of"]
+    assert chart[0]["portfolio_nav_index"] == pytest.approx(100.0)
+
+
+def test_build_performance_view_restates_nav_in_display_currency(monkeypatch):
+    fx_service = importlib.import_module("src.enduser.fx_service")
+
+    class FakeRepository:
+        def read_portfolio_snapshots(self, limit: int = 365):
+            return [
+                {"as_of": "2026-01-03", "nav": 100},
+                {"as_of": "2026-01-02", "nav": 100},
+                {"as_of": "2026-01-01", "nav": 100},
+            ]
+
+        def read_macro_series_window(self, metric_keys, start, end):
+            return [
+                {"metric_key": "FX_USDKRW", "as_of": "2026-01-02", "value": 1_000.0},
+                {"metric_key": "FX_USDKRW", "as_of": "2026-01-03", "value": 1_100.0},
+            ]
+
+    monkeypatch.setenv("PERFORMANCE_CURRENCY", "KRW")
+    monkeypatch.setattr(fx_service, "FX_RATE_CACHE", fx_service.FxRateCache())
+    monkeypatch.setattr(performance_service, "compute_benchmark_series", lambda repository, start_date, end_date: [])
+
+    view = performance_service.build_performance_view(FakeRepository())
+
+    assert view["currency"] == "KRW"
+    # 2026-01-01 has no rate on or before it and is dropped.
+    assert [row["nav"] for row in view["nav_series"]] == pytest.approx([100_000.0, 110_000.0])
+    assert view["total_return_pct"] == pytest.approx(10.0)
+    assert performance_service.build_performance_view(FakeRepository(), currency="USD")["total_return_pct"] == 0.0
@@ -0,0 +1,11 @@
+from pathlib import Path
+
+
+def test_portfolio_positions_migration_keys_holdings_by_day_and_symbol():
+    sql = Path("migrations/017_portfolio_positions.sql").read_text(encoding="utf-8")
+
+    assert "CREATE TABLE IF NOT EXISTS portfolio_positions" in sql
+    assert "UNIQUE (as_of, symbol)" in sql
+    for column in ["quantity NUMERIC", "currency TEXT", "asset_class TEXT", "region TEXT", "is_leveraged BOOLEAN"]:
+        assert column in sql
+    assert "ON portfolio_positions (as_of DESC)" in sql
@@ -0,0 +1,95 @@
+import math
+from datetime import date
+
+from src.ingestion.portfolio_valuation import (
+    EXPOSURE_METRIC_ALT,
+    EXPOSURE_METRIC_BTC_ETH,
+    EXPOSURE_METRIC_LEVERAGE,
+    plan_valuation_series,
+    value_positions,
+)
+from src.ingestion.realization_evaluator import build_price_series
+
+
+def _series(points):
+    return build_price_series(
+        [{"metric_key": key, "as_of": f"{day}T00:00:00+00:00", "value": value} for key, day, value in points]
+    )
+
+
+POSITIONS = [
+    {"as_of": "2026-02-20", "symbol": "QQQ", "quantity": 10, "currency": "USD", "asset_class": "etf", "region": "US"},
+    {
+        "as_of": "2026-02-20",
+        "symbol": "KODEX200",
+        "quantity": 100,
+        "currency": "KRW",
+        "asset_class": "etf",
+        "region": "KR",
+        "price_series_key": "KOSPI200",
+    },
+    {"as_of": "2026-02-20", "symbol": "BTC", "quantity": 0.01, "currency": "USD", "asset_class": "crypto", "region": "CRYPTO"},
+    {"as_of": "2026-02-20", "symbol": "SOL", "quantity": 2, "currency": "USD", "asset_class": "crypto", "region": "CRYPTO"},
+    {
+        "as_of": "2026-02-20",
+        "symbol": "TQQQ",
+        "quantity": 1,
+        "currency": "USD",
+        "asset_class": "etf",
+        "region": "US",
+        "is_leveraged": True,
+    },
+    {"as_of": "2026-02-20", "symbol": "CASH", "quantity": 100, "currency": "USD", "asset_class": "cash"},
+]
+
+
+def test_plan_valuation_series_collects_price_and_fx_keys():
+    keys, start, end = plan_valuation_series(POSITIONS, max_price_lag_days=3)
+
+    assert keys == ["QQQ", "KOSPI200", "FX_KRWUSD", "FX_USDKRW", "DEXKOUS", "BTC", "SOL", "TQQQ"]
+    assert start.date() == date(2026, 2, 17)
+    assert end.date() == date(2026, 2, 20)
+
+
+def test_value_positions_prices_holdings_with_fx_and_exposure_shares():
+    series = _series(
+        [
+            ("QQQ", "2026-02-20", 500.0),
+            ("KOSPI200", "2026-02-19", 40_000.0),
+            ("FX_USDKRW", "2026-02-20", 1_000.0),
+            ("BTC", "2026-02-20", 70_000.0),
+            ("SOL", "2026-02-20", 150.0),
+            ("TQQQ", "2026-02-20", 100.0),
+        ]
+    )
+
+    valuations, skipped = value_positions(POSITIONS, series)
+
+    assert skipped == {"skipped_days": {}}
+    (valuation,) = valuations
+    nav = 5000.0 + 4000.0 + 700.0 + 300.0 + 100.0 + 100.0
+    assert valuation["as_of"] == date(2026, 2, 20)
+    assert math.isclose(valuation["nav"], nav)
+    assert math.isclose(valuation["us_weight"], 5100.0 / nav)
+    assert math.isclose(valuation["kr_weight"], 4000.0 / nav)
+    assert math.isclose(valuation["crypto_weight"], 1000.0 / nav)
+    assert math.isclose(valuation["leverage_weight"], 100.0 / nav)
+    assert math.isclose(valuation["metrics"][EXPOSURE_METRIC_BTC_ETH], 0.7)
+    assert math.isclose(valuation["metrics"][EXPOSURE_METRIC_ALT], 0.3)
+    assert math.isclose(valuation["metrics"][EXPOSURE_METRIC_LEVERAGE], 100.0 / nav)
+
+
+def test_value_positions_skips_days_with_stale_or_missing_prices():
+    positions = [
+        {"as_of": "2026-02-20", "symbol": "QQQ", "quantity": 1, "currency": "USD", "asset_class": "etf", "region": "US"},
+        {"as_of": "2026-02-20", "symbol": "KODEX200", "quantity": 1, "currency": "KRW", "asset_class": "etf"},
+        {"as_of": "2026-03-20", "symbol": "QQQ", "quantity": 1, "currency": "USD", "asset_class": "etf"},
+        {"as_of": "bad", "symbol": "QQQ", "quantity": 1, "currency": "USD", "asset_class": "etf"},
+    ]
+    series = _series([("QQQ", "2026-02-20", 500.0), ("KODEX200", "2026-02-20", 10_000.0)])
+
+    valuations, skipped = value_positions(positions, series, max_price_lag_days=5)
+
+    assert valuations == []
+    assert skipped["skipped_days"] == {"2026-02-20": ["KODEX200:KRW"], "2026-03-20": ["QQQ"]}
+    assert skipped["invalid_positions"] == 1
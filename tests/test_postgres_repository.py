@@ -1,4 +1,8 @@
 import importlib
+import json
+from datetime import datetime, timezone
+
+import pytest
 
 
 postgres_repository = importlib.import_module("src.ingestion.postgres_repository")
@@ -88,7 +92,8 @@ def test_postgres_repository_reads_latest_runs():
 
 
 def test_postgres_repository_writes_pipeline_rows_and_reads_counters():
-    cursor = FakeCursor(fetch_one_rows=[(3,), (2,), (1,)])
+    # Blob probes find nothing, then the three counters are read.
+    cursor = FakeCursor(fetch_one_rows=[None, None, (3,), (2,), (1,)])
     conn = FakeConnection(cursor)
     repo = PostgresRepository(connection_factory=lambda: conn)
 
@@ -97,10 +102,12 @@ def test_postgres_repository_writes_pipeline_rows_and_reads_counters():
     repo.write_quarantine("quality_gate_failed", {"source": "sec_edgar"})
     counters = repo.read_status_counters()
 
-    assert "INSERT INTO raw_event_store" in cursor.executed[0][0]
-    assert "INSERT INTO canonical_fact_store" in cursor.executed[1][0]
-    assert "INSERT INTO quarantine_batches" in cursor.executed[2][0]
-    assert counters == {"raw_events": 3, "canonical_events": 2, "quarantine_events": 1}
+    assert "INSERT INTO raw_payload_blobs" in cursor.executed[1][0]
+    assert "INSERT INTO raw_event_store" in cursor.executed[2][0]
+    assert "INSERT INTO canonical_fact_store" in cursor.executed[3][0]
+    assert "INSERT INTO raw_payload_blobs" in cursor.executed[5][0]
+    assert "INSERT INTO quarantine_batches" in cursor.executed[6][0]
+    assert counters == {"raw_events": 3, "canonical_facts": 2, "quarantine_events": 1}
 
 
 def test_postgres_repository_reads_learning_metrics_for_1m_horizon():
@@ -108,7 +115,7 @@ def test_postgres_repository_reads_learning_metrics_for_1m_horizon():
     conn = FakeConnection(cursor)
     repo = PostgresRepository(connection_factory=lambda: conn)
 
-    metrics = repo.read_learning_metrics(horizon="1M")
+    metrics = repo.read_learning_metrics(horizon="1M", source="raw")
 
     forecast_sql, forecast_params = cursor.executed[0]
     assert "FROM forecast_records" in forecast_sql
@@ -480,6 +487,66 @@ def test_postgres_repository_reads_forecast_error_attribution_detail_payload():
     assert payload["lineage_summary"] == ["lin-1"]
 
 
+def test_postgres_repository_reads_forecast_error_attribution_details_in_one_query():
+    cursor = FakeCursor(
+        fetch_rows=[
+            (
+                501,
+                7,
+                "thesis-1",
+                "2026-02-22T00:00:00+00:00",
+                "2026-03-22T00:00:00+00:00",
+                "2026-03-22T00:05:00+00:00",
+                [{"source": "fred", "metric": "CPI", "lineage_id": "lin-1"}],
+                '[{"source": "fred"}]',
+                "[]",
+            ),
+            (
+                502,
+                8,
+                "thesis-2",
+                "2026-02-22T00:00:00+00:00",
+                "2026-03-22T00:00:00+00:00",
+                "2026-03-22T00:05:00+00:00",
+                [],
+                "[]",
+                '[{"note": "long"…(truncated)',
+            ),
+        ],
+        columns=[
+            "attribution_id",
+            "forecast_id",
+            "thesis_id",
+            "as_of",
+            "evaluated_at",
+            "created_at",
+            "hard_evidence_refs",
+            "hard_evidence_preview",
+            "soft_evidence_preview",
+        ],
+    )
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    details = repo.read_forecast_error_attribution_details([502, 501, 502], max_preview_chars=80)
+
+    assert len(cursor.executed) == 1
+    sql, params = cursor.executed[0]
+    assert "WHERE fea.id = ANY(%s)" in sql
+    assert "left(fea.evidence_hard::text, %s)" in sql
+    assert params == (80, 80, 80, 80, [501, 502])
+    assert sorted(details) == [501, 502]
+    assert details[501]["hard_evidence_refs"][0]["source"] == "fred"
+    assert details[501]["lineage_summary"] == ["lin-1"]
+    assert details[502]["soft_evidence_preview"].endswith("…(truncated)")
+
+
+def test_postgres_repository_attribution_details_skip_query_for_empty_ids():
+    repo = PostgresRepository(connection_factory=lambda: (_ for _ in ()).throw(AssertionError("no connect")))
+
+    assert repo.read_forecast_error_attribution_details([]) == {}
+
+
 def test_postgres_repository_reads_expected_vs_realized_with_evidence_fields():
     cursor = FakeCursor(
         fetch_rows=[
@@ -570,7 +637,7 @@ def test_postgres_repository_reads_forecast_error_category_stats():
     conn = FakeConnection(cursor)
     repo = PostgresRepository(connection_factory=lambda: conn)
 
-    rows = repo.read_forecast_error_category_stats(horizon="1M", limit=5)
+    rows = repo.read_forecast_error_category_stats(horizon="1M", limit=5, source="raw")
 
     sql, params = cursor.executed[0]
     assert "FROM forecast_error_attributions fea" in sql
@@ -588,7 +655,7 @@ def test_postgres_repository_learning_reads_fallback_when_tables_missing():
     assert repo.read_latest_runs(limit=5) == []
     assert repo.read_status_counters() == {
         "raw_events": 0,
-        "canonical_events": 0,
+        "canonical_facts": 0,
         "quarantine_events": 0,
     }
 
@@ -797,3 +864,702 @@ def test_postgres_repository_reads_portfolio_snapshots():
     assert rows[0]["id"] == 501
     assert rows[0]["nav"] == 1015.0
     assert "FROM portfolio_snapshots" in cursor.executed[0][0]
+
+
+def test_postgres_repository_pooled_returns_connections_to_pool(monkeypatch):
+    events = []
+
+    class FakePool:
+        def __init__(self, minconn, maxconn, dsn):
+            events.append(("init", minconn, maxconn, dsn))
+
+        def getconn(self):
+            events.append(("get",))
+            return FakeConnection(FakeCursor(fetch_rows=[], columns=["run_id"]))
+
+        def putconn(self, conn):
+            events.append(("put",))
+
+    monkeypatch.setattr(postgres_repository.psycopg2.pool, "ThreadedConnectionPool", FakePool)
+    repo = PostgresRepository.pooled("postgresql://demo", max_connections=2)
+
+    assert events == []
+    assert repo.read_latest_runs(limit=1) == []
+    assert repo.read_latest_runs(limit=1) == []
+    assert events == [("init", 1, 2, "postgresql://demo"), ("get",), ("put",), ("get",), ("put",)]
+
+
+def test_postgres_repository_pooled_sets_server_side_statement_timeout(monkeypatch):
+    created = []
+
+    class FakePool:
+        def __init__(self, minconn, maxconn, dsn, **kwargs):
+            created.append(kwargs)
+
+        def getconn(self):
+            return FakeConnection(FakeCursor(fetch_rows=[], columns=["run_id"]))
+
+        def putconn(self, conn):
+            return None
+
+    monkeypatch.setattr(postgres_repository.psycopg2.pool, "ThreadedConnectionPool", FakePool)
+    repo = PostgresRepository.pooled("postgresql://demo", statement_timeout_ms=5000)
+
+    repo.read_latest_runs(limit=1)
+
+    assert created == [{"options": "-c statement_timeout=5000"}]
+
+
+def test_postgres_repository_writes_dashboard_snapshot_and_prunes_old_rows():
+    cursor = FakeCursor(fetch_one_rows=[(77,)])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    snapshot_id = repo.write_dashboard_snapshot(
+        view={"counters": {"raw_events": 3}},
+        computed_at="2026-03-01T00:00:00+00:00",
+        build_ms=812.5,
+        keep_latest=5,
+    )
+
+    assert snapshot_id == 77
+    assert "INSERT INTO dashboard_snapshots" in cursor.executed[0][0]
+    assert '"raw_events": 3' in cursor.executed[0][1][2]
+    assert "DELETE FROM dashboard_snapshots" in cursor.executed[1][0]
+    assert cursor.executed[1][1] == (5,)
+    assert conn.committed is True
+
+
+def test_postgres_repository_reads_latest_dashboard_snapshot_or_none_when_missing():
+    cursor = FakeCursor(
+        fetch_one_rows=[(77, "2026-03-01T00:00:00+00:00", 812.5, {"counters": {}})],
+        columns=["id", "computed_at", "build_ms", "view"],
+    )
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    row = repo.read_latest_dashboard_snapshot()
+
+    assert row is not None
+    assert row["id"] == 77
+    assert "LIMIT 1" in cursor.executed[0][0]
+
+    missing_repo = PostgresRepository(connection_factory=lambda: FakeConnection(ExplodingCursor()))
+    assert missing_repo.read_latest_dashboard_snapshot() is None
+
+
+def test_postgres_repository_reads_view_data_version_from_table_statistics():
+    cursor = FakeCursor(fetch_rows=[("portfolio_snapshots", 7, 2, 0, 7), ("refresh_requests", 3, 1, 0, 3)])
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    assert repo.read_view_data_version() == {"portfolio_snapshots": "7:2:0:7", "refresh_requests": "3:1:0:3"}
+    assert len(cursor.executed) == 1
+    sql, params = cursor.executed[0]
+    assert "FROM pg_stat_user_tables" in sql
+    assert "portfolio_snapshots" in params[0] and "macro_series_points" in params[0]
+
+
+def test_postgres_repository_probes_view_data_markers_independently_without_version_table():
+    class MissingTablesCursor(FakeCursor):
+        def execute(self, sql, params=None):
+            super().execute(sql, params)
+            if "pg_stat_user_tables" in sql or "dashboard_snapshots" in sql:
+                raise RuntimeError("relation does not exist")
+
+    cursor = MissingTablesCursor(fetch_one_rows=[("2026-03-01T00:00:00+00:00",), (12,)])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    version = repo.read_view_data_version()
+
+    assert version["latest_run_finished_at"] == "2026-03-01T00:00:00+00:00"
+    assert version["latest_portfolio_snapshot_id"] == 12
+    assert "latest_dashboard_snapshot_at" not in version
+    # Probes after the failing one still ran.
+    assert any("FROM refresh_requests" in sql for sql, _ in cursor.executed)
+
+
+def test_postgres_repository_reads_status_counters_from_store_counters():
+    cursor = FakeCursor(
+        fetch_rows=[("raw_event_store", 300), ("canonical_fact_store", 200), ("quarantine_batches", 4)],
+    )
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    counters = repo.read_status_counters(mode="counter")
+
+    assert counters == {"raw_events": 300, "canonical_facts": 200, "quarantine_events": 4}
+    assert len(cursor.executed) == 1
+    assert "FROM store_counters" in cursor.executed[0][0]
+    assert "COUNT(*)" not in cursor.executed[0][0]
+
+
+def test_postgres_repository_reads_status_counters_from_planner_estimates(monkeypatch):
+    cursor = FakeCursor(
+        fetch_rows=[("raw_event_store", 1.5e6), ("canonical_fact_store", 9.0e5), ("quarantine_batches", -1.0)],
+    )
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+    monkeypatch.setenv("STATUS_COUNTER_MODE", "estimate")
+
+    counters = repo.read_status_counters()
+
+    assert counters == {"raw_events": 1500000, "canonical_facts": 900000, "quarantine_events": 0}
+    assert "pg_class" in cursor.executed[0][0]
+
+
+def test_postgres_repository_exact_status_counter_mode_skips_counter_table():
+    cursor = FakeCursor(fetch_one_rows=[(3,), (2,), (1,)])
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    counters = repo.read_status_counters(mode="exact")
+
+    assert counters == {"raw_events": 3, "canonical_facts": 2, "quarantine_events": 1}
+    assert all("COUNT(*)" in sql for sql, _ in cursor.executed)
+
+
+class SequencedCursor(FakeCursor):
+    def __init__(self, fetchall_batches):
+        super().__init__()
+        self.fetchall_batches = list(fetchall_batches)
+
+    def fetchall(self):
+        if self.fetchall_batches:
+            return self.fetchall_batches.pop(0)
+        return []
+
+
+def _learning_sample(thesis_id, as_of):
+    return {
+        "thesis": {
+            "thesis_id": thesis_id,
+            "scope_level": "portfolio",
+            "target_id": "1M",
+            "title": "t",
+            "summary": "s",
+            "evidence_hard": [{"source": "bootstrap"}],
+            "as_of": as_of,
+            "lineage_id": "seed",
+        },
+        "forecast": {
+            "thesis_id": thesis_id,
+            "horizon": "1M",
+            "expected_return_low": 0.01,
+            "expected_return_high": 0.04,
+            "confidence": 0.5,
+            "evidence_hard": [{"source": "bootstrap"}],
+            "as_of": as_of,
+        },
+        "realization": {"realized_return": 0.025, "evaluated_at": "2026-02-01T00:00:00+00:00"},
+        "attribution": {"category": "unknown", "evidence_hard": [{"source": "bootstrap"}]},
+    }
+
+
+def test_postgres_repository_bulk_learning_samples_use_set_based_statements():
+    # Forecast 11 already has a realization; only forecast 12 gets realized + attributed.
+    cursor = SequencedCursor([[(1, 11, False, True), (2, 12, True, False)], [(901, 12)]])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    written = repo.write_learning_samples_bulk(
+        [
+            _learning_sample("seed-01", "2026-01-01T00:00:00+00:00"),
+            _learning_sample("seed-02", "2026-01-02T00:00:00+00:00"),
+        ]
+    )
+
+    assert written == {
+        "thesis_upserts": 2,
+        "forecast_upserts": 2,
+        "forecast_inserts": 1,
+        "realization_inserts": 1,
+        "attribution_inserts": 1,
+    }
+    assert len(cursor.executed) == 4
+    assert "INSERT INTO investment_theses" in cursor.executed[0][0]
+    assert "unnest(" in cursor.executed[0][0]
+    assert "EXISTS" in cursor.executed[1][0]
+    assert cursor.executed[2][1][0] == [12]
+    assert cursor.executed[3][1][0] == [901]
+    assert conn.committed is True
+
+
+def test_postgres_repository_bulk_learning_samples_skip_connection_when_empty():
+    def fail_connect():
+        raise AssertionError("should not connect")
+
+    repo = PostgresRepository(connection_factory=fail_connect)
+
+    assert repo.write_learning_samples_bulk([])["forecast_upserts"] == 0
+
+
+def test_postgres_repository_writes_realizations_in_one_statement():
+    cursor = SequencedCursor([[(501, 11), (502, 12)]])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    inserted = repo.write_realizations_bulk(
+        [
+            {"forecast_id": 11, "realized_return": 0.02, "evaluated_at": "2026-02-01T00:00:00+00:00"},
+            {"forecast_id": 12, "realized_return": -0.01, "evaluated_at": "2026-02-02T00:00:00+00:00"},
+        ]
+    )
+
+    assert inserted == {11: 501, 12: 502}
+    assert len(cursor.executed) == 1
+    assert "NOT EXISTS" in cursor.executed[0][0]
+    assert cursor.executed[0][1][0] == [11, 12]
+    assert conn.committed is True
+
+
+def test_postgres_repository_reads_matured_unrealized_forecasts():
+    cursor = FakeCursor(
+        fetch_rows=[(11, "t-1", "1M", "2026-01-01T00:00:00+00:00", 0.01, 0.04, "stock", "AAPL")],
+        columns=[
+            "forecast_id",
+            "thesis_id",
+            "horizon",
+            "as_of",
+            "expected_return_low",
+            "expected_return_high",
+            "scope_level",
+            "target_id",
+        ],
+    )
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    rows = repo.read_matured_unrealized_forecasts(as_of="2026-03-01T00:00:00+00:00", limit=10)
+
+    assert rows[0]["forecast_id"] == 11
+    assert "NOT EXISTS" in cursor.executed[0][0]
+    assert cursor.executed[0][1] == ("2026-03-01T00:00:00+00:00", None, None, None, 10)
+
+    repo.read_matured_unrealized_forecasts(as_of="2026-03-01T00:00:00+00:00", limit=10, after=("2026-01-01", 11))
+    assert "(fr.as_of, fr.id) >" in cursor.executed[1][0]
+    assert cursor.executed[1][1] == ("2026-03-01T00:00:00+00:00", "2026-01-01", "2026-01-01", 11, 10)
+
+
+def test_postgres_repository_reads_learning_metrics_from_rollups_by_default():
+    cursor = FakeCursor(fetch_one_rows=[(20,), (12, 0.5833, 0.0315, -0.0042)])
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    metrics = repo.read_learning_metrics(horizon="1M")
+
+    assert "FROM learning_forecast_rollup" in cursor.executed[0][0]
+    assert "FROM learning_realization_rollup" in cursor.executed[1][0]
+    assert len(cursor.executed) == 2
+    assert metrics["realization_coverage"] == 0.6
+    assert metrics["hit_rate"] == 0.5833
+
+
+class RollupMissingCursor(FakeCursor):
+    def execute(self, sql, params=None):
+        if "_rollup" in sql:
+            raise RuntimeError("relation does not exist")
+        super().execute(sql, params)
+
+
+def test_postgres_repository_learning_reads_fall_back_to_raw_when_rollups_missing():
+    cursor = RollupMissingCursor(
+        fetch_rows=[("macro_miss", 4, -0.01, 0.02)],
+        columns=["category", "attribution_count", "mean_contribution", "mean_abs_contribution"],
+        fetch_one_rows=[(20,), (12, 0.5, 0.03, -0.004)],
+    )
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    metrics = repo.read_learning_metrics(horizon="1M")
+    rows = repo.read_forecast_error_category_stats(horizon="1M", limit=5)
+
+    assert metrics["forecast_count"] == 20
+    assert rows[0]["attribution_count"] == 4
+    assert "FROM forecast_error_attributions fea" in cursor.executed[-1][0]
+
+
+def test_postgres_repository_learning_reads_fall_back_to_raw_when_rollups_empty():
+    cursor = FakeCursor(
+        columns=["category", "attribution_count", "mean_contribution", "mean_abs_contribution"],
+        fetch_one_rows=[(0,), (0, None, None, None), (20,), (12, 0.5, 0.03, -0.004)],
+    )
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    metrics = repo.read_learning_metrics(horizon="1M")
+
+    assert metrics["forecast_count"] == 20
+    assert "FROM forecast_records" in cursor.executed[2][0]
+
+    cursor.executed.clear()
+    repo.read_forecast_error_category_stats(horizon="1M", limit=5)
+
+    assert "FROM forecast_error_category_rollup" in cursor.executed[0][0]
+    assert "FROM forecast_error_attributions fea" in cursor.executed[1][0]
+
+
+def test_postgres_repository_rebuild_learning_rollups_reports_drift_and_replaces_rows():
+    cursor = FakeCursor(fetch_one_rows=[(1, 0, 2, 10), (0, 0, 0, 5), (0, 3, 0, 7)])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    report = repo.rebuild_learning_rollups()
+
+    assert report["learning_forecast_rollup"] == {
+        "missing_rows": 1,
+        "orphan_rows": 0,
+        "drifted_rows": 2,
+        "fresh_rows": 10,
+    }
+    assert report["forecast_error_category_rollup"]["orphan_rows"] == 3
+    assert cursor.executed[0][0].startswith("LOCK TABLE")
+    assert any(sql.startswith("DELETE FROM learning_realization_rollup") for sql, _ in cursor.executed)
+    assert conn.committed is True
+
+
+def test_postgres_repository_rebuild_learning_rollups_dry_run_does_not_write():
+    cursor = FakeCursor(fetch_one_rows=[(0, 0, 0, 1), (0, 0, 0, 1), (0, 0, 0, 1)])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    repo.rebuild_learning_rollups(dry_run=True)
+
+    assert not any(sql.startswith(("DELETE", "INSERT")) for sql, _ in cursor.executed)
+    assert conn.committed is False
+
+
+class ScriptedCursor(FakeCursor):
+    """Returns a different (columns, rows) result for each executed statement."""
+
+    def __init__(self, results):
+        super().__init__()
+        self.results = list(results)
+        self._current = []
+
+    def execute(self, sql, params=None):
+        super().execute(sql, params)
+        columns, self._current = self.results.pop(0) if self.results else ([], [])
+        self.description = [(name,) for name in columns]
+
+    def fetchall(self):
+        return self._current
+
+
+def test_postgres_repository_reads_learning_calibration_with_window_functions():
+    rolling_columns = ["realization_id", "forecast_id", "evaluated_at"]
+    for size in (5, 20):
+        rolling_columns += [
+            f"n_{size}",
+            f"directional_hit_rate_{size}",
+            f"interval_coverage_{size}",
+            f"mean_abs_error_{size}",
+            f"signed_bias_{size}",
+            f"mean_confidence_{size}",
+        ]
+    cursor = ScriptedCursor(
+        [
+            (
+                rolling_columns,
+                [
+                    (2, 12, "2026-02-02", 2, 0.5, 0.5, 0.02, -0.01, 0.6, 2, 0.5, 0.5, 0.02, -0.01, 0.6),
+                    (1, 11, "2026-02-01", 1, 1.0, 0.0, 0.03, 0.03, 0.7, 1, 1.0, 0.0, 0.03, 0.03, 0.7),
+                ],
+            ),
+            (["bin", "n", "mean_confidence", "interval_coverage"], [(3, 1, 0.55, 1.0), (4, 1, 0.7, 0.0)]),
+        ]
+    )
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    calibration = repo.read_learning_calibration(horizon="1M", windows=(20, 5), bins=5, limit=50)
+
+    rolling_sql, rolling_params = cursor.executed[0]
+    assert "ROWS BETWEEN 4 PRECEDING AND CURRENT ROW" in rolling_sql
+    assert "ROWS BETWEEN 19 PRECEDING AND CURRENT ROW" in rolling_sql
+    assert rolling_params == ("1M", 50)
+    curve_sql, curve_params = cursor.executed[1]
+    assert "GREATEST(LEAST(width_bucket(fr.confidence, 0, 1, %s), %s), 1)" in curve_sql
+    assert "fr.confidence IS NOT NULL" in curve_sql
+    assert curve_params == (5, 5, "1M")
+    assert calibration["windows"] == [5, 20]
+    assert [point["realization_id"] for point in calibration["series"]] == [1, 2]
+    assert calibration["latest"]["5"]["signed_bias"] == -0.01
+    assert calibration["reliability"][0]["confidence_low"] == 0.4
+    assert calibration["reliability"][1]["interval_coverage"] == 0.0
+
+
+def test_postgres_repository_learning_calibration_rejects_empty_windows():
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(FakeCursor()))
+
+    with pytest.raises(ValueError):
+        repo.read_learning_calibration(windows=(0,))
+
+
+def _forecast_record(thesis_id="thesis-1", as_of="2026-02-22T00:00:00+00:00", **overrides):
+    record = {
+        "thesis_id": thesis_id,
+        "horizon": "1M",
+        "expected_return_low": 0.01,
+        "expected_return_high": 0.05,
+        "confidence": 0.6,
+        "key_drivers": [],
+        "evidence_hard": [{"source": "fred"}],
+        "evidence_soft": [],
+        "as_of": as_of,
+    }
+    record.update(overrides)
+    return record
+
+
+def test_postgres_repository_writes_forecast_record_chunks_with_per_line_results():
+    cursor = ScriptedCursor(
+        [
+            (["thesis_id"], [("thesis-1",)]),
+            (["ord", "id", "inserted", "has_realization"], [(1, 10, True, False), (2, 11, False, False)]),
+            (["thesis_id"], [("thesis-1",)]),
+            (["ord", "id", "inserted", "has_realization"], [(1, 11, False, False)]),
+        ]
+    )
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    chunks = [
+        [
+            (1, _forecast_record()),
+            (2, _forecast_record(evidence_hard=[])),
+            (3, _forecast_record(thesis_id="thesis-missing")),
+            (4, _forecast_record(as_of="2026-02-23T00:00:00+00:00")),
+            (5, _forecast_record()),
+        ],
+        [(6, _forecast_record(as_of="2026-02-23T00:00:00+00:00"))],
+    ]
+    results = list(repo.write_forecast_record_chunks(iter(chunks)))
+
+    assert [ref for ref, _ in results[0]] == [1, 2, 3, 4, 5]
+    first = dict(results[0])
+    assert first[1] == {"status": "deduplicated", "forecast_id": 10}
+    assert first[2]["status"] == "error" and "evidence_hard" in first[2]["error"]
+    assert first[3] == {"status": "error", "error": "unknown thesis_id: thesis-missing"}
+    assert first[4] == {"status": "deduplicated", "forecast_id": 11}
+    # Line 5 repeats line 1's key, so only line 5 goes to the upsert and line 1 reuses its id.
+    assert first[5] == {"status": "inserted", "forecast_id": 10}
+    assert results[1] == [(6, {"status": "deduplicated", "forecast_id": 11})]
+
+    upsert_sql, upsert_params = cursor.executed[1]
+    assert "ON CONFLICT" in upsert_sql
+    assert upsert_params[0] == ["thesis-1", "thesis-1"]
+    assert len(upsert_params) == 14
+    assert conn.committed is True
+
+
+def test_postgres_repository_forecast_record_chunk_failure_marks_chunk_and_continues():
+    class FailingUpsertCursor(ScriptedCursor):
+        def execute(self, sql, params=None):
+            if "WITH upserted" in sql and not self.failed:
+                self.failed = True
+                raise RuntimeError("deadlock detected")
+            super().execute(sql, params)
+
+    cursor = FailingUpsertCursor(
+        [
+            (["thesis_id"], [("thesis-1",)]),
+            (["thesis_id"], [("thesis-1",)]),
+            (["ord", "id", "inserted", "has_realization"], [(1, 12, True, False)]),
+        ]
+    )
+    cursor.failed = False
+    rollbacks = []
+    conn = FakeConnection(cursor)
+    conn.rollback = lambda: rollbacks.append(True)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    results = list(
+        repo.write_forecast_record_chunks(iter([[(1, _forecast_record())], [(2, _forecast_record())]]))
+    )
+
+    assert results[0] == [(1, {"status": "error", "error": "chunk failed: deadlock detected"})]
+    assert results[1] == [(2, {"status": "inserted", "forecast_id": 12})]
+    assert rollbacks == [True]
+
+
+def test_postgres_repository_reads_latest_macro_as_of_per_key_in_one_query():
+    cursor = FakeCursor(fetch_rows=[("QQQ", "2026-02-20T00:00:00+00:00"), ("BTC", "2026-02-21T00:00:00+00:00")])
+    repo = PostgresRepository(dsn="postgres://example", connection_factory=lambda: FakeConnection(cursor))
+
+    latest = repo.read_macro_series_latest_as_of(["QQQ", "BTC", "SGOV"])
+
+    sql, params = cursor.executed[0]
+    assert "CROSS JOIN LATERAL" in sql
+    assert params == (["QQQ", "BTC", "SGOV"],)
+    assert latest == {"QQQ": "2026-02-20T00:00:00+00:00", "BTC": "2026-02-21T00:00:00+00:00"}
+    assert repo.cache_scope == "postgres://example"
+    assert PostgresRepository(connection_factory=lambda: FakeConnection(cursor)).cache_scope is None
+
+
+class CopyCursor(FakeCursor):
+    def __init__(self, fetch_rows=None):
+        super().__init__(fetch_rows=fetch_rows)
+        self.copied = None
+
+    def copy_expert(self, sql, file):
+        self.copy_sql = sql
+        chunks = []
+        while True:
+            chunk = file.read(7)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        self.copied = "".join(chunks)
+
+
+def test_postgres_repository_copies_portfolio_snapshots_through_staging_table():
+    cursor = CopyCursor(fetch_rows=[(True,), (False,)])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    result = repo.copy_portfolio_snapshots(
+        iter(
+            [
+                {"as_of": "2026-01-02", "nav": 100.0, "us_weight": 0.5, "kr_weight": None},
+                {"as_of": "2026-01-03", "nav": 101.5, "us_weight": 0.5},
+                {"as_of": "2026-01-03", "nav": 102.0, "leverage_weight": 0.1},
+            ]
+        )
+    )
+
+    assert "CREATE TEMP TABLE portfolio_snapshots_staging" in cursor.executed[0][0]
+    assert "FROM STDIN WITH (FORMAT csv)" in cursor.copy_sql
+    assert cursor.copied == (
+        "0,2026-01-02,100.0,0.5,,,\n"
+        "1,2026-01-03,101.5,0.5,,,\n"
+        "2,2026-01-03,102.0,,,,0.1\n"
+    )
+    upsert_sql = cursor.executed[1][0]
+    assert "DISTINCT ON (as_of)" in upsert_sql
+    assert "ORDER BY as_of, seq DESC" in upsert_sql
+    assert "ON CONFLICT (as_of) DO UPDATE" in upsert_sql
+    assert result == {"staged": 3, "inserted": 1, "updated": 1, "duplicates": 1}
+    assert conn.committed is True
+
+
+def test_postgres_repository_upserts_positions_in_one_statement():
+    cursor = FakeCursor(fetch_rows=[(True,), (False,)])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    written = repo.write_portfolio_positions_bulk(
+        [
+            {"as_of": "2026-02-20", "symbol": "QQQ", "quantity": 1.0, "currency": "USD", "asset_class": "etf"},
+            {"as_of": "2026-02-20", "symbol": "BTC", "quantity": 0.1, "currency": "USD", "asset_class": "crypto"},
+            {"as_of": "2026-02-20", "symbol": "QQQ", "quantity": 2.0, "currency": "USD", "asset_class": "etf"},
+        ]
+    )
+
+    sql, params = cursor.executed[0]
+    assert len(cursor.executed) == 1
+    assert "ON CONFLICT (as_of, symbol) DO UPDATE" in sql
+    assert params[1] == ["QQQ", "BTC"]
+    assert params[2] == [2.0, 0.1]
+    assert params[5] == ["OTHER", "OTHER"]
+    assert written == {"inserted": 1, "updated": 1}
+    assert conn.committed is True
+
+
+def test_postgres_repository_writes_valuations_and_changed_metrics_in_one_transaction():
+    cursor = ScriptedCursor([(["inserted"], [(True,)]), (["id"], [(91,), (92,)])])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    written = repo.write_portfolio_valuations_bulk(
+        [
+            {
+                "as_of": "2026-02-20",
+                "nav": 10_200.0,
+                "us_weight": 0.5,
+                "kr_weight": 0.39,
+                "crypto_weight": 0.1,
+                "leverage_weight": 0.01,
+                "metrics": {
+                    "portfolio_exposure_crypto_btc_eth_share": 0.7,
+                    "portfolio_exposure_crypto_alt_share": None,
+                    "portfolio_exposure_leverage_share": 0.01,
+                },
+            }
+        ]
+    )
+
+    snapshot_sql, snapshot_params = cursor.executed[0]
+    assert "INSERT INTO portfolio_snapshots" in snapshot_sql
+    assert snapshot_params[1] == [10_200.0]
+    metric_sql, metric_params = cursor.executed[1]
+    assert "INSERT INTO canonical_fact_store" in metric_sql
+    assert "WHERE latest.metric_value = m.metric_value" in metric_sql
+    assert metric_params[0] == "portfolio_valuation"
+    assert metric_params[5] == ["portfolio_exposure_crypto_btc_eth_share", "portfolio_exposure_leverage_share"]
+    assert written == {"snapshots_inserted": 1, "snapshots_updated": 0, "metrics_written": 2}
+    assert conn.committed is True
+
+
+def test_postgres_repository_stores_unchanged_raw_payloads_once():
+    payload = {"source": "sec_edgar", "entity_id": "AAPL", "payload": {"facts": {"eps": [1.2] * 500}}}
+    cursor = FakeCursor(fetch_one_rows=[None])
+    conn = FakeConnection(cursor)
+    repo = PostgresRepository(connection_factory=lambda: conn)
+
+    repo.write_raw(payload)
+    repo.write_raw(dict(reversed(list(payload.items()))))
+    repo.write_quarantine("quality_gate_failed", payload)
+
+    blob_writes = [params for sql, params in cursor.executed if "INSERT INTO raw_payload_blobs" in sql]
+    assert len(blob_writes) == 1
+    digest, encoding, byte_size, body = blob_writes[0]
+    assert encoding == "zlib"
+    assert len(body) < byte_size
+    raw_writes = [params for sql, params in cursor.executed if "INSERT INTO raw_event_store" in sql]
+    assert [params[-1] for params in raw_writes] == [digest, digest]
+    quarantine_sql, quarantine_params = cursor.executed[-1]
+    assert "INSERT INTO quarantine_batches" in quarantine_sql
+    assert quarantine_params[-1] == digest
+    # Only the first write probed for the blob; later writes reused the remembered hash.
+    assert sum("SELECT 1 FROM raw_payload_blobs" in sql for sql, _ in cursor.executed) == 1
+
+
+def test_postgres_repository_rehydrates_raw_event_payloads():
+    payload_blobs = importlib.import_module("src.ingestion.payload_blobs")
+    raw = payload_blobs.canonical_payload_bytes({"eps": 1.2})
+    digest = payload_blobs.payload_hash(raw)
+    cursor = FakeCursor(
+        fetch_rows=[
+            (2, "sec_edgar", digest, None, "zlib", memoryview(payload_blobs.compress_payload_bytes(raw))),
+            (1, "sec_edgar", None, {"legacy": True}, None, None),
+        ],
+        columns=["id", "source", "payload_hash", "payload", "blob_encoding", "blob_body"],
+    )
+    repo = PostgresRepository(connection_factory=lambda: FakeConnection(cursor))
+
+    rows = repo.read_raw_events(limit=2, source="sec_edgar")
+
+    assert "LEFT JOIN raw_payload_blobs" in cursor.executed[0][0]
+    assert cursor.executed[0][1] == ("sec_edgar", "sec_edgar", None, None, 2)
+    assert rows == [
+        {"id": 2, "source": "sec_edgar", "payload_hash": digest, "payload": {"eps": 1.2}},
+        {"id": 1, "source": "sec_edgar", "payload_hash": None, "payload": {"legacy": True}},
+    ]
+
+
+def test_postgres_repository_source_schema_is_read_once_per_process_scope():
+    profiler = importlib.import_module("src.ingestion.quality_profiler")
+    stored = ("stale-fingerprint", '{"date": "str", "value": "str"}', '["date", "value"]')
+    cursor = FakeCursor(fetch_one_rows=[stored])
+    repo = PostgresRepository(dsn="postgres://example", connection_factory=lambda: FakeConnection(cursor))
+    cache = profiler.SchemaFingerprintCache()
+    payload = {"payload": {"observations": [{"date": "2026-10-16", "value": "4.1", "note": None}]}}
+
+    for _ in range(2):
+        profile = profiler.profile_batch(
+            "fred", payload, [], datetime(2026, 10, 19, tzinfo=timezone.utc), schema_store=repo, cache=cache
+        )
+        assert profile.metrics.schema_drift is False
+        profiler.accept_batch_schema(repo, "fred", profile, cache)
+
+    reads = [params for sql, params in cursor.executed if "FROM source_schema_fingerprints" in sql]
+    assert reads == [("fred",)]
+    writes = [params for sql, params in cursor.executed if "INSERT INTO source_schema_fingerprints" in sql]
+    # The widened schema is written once; the second batch matches the cached fingerprint.
+    assert len(writes) == 1
+    source, _, field_types, required_fields = writes[0]
+    assert source == "fred"
+    assert json.loads(field_types) == {"date": "str", "note": "null", "value": "str"}
+    assert json.loads(required_fields) == ["date", "value"]
@@ -0,0 +1,122 @@
+import importlib
+from array import array
+from datetime import date, datetime, timedelta, timezone
+
+
+profiler = importlib.import_module("src.ingestion.quality_profiler")
+repository_mod = importlib.import_module("src.ingestion.repository")
+
+profile_batch = profiler.profile_batch
+accept_batch_schema = profiler.accept_batch_schema
+SchemaFingerprintCache = profiler.SchemaFingerprintCache
+InMemoryRepository = repository_mod.InMemoryRepository
+
+DECISION_TIME = datetime(2026, 10, 19, tzinfo=timezone.utc)
+
+
+def _epoch(day: date) -> float:
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp()
+
+
+def _business_days(last: date, count: int) -> list[date]:
+    days: list[date] = []
+    current = last
+    while len(days) < count:
+        if current.weekday() < 5:
+            days.append(current)
+        current -= timedelta(days=1)
+    return days[::-1]
+
+
+def _fred_payload(days: list[date], value: object = "1.5") -> dict[str, object]:
+    return {
+        "source": "fred",
+        "entity_id": "DGS10",
+        "payload": {"observations": [{"date": day.isoformat(), "value": value} for day in days]},
+    }
+
+
+def test_profile_passes_fresh_complete_business_day_series():
+    days = _business_days(date(2026, 10, 16), 100_000)
+    series = [("DGS10:fred:DGS10", array("d", map(_epoch, days)))]
+
+    profile = profile_batch("fred", _fred_payload(days), series, DECISION_TIME, InMemoryRepository(), SchemaFingerprintCache())
+
+    assert profile.metrics == profiler.BatchMetrics(True, True, False, True)
+    assert profile.cadence == "daily"
+    assert profile.points == 100_000
+    assert profile.expected_periods == profile.present_periods == 100_000
+    assert profile.reasons == ()
+
+
+def test_profile_flags_stale_and_gappy_monthly_series():
+    months = [date(2020 + idx // 12, idx % 12 + 1, 1) for idx in range(48)]
+    present = [month for idx, month in enumerate(months) if idx % 3 != 0]
+    series = [("KR:ecos:rate", [_epoch(month) for month in present])]
+
+    profile = profile_batch("ecos", {"payload": {}}, series, DECISION_TIME)
+
+    assert profile.cadence == "monthly"
+    assert profile.expected_periods == 47
+    assert profile.metrics.freshness is False
+    assert profile.metrics.completeness is False
+    assert any(reason.startswith("stale: latest 2023-12-01") for reason in profile.reasons)
+
+
+def test_profile_without_points_fails_series_source_but_not_documents():
+    assert profile_batch("fred", {"payload": {"observations": []}}, [], DECISION_TIME).metrics.completeness is False
+
+    document = profile_batch("opendart", {"payload": {"status": "000", "corp_name": "Samsung"}}, [], DECISION_TIME)
+    assert document.metrics.completeness is True
+    assert document.metrics.freshness is True
+
+    failed = profile_batch("opendart", {"payload": {"status": "013", "message": "no data"}}, [], DECISION_TIME)
+    assert failed.metrics.completeness is False
+    assert "opendart error: 013 no data" in failed.reasons
+
+
+def test_profile_rejects_unlicensed_source():
+    profile = profile_batch("scraped_forum", {"payload": {}}, [], DECISION_TIME)
+    assert profile.metrics.license_ok is False
+
+
+def test_schema_drift_is_detected_against_the_accepted_schema_and_cached():
+    repo = InMemoryRepository()
+    cache = SchemaFingerprintCache()
+    days = _business_days(date(2026, 10, 16), 10)
+    series = [("DGS10:fred:DGS10", [_epoch(day) for day in days])]
+
+    first = profile_batch("fred", _fred_payload(days), series, DECISION_TIME, repo, cache)
+    assert first.metrics.schema_drift is False
+    assert "fred" not in repo.source_schemas
+    assert accept_batch_schema(repo, "fred", first, cache) is True
+    assert repo.source_schemas["fred"]["field_types"] == {"date": "str", "value": "str"}
+
+    retyped = profile_batch("fred", _fred_payload(days, value=1.5), series, DECISION_TIME, repo, cache)
+    assert retyped.metrics.schema_drift is True
+    assert "schema drift: type value:str->number" in retyped.reasons
+
+    missing = {"payload": {"observations": [{"date": day.isoformat()} for day in days]}}
+    dropped = profile_batch("fred", missing, series, DECISION_TIME, repo, cache)
+    assert "schema drift: missing value" in dropped.reasons
+
+    # A new nullable field widens the accepted schema instead of drifting.
+    widened = _fred_payload(days)
+    widened["payload"]["observations"][0]["note"] = None  # type: ignore[index]
+    widened_profile = profile_batch("fred", widened, series, DECISION_TIME, repo, cache)
+    assert widened_profile.metrics.schema_drift is False
+    assert accept_batch_schema(repo, "fred", widened_profile, cache) is True
+    assert repo.source_schemas["fred"]["field_types"]["note"] == "null"
+    assert repo.source_schemas["fred"]["required_fields"] == ["date", "value"]
+
+
+def test_profile_batch_proposes_a_schema_without_storing_it():
+    repo = InMemoryRepository()
+    cache = SchemaFingerprintCache()
+    stale_days = _business_days(date(2026, 9, 18), 10)
+    series = [("DGS10:fred:DGS10", [_epoch(day) for day in stale_days])]
+
+    stale = profile_batch("fred", _fred_payload(stale_days), series, DECISION_TIME, repo, cache)
+    assert stale.metrics.freshness is False
+    assert stale.schema_update == ({"date": "str", "value": "str"}, ["date", "value"])
+    assert "fred" not in repo.source_schemas
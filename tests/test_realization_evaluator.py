@@ -0,0 +1,81 @@
+import importlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+realization_evaluator = importlib.import_module("src.ingestion.realization_evaluator")
+
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _daily_rows(metric_key, levels):
+    return [
+        {"metric_key": metric_key, "as_of": START + timedelta(days=idx), "value": level}
+        for idx, level in enumerate(levels)
+    ]
+
+
+def test_evaluate_matured_forecasts_uses_target_series_for_stock_theses():
+    levels = [100.0 + idx for idx in range(8)]
+    levels[3] = 90.0
+    series = realization_evaluator.build_price_series(_daily_rows("AAPL", levels))
+
+    realizations, skipped = realization_evaluator.evaluate_matured_forecasts(
+        [{"forecast_id": 7, "horizon": "1W", "as_of": START, "scope_level": "stock", "target_id": "aapl"}],
+        series,
+    )
+
+    assert skipped == {}
+    assert realizations[0]["series_key"] == "AAPL"
+    assert realizations[0]["realized_return"] == pytest.approx(0.07)
+    assert realizations[0]["max_drawdown"] == pytest.approx(90.0 / 102.0 - 1.0)
+    assert realizations[0]["evaluated_at"] == START + timedelta(days=7)
+    assert realizations[0]["realized_volatility"] > 0
+
+
+def test_evaluate_matured_forecasts_uses_weighted_benchmark_for_portfolio(monkeypatch):
+    for env_name in ["BENCHMARK_WEIGHT_QQQ", "BENCHMARK_WEIGHT_KOSPI200", "BENCHMARK_WEIGHT_BTC", "BENCHMARK_WEIGHT_SGOV"]:
+        monkeypatch.delenv(env_name, raising=False)
+    rows = []
+    for key, end_level in {"QQQ": 110.0, "KOSPI200": 100.0, "BTC": 120.0, "SGOV": 100.0}.items():
+        rows.extend(_daily_rows(key, [100.0] * 7 + [end_level]))
+    series = realization_evaluator.build_price_series(rows)
+
+    realizations, _ = realization_evaluator.evaluate_matured_forecasts(
+        [{"forecast_id": 1, "horizon": "1W", "as_of": START, "scope_level": "portfolio", "target_id": "1W"}],
+        series,
+    )
+
+    assert realizations[0]["series_key"] == "BENCHMARK"
+    assert realizations[0]["realized_return"] == pytest.approx(0.45 * 0.10 + 0.20 * 0.20)
+
+
+def test_evaluate_matured_forecasts_skips_forecasts_without_fresh_prices():
+    series = realization_evaluator.build_price_series(_daily_rows("AAPL", [100.0, 101.0]))
+
+    realizations, skipped = realization_evaluator.evaluate_matured_forecasts(
+        [
+            {"forecast_id": 1, "horizon": "1M", "as_of": START, "scope_level": "stock", "target_id": "AAPL"},
+            {"forecast_id": 2, "horizon": "5Y", "as_of": START, "scope_level": "stock", "target_id": "AAPL"},
+        ],
+        series,
+    )
+
+    assert realizations == []
+    assert skipped == {"missing_prices": 1, "invalid_forecast": 1}
+
+
+def test_plan_series_window_covers_all_forecasts_in_one_read():
+    keys, start, end = realization_evaluator.plan_series_window(
+        [
+            {"as_of": START, "scope_level": "stock", "target_id": "aapl"},
+            {"as_of": START + timedelta(days=10), "scope_level": "portfolio", "target_id": "1M"},
+        ],
+        max_price_lag_days=5,
+    )
+
+    assert keys == ["QQQ", "KOSPI200", "BTC", "SGOV", "AAPL"]
+    assert start == START - timedelta(days=5)
+    assert end == START + timedelta(days=100)
@@ -1,7 +1,9 @@
 import importlib
 
 
-RevisionStore = importlib.import_module("src.ingestion.revision_store").RevisionStore
+revision_store_mod = importlib.import_module("src.ingestion.revision_store")
+RevisionStore = revision_store_mod.RevisionStore
+revision_content = revision_store_mod.revision_content
 
 
 def test_revision_store_noop_for_same_key_and_hash():
@@ -26,3 +28,43 @@ def test_revision_store_adds_revision_when_hash_changes():
     assert first.status == "inserted"
     assert second.status == "revision"
     assert second.revision_number == 2
+
+
+class CountingBackend:
+    def __init__(self):
+        self.repo = importlib.import_module("src.ingestion.repository").InMemoryRepository()
+        self.reads = 0
+
+    def read_payload_revision(self, idempotency_key):
+        self.reads += 1
+        return self.repo.read_payload_revision(idempotency_key)
+
+    def put_payload_revision(self, idempotency_key, payload_hash):
+        return self.repo.put_payload_revision(idempotency_key, payload_hash)
+
+
+def test_revision_store_with_backend_survives_a_new_store_and_caches_latest():
+    backend = CountingBackend()
+    key = "sec_edgar|AAPL|2026-01-01|manual"
+
+    assert RevisionStore(backend=backend).put(key, {"x": 1}).status == "inserted"
+
+    store = RevisionStore(backend=backend)
+    assert store.is_unchanged(key, {"x": 1}) is True
+    assert store.is_unchanged(key, {"x": 1}) is True
+    assert backend.reads == 1
+    assert store.stats == {"hits": 1, "loads": 1}
+    assert store.put(key, {"x": 1}).status == "noop"
+
+    changed = store.put(key, {"x": 2})
+    assert (changed.status, changed.revision_number) == ("revision", 2)
+    assert store.latest(key)[0] == 2
+    assert backend.reads == 1
+
+
+def test_revision_content_drops_fred_vintage_fields_only():
+    fred = {"payload": {"realtime_start": "2026-01-02", "observations": [{"realtime_end": "x", "value": "1"}]}}
+    ecos = {"payload": {"realtime_start": "2026-01-02"}}
+
+    assert dict(revision_content("fred", fred)) == {"payload": {"observations": [{"value": "1"}]}}
+    assert revision_content("ecos", ecos) is ecos
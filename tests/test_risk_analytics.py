@@ -0,0 +1,93 @@
+import math
+from datetime import date, timedelta
+from statistics import stdev
+
+from src.enduser.risk_analytics import RiskAnalyticsCache, compute_risk_analytics, risk_inputs_fingerprint
+
+
+def _nav_points(navs, start=date(2026, 1, 1)):
+    return [(start + timedelta(days=idx), nav) for idx, nav in enumerate(navs)]
+
+
+def test_rolling_metrics_match_direct_computation():
+    navs = [100, 102, 101, 105, 103, 104, 108, 107]
+    points = _nav_points(navs)
+    returns = [(navs[i] / navs[i - 1]) - 1.0 for i in range(1, len(navs))]
+
+    analytics = compute_risk_analytics(points, [], windows=(3,))
+    rolling = analytics["rolling"]["3"]
+
+    assert len(rolling) == len(returns) - 2
+    for offset, row in enumerate(rolling):
+        window = returns[offset : offset + 3]
+        mean = sum(window) / 3
+        assert row["as_of"] == points[offset + 3][0].isoformat()
+        assert math.isclose(row["volatility"], stdev(window) * math.sqrt(252), rel_tol=1e-9)
+        assert math.isclose(row["sharpe"], mean / stdev(window) * math.sqrt(252), rel_tol=1e-9)
+        downside = math.sqrt(sum(min(r, 0.0) ** 2 for r in window) / 3)
+        if downside > 0:
+            assert math.isclose(row["sortino"], mean / downside * math.sqrt(252), rel_tol=1e-9)
+        else:
+            assert row["sortino"] is None
+
+
+def test_drawdown_episodes_track_depth_duration_and_recovery():
+    points = _nav_points([100, 90, 80, 95, 100, 110, 99])
+
+    analytics = compute_risk_analytics(points, [])
+
+    first, second = analytics["drawdown_episodes"]
+    assert first["peak"] == "2026-01-01"
+    assert first["trough"] == "2026-01-03"
+    assert math.isclose(first["depth"], -0.2)
+    assert first["recovery"] == "2026-01-05"
+    assert first["duration_days"] == 4
+    assert first["recovery_days"] == 2
+    assert second["recovery"] is None
+    assert second["duration_days"] == 1
+    assert math.isclose(analytics["current_drawdown"], 99 / 110 - 1.0)
+    assert analytics["max_drawdown_duration_days"] == 4
+
+
+def test_historical_var_cvar_and_beta_to_benchmark():
+    navs = [100.0]
+    benchmark_returns = [0.01, -0.02, 0.015, -0.01, 0.005, 0.02, -0.03, 0.01, 0.0, -0.005]
+    for value in benchmark_returns:
+        navs.append(navs[-1] * (1.0 + 2.0 * value))
+    points = _nav_points(navs)
+    benchmark = [
+        {"as_of": points[idx + 1][0].isoformat(), "benchmark_return": value}
+        for idx, value in enumerate(benchmark_returns)
+    ]
+
+    analytics = compute_risk_analytics(points, benchmark, confidence=0.8)
+
+    assert math.isclose(analytics["beta"], 2.0, rel_tol=1e-9)
+    assert analytics["beta_observations"] == 10
+    # Worst two of ten returns: -6% and -4%.
+    assert math.isclose(analytics["var"], 0.04, rel_tol=1e-9)
+    assert math.isclose(analytics["cvar"], 0.05, rel_tol=1e-9)
+
+
+def test_risk_cache_reuses_results_per_key():
+    cache = RiskAnalyticsCache()
+    points = _nav_points([100, 101, 102])
+
+    first = cache.get_or_compute(("dsn", "2026-01-03", 3), points, [])
+    second = cache.get_or_compute(("dsn", "2026-01-03", 3), _nav_points([1, 1, 1]), [])
+    uncached = cache.get_or_compute(None, _nav_points([1, 1, 1]), [])
+
+    assert second is first
+    assert uncached["current_drawdown"] == 0.0
+    assert compute_risk_analytics([], [])["var"] is None
+
+
+def test_risk_inputs_fingerprint_changes_when_an_earlier_snapshot_is_corrected():
+    benchmark = [{"as_of": "2026-01-03", "benchmark_return": 0.01}]
+    original = _nav_points([100, 101, 102])
+    corrected = _nav_points([100, 99, 102])
+
+    assert risk_inputs_fingerprint(original, benchmark) == risk_inputs_fingerprint(_nav_points([100, 101, 102]), benchmark)
+    assert risk_inputs_fingerprint(original, benchmark) != risk_inputs_fingerprint(corrected, benchmark)
+    restated = [{"as_of": "2026-01-03", "benchmark_return": 0.02}]
+    assert risk_inputs_fingerprint(original, benchmark) != risk_inputs_fingerprint(original, restated)
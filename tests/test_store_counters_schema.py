@@ -0,0 +1,12 @@
+from pathlib import Path
+
+
+def test_store_counters_migration_maintains_counts_per_statement():
+    sql = Path("migrations/014_store_counters.sql").read_text(encoding="utf-8")
+
+    assert "CREATE TABLE IF NOT EXISTS store_counters" in sql
+    for table in ["raw_event_store", "canonical_fact_store", "quarantine_batches"]:
+        assert f"AFTER INSERT ON {table}" in sql
+    assert "FOR EACH STATEMENT" in sql
+    assert "FOR EACH ROW" not in sql
+
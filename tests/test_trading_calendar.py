@@ -0,0 +1,74 @@
+import importlib
+import logging
+from datetime import date
+
+
+trading_calendar = importlib.import_module("src.research.trading_calendar")
+
+
+def test_us_calendar_applies_nyse_rules_and_observed_dates():
+    holidays = trading_calendar.us_holidays(2026)
+
+    assert date(2026, 1, 19) in holidays  # MLK Day
+    assert date(2026, 4, 3) in holidays  # Good Friday
+    assert date(2026, 7, 3) in holidays  # July 4th on a Saturday
+    assert date(2026, 11, 26) in holidays  # Thanksgiving
+    # A Saturday New Year's Day is not observed on the previous Friday.
+    assert date(2021, 12, 31) not in trading_calendar.us_holidays(2021)
+    assert date(2022, 6, 20) in trading_calendar.us_holidays(2022)
+    assert trading_calendar.US_CALENDAR.is_session(date(2026, 2, 17)) is True
+
+
+def test_kr_calendar_covers_lunar_substitute_and_year_end_closures():
+    holidays = trading_calendar.kr_holidays(2025)
+
+    assert {date(2025, 1, 28), date(2025, 1, 29), date(2025, 1, 30)} <= holidays
+    assert date(2025, 5, 6) in holidays  # Children's Day shared with Buddha's Birthday
+    assert date(2025, 10, 8) in holidays  # Chuseok Sunday substitute
+    assert date(2025, 12, 31) in holidays
+    assert date(2022, 12, 30) in trading_calendar.kr_holidays(2022)  # Dec 31 on a Saturday
+    assert date(2028, 10, 5) in trading_calendar.kr_holidays(2028)  # Chuseok overlapping Gaecheonjeol
+
+
+def test_kr_calendar_warns_for_years_without_lunar_dates(caplog):
+    with caplog.at_level(logging.WARNING, logger="src.research.trading_calendar"):
+        holidays = trading_calendar.kr_holidays(2031)
+
+    assert date(2031, 3, 3) in holidays  # fixed-date holidays still apply
+    assert "not listed for 2031" in caplog.text
+    caplog.clear()
+    trading_calendar.kr_holidays(2026)
+    assert caplog.text == ""
+
+
+def test_union_calendar():
+    calendars = trading_calendar.CALENDARS
+    start, end = date(2026, 2, 13), date(2026, 2, 20)
+
+    assert [date.fromordinal(d).day for d in calendars["US"].sessions(start, end)] == [13, 17, 18, 19, 20]
+    assert [date.fromordinal(d).day for d in calendars["KR"].sessions(start, end)] == [13, 19, 20]
+    assert [date.fromordinal(d).day for d in calendars["US|KR"].sessions(start, end)] == [13, 17, 18, 19, 20]
+    assert calendars["KR"].previous_session(date(2026, 2, 19)) == date(2026, 2, 13)
+
+
+def test_align_asof_forward_fills_within_lag_and_align_many_keeps_common_days():
+    days = [10, 12, 20]
+    values = [1.0, 2.0, 3.0]
+
+    assert trading_calendar.align_asof(days, values, [9, 10, 11, 15, 17, 20], max_lag_days=3) == [
+        None,
+        1.0,
+        1.0,
+        2.0,
+        None,
+        3.0,
+    ]
+
+    grid, columns = trading_calendar.align_many(
+        {"a": (days, values), "b": ([11, 20], [5.0, 6.0])},
+        [10, 11, 12, 20],
+        max_lag_days=3,
+    )
+    assert grid == [11, 12, 20]
+    assert columns == {"a": [1.0, 2.0, 3.0], "b": [5.0, 5.0, 6.0]}
+
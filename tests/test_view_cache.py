@@ -0,0 +1,80 @@
+import importlib
+
+
+view_cache = importlib.import_module("src.ingestion.view_cache")
+ViewCache = view_cache.ViewCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting_loader(calls):
+    def loader(dsn, *params):
+        calls.append((dsn, params))
+        return {"dsn": dsn, "params": params, "call": len(calls)}
+
+    return loader
+
+
+def test_view_cache_serves_hits_until_ttl_expires():
+    clock = FakeClock()
+    cache = ViewCache(ttl_seconds=60, clock=clock)
+    calls = []
+    loader = _counting_loader(calls)
+
+    first = cache.get_or_load("performance", "postgres://a", loader, 30, data_version="v1")
+    second = cache.get_or_load("performance", "postgres://a", loader, 30, data_version="v1")
+    clock.now += 61
+    third = cache.get_or_load("performance", "postgres://a", loader, 30, data_version="v1")
+
+    assert first.hit is False
+    assert second.hit is True
+    assert second.value == first.value
+    assert third.hit is False
+    assert len(calls) == 2
+
+
+def test_view_cache_new_data_version_or_params_miss_the_cache():
+    cache = ViewCache(ttl_seconds=60, clock=FakeClock())
+    calls = []
+    loader = _counting_loader(calls)
+
+    cache.get_or_load("performance", "postgres://a", loader, data_version="v1")
+    cache.get_or_load("performance", "postgres://a", loader, data_version="v2")
+    cache.get_or_load("performance", "postgres://b", loader, data_version="v2")
+    cache.get_or_load("performance", "postgres://b", loader, 90, data_version="v2")
+
+    assert len(calls) == 4
+
+
+def test_view_cache_bypasses_when_data_version_unknown_and_bounds_entries():
+    cache = ViewCache(ttl_seconds=60, max_entries=2, clock=FakeClock())
+    calls = []
+    loader = _counting_loader(calls)
+
+    cache.get_or_load("signal", "postgres://a", loader, data_version=None)
+    cache.get_or_load("signal", "postgres://a", loader, data_version=None)
+    assert len(calls) == 2
+
+    for version in ("v1", "v2", "v3"):
+        cache.get_or_load("signal", "postgres://a", loader, data_version=version)
+    assert cache.get_or_load("signal", "postgres://a", loader, data_version="v1").hit is False
+
+
+def test_read_data_version_is_stable_and_tolerates_failures():
+    class Repo:
+        def read_view_data_version(self):
+            return {"latest_run_finished_at": "2026-03-01T00:00:00+00:00", "latest_portfolio_snapshot_id": 7}
+
+    class BrokenRepo:
+        def read_view_data_version(self):
+            raise RuntimeError("connection refused")
+
+    assert view_cache.read_data_version(Repo()) == view_cache.read_data_version(Repo())
+    assert view_cache.read_data_version(BrokenRepo()) is None
+    assert view_cache.read_data_version(object()) is None